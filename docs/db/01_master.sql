@@ -376,6 +376,21 @@ CREATE TABLE MST_USER (
 
 COMMENT ON TABLE MST_USER IS '사용자 마스터';
 
+-- ----------------------------------------------------------------------------
+-- 1.14 문서번호 시퀀스 (Document Number Sequence)
+-- 서버가 블록(100건) 단위로 NEXT_VAL을 증가시켜 예약하고 메모리에서 번호를 발급
+-- ----------------------------------------------------------------------------
+CREATE TABLE MST_SEQUENCE (
+    SEQ_NM              VARCHAR(50)     PRIMARY KEY,        -- 시퀀스명 (번호 접두어, 예: HBL2026)
+    NEXT_VAL            BIGINT          NOT NULL DEFAULT 1, -- 다음 할당 시작값
+    CREATED_BY          VARCHAR(50),
+    CREATED_DTM         DATETIME        DEFAULT CURRENT_TIMESTAMP,
+    UPDATED_BY          VARCHAR(50),
+    UPDATED_DTM         DATETIME
+);
+
+COMMENT ON TABLE MST_SEQUENCE IS '문서번호 시퀀스';
+
 -- ----------------------------------------------------------------------------
 -- 인덱스 생성
 -- ----------------------------------------------------------------------------
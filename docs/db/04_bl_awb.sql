@@ -546,10 +546,16 @@ COMMENT ON TABLE BL_IRRE IS 'IRRE (Irregularity/사고)';
 -- 인덱스 생성
 -- ----------------------------------------------------------------------------
 CREATE INDEX IDX_BL_MBL_SHIPMENT ON BL_MASTER_BL(SHIPMENT_ID);
-CREATE INDEX IDX_BL_MBL_CARRIER ON BL_MASTER_BL(CARRIER_ID);
+CREATE INDEX IDX_BL_MBL_CARRIER ON BL_MASTER_BL(CARRIER_ID, DEL_YN, CREATED_DTM);
+CREATE INDEX IDX_BL_MBL_DEL_CREATED ON BL_MASTER_BL(DEL_YN, CREATED_DTM);
+CREATE INDEX IDX_BL_MBL_DEL_STATUS ON BL_MASTER_BL(DEL_YN, STATUS_CD, CREATED_DTM);
+CREATE INDEX IDX_BL_MBL_UPDATED ON BL_MASTER_BL(UPDATED_DTM);
 CREATE INDEX IDX_BL_HBL_SHIPMENT ON BL_HOUSE_BL(SHIPMENT_ID);
-CREATE INDEX IDX_BL_HBL_MBL ON BL_HOUSE_BL(MBL_ID);
+CREATE INDEX IDX_BL_HBL_MBL ON BL_HOUSE_BL(MBL_ID, DEL_YN);
 CREATE INDEX IDX_BL_HBL_CUSTOMER ON BL_HOUSE_BL(CUSTOMER_ID);
+CREATE INDEX IDX_BL_HBL_DEL_CREATED ON BL_HOUSE_BL(DEL_YN, CREATED_DTM);
+CREATE INDEX IDX_BL_HBL_DEL_STATUS ON BL_HOUSE_BL(DEL_YN, STATUS_CD, CREATED_DTM);
+CREATE INDEX IDX_BL_HBL_UPDATED ON BL_HOUSE_BL(UPDATED_DTM);
 CREATE INDEX IDX_BL_CNTR_MBL ON BL_CONTAINER(MBL_ID);
 CREATE INDEX IDX_BL_CNTR_HBL ON BL_CONTAINER(HBL_ID);
 CREATE INDEX IDX_BL_MAWB_SHIPMENT ON BL_MASTER_AWB(SHIPMENT_ID);
@@ -332,6 +332,131 @@ CREATE TABLE SHP_TRACKING_EVENT (
 
 COMMENT ON TABLE SHP_TRACKING_EVENT IS '화물 추적 이벤트';
 
+-- ----------------------------------------------------------------------------
+-- 5.6 Status Count (선적 상태별 건수)
+-- 등록/상태 변경 시 증감 반영, status_rollup.py로 주기적 재집계
+-- ----------------------------------------------------------------------------
+CREATE TABLE SHP_STATUS_COUNT (
+    STATUS_CD           VARCHAR(20)     NOT NULL,           -- 상태코드
+    TRANSPORT_MODE_CD   VARCHAR(10)     NOT NULL,           -- 운송모드 (SEA/AIR)
+    SHIPMENT_CNT        BIGINT          NOT NULL DEFAULT 0, -- 선적건수 (DEL_YN = 'N')
+    UPDATED_DTM         DATETIME,                           -- 갱신일시
+
+    PRIMARY KEY (STATUS_CD, TRANSPORT_MODE_CD)
+);
+
+COMMENT ON TABLE SHP_STATUS_COUNT IS '선적 상태별 건수';
+
+-- status_rollup.py 체크포인트 (JOB_NM = 'STATUS_COUNT' 행은 최초 재집계 완료 표시,
+-- 그 전에는 대시보드가 ORD_SHIPMENT를 직접 집계한다)
+CREATE TABLE STATUS_ROLLUP_CHECKPOINT (
+    JOB_NM              VARCHAR(50)     NOT NULL,           -- 작업명
+    LAST_HIST_ID        BIGINT          DEFAULT 0,          -- 마지막 확인 이력 ID
+    UPDATED_DTM         DATETIME        DEFAULT CURRENT_TIMESTAMP,
+
+    PRIMARY KEY (JOB_NM)
+);
+
+COMMENT ON TABLE STATUS_ROLLUP_CHECKPOINT IS '상태 건수 재집계 체크포인트';
+
+-- ----------------------------------------------------------------------------
+-- 5.7 Route Geometry (추적 지도 경로 캐시)
+-- route_geometry.py가 활성 B/L·AWB 구간별로 미리 계산
+-- ----------------------------------------------------------------------------
+CREATE TABLE SHP_ROUTE_GEOMETRY (
+    TRANSPORT_MODE_CD   VARCHAR(10)     NOT NULL,           -- 운송모드 (SEA/AIR)
+    ORIGIN_CD           VARCHAR(10)     NOT NULL,           -- 출발 항구/공항
+    DEST_CD             VARCHAR(10)     NOT NULL,           -- 도착 항구/공항
+    GEOMETRY_VER        INT             NOT NULL,           -- 경로 계산 버전
+
+    DISTANCE_KM         DECIMAL(10,1),                      -- 경로 거리(km)
+    POINT_CNT           INT,                                -- 경로 좌표 수
+    PATH_JSON           TEXT            NOT NULL,           -- 경로 [[위도,경도]...] (지도 기준 연속 경도)
+    SEGMENTS_JSON       TEXT            NOT NULL,           -- 날짜변경선 분할 경로 (경도 -180~180)
+    CROSS_DATELINE_YN   CHAR(1)         DEFAULT 'N',        -- 날짜변경선 횡단여부
+
+    CREATED_DTM         DATETIME        DEFAULT CURRENT_TIMESTAMP,
+    UPDATED_DTM         DATETIME,
+
+    PRIMARY KEY (TRANSPORT_MODE_CD, ORIGIN_CD, DEST_CD, GEOMETRY_VER)
+);
+
+COMMENT ON TABLE SHP_ROUTE_GEOMETRY IS '추적 지도 경로 캐시';
+
+-- ----------------------------------------------------------------------------
+-- 5.8 Tracking Snapshot (추적 지도 MBL/MAWB별 요약)
+-- tracking_snapshot.py가 B/L·AWB 변경과 추적 이벤트를 반영해 갱신
+-- 원본이 삭제되면 DEL_YN = 'Y'로 남겨 변경분 조회에 알리고 일정 기간 후 삭제
+-- ----------------------------------------------------------------------------
+CREATE TABLE SHP_TRACKING_SNAPSHOT (
+    SNAPSHOT_ID         BIGINT          PRIMARY KEY AUTO_INCREMENT,
+    TRANSPORT_MODE_CD   VARCHAR(10)     NOT NULL,           -- 운송모드 (SEA/AIR)
+    MASTER_ID           BIGINT          NOT NULL,           -- MBL_ID / MAWB_ID
+    MASTER_NO           VARCHAR(50)     NOT NULL,           -- MBL / MAWB 번호
+    SHIPMENT_ID         BIGINT,                             -- 선적건
+    MASTER_CREATED_DTM  DATETIME        NOT NULL,           -- MBL / MAWB 등록일시
+
+    -- 구간
+    ORIGIN_CD           VARCHAR(10),                        -- 출발 항구/공항
+    DEST_CD             VARCHAR(10),                        -- 도착 항구/공항
+    ROUTE_KEY           VARCHAR(30),                        -- 경로 키 (SHP_ROUTE_GEOMETRY)
+
+    -- 운송 정보
+    STATUS_CD           VARCHAR(20),                        -- 상태
+    CARRIER_NM          VARCHAR(100),                       -- 선사명 / 항공사코드
+    VESSEL_FLIGHT       VARCHAR(100),                       -- 선명 / 편명
+    VOYAGE_NO           VARCHAR(30),                        -- 항차
+    TRADE_TYPE_CD       VARCHAR(10),                        -- B/L유형 (항공은 AIR)
+    SHIPPER_NM          VARCHAR(200),                       -- 발송인명
+    ETD_DT              DATE,                               -- 출발예정일
+    ATD_DT              DATE,                               -- 실제출발일
+    ETA_DT              DATE,                               -- 도착예정일
+    ATA_DT              DATE,                               -- 실제도착일
+
+    -- 화물 (Master + House 합계)
+    PKG_QTY             INT,                                -- 총수량
+    PKG_TYPE_CD         VARCHAR(10),                        -- 포장유형
+    GROSS_WEIGHT_KG     DECIMAL(12,3),                      -- 총중량
+    VOLUME_CBM          DECIMAL(12,4),                      -- 총부피
+    HOUSE_CNT           INT             DEFAULT 0,          -- HBL / HAWB 건수
+    HOUSE_PKG_QTY       INT             DEFAULT 0,          -- House 합계 수량
+    HOUSE_WEIGHT_KG     DECIMAL(14,3)   DEFAULT 0,          -- House 합계 중량
+    FIRST_HOUSE_ID      BIGINT,                             -- 대표 House ID
+    FIRST_HOUSE_NO      VARCHAR(50),                        -- 대표 House 번호
+
+    -- 진행 상황
+    MILESTONE_CD        VARCHAR(20),                        -- 최근 이벤트코드 (SHP_TRACKING_EVENT)
+    MILESTONE_NM        VARCHAR(100),                       -- 최근 이벤트명
+    MILESTONE_DTM       DATETIME,                           -- 최근 이벤트일시
+    MILESTONE_LOCATION_CD VARCHAR(10),                      -- 최근 이벤트 위치
+    PROGRESS_PCT        INT             DEFAULT 0,          -- 진행률(%)
+
+    CREATED_DTM         DATETIME        DEFAULT CURRENT_TIMESTAMP,
+    UPDATED_DTM         DATETIME,
+    DEL_YN              CHAR(1)         DEFAULT 'N',        -- 원본 삭제여부 (변경분 조회용)
+
+    UNIQUE (TRANSPORT_MODE_CD, MASTER_ID)
+);
+
+COMMENT ON TABLE SHP_TRACKING_SNAPSHOT IS '추적 지도 요약';
+
+-- ----------------------------------------------------------------------------
+-- 5.9 Route Geocell (추적 지도 경로 공간 인덱스)
+-- route_geometry.py가 날짜변경선 분할 경로가 지나는 geohash 셀(3자리)을 구간별로 저장
+-- 지도 화면 범위 조회는 범위를 덮는 셀(또는 셀 접두어)로 구간을 찾는다
+-- ----------------------------------------------------------------------------
+CREATE TABLE SHP_ROUTE_GEOCELL (
+    GEOHASH             CHAR(3)         NOT NULL,           -- geohash 셀
+    TRANSPORT_MODE_CD   VARCHAR(10)     NOT NULL,           -- 운송모드 (SEA/AIR)
+    ORIGIN_CD           VARCHAR(10)     NOT NULL,           -- 출발 항구/공항
+    DEST_CD             VARCHAR(10)     NOT NULL,           -- 도착 항구/공항
+    GEOMETRY_VER        INT             NOT NULL,           -- 경로 계산 버전 (SHP_ROUTE_GEOMETRY)
+
+    PRIMARY KEY (GEOHASH, GEOMETRY_VER, TRANSPORT_MODE_CD, ORIGIN_CD, DEST_CD)
+);
+
+COMMENT ON TABLE SHP_ROUTE_GEOCELL IS '추적 지도 경로 공간 인덱스';
+
 -- ----------------------------------------------------------------------------
 -- 인덱스 생성
 -- ----------------------------------------------------------------------------
@@ -342,3 +467,11 @@ CREATE INDEX IDX_SHP_AN_SHIPMENT ON SHP_ARRIVAL_NOTICE(SHIPMENT_ID);
 CREATE INDEX IDX_SHP_AN_CUSTOMER ON SHP_ARRIVAL_NOTICE(CUSTOMER_ID);
 CREATE INDEX IDX_SHP_TRACKING_SHIPMENT ON SHP_TRACKING_EVENT(SHIPMENT_ID);
 CREATE INDEX IDX_SHP_TRACKING_DTM ON SHP_TRACKING_EVENT(EVENT_DTM);
+CREATE INDEX IDX_SHP_TRACKING_MBL ON SHP_TRACKING_EVENT(MBL_ID, EVENT_DTM);
+CREATE INDEX IDX_SHP_TRACKING_MAWB ON SHP_TRACKING_EVENT(MAWB_ID, EVENT_DTM);
+CREATE INDEX IDX_SHP_SNAPSHOT_LIST ON SHP_TRACKING_SNAPSHOT(DEL_YN, TRANSPORT_MODE_CD, MASTER_CREATED_DTM, MASTER_ID);
+CREATE INDEX IDX_SHP_SNAPSHOT_STATUS ON SHP_TRACKING_SNAPSHOT(DEL_YN, TRANSPORT_MODE_CD, STATUS_CD, MASTER_CREATED_DTM, MASTER_ID);
+CREATE INDEX IDX_SHP_SNAPSHOT_DEL_CREATED ON SHP_TRACKING_SNAPSHOT(DEL_YN, CREATED_DTM);
+CREATE INDEX IDX_SHP_SNAPSHOT_UPDATED ON SHP_TRACKING_SNAPSHOT(UPDATED_DTM);
+CREATE INDEX IDX_SHP_SNAPSHOT_ROUTE ON SHP_TRACKING_SNAPSHOT(DEL_YN, ROUTE_KEY);
+CREATE INDEX IDX_SHP_GEOCELL_PAIR ON SHP_ROUTE_GEOCELL(TRANSPORT_MODE_CD, ORIGIN_CD, DEST_CD, GEOMETRY_VER);
@@ -0,0 +1,428 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+FMS API Query Benchmark
+Replays the statements of the fms-web API routes (dashboard, shipment tracking,
+House B/L, import B/L and shipment detail) exactly as the routes send them,
+with parameters sampled from the loaded data, at several concurrency levels.
+Reports p50/p95/p99 latency and rows examined (InnoDB handler reads) per
+statement; pass snapshot directories of different sizes to compare scales
+"""
+
+import argparse
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import pymysql
+
+from latency_stats import percentile
+from provision_schema import DB_CONFIG, DEFAULT_WORKERS
+from snapshot import restore
+
+DEFAULT_SAMPLES = 50
+DEFAULT_CONCURRENCY = (1, 4, 16)
+DEFAULT_SEED = 1
+
+# api/shipments/tracking SNAPSHOT_COLUMNS
+TRACKING_SNAPSHOT_COLUMNS = """
+        s.SNAPSHOT_ID, s.TRANSPORT_MODE_CD, s.MASTER_ID, s.MASTER_NO, s.ORIGIN_CD, s.DEST_CD, s.ROUTE_KEY,
+        s.STATUS_CD, s.CARRIER_NM, s.VESSEL_FLIGHT, s.VOYAGE_NO, s.TRADE_TYPE_CD, s.SHIPPER_NM,
+        s.ETD_DT, s.ATD_DT, s.ETA_DT, s.ATA_DT, s.PKG_QTY, s.PKG_TYPE_CD, s.GROSS_WEIGHT_KG, s.VOLUME_CBM,
+        s.HOUSE_CNT, s.HOUSE_WEIGHT_KG, s.FIRST_HOUSE_ID, s.FIRST_HOUSE_NO, s.MILESTONE_CD, s.MILESTONE_NM,
+        s.MILESTONE_DTM, s.MILESTONE_LOCATION_CD, s.PROGRESS_PCT, s.DEL_YN"""
+
+HBL_COLUMNS = """
+        h.HBL_ID as hbl_id,
+        h.HBL_NO as hbl_no,
+        h.SHIPMENT_ID as shipment_id,
+        h.MBL_ID as mbl_id,
+        m.MBL_NO as mbl_no,
+        h.CUSTOMER_ID as customer_id,
+        c.CUSTOMER_NM as customer_name,
+        h.CARRIER_ID as carrier_id,
+        cr.CARRIER_NM as carrier_name,
+        h.VESSEL_NM as vessel_nm,
+        h.VOYAGE_NO as voyage_no,
+        h.POL_PORT_CD as pol_port_cd,
+        h.POD_PORT_CD as pod_port_cd,
+        pol.PORT_NM as pol_port_name,
+        pod.PORT_NM as pod_port_name,
+        h.PLACE_OF_RECEIPT as place_of_receipt,
+        h.PLACE_OF_DELIVERY as place_of_delivery,
+        h.FINAL_DEST as final_dest,
+        DATE_FORMAT(h.ETD_DT, '%%Y-%%m-%%d') as etd_dt,
+        DATE_FORMAT(h.ATD_DT, '%%Y-%%m-%%d') as atd_dt,
+        DATE_FORMAT(h.ETA_DT, '%%Y-%%m-%%d') as eta_dt,
+        DATE_FORMAT(h.ATA_DT, '%%Y-%%m-%%d') as ata_dt,
+        DATE_FORMAT(h.ON_BOARD_DT, '%%Y-%%m-%%d') as on_board_dt,
+        DATE_FORMAT(h.ISSUE_DT, '%%Y-%%m-%%d') as issue_dt,
+        h.ISSUE_PLACE as issue_place,
+        h.SHIPPER_NM as shipper_nm,
+        h.SHIPPER_ADDR as shipper_addr,
+        h.CONSIGNEE_NM as consignee_nm,
+        h.CONSIGNEE_ADDR as consignee_addr,
+        h.NOTIFY_PARTY as notify_party,
+        h.TOTAL_PKG_QTY as total_pkg_qty,
+        h.PKG_TYPE_CD as pkg_type_cd,
+        h.GROSS_WEIGHT_KG as gross_weight_kg,
+        h.VOLUME_CBM as volume_cbm,
+        h.COMMODITY_DESC as commodity_desc,
+        h.HS_CODE as hs_code,
+        h.MARKS_NOS as marks_nos,
+        h.FREIGHT_TERM_CD as freight_term_cd,
+        h.BL_TYPE_CD as bl_type_cd,
+        h.ORIGINAL_BL_COUNT as original_bl_count,
+        h.STATUS_CD as status_cd,
+        h.PRINT_YN as print_yn,
+        h.SURRENDER_YN as surrender_yn,
+        DATE_FORMAT(h.CREATED_DTM, '%%Y-%%m-%%d %%H:%%i') as created_dtm,
+        DATE_FORMAT(h.CREATED_DTM, '%%Y-%%m-%%d %%H:%%i:%%s') as _cursor_dtm, h.HBL_ID as _cursor_id"""
+
+IMPORT_COLUMNS = """
+        h.HBL_ID as hbl_id,
+        h.HBL_NO as hbl_no,
+        h.MBL_ID as mbl_id,
+        m.MBL_NO as mbl_no,
+        h.CUSTOMER_ID as customer_id,
+        c.CUSTOMER_NM as customer_name,
+        h.CARRIER_ID as carrier_id,
+        cr.CARRIER_NM as carrier_name,
+        cr.CARRIER_CD as carrier_code,
+        h.VESSEL_NM as vessel_nm,
+        h.VOYAGE_NO as voyage_no,
+        h.POL_PORT_CD as pol_port_cd,
+        h.POD_PORT_CD as pod_port_cd,
+        pol.PORT_NM as pol_port_name,
+        pod.PORT_NM as pod_port_name,
+        h.PLACE_OF_RECEIPT as place_of_receipt,
+        h.PLACE_OF_DELIVERY as place_of_delivery,
+        h.FINAL_DEST as final_dest,
+        DATE_FORMAT(h.ETD_DT, '%%Y-%%m-%%d') as etd_dt,
+        DATE_FORMAT(h.ATD_DT, '%%Y-%%m-%%d') as atd_dt,
+        DATE_FORMAT(h.ETA_DT, '%%Y-%%m-%%d') as eta_dt,
+        DATE_FORMAT(h.ATA_DT, '%%Y-%%m-%%d') as ata_dt,
+        DATE_FORMAT(h.ISSUE_DT, '%%Y-%%m-%%d') as issue_dt,
+        h.ISSUE_PLACE as issue_place,
+        h.SHIPPER_NM as shipper_nm,
+        h.SHIPPER_ADDR as shipper_addr,
+        h.CONSIGNEE_NM as consignee_nm,
+        h.CONSIGNEE_ADDR as consignee_addr,
+        h.NOTIFY_PARTY as notify_party,
+        h.TOTAL_PKG_QTY as total_pkg_qty,
+        h.PKG_TYPE_CD as pkg_type_cd,
+        h.GROSS_WEIGHT_KG as gross_weight_kg,
+        h.VOLUME_CBM as volume_cbm,
+        h.COMMODITY_DESC as commodity_desc,
+        h.MARKS_NOS as marks_nos,
+        h.FREIGHT_TERM_CD as freight_term_cd,
+        h.BL_TYPE_CD as bl_type_cd,
+        h.STATUS_CD as status_cd,
+        DATE_FORMAT(h.CREATED_DTM, '%%Y-%%m-%%d %%H:%%i') as created_dtm,
+        DATE_FORMAT(h.CREATED_DTM, '%%Y-%%m-%%d %%H:%%i:%%s') as _cursor_dtm, h.HBL_ID as _cursor_id"""
+
+HBL_JOINS = """
+      FROM BL_HOUSE_BL h
+      LEFT JOIN BL_MASTER_BL m ON h.MBL_ID = m.MBL_ID
+      LEFT JOIN MST_CUSTOMER c ON h.CUSTOMER_ID = c.CUSTOMER_ID
+      LEFT JOIN MST_CARRIER cr ON h.CARRIER_ID = cr.CARRIER_ID
+      LEFT JOIN MST_PORT pol ON h.POL_PORT_CD = pol.PORT_CD
+      LEFT JOIN MST_PORT pod ON h.POD_PORT_CD = pod.PORT_CD"""
+
+SHIPMENT_DETAIL = """
+      SELECT
+        s.*,
+        c.CUSTOMER_NM,
+        c.CUSTOMER_CD,
+        cr.CARRIER_NM,
+        cr.CARRIER_CD,
+        shipper.CUSTOMER_NM as SHIPPER_NM,
+        consignee.CUSTOMER_NM as CONSIGNEE_NM,
+        op.PORT_NM as ORIGIN_PORT_NM,
+        op.LATITUDE as ORIGIN_LAT,
+        op.LONGITUDE as ORIGIN_LNG,
+        dp.PORT_NM as DEST_PORT_NM,
+        dp.LATITUDE as DEST_LAT,
+        dp.LONGITUDE as DEST_LNG,
+        oc.COUNTRY_NM as ORIGIN_COUNTRY_NM,
+        dc.COUNTRY_NM as DEST_COUNTRY_NM
+      FROM ORD_SHIPMENT s
+      LEFT JOIN MST_CUSTOMER c ON s.CUSTOMER_ID = c.CUSTOMER_ID
+      LEFT JOIN MST_CARRIER cr ON s.CARRIER_ID = cr.CARRIER_ID
+      LEFT JOIN MST_CUSTOMER shipper ON s.SHIPPER_ID = shipper.CUSTOMER_ID
+      LEFT JOIN MST_CUSTOMER consignee ON s.CONSIGNEE_ID = consignee.CUSTOMER_ID
+      LEFT JOIN MST_PORT op ON s.ORIGIN_PORT_CD = op.PORT_CD
+      LEFT JOIN MST_PORT dp ON s.DEST_PORT_CD = dp.PORT_CD
+      LEFT JOIN MST_COUNTRY oc ON s.ORIGIN_COUNTRY_CD = oc.COUNTRY_CD
+      LEFT JOIN MST_COUNTRY dc ON s.DEST_COUNTRY_CD = dc.COUNTRY_CD"""
+
+# (name, route, statement, sample keys bound to its placeholders).
+# Statements are copied from the routes; only '%' is doubled for pymysql and long column lists rewrapped.
+WORKLOAD = [
+    ("dashboard_status_counts", "api/dashboard", """
+      SELECT STATUS_CD as status, SUM(SHIPMENT_CNT) as count
+        FROM SHP_STATUS_COUNT
+       WHERE EXISTS (SELECT 1 FROM STATUS_ROLLUP_CHECKPOINT WHERE JOB_NM = 'STATUS_COUNT')
+       GROUP BY STATUS_CD
+    """, ()),
+    ("dashboard_recent", "api/dashboard", """
+      SELECT
+        s.SHIPMENT_NO as shipment_no,
+        s.TRANSPORT_MODE_CD as transport_mode,
+        c.CUSTOMER_NM as customer_name,
+        CONCAT(s.ORIGIN_PORT_CD, ' → ', s.DEST_PORT_CD) as route,
+        s.STATUS_CD as status,
+        DATE_FORMAT(s.ETA_DT, '%%Y-%%m-%%d') as eta,
+        COALESCE(s.TOTAL_PKG_QTY, 0) as pkg_qty,
+        COALESCE(s.PKG_TYPE_CD, 'PKG') as pkg_type,
+        COALESCE(s.GROSS_WEIGHT_KG, 0) as gross_weight,
+        COALESCE(s.VOLUME_CBM, 0) as volume_cbm
+      FROM ORD_SHIPMENT s
+      LEFT JOIN MST_CUSTOMER c ON s.CUSTOMER_ID = c.CUSTOMER_ID
+      WHERE s.DEL_YN = 'N'
+      ORDER BY s.CREATED_DTM DESC
+      LIMIT 10
+    """, ()),
+    ("tracking_snapshot_sea", "api/shipments/tracking", f"""
+      SELECT{TRACKING_SNAPSHOT_COLUMNS},
+        DATE_FORMAT(s.MASTER_CREATED_DTM, '%%Y-%%m-%%d %%H:%%i:%%s') as _cursor_dtm, s.MASTER_ID as _cursor_id
+      FROM SHP_TRACKING_SNAPSHOT s
+      WHERE s.DEL_YN = 'N' AND s.TRANSPORT_MODE_CD = 'SEA'
+      ORDER BY s.MASTER_CREATED_DTM DESC, s.MASTER_ID DESC LIMIT 101
+    """, ()),
+    ("tracking_snapshot_air", "api/shipments/tracking", f"""
+      SELECT{TRACKING_SNAPSHOT_COLUMNS},
+        DATE_FORMAT(s.MASTER_CREATED_DTM, '%%Y-%%m-%%d %%H:%%i:%%s') as _cursor_dtm, s.MASTER_ID as _cursor_id
+      FROM SHP_TRACKING_SNAPSHOT s
+      WHERE s.DEL_YN = 'N' AND s.TRANSPORT_MODE_CD = 'AIR'
+      ORDER BY s.MASTER_CREATED_DTM DESC, s.MASTER_ID DESC LIMIT 101
+    """, ()),
+    # Viewport query (lib/viewport.ts): East Asia at zoom 5, bbox 115,20,145,45 covered by 2-character cells
+    ("tracking_viewport_cells", "api/shipments/tracking", """
+      SELECT DISTINCT TRANSPORT_MODE_CD, ORIGIN_CD, DEST_CD
+        FROM SHP_ROUTE_GEOCELL
+       WHERE GEOMETRY_VER = 1 AND (GEOHASH LIKE 'we%%' OR GEOHASH LIKE 'wg%%' OR GEOHASH LIKE 'ws%%'
+          OR GEOHASH LIKE 'wt%%' OR GEOHASH LIKE 'wu%%' OR GEOHASH LIKE 'wv%%' OR GEOHASH LIKE 'ww%%'
+          OR GEOHASH LIKE 'wx%%' OR GEOHASH LIKE 'wy%%' OR GEOHASH LIKE 'wz%%' OR GEOHASH LIKE 'x5%%'
+          OR GEOHASH LIKE 'xh%%' OR GEOHASH LIKE 'xj%%' OR GEOHASH LIKE 'xn%%' OR GEOHASH LIKE 'xp%%'
+          OR GEOHASH LIKE 'y8%%' OR GEOHASH LIKE 'yb%%' OR GEOHASH LIKE 'z0%%')
+         AND TRANSPORT_MODE_CD IN ('SEA', 'AIR')
+    """, ()),
+    ("tracking_viewport_clusters", "api/shipments/tracking", """
+      SELECT s.ORIGIN_CD, s.DEST_CD, COUNT(*) as SHIPMENT_CNT
+      FROM SHP_TRACKING_SNAPSHOT s
+      WHERE s.DEL_YN = 'N' AND s.ROUTE_KEY IN (
+        SELECT CONCAT(TRANSPORT_MODE_CD, ':', ORIGIN_CD, '-', DEST_CD) FROM SHP_ROUTE_GEOCELL
+         WHERE GEOMETRY_VER = 1 AND GEOHASH LIKE 'w%%')
+      GROUP BY s.ROUTE_KEY, s.ORIGIN_CD, s.DEST_CD
+    """, ()),
+    # Incremental poll (lib/changeFeed.ts): changes of the last minute up to the settle horizon
+    ("tracking_changes", "api/shipments/tracking", """
+      SELECT ID, PARENT_ID, DEL_YN, DATE_FORMAT(CHANGED_DTM, '%%Y-%%m-%%d %%H:%%i:%%s') as CHANGED_DTM
+        FROM (
+          (SELECT SNAPSHOT_ID as ID, NULL as PARENT_ID, DEL_YN, UPDATED_DTM as CHANGED_DTM
+             FROM SHP_TRACKING_SNAPSHOT
+            WHERE UPDATED_DTM >= NOW() - INTERVAL 1 MINUTE AND UPDATED_DTM < NOW() - INTERVAL 2 SECOND
+            ORDER BY UPDATED_DTM, SNAPSHOT_ID LIMIT 101)
+          UNION ALL
+          (SELECT SNAPSHOT_ID, NULL, DEL_YN, CREATED_DTM
+             FROM SHP_TRACKING_SNAPSHOT
+            WHERE DEL_YN = 'N' AND CREATED_DTM >= NOW() - INTERVAL 1 MINUTE
+              AND CREATED_DTM < NOW() - INTERVAL 2 SECOND AND UPDATED_DTM IS NULL
+            ORDER BY CREATED_DTM, SNAPSHOT_ID LIMIT 101)
+        ) c
+       ORDER BY CHANGED_DTM, ID
+       LIMIT 101
+    """, ()),
+    # First page of the keyset-paginated list (lib/pagination.ts: DEFAULT_PAGE_SIZE + 1 rows)
+    ("hbl_list", "api/bl/hbl",
+     f"SELECT{HBL_COLUMNS}{HBL_JOINS}\n      WHERE h.DEL_YN = 'N'\n"
+     f"      ORDER BY h.CREATED_DTM DESC, h.HBL_ID DESC LIMIT 101", ()),
+    ("hbl_by_shipment", "api/bl/hbl",
+     f"SELECT{HBL_COLUMNS}{HBL_JOINS}\n      WHERE h.DEL_YN = 'N' AND h.SHIPMENT_ID = %s\n"
+     f"      ORDER BY h.CREATED_DTM DESC, h.HBL_ID DESC LIMIT 101", ('hbl_shipment_id',)),
+    ("import_by_hbl_id", "api/bl/import",
+     f"SELECT{IMPORT_COLUMNS}{HBL_JOINS}\n      WHERE h.DEL_YN != 'Y' AND h.HBL_ID = %s\n"
+     f"      ORDER BY h.CREATED_DTM DESC, h.HBL_ID DESC LIMIT 101", ('hbl_id',)),
+    ("import_mbl_like", "api/bl/import",
+     f"SELECT{IMPORT_COLUMNS}{HBL_JOINS}\n      WHERE h.DEL_YN != 'Y' AND m.MBL_NO LIKE %s\n"
+     f"      ORDER BY h.CREATED_DTM DESC, h.HBL_ID DESC LIMIT 101", ('mbl_like',)),
+    # The route's "ID = ? OR NO = ? AND DEL_YN" precedence is kept as is
+    ("shipment_detail", "api/shipments/[id]",
+     f"{SHIPMENT_DETAIL}\n      WHERE s.SHIPMENT_ID = %s OR s.SHIPMENT_NO = %s\n      AND s.DEL_YN = 'N'\n",
+     ('shipment_key', 'shipment_key')),
+    ("shipment_sr", "api/shipments/[id]",
+     "SELECT * FROM SHP_SHIPPING_REQUEST WHERE SHIPMENT_ID = %s AND DEL_YN = 'N'", ('shipment_id',)),
+    ("shipment_sn", "api/shipments/[id]",
+     "SELECT * FROM SHP_SHIPPING_NOTICE WHERE SHIPMENT_ID = %s AND DEL_YN = 'N'", ('shipment_id',)),
+    ("shipment_containers", "api/shipments/[id]", """
+        SELECT * FROM ORD_OCEAN_BOOKING_CNTR
+        WHERE BOOKING_ID IN (
+          SELECT BOOKING_ID FROM ORD_OCEAN_BOOKING WHERE SHIPMENT_ID = %s
+        )
+    """, ('shipment_id',)),
+    ("shipment_events", "api/shipments/[id]",
+     "SELECT * FROM SHP_TRACKING_EVENT WHERE SHIPMENT_ID = %s ORDER BY EVENT_DTM DESC", ('shipment_id',)),
+]
+
+
+def get_connection():
+    return pymysql.connect(**DB_CONFIG)
+
+
+def sample_rows(cursor, table, key, columns, count, rng):
+    """count rows at random key positions (seeks from MIN..MAX, no ORDER BY RAND())"""
+    cursor.execute(f"SELECT MIN({key}), MAX({key}) FROM {table}")
+    low, high = cursor.fetchone()
+    if low is None:
+        return []
+    rows = []
+    for _ in range(count):
+        cursor.execute(f"SELECT {', '.join(columns)} FROM {table} WHERE {key} >= %s ORDER BY {key} LIMIT 1",
+                       (rng.randint(low, high),))
+        rows.append(cursor.fetchone())
+    return rows
+
+
+def sample_params(conn, samples, seed=DEFAULT_SEED):
+    """samples dicts of parameter values taken from the loaded rows"""
+    rng = random.Random(seed)
+    with conn.cursor() as cursor:
+        shipments = sample_rows(cursor, 'ORD_SHIPMENT', 'SHIPMENT_ID', ['SHIPMENT_ID'], samples, rng)
+        hbls = sample_rows(cursor, 'BL_HOUSE_BL', 'HBL_ID', ['HBL_ID', 'SHIPMENT_ID'], samples, rng)
+        mbls = sample_rows(cursor, 'BL_MASTER_BL', 'MBL_ID', ['MBL_NO'], samples, rng)
+    if not (shipments and hbls and mbls):
+        raise ValueError("ORD_SHIPMENT, BL_HOUSE_BL and BL_MASTER_BL need data; load a data set first")
+    params = []
+    for shipment, hbl, mbl in zip(shipments, hbls, mbls):
+        params.append({
+            'shipment_id': shipment[0],
+            # The detail page passes the path segment as a string for both placeholders
+            'shipment_key': str(shipment[0]),
+            'hbl_id': hbl[0],
+            'hbl_shipment_id': hbl[1],
+            # The screen's search box: a partial number, matched with %...%
+            'mbl_like': f"%{mbl[0][-6:]}%",
+        })
+    return params
+
+
+def handler_reads(cursor):
+    cursor.execute("SHOW SESSION STATUS LIKE 'Handler_read%'")
+    return sum(int(value) for _, value in cursor.fetchall())
+
+
+def rows_examined(conn, workload, params):
+    """name -> handler reads of one execution, net of the reads of SHOW STATUS itself"""
+    examined = {}
+    with conn.cursor() as cursor:
+        before = handler_reads(cursor)
+        overhead = handler_reads(cursor) - before
+        for name, _, sql, keys in workload:
+            before = handler_reads(cursor)
+            cursor.execute(sql, tuple(params[0][k] for k in keys))
+            cursor.fetchall()
+            examined[name] = max(0, handler_reads(cursor) - before - overhead)
+    return examined
+
+
+def run_level(workload, params, concurrency):
+    """
+    concurrency clients on their own connections, each replaying every statement once per
+    parameter sample. Returns (name -> latencies in ms, seconds).
+    """
+    timings = {name: [] for name, _, _, _ in workload}
+    lock = threading.Lock()
+
+    def client(n):
+        local = {name: [] for name in timings}
+        # Clients walk the samples from different offsets so they do not hit the same rows in step
+        ordered = params[n % len(params):] + params[:n % len(params)]
+        conn = get_connection()
+        try:
+            with conn.cursor() as cursor:
+                for values in ordered:
+                    for name, _, sql, keys in workload:
+                        started = time.perf_counter()
+                        cursor.execute(sql, tuple(values[k] for k in keys))
+                        cursor.fetchall()
+                        local[name].append((time.perf_counter() - started) * 1000)
+        finally:
+            conn.close()
+        with lock:
+            for name, values in local.items():
+                timings[name].extend(values)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for future in [pool.submit(client, n) for n in range(concurrency)]:
+            future.result()
+    return timings, time.perf_counter() - started
+
+
+def shipment_count(conn):
+    with conn.cursor() as cursor:
+        cursor.execute("SELECT COUNT(*) FROM ORD_SHIPMENT")
+        return cursor.fetchone()[0]
+
+
+def print_level(workload, timings, examined, concurrency, seconds):
+    executed = sum(len(v) for v in timings.values())
+    print(f"\n  concurrency {concurrency}: {executed:,} statements in {seconds:.1f}s "
+          f"({executed / seconds if seconds else 0:,.0f}/s)")
+    print(f"  {'query':<22}{'route':<24}{'p50':>10}{'p95':>10}{'p99':>10}{'rows examined':>16}")
+    for name, route, _, _ in workload:
+        values = timings[name]
+        print(f"  {name:<22}{route:<24}{percentile(values, 50):>8.1f}ms{percentile(values, 95):>8.1f}ms"
+              f"{percentile(values, 99):>8.1f}ms{examined[name]:>16,}")
+
+
+def bench(levels=DEFAULT_CONCURRENCY, samples=DEFAULT_SAMPLES, queries=None, seed=DEFAULT_SEED, label=None):
+    workload = [w for w in WORKLOAD if not queries or w[0] in queries]
+    if not workload:
+        raise ValueError(f"no such query; choose from {', '.join(w[0] for w in WORKLOAD)}")
+    conn = get_connection()
+    try:
+        shipments = shipment_count(conn)
+        params = sample_params(conn, samples, seed)
+        examined = rows_examined(conn, workload, params)
+    finally:
+        conn.close()
+
+    print(f"\n=== {label or 'current data'}: {shipments:,} shipments, {len(params)} samples ===")
+    for concurrency in levels:
+        timings, seconds = run_level(workload, params, concurrency)
+        print_level(workload, timings, examined, concurrency, seconds)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay the fms-web API queries and report latency percentiles")
+    parser.add_argument('snapshots', nargs='*',
+                        help='snapshot.py directories to restore and benchmark in turn (default: current data)')
+    parser.add_argument('--concurrency', type=lambda s: [int(n) for n in s.split(',')],
+                        default=list(DEFAULT_CONCURRENCY), help='comma separated client counts')
+    parser.add_argument('--samples', type=int, default=DEFAULT_SAMPLES, help='parameter samples per client')
+    parser.add_argument('--query', action='append', help='only this query (repeatable)')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS, help='parallel connections for restores')
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print(f"FMS API Query Benchmark ({datetime.now():%Y-%m-%d %H:%M}, "
+          f"concurrency {', '.join(map(str, args.concurrency))})")
+    print("=" * 60)
+
+    try:
+        if not args.snapshots:
+            bench(args.concurrency, args.samples, args.query, args.seed)
+        for directory in args.snapshots:
+            restore(directory, workers=args.workers)
+            bench(args.concurrency, args.samples, args.query, args.seed, label=directory)
+    except Exception as e:
+        print(f"\nError: {e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+FMS Index Pack Benchmark
+Times the per-shipment transport/customs/billing lookups with the part3
+secondary indexes dropped and again after schema_model.sync() rebuilds them
+"""
+
+import argparse
+import random
+import time
+from datetime import date, timedelta
+
+import pymysql
+
+from latency_stats import percentile
+from provision_schema import DB_CONFIG
+from schema_model import SchemaModel, LiveSchema, sync
+
+PART3_DOMAINS = ["06. Transport Tables", "07. Customs Tables", "08. Billing Tables"]
+BENCH_PREFIX = 'BX'
+BATCH_SIZE = 1000
+SNAPSHOT_DAYS = 30
+BASE_DATE = date(2025, 1, 1)
+BENCH_KEY_BASE = 9000000000  # BIGINT shipment/customer keys well above the live AUTO_INCREMENT range
+
+WORKLOAD = [
+    ("charge_by_shipment", "SELECT * FROM BIL_CHARGE WHERE SHIPMENT_ID = %s", 'shipment'),
+    ("charge_by_invoice", "SELECT * FROM BIL_CHARGE WHERE INVOICE_ID = %s", 'invoice'),
+    ("invoice_detail", "SELECT * FROM BIL_INVOICE_DETAIL WHERE INVOICE_ID = %s ORDER BY LINE_NO", 'invoice'),
+    ("declaration_by_shipment", "SELECT * FROM CUS_DECLARATION WHERE SHIPMENT_ID = %s", 'shipment'),
+    ("declaration_items", "SELECT * FROM CUS_DECLARATION_ITEM WHERE DECLARATION_ID = %s ORDER BY LINE_NO", 'declaration'),
+    ("edi_log_by_ref", "SELECT * FROM CUS_EDI_LOG WHERE REFERENCE_ID = %s", 'declaration'),
+    ("container_moves", "SELECT * FROM TRN_CONTAINER_MOVEMENT WHERE CONTAINER_NO = %s ORDER BY MOVEMENT_DATE", 'container'),
+    ("ar_aging_snapshot", "SELECT CUSTOMER_ID, SUM(BALANCE) FROM BIL_AR_AGING WHERE SNAPSHOT_DATE = %s GROUP BY CUSTOMER_ID", 'snapshot'),
+]
+
+
+def get_connection():
+    return pymysql.connect(**DB_CONFIG)
+
+
+def bench_id(kind, n):
+    return f"{BENCH_PREFIX}{kind}{n:010d}"
+
+
+def seed(conn, shipments):
+    """Seed part3 rows for N synthetic shipments (ids prefixed BX, removable with --cleanup)"""
+    cursor = conn.cursor()
+    rows = {name: [] for name in (
+        'BIL_CHARGE', 'BIL_INVOICE_DETAIL', 'CUS_DECLARATION', 'CUS_DECLARATION_ITEM',
+        'CUS_EDI_LOG', 'TRN_CONTAINER_MOVEMENT', 'BIL_AR_AGING')}
+    sql = {
+        'BIL_CHARGE': """INSERT INTO BIL_CHARGE (CHARGE_ID, SHIPMENT_ID, CHARGE_TYPE, CHARGE_CODE, CUSTOMER_ID,
+                         AMOUNT, INVOICE_ID, STATUS) VALUES (%s, %s, %s, %s, %s, %s, %s, %s)""",
+        'BIL_INVOICE_DETAIL': """INSERT INTO BIL_INVOICE_DETAIL (DETAIL_ID, INVOICE_ID, LINE_NO, CHARGE_ID,
+                                 SHIPMENT_ID, AMOUNT) VALUES (%s, %s, %s, %s, %s, %s)""",
+        'CUS_DECLARATION': """INSERT INTO CUS_DECLARATION (DECLARATION_ID, SHIPMENT_ID, DECLARATION_NO,
+                              DECLARATION_TYPE, DECLARATION_DATE, STATUS) VALUES (%s, %s, %s, %s, %s, %s)""",
+        'CUS_DECLARATION_ITEM': """INSERT INTO CUS_DECLARATION_ITEM (ITEM_ID, DECLARATION_ID, LINE_NO, HS_CODE,
+                                   AMOUNT) VALUES (%s, %s, %s, %s, %s)""",
+        'CUS_EDI_LOG': """INSERT INTO CUS_EDI_LOG (EDI_TYPE, DIRECTION, REFERENCE_ID, REFERENCE_TYPE, MESSAGE_ID,
+                          STATUS) VALUES (%s, %s, %s, %s, %s, %s)""",
+        'TRN_CONTAINER_MOVEMENT': """INSERT INTO TRN_CONTAINER_MOVEMENT (MOVEMENT_ID, CONTAINER_NO, SHIPMENT_ID,
+                                     MOVEMENT_TYPE, MOVEMENT_DATE) VALUES (%s, %s, %s, %s, %s)""",
+        'BIL_AR_AGING': """INSERT INTO BIL_AR_AGING (SNAPSHOT_DATE, CUSTOMER_ID, INVOICE_ID, BALANCE, AGING_BUCKET)
+                           VALUES (%s, %s, %s, %s, %s)""",
+    }
+
+    def flush(force=False):
+        for name, batch in rows.items():
+            if batch and (force or len(batch) >= BATCH_SIZE):
+                cursor.executemany(sql[name], batch)
+                batch.clear()
+        conn.commit()
+
+    rng = random.Random(shipments)
+    for i in range(shipments):
+        shipment_id = BENCH_KEY_BASE + i
+        invoice_id = bench_id('I', i)
+        declaration_id = bench_id('D', i)
+        customer_id = BENCH_KEY_BASE + i % 500
+        etd = BASE_DATE + timedelta(days=i % 365)
+
+        for line in range(3):
+            charge_id = bench_id('H', i * 3 + line)
+            amount = round(rng.uniform(50, 5000), 2)
+            rows['BIL_CHARGE'].append((charge_id, shipment_id, 'AR', f'CHG{line:02d}', customer_id,
+                                       amount, invoice_id, 'INVOICED'))
+            rows['BIL_INVOICE_DETAIL'].append((bench_id('L', i * 3 + line), invoice_id, line + 1,
+                                               charge_id, shipment_id, amount))
+        rows['CUS_DECLARATION'].append((declaration_id, shipment_id, f'DECL{i:012d}', 'EXPORT', etd, 'CLEARED'))
+        for line in range(2):
+            rows['CUS_DECLARATION_ITEM'].append((bench_id('T', i * 2 + line), declaration_id, line + 1,
+                                                 '8471300000', round(rng.uniform(100, 20000), 2)))
+            rows['CUS_EDI_LOG'].append(('CUSDEC', 'OUT', declaration_id, 'DECLARATION',
+                                        f'MSG{i:010d}{line}', 'ACK'))
+        container_no = f'BXCU{i:07d}'
+        for step, movement in enumerate(('GATE_IN', 'LOAD', 'DISCHARGE', 'GATE_OUT')):
+            rows['TRN_CONTAINER_MOVEMENT'].append((bench_id('M', i * 4 + step), container_no, shipment_id,
+                                                   movement, etd + timedelta(days=step * 7)))
+        rows['BIL_AR_AGING'].append((BASE_DATE + timedelta(days=i % SNAPSHOT_DAYS), customer_id, invoice_id,
+                                     round(rng.uniform(0, 10000), 2), 'CURRENT'))
+        flush()
+    flush(force=True)
+    cursor.close()
+
+
+def cleanup(conn):
+    cursor = conn.cursor()
+    like = BENCH_PREFIX + '%'
+    for table, column in [
+        ('BIL_CHARGE', 'CHARGE_ID'), ('BIL_INVOICE_DETAIL', 'DETAIL_ID'), ('CUS_DECLARATION', 'DECLARATION_ID'),
+        ('CUS_DECLARATION_ITEM', 'ITEM_ID'), ('CUS_EDI_LOG', 'REFERENCE_ID'),
+        ('TRN_CONTAINER_MOVEMENT', 'MOVEMENT_ID'), ('BIL_AR_AGING', 'INVOICE_ID'),
+    ]:
+        cursor.execute(f"DELETE FROM {table} WHERE {column} LIKE %s", (like,))
+        print(f"  [OK] {table}: {cursor.rowcount} rows removed")
+    conn.commit()
+    cursor.close()
+
+
+def pack_indexes():
+    """table -> [index names] of the part3 secondary indexes"""
+    model = SchemaModel.from_create_scripts()
+    return {t.name: [i.name for i in t.indexes.values() if not i.unique]
+            for t in model.tables.values() if t.domain in PART3_DOMAINS and t.indexes}
+
+
+def drop_pack(conn):
+    live = LiveSchema.read(conn)
+    cursor = conn.cursor()
+    for table, names in pack_indexes().items():
+        present = [n for n in names if n in live.indexes.get(table, {})]
+        if present:
+            cursor.execute(f"ALTER TABLE {table} " + ", ".join(f"DROP INDEX {n}" for n in present))
+    cursor.close()
+
+
+def sample_keys(shipments, samples):
+    rng = random.Random(samples)
+    keys = []
+    for _ in range(samples):
+        i = rng.randrange(shipments)
+        keys.append({
+            'shipment': BENCH_KEY_BASE + i,
+            'invoice': bench_id('I', i),
+            'declaration': bench_id('D', i),
+            'container': f'BXCU{i:07d}',
+            'snapshot': BASE_DATE + timedelta(days=i % SNAPSHOT_DAYS),
+        })
+    return keys
+
+
+def run_workload(conn, keys):
+    """name -> list of latencies in ms"""
+    cursor = conn.cursor()
+    timings = {name: [] for name, _, _ in WORKLOAD}
+    for key in keys:
+        for name, sql, param in WORKLOAD:
+            started = time.perf_counter()
+            cursor.execute(sql, (key[param],))
+            cursor.fetchall()
+            timings[name].append((time.perf_counter() - started) * 1000)
+    cursor.close()
+    return timings
+
+
+def print_comparison(before, after):
+    print(f"\n  {'query':<26}{'p50 before':>12}{'p50 after':>12}{'p95 before':>12}{'p95 after':>12}{'speedup':>10}")
+    for name, _, _ in WORKLOAD:
+        b50, a50 = percentile(before[name], 50), percentile(after[name], 50)
+        b95, a95 = percentile(before[name], 95), percentile(after[name], 95)
+        speedup = b50 / a50 if a50 else 0
+        print(f"  {name:<26}{b50:>10.2f}ms{a50:>10.2f}ms{b95:>10.2f}ms{a95:>10.2f}ms{speedup:>9.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Before/after benchmark of the part3 index pack")
+    parser.add_argument('--shipments', type=int, default=100000, help='synthetic shipments to seed')
+    parser.add_argument('--samples', type=int, default=200, help='lookups per query')
+    parser.add_argument('--skip-seed', action='store_true', help='reuse previously seeded BX rows')
+    parser.add_argument('--cleanup', action='store_true', help='remove seeded BX rows and exit')
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print(f"FMS Index Pack Benchmark ({args.shipments:,} shipments)")
+    print("=" * 60)
+
+    conn = get_connection()
+    try:
+        if args.cleanup:
+            cleanup(conn)
+            return
+
+        if not args.skip_seed:
+            print("\n=== Seeding ===")
+            started = time.perf_counter()
+            seed(conn, args.shipments)
+            print(f"  [OK] seeded in {time.perf_counter() - started:.1f}s")
+
+        keys = sample_keys(args.shipments, args.samples)
+
+        print("\n=== Without index pack ===")
+        drop_pack(conn)
+        cursor = conn.cursor()
+        cursor.execute("ANALYZE TABLE BIL_CHARGE, BIL_INVOICE_DETAIL, CUS_DECLARATION, "
+                       "CUS_DECLARATION_ITEM, CUS_EDI_LOG, TRN_CONTAINER_MOVEMENT, BIL_AR_AGING")
+        cursor.fetchall()
+        cursor.close()
+        before = run_workload(conn, keys)
+
+        print("\n=== Building index pack (online) ===")
+        started = time.perf_counter()
+        sync(domains=PART3_DOMAINS)
+        print(f"  index build: {time.perf_counter() - started:.1f}s")
+
+        print("\n=== With index pack ===")
+        after = run_workload(conn, keys)
+        print_comparison(before, after)
+
+    except Exception as e:
+        print(f"\nError: {e}")
+        conn.rollback()
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
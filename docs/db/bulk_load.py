@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+FMS Bulk Load Helpers
+Writes generated rows with multi-row INSERTs (executemany) or
+LOAD DATA LOCAL INFILE, and hands out key ranges so callers never need a
+LAST_INSERT_ID() round trip per row
+"""
+
+import os
+import tempfile
+from datetime import timedelta
+
+MODES = ('insert', 'infile')
+DEFAULT_MODE = 'infile'
+
+
+def key_range(cursor, table, key, count, prefix=None):
+    """
+    Next count keys above the current maximum of table.key.
+    BIGINT keys come back as ints; VARCHAR keys as prefix + zero-padded number.
+    Intended for single-writer seeding; concurrent writers need disjoint ranges.
+    """
+    if prefix is None:
+        cursor.execute(f"SELECT COALESCE(MAX({key}), 0) FROM {table}")
+        first = int(cursor.fetchone()[0]) + 1
+        return list(range(first, first + count))
+
+    cursor.execute(f"""
+        SELECT COALESCE(MAX(CAST(SUBSTRING({key}, {len(prefix) + 1}) AS UNSIGNED)), 0)
+        FROM {table} WHERE {key} LIKE %s
+    """, (prefix + '%',))
+    first = int(cursor.fetchone()[0]) + 1
+    return [f"{prefix}{n:010d}" for n in range(first, first + count)]
+
+
+def tsv_value(value):
+    """Encode a value for the default LOAD DATA format (tab separated, backslash escaped)"""
+    if value is None:
+        return '\\N'
+    if isinstance(value, bool):
+        return '1' if value else '0'
+    if isinstance(value, float):
+        return repr(value)
+    if isinstance(value, timedelta):
+        # TIME columns come back as timedelta; str() would give "1 day, 2:00:00"
+        seconds = int(value.total_seconds())
+        sign = '-' if seconds < 0 else ''
+        seconds = abs(seconds)
+        return f"{sign}{seconds // 3600:02d}:{seconds // 60 % 60:02d}:{seconds % 60:02d}"
+    text = str(value)
+    return text.replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n')
+
+
+def load_file(cursor, table, columns, path, ignore=False):
+    """
+    LOAD DATA LOCAL INFILE of a tab separated file; returns the rows loaded.
+    columns may contain @variables for fields that are read and discarded.
+    """
+    cursor.execute(f"""
+        LOAD DATA LOCAL INFILE %s {'IGNORE ' if ignore else ''}INTO TABLE {table}
+        CHARACTER SET utf8mb4 ({', '.join(columns)})
+    """, (path,))
+    return cursor.rowcount
+
+
+def warning_count(cursor):
+    """
+    Warnings of the last statement. LOAD DATA LOCAL and INSERT IGNORE skip duplicate
+    keys with a warning instead of an error, so skipped rows only show up here.
+    """
+    cursor.execute("SHOW COUNT(*) WARNINGS")
+    return int(cursor.fetchone()[0])
+
+
+class BulkLoader:
+    """
+    Loads table -> [row dict] batches in schema model order.
+    Columns unknown to the schema model are dropped, so generated rows survive DDL drift.
+    counts holds the rows the server reports as written, warnings the skipped or
+    converted rows (for insert mode, of the last statement executemany sent).
+    infile mode needs a connection opened with local_infile=True.
+    """
+
+    def __init__(self, conn, model, mode=DEFAULT_MODE, ignore=False):
+        if mode not in MODES:
+            raise ValueError(f"mode must be one of {', '.join(MODES)}")
+        self.conn = conn
+        self.model = model
+        self.mode = mode
+        self.ignore = ignore
+        self.counts = {}
+        self.warnings = {}
+
+    def columns(self, table, rows):
+        known = self.model.tables[table].columns
+        return [c for c in rows[0] if c in known]
+
+    def load(self, cursor, table, rows):
+        columns = self.columns(table, rows)
+        if self.mode == 'insert':
+            # pymysql folds executemany() of a plain INSERT into multi-row statements
+            cursor.executemany(
+                f"INSERT {'IGNORE ' if self.ignore else ''}INTO {table} ({', '.join(columns)}) "
+                f"VALUES ({', '.join(['%s'] * len(columns))})",
+                [tuple(r[c] for c in columns) for r in rows])
+        else:
+            self.load_infile(cursor, table, columns, rows)
+        self.counts[table] = self.counts.get(table, 0) + cursor.rowcount
+        warnings = warning_count(cursor)
+        if warnings:
+            self.warnings[table] = self.warnings.get(table, 0) + warnings
+
+    def load_infile(self, cursor, table, columns, rows):
+        # pymysql streams LOCAL INFILE from a path, so the batch is spooled to a temp file
+        with tempfile.NamedTemporaryFile('w', suffix='.tsv', encoding='utf-8', newline='\n',
+                                         delete=False) as f:
+            for r in rows:
+                f.write('\t'.join(tsv_value(r[c]) for c in columns))
+                f.write('\n')
+        try:
+            load_file(cursor, table, columns, f.name, self.ignore)
+        finally:
+            os.unlink(f.name)
+
+    def write(self, rows):
+        """Load every table of a batch and commit it as one unit"""
+        with self.conn.cursor() as cursor:
+            for table in self.model.tables:
+                if rows.get(table):
+                    self.load(cursor, table, rows[table])
+        self.conn.commit()
@@ -387,6 +387,18 @@ def create_master_tables(cursor):
         ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='사용자 마스터'
     """, "MST_USER")
 
+    # 1.16 문서번호 시퀀스
+    execute_sql(cursor, """
+        CREATE TABLE IF NOT EXISTS MST_SEQUENCE (
+            SEQ_NM              VARCHAR(50)     PRIMARY KEY COMMENT '시퀀스명 (번호 접두어, 예: HBL2026)',
+            NEXT_VAL            BIGINT          NOT NULL DEFAULT 1 COMMENT '다음 할당 시작값',
+            CREATED_BY          VARCHAR(50),
+            CREATED_DTM         DATETIME        DEFAULT CURRENT_TIMESTAMP,
+            UPDATED_BY          VARCHAR(50),
+            UPDATED_DTM         DATETIME        ON UPDATE CURRENT_TIMESTAMP
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='문서번호 시퀀스 (블록 단위 할당)'
+    """, "MST_SEQUENCE")
+
 def create_schedule_tables(cursor):
     """02. Schedule Tables (스케줄)"""
     print("\n=== 02. Schedule Tables (스케줄) ===")
@@ -624,10 +636,13 @@ def create_order_tables(cursor):
             UPDATED_BY          VARCHAR(50),
             UPDATED_DTM         DATETIME        ON UPDATE CURRENT_TIMESTAMP,
             DEL_YN              CHAR(1)         DEFAULT 'N',
-            INDEX IDX_SHIPMENT_CUSTOMER (CUSTOMER_ID),
+            INDEX IDX_SHIPMENT_CUSTOMER (CUSTOMER_ID, DEL_YN, CREATED_DTM),
             INDEX IDX_SHIPMENT_CARRIER (CARRIER_ID),
             INDEX IDX_SHIPMENT_ETD (ETD_DT),
-            INDEX IDX_SHIPMENT_STATUS (STATUS_CD)
+            INDEX IDX_SHIPMENT_STATUS (STATUS_CD),
+            INDEX IDX_SHIPMENT_DEL_CREATED (DEL_YN, CREATED_DTM),
+            INDEX IDX_SHIPMENT_DEL_STATUS (DEL_YN, STATUS_CD, CREATED_DTM),
+            INDEX IDX_SHIPMENT_DEL_MODE (DEL_YN, TRANSPORT_MODE_CD, CREATED_DTM)
         ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='선적건 (Shipment)'
     """, "ORD_SHIPMENT")
 
@@ -830,7 +845,8 @@ def create_order_tables(cursor):
             EVENT_DESC          VARCHAR(500)    COMMENT '이벤트설명',
             SOURCE_CD           VARCHAR(20)     COMMENT '출처',
             CREATED_BY          VARCHAR(50),
-            CREATED_DTM         DATETIME        DEFAULT CURRENT_TIMESTAMP
+            CREATED_DTM         DATETIME        DEFAULT CURRENT_TIMESTAMP,
+            INDEX IDX_STATUS_HIST_SHIPMENT (SHIPMENT_ID, EVENT_DTM)
         ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='Shipment 상태 이력'
     """, "ORD_SHIPMENT_STATUS_HIST")
 
@@ -854,41 +870,17 @@ def create_order_tables(cursor):
     """, "ORD_ATTACHMENT")
 
 def main():
-    """Main execution"""
+    """Main execution - applies only what the live schema is missing (see schema_model.py)"""
+    from schema_model import sync
+
     print("=" * 60)
     print("FMS Database Table Creation")
     print("=" * 60)
 
-    conn = get_connection()
-    cursor = conn.cursor()
-
     try:
-        # Set SQL mode
-        cursor.execute("SET FOREIGN_KEY_CHECKS = 0")
-
-        # Create tables
-        create_master_tables(cursor)
-        create_schedule_tables(cursor)
-        create_order_tables(cursor)
-
-        # Re-enable foreign key checks
-        cursor.execute("SET FOREIGN_KEY_CHECKS = 1")
-
-        conn.commit()
-
-        # Show results
-        cursor.execute("SHOW TABLES")
-        tables = cursor.fetchall()
-        print("\n" + "=" * 60)
-        print(f"Total tables created: {len(tables)}")
-        print("=" * 60)
-
+        sync(domains=["01. Master Tables", "02. Schedule Tables", "03. Order Tables"])
     except Exception as e:
         print(f"\nError: {e}")
-        conn.rollback()
-    finally:
-        cursor.close()
-        conn.close()
 
 if __name__ == "__main__":
     main()
@@ -84,7 +84,10 @@ def create_bl_tables(cursor):
             UPDATED_DTM         DATETIME        ON UPDATE CURRENT_TIMESTAMP,
             DEL_YN              CHAR(1)         DEFAULT 'N',
             INDEX IDX_MBL_SHIPMENT (SHIPMENT_ID),
-            INDEX IDX_MBL_CARRIER (CARRIER_ID)
+            INDEX IDX_MBL_CARRIER (CARRIER_ID, DEL_YN, CREATED_DTM),
+            INDEX IDX_MBL_DEL_CREATED (DEL_YN, CREATED_DTM),
+            INDEX IDX_MBL_DEL_STATUS (DEL_YN, STATUS_CD, CREATED_DTM),
+            INDEX IDX_MBL_UPDATED (UPDATED_DTM)
         ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='Master B/L (해상)'
     """, "BL_MASTER_BL")
 
@@ -153,8 +156,11 @@ def create_bl_tables(cursor):
             UPDATED_DTM         DATETIME        ON UPDATE CURRENT_TIMESTAMP,
             DEL_YN              CHAR(1)         DEFAULT 'N',
             INDEX IDX_HBL_SHIPMENT (SHIPMENT_ID),
-            INDEX IDX_HBL_MBL (MBL_ID),
-            INDEX IDX_HBL_CUSTOMER (CUSTOMER_ID)
+            INDEX IDX_HBL_MBL (MBL_ID, DEL_YN),
+            INDEX IDX_HBL_CUSTOMER (CUSTOMER_ID),
+            INDEX IDX_HBL_DEL_CREATED (DEL_YN, CREATED_DTM),
+            INDEX IDX_HBL_DEL_STATUS (DEL_YN, STATUS_CD, CREATED_DTM),
+            INDEX IDX_HBL_UPDATED (UPDATED_DTM)
         ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='House B/L (해상)'
     """, "BL_HOUSE_BL")
 
@@ -653,39 +659,123 @@ def create_shipment_tables(cursor):
             CREATED_BY          VARCHAR(50),
             CREATED_DTM         DATETIME        DEFAULT CURRENT_TIMESTAMP,
             INDEX IDX_TRACKING_SHIPMENT (SHIPMENT_ID),
-            INDEX IDX_TRACKING_DTM (EVENT_DTM)
+            INDEX IDX_TRACKING_DTM (EVENT_DTM),
+            INDEX IDX_TRACKING_MBL (MBL_ID, EVENT_DTM),
+            INDEX IDX_TRACKING_MAWB (MAWB_ID, EVENT_DTM)
         ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='화물 추적 이벤트'
     """, "SHP_TRACKING_EVENT")
 
-def main():
-    print("=" * 60)
-    print("FMS Database Table Creation - Part 2")
-    print("=" * 60)
+    # Status Count (대시보드 상태별 건수 롤업)
+    execute_sql(cursor, """
+        CREATE TABLE IF NOT EXISTS SHP_STATUS_COUNT (
+            STATUS_CD           VARCHAR(20)     NOT NULL COMMENT '상태코드',
+            TRANSPORT_MODE_CD   VARCHAR(10)     NOT NULL COMMENT '운송모드',
+            SHIPMENT_CNT        BIGINT          NOT NULL DEFAULT 0 COMMENT '선적건수',
+            UPDATED_DTM         DATETIME        COMMENT '갱신일시',
+            PRIMARY KEY (STATUS_CD, TRANSPORT_MODE_CD)
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='선적 상태별 건수'
+    """, "SHP_STATUS_COUNT")
 
-    conn = get_connection()
-    cursor = conn.cursor()
+    # Status Rollup Checkpoint (status_rollup.py, STATUS_COUNT 행 = 최초 재집계 완료)
+    execute_sql(cursor, """
+        CREATE TABLE IF NOT EXISTS STATUS_ROLLUP_CHECKPOINT (
+            JOB_NM              VARCHAR(50)     NOT NULL,
+            LAST_HIST_ID        BIGINT          DEFAULT 0 COMMENT '마지막 확인 이력 ID',
+            UPDATED_DTM         DATETIME        DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+            PRIMARY KEY (JOB_NM)
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='상태 건수 재집계 체크포인트'
+    """, "STATUS_ROLLUP_CHECKPOINT")
 
-    try:
-        cursor.execute("SET FOREIGN_KEY_CHECKS = 0")
+    # Route Geometry (추적 지도 경로 캐시)
+    execute_sql(cursor, """
+        CREATE TABLE IF NOT EXISTS SHP_ROUTE_GEOMETRY (
+            TRANSPORT_MODE_CD   VARCHAR(10)     NOT NULL COMMENT '운송모드 (SEA/AIR)',
+            ORIGIN_CD           VARCHAR(10)     NOT NULL COMMENT '출발 항구/공항',
+            DEST_CD             VARCHAR(10)     NOT NULL COMMENT '도착 항구/공항',
+            GEOMETRY_VER        INT             NOT NULL COMMENT '경로 계산 버전',
+            DISTANCE_KM         DECIMAL(10,1)   COMMENT '경로 거리(km)',
+            POINT_CNT           INT             COMMENT '경로 좌표 수',
+            PATH_JSON           MEDIUMTEXT      NOT NULL COMMENT '경로 [[위도,경도]...] (지도 기준 연속 경도)',
+            SEGMENTS_JSON       MEDIUMTEXT      NOT NULL COMMENT '날짜변경선 분할 경로 (경도 -180~180)',
+            CROSS_DATELINE_YN   CHAR(1)         DEFAULT 'N' COMMENT '날짜변경선 횡단여부',
+            CREATED_DTM         DATETIME        DEFAULT CURRENT_TIMESTAMP,
+            UPDATED_DTM         DATETIME        ON UPDATE CURRENT_TIMESTAMP,
+            PRIMARY KEY (TRANSPORT_MODE_CD, ORIGIN_CD, DEST_CD, GEOMETRY_VER)
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='추적 지도 경로 캐시'
+    """, "SHP_ROUTE_GEOMETRY")
+
+    # Tracking Snapshot (추적 지도 MBL/MAWB별 요약)
+    execute_sql(cursor, """
+        CREATE TABLE IF NOT EXISTS SHP_TRACKING_SNAPSHOT (
+            SNAPSHOT_ID         BIGINT          PRIMARY KEY AUTO_INCREMENT,
+            TRANSPORT_MODE_CD   VARCHAR(10)     NOT NULL COMMENT '운송모드 (SEA/AIR)',
+            MASTER_ID           BIGINT          NOT NULL COMMENT 'MBL_ID / MAWB_ID',
+            MASTER_NO           VARCHAR(50)     NOT NULL COMMENT 'MBL / MAWB 번호',
+            SHIPMENT_ID         BIGINT          COMMENT '선적건',
+            MASTER_CREATED_DTM  DATETIME        NOT NULL COMMENT 'MBL / MAWB 등록일시',
+            ORIGIN_CD           VARCHAR(10)     COMMENT '출발 항구/공항',
+            DEST_CD             VARCHAR(10)     COMMENT '도착 항구/공항',
+            ROUTE_KEY           VARCHAR(30)     COMMENT '경로 키 (SHP_ROUTE_GEOMETRY)',
+            STATUS_CD           VARCHAR(20)     COMMENT '상태',
+            CARRIER_NM          VARCHAR(100)    COMMENT '선사명 / 항공사코드',
+            VESSEL_FLIGHT       VARCHAR(100)    COMMENT '선명 / 편명',
+            VOYAGE_NO           VARCHAR(30)     COMMENT '항차',
+            TRADE_TYPE_CD       VARCHAR(10)     COMMENT 'B/L유형 (항공은 AIR)',
+            SHIPPER_NM          VARCHAR(200)    COMMENT '발송인명',
+            ETD_DT              DATE            COMMENT '출발예정일',
+            ATD_DT              DATE            COMMENT '실제출발일',
+            ETA_DT              DATE            COMMENT '도착예정일',
+            ATA_DT              DATE            COMMENT '실제도착일',
+            PKG_QTY             INT             COMMENT '총수량',
+            PKG_TYPE_CD         VARCHAR(10)     COMMENT '포장유형',
+            GROSS_WEIGHT_KG     DECIMAL(12,3)   COMMENT '총중량',
+            VOLUME_CBM          DECIMAL(12,4)   COMMENT '총부피',
+            HOUSE_CNT           INT             DEFAULT 0 COMMENT 'HBL / HAWB 건수',
+            HOUSE_PKG_QTY       INT             DEFAULT 0 COMMENT 'House 합계 수량',
+            HOUSE_WEIGHT_KG     DECIMAL(14,3)   DEFAULT 0 COMMENT 'House 합계 중량',
+            FIRST_HOUSE_ID      BIGINT          COMMENT '대표 House ID',
+            FIRST_HOUSE_NO      VARCHAR(50)     COMMENT '대표 House 번호',
+            MILESTONE_CD        VARCHAR(20)     COMMENT '최근 이벤트코드',
+            MILESTONE_NM        VARCHAR(100)    COMMENT '최근 이벤트명',
+            MILESTONE_DTM       DATETIME        COMMENT '최근 이벤트일시',
+            MILESTONE_LOCATION_CD VARCHAR(10)   COMMENT '최근 이벤트 위치',
+            PROGRESS_PCT        TINYINT         DEFAULT 0 COMMENT '진행률(%)',
+            CREATED_DTM         DATETIME        DEFAULT CURRENT_TIMESTAMP,
+            UPDATED_DTM         DATETIME        ON UPDATE CURRENT_TIMESTAMP,
+            DEL_YN              CHAR(1)         DEFAULT 'N' COMMENT '원본 삭제여부 (변경분 조회용)',
+            UNIQUE KEY UK_SNAPSHOT_MASTER (TRANSPORT_MODE_CD, MASTER_ID),
+            INDEX IDX_SNAPSHOT_LIST (DEL_YN, TRANSPORT_MODE_CD, MASTER_CREATED_DTM, MASTER_ID),
+            INDEX IDX_SNAPSHOT_STATUS (DEL_YN, TRANSPORT_MODE_CD, STATUS_CD, MASTER_CREATED_DTM, MASTER_ID),
+            INDEX IDX_SNAPSHOT_DEL_CREATED (DEL_YN, CREATED_DTM),
+            INDEX IDX_SNAPSHOT_UPDATED (UPDATED_DTM),
+            INDEX IDX_SNAPSHOT_ROUTE (DEL_YN, ROUTE_KEY)
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='추적 지도 요약'
+    """, "SHP_TRACKING_SNAPSHOT")
 
-        create_bl_tables(cursor)
-        create_shipment_tables(cursor)
+    # Route Geocell (추적 지도 경로 공간 인덱스)
+    execute_sql(cursor, """
+        CREATE TABLE IF NOT EXISTS SHP_ROUTE_GEOCELL (
+            GEOHASH             CHAR(3)         NOT NULL COMMENT 'geohash 셀',
+            TRANSPORT_MODE_CD   VARCHAR(10)     NOT NULL COMMENT '운송모드 (SEA/AIR)',
+            ORIGIN_CD           VARCHAR(10)     NOT NULL COMMENT '출발 항구/공항',
+            DEST_CD             VARCHAR(10)     NOT NULL COMMENT '도착 항구/공항',
+            GEOMETRY_VER        INT             NOT NULL COMMENT '경로 계산 버전',
+            PRIMARY KEY (GEOHASH, GEOMETRY_VER, TRANSPORT_MODE_CD, ORIGIN_CD, DEST_CD),
+            INDEX IDX_GEOCELL_PAIR (TRANSPORT_MODE_CD, ORIGIN_CD, DEST_CD, GEOMETRY_VER)
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='추적 지도 경로 공간 인덱스'
+    """, "SHP_ROUTE_GEOCELL")
 
-        cursor.execute("SET FOREIGN_KEY_CHECKS = 1")
-        conn.commit()
+def main():
+    from schema_model import sync
 
-        cursor.execute("SHOW TABLES")
-        tables = cursor.fetchall()
-        print("\n" + "=" * 60)
-        print(f"Total tables: {len(tables)}")
-        print("=" * 60)
+    print("=" * 60)
+    print("FMS Database Table Creation - Part 2")
+    print("=" * 60)
 
+    try:
+        sync(domains=["04. B/L Tables", "05. Shipment Tables"])
     except Exception as e:
         print(f"\nError: {e}")
-        conn.rollback()
-    finally:
-        cursor.close()
-        conn.close()
 
 if __name__ == "__main__":
     main()
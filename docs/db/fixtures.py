@@ -0,0 +1,419 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+FMS Schema Fixtures
+Fixture rows generated from the schema model itself: every column gets a value
+generator derived from its type, length, name suffix, DEFAULT and COMMENT
+(e.g. 'Movement Type (GATE_IN/GATE_OUT/LOAD/DISCHARGE)'), reference columns
+pick keys of existing parent rows, and primary / unique keys get serial
+values numbered above the existing keys. Rows therefore always carry exactly
+the columns the DDL defines.
+--check lists INSERT column lists in the sample scripts that drifted from it
+"""
+
+import argparse
+import random
+import re
+import time
+from datetime import timedelta, time as clock
+from graphlib import TopologicalSorter
+
+import pymysql
+
+from bulk_load import BulkLoader, MODES, key_range
+from generate_data import DEFAULT_ANCHOR, HISTORY_DAYS, FUTURE_DAYS
+from insert_sample_data import COUNTRIES, PORTS, CURRENCIES, HS_CODES
+from provision_schema import DB_CONFIG
+from schema_model import SchemaModel, LiveSchema, base_type
+
+SAMPLE_SCRIPTS = ('insert_sample_data.py', 'insert_sample_data_v2.py', 'insert_sample_quick.py')
+DEFAULT_ROWS = 1_000
+DEFAULT_BATCH = 5_000
+# Parent keys sampled per referenced table
+REF_SAMPLE = 10_000
+FIXTURE_USER = 'fixtures'
+SERIAL_PREFIX = 'FX'
+
+INSERT_RE = re.compile(r'INSERT\s+(?:IGNORE\s+)?INTO\s+(\w+)\s*\(([^)]*)\)', re.I)
+ENUM_RE = re.compile(r'\(([^()]*/[^()]*)\)')
+DEFAULT_RE = re.compile(r"\bDEFAULT\s+(?:'([^']*)'|(-?\d+(?:\.\d+)?))", re.I)
+INTEGER_MAX = {'tinyint': 100, 'smallint': 10_000, 'int': 100_000, 'bigint': 1_000_000}
+# Coordinate columns stay inside their valid range whatever the DECIMAL precision allows
+COORDINATE_BOUNDS = [
+    (re.compile(r'LATITUDE$|_LAT$'), 90),
+    (re.compile(r'LONGITUDE$|_LNG$|_LON$'), 180),
+]
+
+# Columns holding master codes draw from the sample master lists
+KNOWN_CODES = [
+    (re.compile(r'COUNTRY_CD$'), [c[0] for c in COUNTRIES]),
+    (re.compile(r'PORT_CD$|^(POL|POD|POR|FDEST)_CD$'), [p[0] for p in PORTS]),
+    (re.compile(r'CURRENCY_CD$|_CURR$'), [c[0] for c in CURRENCIES]),
+    (re.compile(r'^HS_CODE$'), [h[0] for h in HS_CODES]),
+]
+
+
+def get_connection(local_infile=False):
+    return pymysql.connect(**DB_CONFIG, local_infile=local_infile)
+
+
+def type_args(column_type):
+    """'decimal(18,6)' -> [18, 6], 'varchar(30)' -> [30], 'date' -> []"""
+    match = re.search(r'\(([\d,\s]+)\)', column_type)
+    return [int(a) for a in match.group(1).split(',')] if match else []
+
+
+def comment_choices(column):
+    """Values listed in the column comment, if they fit the column"""
+    match = ENUM_RE.search(column.comment)
+    if not match or base_type(column.column_type) not in ('varchar', 'char'):
+        return None
+    values = [v.strip() for v in re.sub(r'\s+etc\.?$', '', match.group(1)).split('/')]
+    length = (type_args(column.column_type) or [255])[0]
+    if all(re.fullmatch(r'[A-Z0-9_+\-]+', v) and len(v) <= length for v in values):
+        return values
+    return None
+
+
+def default_value(column):
+    match = DEFAULT_RE.search(column.definition)
+    if not match:
+        return None
+    if match.group(1) is not None:
+        return match.group(1)
+    return float(match.group(2)) if '.' in match.group(2) else int(match.group(2))
+
+
+def serial_value(column, serial, anchor):
+    """Value that differs for every serial (unique key columns)"""
+    kind = base_type(column.column_type)
+    if kind in INTEGER_MAX or kind == 'decimal':
+        return serial
+    if kind in ('date', 'datetime', 'timestamp'):
+        value = anchor - timedelta(days=serial)
+        return value.date() if kind == 'date' else value
+    length = (type_args(column.column_type) or [255])[0]
+    text = f"{SERIAL_PREFIX}{serial:010d}"
+    if len(text) <= length:
+        return text
+    # Short codes: base 36, still distinct up to 36 ** length values
+    digits = ''
+    while serial:
+        serial, d = divmod(serial, 36)
+        digits = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ'[d] + digits
+    return digits[-length:].rjust(length, '0')
+
+
+def serial_capacity(column):
+    """Distinct values serial_value() gives a string column before repeating, or None if unbounded"""
+    if base_type(column.column_type) not in ('varchar', 'char'):
+        return None
+    length = (type_args(column.column_type) or [255])[0]
+    return None if len(SERIAL_PREFIX) + 10 <= length else 36 ** length
+
+
+def value_generator(column, anchor):
+    """(rng, serial) -> value for one column, from its name, type, comment and DEFAULT"""
+    name = column.name
+    kind = base_type(column.column_type)
+    args = type_args(column.column_type)
+    label = column.comment or name.title().replace('_', ' ')
+
+    choices = comment_choices(column)
+    if choices:
+        return lambda rng, serial: rng.choice(choices)
+    for pattern, codes in KNOWN_CODES:
+        if pattern.search(name):
+            length = (args or [255])[0]
+            fitting = [c for c in codes if len(c) <= length]
+            if fitting:
+                return lambda rng, serial: rng.choice(fitting)
+    default = default_value(column)
+    if default is not None:
+        return lambda rng, serial: default
+    if name.endswith('_YN'):
+        return lambda rng, serial: rng.choice('YN')
+    if name == 'CREATED_BY' or name == 'UPDATED_BY':
+        return lambda rng, serial: FIXTURE_USER
+
+    if kind in ('date', 'datetime', 'timestamp'):
+        def when(rng, serial):
+            value = anchor + timedelta(minutes=rng.randrange(-HISTORY_DAYS * 1440, FUTURE_DAYS * 1440))
+            return value.date() if kind == 'date' else value
+        return when
+    if kind == 'time':
+        return lambda rng, serial: clock(rng.randrange(24), rng.randrange(0, 60, 5))
+    if kind in INTEGER_MAX:
+        high = 1_000 if name.endswith(('_QTY', '_CNT', '_COUNT')) else INTEGER_MAX[kind]
+        return lambda rng, serial: rng.randint(0, high)
+    for pattern, bound in COORDINATE_BOUNDS:
+        if kind in ('decimal', 'float', 'double') and pattern.search(name):
+            digits = (args + [10, 6][len(args):])[1] if kind == 'decimal' else 6
+            return lambda rng, serial: round(rng.uniform(-bound, bound), digits)
+    if kind == 'decimal':
+        precision, scale = (args + [10, 0][len(args):])[:2]
+        high = min(10 ** (precision - scale) - 1, 100 if name.endswith('_RATE') else 100_000)
+        return lambda rng, serial: round(rng.uniform(0, high), scale)
+    if kind in ('text', 'longtext'):
+        return lambda rng, serial: f"{label} {serial}"
+
+    length = (args or [255])[0]
+    if 'EMAIL' in name:
+        return lambda rng, serial: f"user{serial}@example.com"[-length:]
+    if name.endswith(('TEL_NO', 'FAX_NO', 'MOBILE', 'PHONE')):
+        return lambda rng, serial: f"02-{rng.randrange(1000, 10000)}-{rng.randrange(10000):04d}"[:length]
+    if name.endswith(('_NO', '_CD', '_CODE')) or length <= 10:
+        return lambda rng, serial: serial_value(column, serial, anchor)
+    return lambda rng, serial: f"{label} {serial}"[:length]
+
+
+class FixtureGenerator:
+    """
+    Rows for any model table. Reference columns (named like another table's
+    single-column primary key) draw from self.refs[owner], the parent keys
+    loaded by load_refs(); NOT NULL references without parent rows raise.
+    """
+
+    def __init__(self, model, seed=1, anchor=DEFAULT_ANCHOR):
+        self.model = model
+        self.seed = seed
+        self.anchor = anchor
+        self.refs = {}
+        self.owners = {}
+        for table in model.tables.values():
+            if len(table.primary_key) == 1:
+                self.owners.setdefault(table.primary_key[0], []).append(table.name)
+        self.plans = {}
+
+    def references(self, table):
+        """column -> parent tables for the reference columns of table"""
+        t = self.model.tables[table]
+        return {c: [o for o in self.owners[c] if o != table] for c in t.columns
+                if c in self.owners and t.primary_key != [c] and set(self.owners[c]) - {table}}
+
+    def serial_columns(self, table):
+        """Primary / unique key columns that take serial_value()"""
+        t = self.model.tables[table]
+        columns = {index.columns[-1] for index in t.indexes.values() if index.unique}
+        if t.primary_key:
+            columns.add(t.primary_key[-1])
+        return columns
+
+    def plan(self, table):
+        """[(column, generator)]; auto-increment keys are left to the database"""
+        if table not in self.plans:
+            t = self.model.tables[table]
+            references = self.references(table)
+            serial_columns = self.serial_columns(table)
+            plan = []
+            for column in t.columns.values():
+                if 'AUTO_INCREMENT' in column.definition.upper():
+                    continue
+                if column.name in references:
+                    plan.append((column.name, self.reference(t, column, references[column.name])))
+                elif column.name in serial_columns:
+                    plan.append((column.name, lambda rng, serial, c=column: serial_value(c, serial, self.anchor)))
+                else:
+                    plan.append((column.name, value_generator(column, self.anchor)))
+            self.plans[table] = plan
+        return self.plans[table]
+
+    def reference(self, table, column, owners):
+        def pick(rng, serial):
+            for owner in owners:
+                keys = self.refs.get(owner)
+                if keys:
+                    return rng.choice(keys)
+            if column.nullable:
+                return None
+            raise ValueError(f"{table.name}.{column.name}: no {' / '.join(owners)} rows to reference")
+        return pick
+
+    def rows(self, table, count, start=1, keys=None):
+        """count rows with serials start, start + 1, ...; keys fills a non-generated primary key"""
+        rng = random.Random(f"{self.seed}:{table}:{start}")
+        plan = self.plan(table)
+        pk = self.model.tables[table].primary_key
+        rows = []
+        for n in range(count):
+            serial = start + n
+            row = {name: generate(rng, serial) for name, generate in plan}
+            if keys and len(pk) == 1:
+                row[pk[0]] = keys[n]
+            rows.append(row)
+        return rows
+
+
+def load_refs(cursor, generator, table):
+    """Sample the keys of every table referenced by table"""
+    for owners in generator.references(table).values():
+        for owner in owners:
+            if owner not in generator.refs:
+                key = generator.model.tables[owner].primary_key[0]
+                cursor.execute(f"SELECT {key} FROM {owner} ORDER BY {key} DESC LIMIT {REF_SAMPLE}")
+                generator.refs[owner] = [row[0] for row in cursor.fetchall()]
+
+
+def next_serial(cursor, generator, table):
+    """First serial above every value serial_value() could have produced in the existing rows"""
+    t = generator.model.tables[table]
+    last = 0
+    for name in sorted(generator.serial_columns(table) - set(generator.references(table))):
+        column = t.columns[name]
+        kind = base_type(column.column_type)
+        if 'AUTO_INCREMENT' in column.definition.upper() or kind in ('date', 'datetime', 'timestamp'):
+            continue
+        if kind in INTEGER_MAX or kind == 'decimal':
+            cursor.execute(f"SELECT COALESCE(MAX({name}), 0) FROM {table}")
+        elif serial_capacity(column) is None:
+            cursor.execute(f"""
+                SELECT COALESCE(MAX(CAST(SUBSTRING({name}, {len(SERIAL_PREFIX) + 1}) AS UNSIGNED)), 0)
+                FROM {table} WHERE {name} LIKE %s
+            """, (SERIAL_PREFIX + '%',))
+        else:
+            # Short codes are base 36; codes such as 'KR' in the sample data decode the same way
+            cursor.execute(f"SELECT COALESCE(MAX(CAST(CONV({name}, 36, 10) AS UNSIGNED)), 0) FROM {table}")
+        last = max(last, int(cursor.fetchone()[0]))
+    return last + 1
+
+
+def preflight(model, live, generator, targets, rows, starts):
+    """Everything that would make a load fail halfway, checked before the first row is written"""
+    problems = []
+    for table in targets:
+        if table not in live.tables:
+            problems.append(f"{table}: table missing in the database")
+            continue
+        t = model.tables[table]
+        if len(t.primary_key) == 1:
+            pk = t.columns[t.primary_key[0]]
+            capacity = serial_capacity(pk)
+            if capacity is not None and starts[table] - 1 + rows > capacity:
+                problems.append(f"{table}.{pk.name}: {pk.column_type} holds only {capacity:,} generated keys"
+                                f" and the existing keys already reach {starts[table] - 1:,}")
+        missing = [c for c in model.tables[table].columns if c not in live.columns[table]]
+        if missing:
+            problems.append(f"{table}: columns missing in the database: {', '.join(missing)}")
+        for column, owners in generator.references(table).items():
+            if model.tables[table].columns[column].nullable:
+                continue
+            if not any(generator.refs.get(o) or o in targets for o in owners):
+                problems.append(f"{table}.{column}: no {' / '.join(owners)} rows to reference")
+    return problems
+
+
+def load_fixtures(tables, rows=DEFAULT_ROWS, batch=DEFAULT_BATCH, seed=1, mode='insert'):
+    model = SchemaModel.from_create_scripts()
+    unknown = [t for t in tables if t not in model.tables]
+    if unknown:
+        raise ValueError(f"not in the schema model: {', '.join(unknown)}")
+    graph = model.dependency_graph()
+    # Parents first, so children of tables loaded in this run can reference them
+    targets = [t for t in TopologicalSorter({t: graph[t] & set(tables) for t in tables}).static_order()]
+    generator = FixtureGenerator(model, seed)
+
+    conn = get_connection(local_infile=mode == 'infile')
+    try:
+        live = LiveSchema.read(conn)
+        starts = {}
+        with conn.cursor() as cursor:
+            for table in targets:
+                if table in live.tables:
+                    load_refs(cursor, generator, table)
+                    starts[table] = next_serial(cursor, generator, table)
+        problems = preflight(model, live, generator, targets, rows, starts)
+        if problems:
+            for problem in problems:
+                print(f"  [FAIL] {problem}")
+            print("\nNothing loaded; run schema_model.py or load the parent tables first")
+            return
+
+        # Re-runs skip rows whose unique keys already exist instead of failing
+        loader = BulkLoader(conn, model, mode, ignore=True)
+        print(f"\n=== Fixtures ({len(targets)} tables x {rows:,} rows) ===")
+        for table in targets:
+            started = time.perf_counter()
+            t = model.tables[table]
+            with conn.cursor() as cursor:
+                load_refs(cursor, generator, table)
+                start = starts[table]
+                # Integer keys continue above MAX(); string keys come from serial_value() sized to the column
+                integer_key = (len(t.primary_key) == 1
+                               and 'AUTO_INCREMENT' not in t.columns[t.primary_key[0]].definition.upper()
+                               and base_type(t.columns[t.primary_key[0]].column_type) in INTEGER_MAX)
+                for offset in range(0, rows, batch):
+                    count = min(batch, rows - offset)
+                    keys = None
+                    if integer_key:
+                        keys = key_range(cursor, table, t.primary_key[0], count)
+                    loader.write({table: generator.rows(table, count, start + offset, keys)})
+            # Children loaded later in this run sample the new rows too
+            generator.refs.pop(table, None)
+            skipped = loader.warnings.get(table, 0)
+            print(f"  [OK] {table:<32} {loader.counts.get(table, 0):>10,} rows {time.perf_counter() - started:8.1f}s"
+                  f"{f'  ({skipped:,} warnings)' if skipped else ''}")
+    finally:
+        conn.close()
+
+
+def check_scripts(model, scripts=SAMPLE_SCRIPTS):
+    """Compare the INSERT column lists of the sample scripts with the schema model"""
+    drifted = 0
+    for script in scripts:
+        with open(script, encoding='utf-8') as f:
+            source = f.read()
+        print(f"\n=== {script} ===")
+        for table, column_list in INSERT_RE.findall(source):
+            table = table.upper()
+            columns = [c.strip().upper() for c in column_list.split(',')]
+            if table not in model.tables:
+                print(f"  [FAIL] {table}: not in the schema model")
+                drifted += 1
+                continue
+            t = model.tables[table]
+            unknown = [c for c in columns if c not in t.columns]
+            required = [c.name for c in t.columns.values()
+                        if not c.nullable and c.name not in columns and default_value(c) is None
+                        and not re.search(r'AUTO_INCREMENT|DEFAULT\s+CURRENT_TIMESTAMP', c.definition, re.I)]
+            if unknown or required:
+                drifted += 1
+                detail = []
+                if unknown:
+                    detail.append(f"unknown {', '.join(unknown)}")
+                if required:
+                    detail.append(f"missing NOT NULL {', '.join(required)}")
+                print(f"  [FAIL] {table}: {'; '.join(detail)}")
+            else:
+                print(f"  [OK] {table}")
+    print(f"\n{drifted} drifted INSERT statements")
+    return drifted
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate fixture rows from the FMS schema model")
+    parser.add_argument('tables', nargs='*', help='tables to load (parents are loaded first)')
+    parser.add_argument('--rows', type=int, default=DEFAULT_ROWS, help='rows per table')
+    parser.add_argument('--batch', type=int, default=DEFAULT_BATCH, help='rows per commit')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--mode', choices=MODES, default='insert',
+                        help='insert: multi-row INSERT, infile: LOAD DATA LOCAL INFILE')
+    parser.add_argument('--check', action='store_true', help='lint the sample scripts against the schema model')
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("FMS Schema Fixtures")
+    print("=" * 60)
+
+    try:
+        if args.check:
+            check_scripts(SchemaModel.from_create_scripts())
+        elif args.tables:
+            load_fixtures([t.upper() for t in args.tables], args.rows, args.batch, args.seed, args.mode)
+        else:
+            parser.print_help()
+    except Exception as e:
+        print(f"\nError: {e}")
+
+
+if __name__ == "__main__":
+    main()
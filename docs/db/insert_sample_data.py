@@ -3,11 +3,16 @@
 """
 FMS Database Sample Data Insertion Script
 - Adapted for actual table structure
+- One multi-row INSERT per table; generated keys resolved by range (bulk_load.key_range)
+- Code -> key lookups through one shared key_cache.KeyCache (each table read at most once)
 """
 
 import pymysql
 from datetime import datetime, timedelta
 
+from bulk_load import key_range
+from key_cache import KeyCache
+
 # Database connection info
 DB_CONFIG = {
     'host': '211.236.174.220',
@@ -18,6 +23,96 @@ DB_CONFIG = {
     'charset': 'utf8mb4'
 }
 
+# Master data shared with generate_data.py
+COUNTRIES = [
+    ('KR', 'KOR', '대한민국', 'Korea, Republic of', 'AS', 'KRW'),
+    ('US', 'USA', '미국', 'United States', 'NA', 'USD'),
+    ('CN', 'CHN', '중국', 'China', 'AS', 'CNY'),
+    ('JP', 'JPN', '일본', 'Japan', 'AS', 'JPY'),
+    ('HK', 'HKG', '홍콩', 'Hong Kong', 'AS', 'HKD'),
+    ('SG', 'SGP', '싱가포르', 'Singapore', 'AS', 'SGD'),
+    ('DE', 'DEU', '독일', 'Germany', 'EU', 'EUR'),
+    ('NL', 'NLD', '네덜란드', 'Netherlands', 'EU', 'EUR'),
+    ('VN', 'VNM', '베트남', 'Vietnam', 'AS', 'VND'),
+    ('TH', 'THA', '태국', 'Thailand', 'AS', 'THB')
+]
+
+PORTS = [
+    ('KRPUS', '부산항', 'Busan Port', 'KR', 'SEA'),
+    ('KRINC', '인천공항', 'Incheon International Airport', 'KR', 'AIR'),
+    ('KRICN', '인천항', 'Incheon Port', 'KR', 'SEA'),
+    ('CNSHA', '상해항', 'Shanghai Port', 'CN', 'SEA'),
+    ('CNPVG', '상해푸동공항', 'Shanghai Pudong Airport', 'CN', 'AIR'),
+    ('CNSHE', '심천항', 'Shenzhen Port', 'CN', 'SEA'),
+    ('HKHKG', '홍콩항', 'Hong Kong Port', 'HK', 'SEA'),
+    ('VKHKG', '홍콩공항', 'Hong Kong International Airport', 'HK', 'AIR'),
+    ('JPYOK', '요코하마항', 'Yokohama Port', 'JP', 'SEA'),
+    ('JPNRT', '나리타공항', 'Narita International Airport', 'JP', 'AIR'),
+    ('SGSIN', '싱가포르항', 'Singapore Port', 'SG', 'SEA'),
+    ('USNYC', '뉴욕항', 'New York Port', 'US', 'SEA'),
+    ('USLAX', 'LA항', 'Los Angeles Port', 'US', 'SEA'),
+    ('USLXP', 'LA공항', 'Los Angeles International Airport', 'US', 'AIR'),
+    ('NLRTM', '로테르담항', 'Rotterdam Port', 'NL', 'SEA'),
+    ('DEHAM', '함부르크항', 'Hamburg Port', 'DE', 'SEA')
+]
+
+CURRENCIES = [
+    ('KRW', '원화', 'Korean Won', 'W', 0),
+    ('USD', '미달러', 'US Dollar', '$', 2),
+    ('EUR', '유로', 'Euro', 'E', 2),
+    ('JPY', '엔화', 'Japanese Yen', 'Y', 0),
+    ('CNY', '위안화', 'Chinese Yuan', 'Y', 2),
+    ('HKD', '홍콩달러', 'Hong Kong Dollar', '$', 2),
+    ('SGD', '싱가포르달러', 'Singapore Dollar', '$', 2)
+]
+
+CARRIERS = [
+    ('MAEU', 'MAERSK', 'Maersk Line', 'SEA', 'MAEU', None, None, 'DK'),
+    ('MSCU', 'MSC', 'Mediterranean Shipping Company', 'SEA', 'MSCU', None, None, 'CH'),
+    ('COSU', 'COSCO', 'COSCO Shipping Lines', 'SEA', 'COSU', None, None, 'CN'),
+    ('EGLV', 'EVERGREEN', 'Evergreen Marine Corp.', 'SEA', 'EGLV', None, None, 'TW'),
+    ('ONEY', 'ONE', 'Ocean Network Express', 'SEA', 'ONEY', None, None, 'JP'),
+    ('HDMU', 'HMM', 'HMM Co., Ltd.', 'SEA', 'HDMU', None, None, 'KR'),
+    ('YMLU', 'YANGMING', 'Yang Ming Marine Transport', 'SEA', 'YMLU', None, None, 'TW'),
+    ('KE', 'KOREAN AIR', 'Korean Air Lines', 'AIR', None, 'KE', 'KAL', 'KR'),
+    ('OZ', 'ASIANA', 'Asiana Airlines', 'AIR', None, 'OZ', 'AAR', 'KR'),
+    ('CX', 'CATHAY', 'Cathay Pacific', 'AIR', None, 'CX', 'CPA', 'HK'),
+    ('SQ', 'SINGAPORE', 'Singapore Airlines', 'AIR', None, 'SQ', 'SIA', 'SG'),
+    ('LH', 'LUFTHANSA', 'Lufthansa Cargo', 'AIR', None, 'LH', 'DLH', 'DE')
+]
+
+CUSTOMERS = [
+    ('CUST001', '삼성전자', 'Samsung Electronics', 'SHIPPER', '124-81-00998', '홍길동', 'KR', '서울시 서초구 서초대로 74길 11', '02-2255-0114', 'logistics@samsung.com'),
+    ('CUST002', 'LG전자', 'LG Electronics', 'SHIPPER', '107-86-14075', '김철수', 'KR', '서울시 영등포구 여의대로 128', '02-3777-1114', 'logistics@lge.com'),
+    ('CUST003', '현대자동차', 'Hyundai Motor Company', 'SHIPPER', '101-81-15116', '이영희', 'KR', '서울시 서초구 헌릉로 12', '02-3464-1114', 'logistics@hyundai.com'),
+    ('CUST004', 'SK하이닉스', 'SK Hynix Inc.', 'SHIPPER', '214-86-05453', '박지성', 'KR', '경기도 이천시 부발읍 경충대로 2091', '031-630-4114', 'logistics@skhynix.com'),
+    ('CUST005', 'ABC Trading Co.', 'ABC Trading Co.', 'CONSIGNEE', '98-7654321', 'John Smith', 'US', '1234 Main Street, Los Angeles, CA', '+1-213-555-0100', 'import@abctrading.com'),
+    ('CUST006', 'XYZ Import GmbH', 'XYZ Import GmbH', 'CONSIGNEE', 'DE123456789', 'Hans Mueller', 'DE', 'Hauptstrasse 123, Hamburg', '+49-40-555-0100', 'logistics@xyzimport.de'),
+    ('CUST007', 'Global Parts Inc.', 'Global Parts Inc.', 'BOTH', '11-2233445', 'Mike Johnson', 'US', '5678 Industrial Blvd, Chicago, IL', '+1-312-555-0200', 'supply@globalparts.com')
+]
+
+TRUCKERS = [
+    ('TRUCK001', '한진육운', 'Hanjin Land Transport', '123-45-67891', '서울시 강서구 공항대로', '02-2660-1234', 'dispatch@hanjinland.kr'),
+    ('TRUCK002', '대한통운', 'Korea Express', '234-56-78902', '서울시 중구 소공로', '02-1588-1255', 'truck@koreaexpress.kr'),
+    ('TRUCK003', '현대글로비스', 'Hyundai Glovis', '124-81-23456', '서울시 강남구 테헤란로', '02-6190-5114', 'transport@glovis.net')
+]
+
+BROKERS = [
+    ('BROKER001', '삼성관세법인', 'Samsung Customs Service', '214-81-12345', '서울시 강남구 삼성로', '02-555-1234', 'customs@samsungcs.kr'),
+    ('BROKER002', '한국관세사', 'Korea Customs Broker', '123-81-23456', '인천시 중구 항동', '032-888-5678', 'clear@koreabroker.kr')
+]
+
+HS_CODES = [
+    ('8542310000', 'Processors and controllers', '프로세서 및 컨트롤러', 0.00),
+    ('8542320000', 'Memories', '메모리', 0.00),
+    ('8542390000', 'Other integrated circuits', '기타 집적회로', 0.00),
+    ('8471300000', 'Portable digital computers', '휴대용 컴퓨터', 0.00),
+    ('8517120000', 'Telephones for cellular networks', '휴대전화기', 0.00),
+    ('8703230000', 'Motor vehicles', '자동차', 8.00),
+    ('8708999000', 'Parts of motor vehicles', '자동차 부품', 8.00),
+    ('6403990000', 'Footwear', '신발류', 13.00)
+]
+
 def get_connection():
     return pymysql.connect(**DB_CONFIG)
 
@@ -36,69 +131,27 @@ def insert_master_data(cursor):
     print("  [OK] MST_COMPANY")
 
     # MST_COUNTRY
-    countries = [
-        ('KR', 'KOR', '대한민국', 'Korea, Republic of', 'AS', 'KRW'),
-        ('US', 'USA', '미국', 'United States', 'NA', 'USD'),
-        ('CN', 'CHN', '중국', 'China', 'AS', 'CNY'),
-        ('JP', 'JPN', '일본', 'Japan', 'AS', 'JPY'),
-        ('HK', 'HKG', '홍콩', 'Hong Kong', 'AS', 'HKD'),
-        ('SG', 'SGP', '싱가포르', 'Singapore', 'AS', 'SGD'),
-        ('DE', 'DEU', '독일', 'Germany', 'EU', 'EUR'),
-        ('NL', 'NLD', '네덜란드', 'Netherlands', 'EU', 'EUR'),
-        ('VN', 'VNM', '베트남', 'Vietnam', 'AS', 'VND'),
-        ('TH', 'THA', '태국', 'Thailand', 'AS', 'THB')
-    ]
-    for c in countries:
-        cursor.execute("""
-            INSERT INTO MST_COUNTRY (COUNTRY_CD, COUNTRY_CD3, COUNTRY_NM, COUNTRY_NM_EN, CONTINENT_CD, CURRENCY_CD, USE_YN)
-            VALUES (%s, %s, %s, %s, %s, %s, 'Y')
-            ON DUPLICATE KEY UPDATE COUNTRY_NM=VALUES(COUNTRY_NM)
-        """, c)
+    cursor.executemany("""
+        INSERT INTO MST_COUNTRY (COUNTRY_CD, COUNTRY_CD3, COUNTRY_NM, COUNTRY_NM_EN, CONTINENT_CD, CURRENCY_CD, USE_YN)
+        VALUES (%s, %s, %s, %s, %s, %s, 'Y')
+        ON DUPLICATE KEY UPDATE COUNTRY_NM=VALUES(COUNTRY_NM)
+    """, COUNTRIES)
     print("  [OK] MST_COUNTRY")
 
     # MST_PORT
-    ports = [
-        ('KRPUS', '부산항', 'Busan Port', 'KR', 'SEA'),
-        ('KRINC', '인천공항', 'Incheon International Airport', 'KR', 'AIR'),
-        ('KRICN', '인천항', 'Incheon Port', 'KR', 'SEA'),
-        ('CNSHA', '상해항', 'Shanghai Port', 'CN', 'SEA'),
-        ('CNPVG', '상해푸동공항', 'Shanghai Pudong Airport', 'CN', 'AIR'),
-        ('CNSHE', '심천항', 'Shenzhen Port', 'CN', 'SEA'),
-        ('HKHKG', '홍콩항', 'Hong Kong Port', 'HK', 'SEA'),
-        ('VKHKG', '홍콩공항', 'Hong Kong International Airport', 'HK', 'AIR'),
-        ('JPYOK', '요코하마항', 'Yokohama Port', 'JP', 'SEA'),
-        ('JPNRT', '나리타공항', 'Narita International Airport', 'JP', 'AIR'),
-        ('SGSIN', '싱가포르항', 'Singapore Port', 'SG', 'SEA'),
-        ('USNYC', '뉴욕항', 'New York Port', 'US', 'SEA'),
-        ('USLAX', 'LA항', 'Los Angeles Port', 'US', 'SEA'),
-        ('USLXP', 'LA공항', 'Los Angeles International Airport', 'US', 'AIR'),
-        ('NLRTM', '로테르담항', 'Rotterdam Port', 'NL', 'SEA'),
-        ('DEHAM', '함부르크항', 'Hamburg Port', 'DE', 'SEA')
-    ]
-    for p in ports:
-        cursor.execute("""
-            INSERT INTO MST_PORT (PORT_CD, PORT_NM, PORT_NM_EN, COUNTRY_CD, PORT_TYPE_CD, USE_YN)
-            VALUES (%s, %s, %s, %s, %s, 'Y')
-            ON DUPLICATE KEY UPDATE PORT_NM=VALUES(PORT_NM)
-        """, p)
+    cursor.executemany("""
+        INSERT INTO MST_PORT (PORT_CD, PORT_NM, PORT_NM_EN, COUNTRY_CD, PORT_TYPE_CD, USE_YN)
+        VALUES (%s, %s, %s, %s, %s, 'Y')
+        ON DUPLICATE KEY UPDATE PORT_NM=VALUES(PORT_NM)
+    """, PORTS)
     print("  [OK] MST_PORT")
 
     # MST_CURRENCY
-    currencies = [
-        ('KRW', '원화', 'Korean Won', 'W', 0),
-        ('USD', '미달러', 'US Dollar', '$', 2),
-        ('EUR', '유로', 'Euro', 'E', 2),
-        ('JPY', '엔화', 'Japanese Yen', 'Y', 0),
-        ('CNY', '위안화', 'Chinese Yuan', 'Y', 2),
-        ('HKD', '홍콩달러', 'Hong Kong Dollar', '$', 2),
-        ('SGD', '싱가포르달러', 'Singapore Dollar', '$', 2)
-    ]
-    for c in currencies:
-        cursor.execute("""
-            INSERT INTO MST_CURRENCY (CURRENCY_CD, CURRENCY_NM, CURRENCY_NM_EN, SYMBOL, DECIMAL_PLACES, USE_YN)
-            VALUES (%s, %s, %s, %s, %s, 'Y')
-            ON DUPLICATE KEY UPDATE CURRENCY_NM=VALUES(CURRENCY_NM)
-        """, c)
+    cursor.executemany("""
+        INSERT INTO MST_CURRENCY (CURRENCY_CD, CURRENCY_NM, CURRENCY_SYMBOL, DECIMAL_PLACES, USE_YN)
+        VALUES (%s, %s, %s, %s, 'Y')
+        ON DUPLICATE KEY UPDATE CURRENCY_NM=VALUES(CURRENCY_NM)
+    """, [(cd, nm, symbol, places) for cd, nm, _, symbol, places in CURRENCIES])
     print("  [OK] MST_CURRENCY")
 
     # MST_EXCHANGE_RATE
@@ -110,53 +163,30 @@ def insert_master_data(cursor):
         ('CNY', 'KRW', today, 185.00, 186.00, 184.00),
         ('HKD', 'KRW', today, 173.00, 174.00, 172.00)
     ]
-    for r in rates:
-        cursor.execute("""
-            INSERT INTO MST_EXCHANGE_RATE (BASE_CURRENCY_CD, QUOTE_CURRENCY_CD, RATE_DT, RATE, SELL_RATE, BUY_RATE, USE_YN)
-            VALUES (%s, %s, %s, %s, %s, %s, 'Y')
-            ON DUPLICATE KEY UPDATE RATE=VALUES(RATE)
-        """, r)
+    # Mid, sell and buy rates are separate rows (RATE_TYPE_CD is part of the unique key)
+    cursor.executemany("""
+        INSERT INTO MST_EXCHANGE_RATE (BASE_CURRENCY_CD, TARGET_CURRENCY_CD, RATE_DT, RATE_TYPE_CD, EXCHANGE_RATE)
+        VALUES (%s, %s, %s, %s, %s)
+        ON DUPLICATE KEY UPDATE EXCHANGE_RATE=VALUES(EXCHANGE_RATE)
+    """, [(base, target, day, rate_type, rate)
+          for base, target, day, *values in rates
+          for rate_type, rate in zip(('MID', 'SELL', 'BUY'), values)])
     print("  [OK] MST_EXCHANGE_RATE")
 
     # MST_CARRIER
-    carriers = [
-        ('MAEU', 'MAERSK', 'Maersk Line', 'SEA', 'MAEU', None, None, 'DK'),
-        ('MSCU', 'MSC', 'Mediterranean Shipping Company', 'SEA', 'MSCU', None, None, 'CH'),
-        ('COSU', 'COSCO', 'COSCO Shipping Lines', 'SEA', 'COSU', None, None, 'CN'),
-        ('EGLV', 'EVERGREEN', 'Evergreen Marine Corp.', 'SEA', 'EGLV', None, None, 'TW'),
-        ('ONEY', 'ONE', 'Ocean Network Express', 'SEA', 'ONEY', None, None, 'JP'),
-        ('HDMU', 'HMM', 'HMM Co., Ltd.', 'SEA', 'HDMU', None, None, 'KR'),
-        ('YMLU', 'YANGMING', 'Yang Ming Marine Transport', 'SEA', 'YMLU', None, None, 'TW'),
-        ('KE', 'KOREAN AIR', 'Korean Air Lines', 'AIR', None, 'KE', 'KAL', 'KR'),
-        ('OZ', 'ASIANA', 'Asiana Airlines', 'AIR', None, 'OZ', 'AAR', 'KR'),
-        ('CX', 'CATHAY', 'Cathay Pacific', 'AIR', None, 'CX', 'CPA', 'HK'),
-        ('SQ', 'SINGAPORE', 'Singapore Airlines', 'AIR', None, 'SQ', 'SIA', 'SG'),
-        ('LH', 'LUFTHANSA', 'Lufthansa Cargo', 'AIR', None, 'LH', 'DLH', 'DE')
-    ]
-    for c in carriers:
-        cursor.execute("""
-            INSERT INTO MST_CARRIER (CARRIER_CD, CARRIER_NM, CARRIER_NM_EN, CARRIER_TYPE_CD, SCAC_CD, IATA_CD, ICAO_CD, COUNTRY_CD, USE_YN)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, 'Y')
-            ON DUPLICATE KEY UPDATE CARRIER_NM=VALUES(CARRIER_NM)
-        """, c)
+    cursor.executemany("""
+        INSERT INTO MST_CARRIER (CARRIER_CD, CARRIER_NM, CARRIER_NM_EN, CARRIER_TYPE_CD, SCAC_CD, IATA_CD, ICAO_CD, COUNTRY_CD, USE_YN)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, 'Y')
+        ON DUPLICATE KEY UPDATE CARRIER_NM=VALUES(CARRIER_NM)
+    """, CARRIERS)
     print("  [OK] MST_CARRIER")
 
     # MST_CUSTOMER
-    customers = [
-        ('CUST001', '삼성전자', 'Samsung Electronics', 'SHIPPER', '124-81-00998', '홍길동', 'KR', '서울시 서초구 서초대로 74길 11', '02-2255-0114', 'logistics@samsung.com'),
-        ('CUST002', 'LG전자', 'LG Electronics', 'SHIPPER', '107-86-14075', '김철수', 'KR', '서울시 영등포구 여의대로 128', '02-3777-1114', 'logistics@lge.com'),
-        ('CUST003', '현대자동차', 'Hyundai Motor Company', 'SHIPPER', '101-81-15116', '이영희', 'KR', '서울시 서초구 헌릉로 12', '02-3464-1114', 'logistics@hyundai.com'),
-        ('CUST004', 'SK하이닉스', 'SK Hynix Inc.', 'SHIPPER', '214-86-05453', '박지성', 'KR', '경기도 이천시 부발읍 경충대로 2091', '031-630-4114', 'logistics@skhynix.com'),
-        ('CUST005', 'ABC Trading Co.', 'ABC Trading Co.', 'CONSIGNEE', '98-7654321', 'John Smith', 'US', '1234 Main Street, Los Angeles, CA', '+1-213-555-0100', 'import@abctrading.com'),
-        ('CUST006', 'XYZ Import GmbH', 'XYZ Import GmbH', 'CONSIGNEE', 'DE123456789', 'Hans Mueller', 'DE', 'Hauptstrasse 123, Hamburg', '+49-40-555-0100', 'logistics@xyzimport.de'),
-        ('CUST007', 'Global Parts Inc.', 'Global Parts Inc.', 'BOTH', '11-2233445', 'Mike Johnson', 'US', '5678 Industrial Blvd, Chicago, IL', '+1-312-555-0200', 'supply@globalparts.com')
-    ]
-    for c in customers:
-        cursor.execute("""
-            INSERT INTO MST_CUSTOMER (CUSTOMER_CD, CUSTOMER_NM, CUSTOMER_NM_EN, CUSTOMER_TYPE_CD, BIZ_REG_NO, CEO_NM, COUNTRY_CD, ADDR, TEL_NO, EMAIL, USE_YN)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, 'Y')
-            ON DUPLICATE KEY UPDATE CUSTOMER_NM=VALUES(CUSTOMER_NM)
-        """, c)
+    cursor.executemany("""
+        INSERT INTO MST_CUSTOMER (CUSTOMER_CD, CUSTOMER_NM, CUSTOMER_NM_EN, CUSTOMER_TYPE_CD, BIZ_REG_NO, CEO_NM, COUNTRY_CD, ADDR, TEL_NO, EMAIL, USE_YN)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, 'Y')
+        ON DUPLICATE KEY UPDATE CUSTOMER_NM=VALUES(CUSTOMER_NM)
+    """, CUSTOMERS)
     print("  [OK] MST_CUSTOMER")
 
     # MST_PARTNER (Overseas Agents)
@@ -167,58 +197,35 @@ def insert_master_data(cursor):
         ('PART004', 'LA Freight Services', 'LA Freight Services', 'AGENT', 'US', '123 Harbor Blvd, Long Beach', '+1-562-555-0100', 'ops@lafreight.com'),
         ('PART005', 'Hamburg Shipping Agency', 'Hamburg Shipping Agency', 'AGENT', 'DE', 'Hafenstrasse 45, Hamburg', '+49-40-555-0200', 'shipping@hamburgagency.de')
     ]
-    for p in partners:
-        cursor.execute("""
-            INSERT INTO MST_PARTNER (PARTNER_CD, PARTNER_NM, PARTNER_NM_EN, PARTNER_TYPE_CD, COUNTRY_CD, ADDR, TEL_NO, EMAIL, USE_YN)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, 'Y')
-            ON DUPLICATE KEY UPDATE PARTNER_NM=VALUES(PARTNER_NM)
-        """, p)
+    cursor.executemany("""
+        INSERT INTO MST_PARTNER (PARTNER_CD, PARTNER_NM, PARTNER_NM_EN, PARTNER_TYPE_CD, COUNTRY_CD, ADDR, TEL_NO, EMAIL, USE_YN)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, 'Y')
+        ON DUPLICATE KEY UPDATE PARTNER_NM=VALUES(PARTNER_NM)
+    """, partners)
     print("  [OK] MST_PARTNER")
 
     # MST_TRUCKER
-    truckers = [
-        ('TRUCK001', '한진육운', 'Hanjin Land Transport', '123-45-67891', '서울시 강서구 공항대로', '02-2660-1234', 'dispatch@hanjinland.kr'),
-        ('TRUCK002', '대한통운', 'Korea Express', '234-56-78902', '서울시 중구 소공로', '02-1588-1255', 'truck@koreaexpress.kr'),
-        ('TRUCK003', '현대글로비스', 'Hyundai Glovis', '124-81-23456', '서울시 강남구 테헤란로', '02-6190-5114', 'transport@glovis.net')
-    ]
-    for t in truckers:
-        cursor.execute("""
-            INSERT INTO MST_TRUCKER (TRUCKER_CD, TRUCKER_NM, TRUCKER_NM_EN, BIZ_REG_NO, ADDR, TEL_NO, EMAIL, USE_YN)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, 'Y')
-            ON DUPLICATE KEY UPDATE TRUCKER_NM=VALUES(TRUCKER_NM)
-        """, t)
+    cursor.executemany("""
+        INSERT INTO MST_TRUCKER (TRUCKER_CD, TRUCKER_NM, TRUCKER_NM_EN, BIZ_REG_NO, ADDR, TEL_NO, EMAIL, USE_YN)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, 'Y')
+        ON DUPLICATE KEY UPDATE TRUCKER_NM=VALUES(TRUCKER_NM)
+    """, TRUCKERS)
     print("  [OK] MST_TRUCKER")
 
     # MST_CUSTOMS_BROKER
-    brokers = [
-        ('BROKER001', '삼성관세법인', 'Samsung Customs Service', '214-81-12345', '서울시 강남구 삼성로', '02-555-1234', 'customs@samsungcs.kr'),
-        ('BROKER002', '한국관세사', 'Korea Customs Broker', '123-81-23456', '인천시 중구 항동', '032-888-5678', 'clear@koreabroker.kr')
-    ]
-    for b in brokers:
-        cursor.execute("""
-            INSERT INTO MST_CUSTOMS_BROKER (BROKER_CD, BROKER_NM, BROKER_NM_EN, BIZ_REG_NO, ADDR, TEL_NO, EMAIL, USE_YN)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, 'Y')
-            ON DUPLICATE KEY UPDATE BROKER_NM=VALUES(BROKER_NM)
-        """, b)
+    cursor.executemany("""
+        INSERT INTO MST_CUSTOMS_BROKER (BROKER_CD, BROKER_NM, BIZ_REG_NO, ADDR, TEL_NO, EMAIL, COUNTRY_CD, USE_YN)
+        VALUES (%s, %s, %s, %s, %s, %s, 'KR', 'Y')
+        ON DUPLICATE KEY UPDATE BROKER_NM=VALUES(BROKER_NM)
+    """, [(cd, nm, biz, addr, tel, email) for cd, nm, _, biz, addr, tel, email in BROKERS])
     print("  [OK] MST_CUSTOMS_BROKER")
 
     # MST_HS_CODE
-    hs_codes = [
-        ('8542310000', 'Processors and controllers', '프로세서 및 컨트롤러', 0.00),
-        ('8542320000', 'Memories', '메모리', 0.00),
-        ('8542390000', 'Other integrated circuits', '기타 집적회로', 0.00),
-        ('8471300000', 'Portable digital computers', '휴대용 컴퓨터', 0.00),
-        ('8517120000', 'Telephones for cellular networks', '휴대전화기', 0.00),
-        ('8703230000', 'Motor vehicles', '자동차', 8.00),
-        ('8708999000', 'Parts of motor vehicles', '자동차 부품', 8.00),
-        ('6403990000', 'Footwear', '신발류', 13.00)
-    ]
-    for h in hs_codes:
-        cursor.execute("""
-            INSERT INTO MST_HS_CODE (HS_CD, DESCRIPTION_EN, DESCRIPTION_KR, DUTY_RATE, USE_YN)
-            VALUES (%s, %s, %s, %s, 'Y')
-            ON DUPLICATE KEY UPDATE DESCRIPTION_EN=VALUES(DESCRIPTION_EN)
-        """, h)
+    cursor.executemany("""
+        INSERT INTO MST_HS_CODE (HS_CODE, HS_CODE_NM_EN, HS_CODE_NM, TARIFF_RATE, USE_YN)
+        VALUES (%s, %s, %s, %s, 'Y')
+        ON DUPLICATE KEY UPDATE HS_CODE_NM_EN=VALUES(HS_CODE_NM_EN)
+    """, HS_CODES)
     print("  [OK] MST_HS_CODE")
 
     # MST_COMMON_CODE_GROUP
@@ -234,12 +241,11 @@ def insert_master_data(cursor):
         ('TRANSPORT_MODE', 'Transport Mode', '운송모드'),
         ('TRADE_TYPE', 'Trade Type', '무역유형')
     ]
-    for g in code_groups:
-        cursor.execute("""
-            INSERT INTO MST_COMMON_CODE_GROUP (GROUP_CD, GROUP_NM_EN, GROUP_NM, USE_YN)
-            VALUES (%s, %s, %s, 'Y')
-            ON DUPLICATE KEY UPDATE GROUP_NM_EN=VALUES(GROUP_NM_EN)
-        """, g)
+    cursor.executemany("""
+        INSERT INTO MST_COMMON_CODE_GROUP (CODE_GROUP_ID, DESCRIPTION, CODE_GROUP_NM, USE_YN)
+        VALUES (%s, %s, %s, 'Y')
+        ON DUPLICATE KEY UPDATE CODE_GROUP_NM=VALUES(CODE_GROUP_NM)
+    """, code_groups)
     print("  [OK] MST_COMMON_CODE_GROUP")
 
     # MST_COMMON_CODE
@@ -279,12 +285,11 @@ def insert_master_data(cursor):
         ('TRADE_TYPE', 'IMPORT', 'Import', '수입', 2),
         ('TRADE_TYPE', 'CROSS', 'Cross Trade', '삼국간', 3)
     ]
-    for c in common_codes:
-        cursor.execute("""
-            INSERT INTO MST_COMMON_CODE (GROUP_CD, CODE, CODE_NM_EN, CODE_NM, SORT_ORDER, USE_YN)
-            VALUES (%s, %s, %s, %s, %s, 'Y')
-            ON DUPLICATE KEY UPDATE CODE_NM_EN=VALUES(CODE_NM_EN)
-        """, c)
+    cursor.executemany("""
+        INSERT INTO MST_COMMON_CODE (CODE_GROUP_ID, CODE_CD, CODE_NM_EN, CODE_NM, SORT_ORDER, USE_YN)
+        VALUES (%s, %s, %s, %s, %s, 'Y')
+        ON DUPLICATE KEY UPDATE CODE_NM_EN=VALUES(CODE_NM_EN)
+    """, common_codes)
     print("  [OK] MST_COMMON_CODE")
 
     # MST_USER
@@ -296,16 +301,15 @@ def insert_master_data(cursor):
         ('billing01', '최정산', 'billing01@intergis.co.kr', 'OPERATOR'),
         ('manager01', '정매니저', 'manager01@intergis.co.kr', 'MANAGER')
     ]
-    for u in users:
-        cursor.execute("""
-            INSERT INTO MST_USER (LOGIN_ID, USER_NM, EMAIL, ROLE_CD, USE_YN)
-            VALUES (%s, %s, %s, %s, 'Y')
-            ON DUPLICATE KEY UPDATE USER_NM=VALUES(USER_NM)
-        """, u)
+    cursor.executemany("""
+        INSERT INTO MST_USER (USER_LOGIN_ID, USER_NM, EMAIL, USER_TYPE_CD, USE_YN)
+        VALUES (%s, %s, %s, %s, 'Y')
+        ON DUPLICATE KEY UPDATE USER_NM=VALUES(USER_NM)
+    """, users)
     print("  [OK] MST_USER")
 
 
-def insert_schedule_data(cursor):
+def insert_schedule_data(cursor, keys):
     """02. Schedule Tables Sample Data"""
     print("\n=== 02. Schedule Tables ===")
 
@@ -313,16 +317,18 @@ def insert_schedule_data(cursor):
 
     # SCH_VOYAGE
     voyages = [
-        ('VOY20260101', 'HDMU', 'HYUNDAI SINGAPORE', 'V.001E', today.strftime('%Y-%m-%d'), (today + timedelta(days=14)).strftime('%Y-%m-%d'), 'KRPUS', 'USLAX', 'ACTIVE'),
-        ('VOY20260102', 'MAEU', 'MAERSK SEALAND', 'V.002W', today.strftime('%Y-%m-%d'), (today + timedelta(days=21)).strftime('%Y-%m-%d'), 'KRPUS', 'NLRTM', 'ACTIVE'),
-        ('VOY20260103', 'COSU', 'COSCO SHIPPING', 'V.003E', (today + timedelta(days=3)).strftime('%Y-%m-%d'), (today + timedelta(days=10)).strftime('%Y-%m-%d'), 'CNSHA', 'KRPUS', 'ACTIVE')
+        ('HDMU', 'HYUNDAI SINGAPORE', 'V.001E', 'KRPUS-USLAX', 'E', 'ACTIVE'),
+        ('MAEU', 'MAERSK SEALAND', 'V.002W', 'KRPUS-NLRTM', 'W', 'ACTIVE'),
+        ('COSU', 'COSCO GALAXY', 'V.003E', 'CNSHA-KRPUS', 'E', 'ACTIVE'),
+        ('ONEY', 'ONE COMPETENCE', 'V.004W', 'KRPUS-SGSIN', 'W', 'ACTIVE')
     ]
-    for v in voyages:
-        cursor.execute("""
-            INSERT INTO SCH_VOYAGE (VOYAGE_NO, CARRIER_CD, VESSEL_NM, VOYAGE_LEG, DEPARTURE_DT, ARRIVAL_DT, ORIGIN_PORT_CD, DEST_PORT_CD, STATUS_CD)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-            ON DUPLICATE KEY UPDATE VESSEL_NM=VALUES(VESSEL_NM)
-        """, v)
+    for carrier_cd, *voyage in voyages:
+        if keys.get('SCH_VOYAGE', voyage[1]) is None:
+            cursor.execute("""
+                INSERT INTO SCH_VOYAGE (CARRIER_ID, VESSEL_NM, VOYAGE_NO, SERVICE_ROUTE_CD, DIRECTION_CD, STATUS_CD)
+                VALUES (%s, %s, %s, %s, %s, %s)
+            """, (keys.get('MST_CARRIER', carrier_cd), *voyage))
+            keys.inserted('SCH_VOYAGE', voyage[1])
     print("  [OK] SCH_VOYAGE")
 
     # SCH_OCEAN_SCHEDULE
@@ -332,12 +338,15 @@ def insert_schedule_data(cursor):
         ('COSU', 'COSCO GALAXY', 'V.003E', 'CNSHA', 'KRPUS', (today + timedelta(days=3)).strftime('%Y-%m-%d'), (today + timedelta(days=6)).strftime('%Y-%m-%d'), 3, (today + timedelta(days=1)).strftime('%Y-%m-%d'), (today + timedelta(days=2)).strftime('%Y-%m-%d')),
         ('ONEY', 'ONE COMPETENCE', 'V.004W', 'KRPUS', 'SGSIN', (today + timedelta(days=7)).strftime('%Y-%m-%d'), (today + timedelta(days=14)).strftime('%Y-%m-%d'), 7, (today + timedelta(days=3)).strftime('%Y-%m-%d'), (today + timedelta(days=5)).strftime('%Y-%m-%d'))
     ]
-    for s in ocean_schedules:
-        cursor.execute("""
-            INSERT INTO SCH_OCEAN_SCHEDULE (CARRIER_CD, VESSEL_NM, VOYAGE_NO, POL_PORT_CD, POD_PORT_CD, ETD_DT, ETA_DT, TRANSIT_DAYS, DOC_CUTOFF_DT, CARGO_CUTOFF_DT, USE_YN)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, 'Y')
-            ON DUPLICATE KEY UPDATE VESSEL_NM=VALUES(VESSEL_NM)
-        """, s)
+    # Schedules are keyed by voyage; existing ones are kept so reruns do not duplicate them
+    for carrier_cd, vessel_nm, voyage_no, *schedule in ocean_schedules:
+        if keys.get('SCH_OCEAN_SCHEDULE', voyage_no) is None:
+            cursor.execute("""
+                INSERT INTO SCH_OCEAN_SCHEDULE (VOYAGE_ID, CARRIER_ID, VESSEL_NM, VOYAGE_NO, POL_PORT_CD, POD_PORT_CD,
+                    ETD_DTM, ETA_DTM, TRANSIT_DAYS, CUT_OFF_DTM, CARGO_CUT_OFF_DTM)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+            """, (keys.get('SCH_VOYAGE', voyage_no), keys.get('MST_CARRIER', carrier_cd), vessel_nm, voyage_no, *schedule))
+            keys.inserted('SCH_OCEAN_SCHEDULE', voyage_no)
     print("  [OK] SCH_OCEAN_SCHEDULE")
 
     # SCH_AIR_SCHEDULE
@@ -347,12 +356,14 @@ def insert_schedule_data(cursor):
         ('CX', 'CX417', 'VKHKG', 'KRINC', (today + timedelta(days=1)).strftime('%Y-%m-%d') + ' 09:00:00', (today + timedelta(days=1)).strftime('%Y-%m-%d') + ' 13:30:00'),
         ('SQ', 'SQ607', 'SGSIN', 'KRINC', (today + timedelta(days=2)).strftime('%Y-%m-%d') + ' 01:00:00', (today + timedelta(days=2)).strftime('%Y-%m-%d') + ' 09:00:00')
     ]
-    for a in air_schedules:
-        cursor.execute("""
-            INSERT INTO SCH_AIR_SCHEDULE (CARRIER_CD, FLIGHT_NO, ORIGIN_PORT_CD, DEST_PORT_CD, ETD_DTM, ETA_DTM, USE_YN)
-            VALUES (%s, %s, %s, %s, %s, %s, 'Y')
-            ON DUPLICATE KEY UPDATE FLIGHT_NO=VALUES(FLIGHT_NO)
-        """, a)
+    # Flights are keyed by flight number like the ocean schedules by voyage
+    for carrier_cd, flight_no, *schedule in air_schedules:
+        if keys.get('SCH_AIR_SCHEDULE', flight_no) is None:
+            cursor.execute("""
+                INSERT INTO SCH_AIR_SCHEDULE (CARRIER_ID, FLIGHT_NO, ORIGIN_PORT_CD, DEST_PORT_CD, ETD_DTM, ETA_DTM, STATUS_CD)
+                VALUES (%s, %s, %s, %s, %s, %s, 'ACTIVE')
+            """, (keys.get('MST_CARRIER', carrier_cd), flight_no, *schedule))
+            keys.inserted('SCH_AIR_SCHEDULE', flight_no)
     print("  [OK] SCH_AIR_SCHEDULE")
 
     # SCH_MAWB_STOCK
@@ -361,116 +372,85 @@ def insert_schedule_data(cursor):
         ('OZ', '988', '98765430', '98765439', 10, 5, 5),
         ('CX', '160', '11112220', '11112229', 10, 2, 8)
     ]
-    for m in mawb_stocks:
-        cursor.execute("""
-            INSERT INTO SCH_MAWB_STOCK (CARRIER_CD, PREFIX, START_NO, END_NO, TOTAL_CNT, USED_CNT, REMAIN_CNT, USE_YN)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, 'Y')
-            ON DUPLICATE KEY UPDATE CARRIER_CD=VALUES(CARRIER_CD)
-        """, m)
+    # No unique key on the stock table: a range already on file is not added again
+    cursor.executemany("""
+        INSERT INTO SCH_MAWB_STOCK (CARRIER_ID, AIRLINE_PREFIX, SERIAL_START, SERIAL_END, TOTAL_QTY, USED_QTY, AVAILABLE_QTY, STATUS_CD)
+        SELECT %s, %s, %s, %s, %s, %s, %s, 'ACTIVE' FROM DUAL
+        WHERE NOT EXISTS (SELECT 1 FROM SCH_MAWB_STOCK WHERE AIRLINE_PREFIX = %s AND SERIAL_START = %s)
+    """, [(keys.get('MST_CARRIER', carrier_cd), *stock, stock[0], stock[1]) for carrier_cd, *stock in mawb_stocks])
     print("  [OK] SCH_MAWB_STOCK")
 
 
-def insert_order_shipment_data(cursor):
+def insert_order_shipment_data(cursor, keys):
     """03. Order, Shipment, BL/AWB Tables Sample Data"""
     print("\n=== 03. Order & Shipment Tables ===")
 
     today = datetime.now()
 
-    # First get carrier IDs
-    cursor.execute("SELECT CARRIER_ID, CARRIER_CD FROM MST_CARRIER")
-    carrier_map = {row[1]: row[0] for row in cursor.fetchall()}
-
-    # Get customer IDs
-    cursor.execute("SELECT CUSTOMER_ID, CUSTOMER_CD FROM MST_CUSTOMER")
-    customer_map = {row[1]: row[0] for row in cursor.fetchall()}
-
-    # Get schedule IDs
-    cursor.execute("SELECT SCHEDULE_ID, VESSEL_NM FROM SCH_OCEAN_SCHEDULE")
-    schedule_map = {row[1]: row[0] for row in cursor.fetchall()}
-
     # ORD_SHIPMENT
     shipments = [
-        ('SHP20260001', 'SEA', 'EXPORT', 'CY-CY', 'FOB', customer_map.get('CUST001'), customer_map.get('CUST001'), customer_map.get('CUST005'), carrier_map.get('HDMU'), 'KR', 'KRPUS', 'US', 'USLAX', today.strftime('%Y-%m-%d'), (today + timedelta(days=14)).strftime('%Y-%m-%d'), 100, 'CTN', 5000.000, 150.000, 1500000.00, 'USD', 'SHIPPED'),
-        ('SHP20260002', 'SEA', 'EXPORT', 'CFS-CFS', 'CIF', customer_map.get('CUST002'), customer_map.get('CUST002'), customer_map.get('CUST006'), carrier_map.get('MAEU'), 'KR', 'KRPUS', 'DE', 'DEHAM', today.strftime('%Y-%m-%d'), (today + timedelta(days=28)).strftime('%Y-%m-%d'), 200, 'CTN', 8000.000, 400.000, 200000.00, 'USD', 'BOOKED'),
-        ('SHP20260003', 'AIR', 'EXPORT', 'D2D', 'FOB', customer_map.get('CUST003'), customer_map.get('CUST003'), customer_map.get('CUST007'), carrier_map.get('KE'), 'KR', 'KRINC', 'US', 'USLXP', today.strftime('%Y-%m-%d'), (today + timedelta(days=1)).strftime('%Y-%m-%d'), 50, 'PLT', 2500.000, 75.000, 150000.00, 'USD', 'DEPARTED'),
-        ('SHP20260004', 'SEA', 'IMPORT', 'CY-CY', 'CIF', customer_map.get('CUST004'), None, customer_map.get('CUST004'), carrier_map.get('COSU'), 'CN', 'CNSHA', 'KR', 'KRPUS', (today - timedelta(days=3)).strftime('%Y-%m-%d'), today.strftime('%Y-%m-%d'), 500, 'CTN', 2000.000, 50.000, 2500000.00, 'USD', 'ARRIVED'),
-        ('SHP20260005', 'AIR', 'IMPORT', 'D2D', 'DDP', customer_map.get('CUST001'), None, customer_map.get('CUST001'), carrier_map.get('CX'), 'HK', 'VKHKG', 'KR', 'KRINC', (today + timedelta(days=1)).strftime('%Y-%m-%d'), (today + timedelta(days=1)).strftime('%Y-%m-%d'), 10, 'CTN', 500.000, 5.000, 800000.00, 'USD', 'PENDING')
-    ]
-
-    shipment_ids = []
-    for s in shipments:
-        cursor.execute("""
-            INSERT INTO ORD_SHIPMENT (SHIPMENT_NO, TRANSPORT_MODE_CD, TRADE_TYPE_CD, SERVICE_TYPE_CD, INCOTERMS_CD,
-                CUSTOMER_ID, SHIPPER_ID, CONSIGNEE_ID, CARRIER_ID, ORIGIN_COUNTRY_CD, ORIGIN_PORT_CD,
-                DEST_COUNTRY_CD, DEST_PORT_CD, ETD_DT, ETA_DT, TOTAL_PKG_QTY, PKG_TYPE_CD, GROSS_WEIGHT_KG,
-                VOLUME_CBM, DECLARED_VALUE_AMT, DECLARED_VALUE_CURR, STATUS_CD)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            ON DUPLICATE KEY UPDATE SHIPMENT_NO=VALUES(SHIPMENT_NO)
-        """, s)
-        cursor.execute("SELECT LAST_INSERT_ID()")
-        shipment_ids.append(cursor.fetchone()[0])
+        ('SHP20260001', 'SEA', 'EXPORT', 'CY-CY', 'FOB', keys.get('MST_CUSTOMER', 'CUST001'), keys.get('MST_CUSTOMER', 'CUST001'), keys.get('MST_CUSTOMER', 'CUST005'), keys.get('MST_CARRIER', 'HDMU'), 'KR', 'KRPUS', 'US', 'USLAX', today.strftime('%Y-%m-%d'), (today + timedelta(days=14)).strftime('%Y-%m-%d'), 100, 'CTN', 5000.000, 150.000, 1500000.00, 'USD', 'SHIPPED'),
+        ('SHP20260002', 'SEA', 'EXPORT', 'CFS-CFS', 'CIF', keys.get('MST_CUSTOMER', 'CUST002'), keys.get('MST_CUSTOMER', 'CUST002'), keys.get('MST_CUSTOMER', 'CUST006'), keys.get('MST_CARRIER', 'MAEU'), 'KR', 'KRPUS', 'DE', 'DEHAM', today.strftime('%Y-%m-%d'), (today + timedelta(days=28)).strftime('%Y-%m-%d'), 200, 'CTN', 8000.000, 400.000, 200000.00, 'USD', 'BOOKED'),
+        ('SHP20260003', 'AIR', 'EXPORT', 'D2D', 'FOB', keys.get('MST_CUSTOMER', 'CUST003'), keys.get('MST_CUSTOMER', 'CUST003'), keys.get('MST_CUSTOMER', 'CUST007'), keys.get('MST_CARRIER', 'KE'), 'KR', 'KRINC', 'US', 'USLXP', today.strftime('%Y-%m-%d'), (today + timedelta(days=1)).strftime('%Y-%m-%d'), 50, 'PLT', 2500.000, 75.000, 150000.00, 'USD', 'DEPARTED'),
+        ('SHP20260004', 'SEA', 'IMPORT', 'CY-CY', 'CIF', keys.get('MST_CUSTOMER', 'CUST004'), None, keys.get('MST_CUSTOMER', 'CUST004'), keys.get('MST_CARRIER', 'COSU'), 'CN', 'CNSHA', 'KR', 'KRPUS', (today - timedelta(days=3)).strftime('%Y-%m-%d'), today.strftime('%Y-%m-%d'), 500, 'CTN', 2000.000, 50.000, 2500000.00, 'USD', 'ARRIVED'),
+        ('SHP20260005', 'AIR', 'IMPORT', 'D2D', 'DDP', keys.get('MST_CUSTOMER', 'CUST001'), None, keys.get('MST_CUSTOMER', 'CUST001'), keys.get('MST_CARRIER', 'CX'), 'HK', 'VKHKG', 'KR', 'KRINC', (today + timedelta(days=1)).strftime('%Y-%m-%d'), (today + timedelta(days=1)).strftime('%Y-%m-%d'), 10, 'CTN', 500.000, 5.000, 800000.00, 'USD', 'PENDING')
+    ]
+
+    shipment_ids = keys.allocate('ORD_SHIPMENT', [s[0] for s in shipments])
+    cursor.executemany("""
+        INSERT INTO ORD_SHIPMENT (SHIPMENT_ID, SHIPMENT_NO, TRANSPORT_MODE_CD, TRADE_TYPE_CD, SERVICE_TYPE_CD, INCOTERMS_CD,
+            CUSTOMER_ID, SHIPPER_ID, CONSIGNEE_ID, CARRIER_ID, ORIGIN_COUNTRY_CD, ORIGIN_PORT_CD,
+            DEST_COUNTRY_CD, DEST_PORT_CD, ETD_DT, ETA_DT, TOTAL_PKG_QTY, PKG_TYPE_CD, GROSS_WEIGHT_KG,
+            VOLUME_CBM, DECLARED_VALUE_AMT, DECLARED_VALUE_CURR, STATUS_CD)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+        ON DUPLICATE KEY UPDATE SHIPMENT_NO=VALUES(SHIPMENT_NO)
+    """, [(k,) + s for k, s in zip(shipment_ids, shipments)])
     print("  [OK] ORD_SHIPMENT")
 
-    # Get actual shipment IDs
-    cursor.execute("SELECT SHIPMENT_ID, SHIPMENT_NO FROM ORD_SHIPMENT")
-    shipment_map = {row[1]: row[0] for row in cursor.fetchall()}
-
     # ORD_OCEAN_BOOKING
-    cursor.execute("SELECT SCHEDULE_ID FROM SCH_OCEAN_SCHEDULE LIMIT 3")
-    schedule_ids = [row[0] for row in cursor.fetchall()]
-
     bookings = [
-        (shipment_map.get('SHP20260001'), schedule_ids[0] if len(schedule_ids) > 0 else None, carrier_map.get('HDMU'), 'HYUNDAI SINGAPORE', 'V.001E', 'KRPUS', 'USLAX', today.strftime('%Y-%m-%d'), (today + timedelta(days=14)).strftime('%Y-%m-%d'), 'CONFIRMED'),
-        (shipment_map.get('SHP20260002'), schedule_ids[1] if len(schedule_ids) > 1 else None, carrier_map.get('MAEU'), 'MAERSK SEALAND', 'V.002W', 'KRPUS', 'NLRTM', today.strftime('%Y-%m-%d'), (today + timedelta(days=28)).strftime('%Y-%m-%d'), 'CONFIRMED'),
-        (shipment_map.get('SHP20260004'), schedule_ids[2] if len(schedule_ids) > 2 else None, carrier_map.get('COSU'), 'COSCO GALAXY', 'V.003E', 'CNSHA', 'KRPUS', (today - timedelta(days=3)).strftime('%Y-%m-%d'), today.strftime('%Y-%m-%d'), 'CONFIRMED')
+        (keys.get('ORD_SHIPMENT', 'SHP20260001'), keys.get('SCH_OCEAN_SCHEDULE', 'V.001E'), keys.get('MST_CARRIER', 'HDMU'), 'HYUNDAI SINGAPORE', 'V.001E', 'KRPUS', 'USLAX', today.strftime('%Y-%m-%d'), (today + timedelta(days=14)).strftime('%Y-%m-%d'), 'CONFIRMED'),
+        (keys.get('ORD_SHIPMENT', 'SHP20260002'), keys.get('SCH_OCEAN_SCHEDULE', 'V.002W'), keys.get('MST_CARRIER', 'MAEU'), 'MAERSK SEALAND', 'V.002W', 'KRPUS', 'NLRTM', today.strftime('%Y-%m-%d'), (today + timedelta(days=28)).strftime('%Y-%m-%d'), 'CONFIRMED'),
+        (keys.get('ORD_SHIPMENT', 'SHP20260004'), keys.get('SCH_OCEAN_SCHEDULE', 'V.003E'), keys.get('MST_CARRIER', 'COSU'), 'COSCO GALAXY', 'V.003E', 'CNSHA', 'KRPUS', (today - timedelta(days=3)).strftime('%Y-%m-%d'), today.strftime('%Y-%m-%d'), 'CONFIRMED')
     ]
 
-    booking_ids = []
-    for b in bookings:
-        cursor.execute("""
-            INSERT INTO ORD_OCEAN_BOOKING (SHIPMENT_ID, SCHEDULE_ID, CARRIER_ID, VESSEL_NM, VOYAGE_NO, POL_PORT_CD, POD_PORT_CD, ETD_DT, ETA_DT, STATUS_CD)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        """, b)
-        cursor.execute("SELECT LAST_INSERT_ID()")
-        booking_ids.append(cursor.fetchone()[0])
+    booking_ids_db = key_range(cursor, 'ORD_OCEAN_BOOKING', 'BOOKING_ID', len(bookings))
+    cursor.executemany("""
+        INSERT INTO ORD_OCEAN_BOOKING (BOOKING_ID, BOOKING_NO, SHIPMENT_ID, OCEAN_SCHEDULE_ID, CARRIER_ID, VESSEL_NM, VOYAGE_NO, POL_PORT_CD, POD_PORT_CD, ETD_DT, ETA_DT, STATUS_CD)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+    """, [(k, f"OBK{k:010d}") + b for k, b in zip(booking_ids_db, bookings)])
     print("  [OK] ORD_OCEAN_BOOKING")
 
     # ORD_OCEAN_BOOKING_CNTR
-    cursor.execute("SELECT BOOKING_ID FROM ORD_OCEAN_BOOKING LIMIT 3")
-    booking_ids_db = [row[0] for row in cursor.fetchall()]
 
+    # Booked equipment per line; container numbers are assigned on the B/L (BL_CONTAINER)
     containers = [
-        (booking_ids_db[0] if len(booking_ids_db) > 0 else None, 'HDMU1234567', '40', 'HC', 1, 25000.000, 'SL12345'),
-        (booking_ids_db[0] if len(booking_ids_db) > 0 else None, 'HDMU2345678', '40', 'HC', 2, 25000.000, 'SL12346'),
-        (booking_ids_db[2] if len(booking_ids_db) > 2 else None, 'COSU9876543', '20', 'GP', 1, 18000.000, 'SL99887')
+        (booking_ids_db[0] if len(booking_ids_db) > 0 else None, 1, '40', 'HC', 2),
+        (booking_ids_db[2] if len(booking_ids_db) > 2 else None, 1, '20', 'GP', 1)
     ]
-    for c in containers:
-        if c[0]:
-            cursor.execute("""
-                INSERT INTO ORD_OCEAN_BOOKING_CNTR (BOOKING_ID, CNTR_NO, CNTR_SIZE_CD, CNTR_TYPE_CD, SEQ_NO, MAX_WEIGHT_KG, SEAL_NO)
-                VALUES (%s, %s, %s, %s, %s, %s, %s)
-            """, c)
+    cursor.executemany("""
+        INSERT INTO ORD_OCEAN_BOOKING_CNTR (BOOKING_ID, LINE_NO, CNTR_SIZE_CD, CNTR_TYPE_CD, CNTR_QTY)
+        VALUES (%s, %s, %s, %s, %s)
+    """, [c for c in containers if c[0]])
     print("  [OK] ORD_OCEAN_BOOKING_CNTR")
 
     # ORD_AIR_BOOKING
-    cursor.execute("SELECT SCHEDULE_ID FROM SCH_AIR_SCHEDULE LIMIT 2")
-    air_schedule_ids = [row[0] for row in cursor.fetchall()]
 
     air_bookings = [
-        (shipment_map.get('SHP20260003'), air_schedule_ids[0] if len(air_schedule_ids) > 0 else None, carrier_map.get('KE'), 'KE001', 'KRINC', 'USLXP', today.strftime('%Y-%m-%d %H:%M:%S'), (today + timedelta(days=1)).strftime('%Y-%m-%d %H:%M:%S'), 2500.000, 75.000, 'CONFIRMED'),
-        (shipment_map.get('SHP20260005'), air_schedule_ids[1] if len(air_schedule_ids) > 1 else None, carrier_map.get('CX'), 'CX417', 'VKHKG', 'KRINC', (today + timedelta(days=1)).strftime('%Y-%m-%d %H:%M:%S'), (today + timedelta(days=1)).strftime('%Y-%m-%d %H:%M:%S'), 500.000, 5.000, 'PENDING')
-    ]
-    for a in air_bookings:
-        cursor.execute("""
-            INSERT INTO ORD_AIR_BOOKING (SHIPMENT_ID, SCHEDULE_ID, CARRIER_ID, FLIGHT_NO, ORIGIN_PORT_CD, DEST_PORT_CD, ETD_DTM, ETA_DTM, GROSS_WEIGHT_KG, VOLUME_CBM, STATUS_CD)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        """, a)
+        (keys.get('ORD_SHIPMENT', 'SHP20260003'), keys.get('SCH_AIR_SCHEDULE', 'KE001'), keys.get('MST_CARRIER', 'KE'), 'KE001', 'KRINC', 'USLXP', today.strftime('%Y-%m-%d %H:%M:%S'), (today + timedelta(days=1)).strftime('%Y-%m-%d %H:%M:%S'), 2500.000, 75.000, 'CONFIRMED'),
+        (keys.get('ORD_SHIPMENT', 'SHP20260005'), keys.get('SCH_AIR_SCHEDULE', 'CX417'), keys.get('MST_CARRIER', 'CX'), 'CX417', 'VKHKG', 'KRINC', (today + timedelta(days=1)).strftime('%Y-%m-%d %H:%M:%S'), (today + timedelta(days=1)).strftime('%Y-%m-%d %H:%M:%S'), 500.000, 5.000, 'PENDING')
+    ]
+    cursor.executemany("""
+        INSERT INTO ORD_AIR_BOOKING (BOOKING_NO, SHIPMENT_ID, AIR_SCHEDULE_ID, CARRIER_ID, FLIGHT_NO, ORIGIN_PORT_CD, DEST_PORT_CD, ETD_DTM, ETA_DTM, GROSS_WEIGHT_KG, VOLUME_CBM, STATUS_CD)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+        ON DUPLICATE KEY UPDATE STATUS_CD=VALUES(STATUS_CD)
+    """, [(f"ABK{b[0]:010d}",) + b for b in air_bookings if b[0]])
     print("  [OK] ORD_AIR_BOOKING")
 
-    return shipment_map, carrier_map, customer_map, booking_ids_db
+    return booking_ids_db
 
 
-def insert_bl_awb_data(cursor, shipment_map, carrier_map, booking_ids_db):
+def insert_bl_awb_data(cursor, keys, booking_ids_db):
     """04. B/L & AWB Tables Sample Data"""
     print("\n=== 04. B/L & AWB Tables ===")
 
@@ -478,85 +458,77 @@ def insert_bl_awb_data(cursor, shipment_map, carrier_map, booking_ids_db):
 
     # BL_MASTER_BL
     mbls = [
-        ('HDMUPUS12345678', shipment_map.get('SHP20260001'), booking_ids_db[0] if len(booking_ids_db) > 0 else None, carrier_map.get('HDMU'), 'HYUNDAI SINGAPORE', 'V.001E', 'KRPUS', 'USLAX', today.strftime('%Y-%m-%d'), (today + timedelta(days=14)).strftime('%Y-%m-%d'), 'Samsung Electronics', 'ABC Trading Co.', 100, 'CTN', 5000.000, 150.000, 'ORIGINAL', 3, 'RELEASED'),
-        ('MAEULAX98765432', shipment_map.get('SHP20260002'), booking_ids_db[1] if len(booking_ids_db) > 1 else None, carrier_map.get('MAEU'), 'MAERSK SEALAND', 'V.002W', 'KRPUS', 'NLRTM', today.strftime('%Y-%m-%d'), (today + timedelta(days=28)).strftime('%Y-%m-%d'), 'LG Electronics', 'XYZ Import GmbH', 200, 'CTN', 8000.000, 400.000, 'ORIGINAL', 3, 'ISSUED'),
-        ('COSUPUS55667788', shipment_map.get('SHP20260004'), booking_ids_db[2] if len(booking_ids_db) > 2 else None, carrier_map.get('COSU'), 'COSCO GALAXY', 'V.003E', 'CNSHA', 'KRPUS', (today - timedelta(days=3)).strftime('%Y-%m-%d'), today.strftime('%Y-%m-%d'), 'Shanghai Supplier', 'SK Hynix Inc.', 500, 'CTN', 2000.000, 50.000, 'ORIGINAL', 3, 'ARRIVED')
+        ('HDMUPUS12345678', keys.get('ORD_SHIPMENT', 'SHP20260001'), booking_ids_db[0] if len(booking_ids_db) > 0 else None, keys.get('MST_CARRIER', 'HDMU'), 'HYUNDAI SINGAPORE', 'V.001E', 'KRPUS', 'USLAX', today.strftime('%Y-%m-%d'), (today + timedelta(days=14)).strftime('%Y-%m-%d'), 'Samsung Electronics', 'ABC Trading Co.', 100, 'CTN', 5000.000, 150.000, 'ORIGINAL', 3, 'RELEASED'),
+        ('MAEULAX98765432', keys.get('ORD_SHIPMENT', 'SHP20260002'), booking_ids_db[1] if len(booking_ids_db) > 1 else None, keys.get('MST_CARRIER', 'MAEU'), 'MAERSK SEALAND', 'V.002W', 'KRPUS', 'NLRTM', today.strftime('%Y-%m-%d'), (today + timedelta(days=28)).strftime('%Y-%m-%d'), 'LG Electronics', 'XYZ Import GmbH', 200, 'CTN', 8000.000, 400.000, 'ORIGINAL', 3, 'ISSUED'),
+        ('COSUPUS55667788', keys.get('ORD_SHIPMENT', 'SHP20260004'), booking_ids_db[2] if len(booking_ids_db) > 2 else None, keys.get('MST_CARRIER', 'COSU'), 'COSCO GALAXY', 'V.003E', 'CNSHA', 'KRPUS', (today - timedelta(days=3)).strftime('%Y-%m-%d'), today.strftime('%Y-%m-%d'), 'Shanghai Supplier', 'SK Hynix Inc.', 500, 'CTN', 2000.000, 50.000, 'ORIGINAL', 3, 'ARRIVED')
     ]
 
-    mbl_ids = []
-    for m in mbls:
-        cursor.execute("""
-            INSERT INTO BL_MASTER_BL (MBL_NO, SHIPMENT_ID, BOOKING_ID, CARRIER_ID, VESSEL_NM, VOYAGE_NO, POL_PORT_CD, POD_PORT_CD,
-                ETD_DT, ETA_DT, SHIPPER_NM, CONSIGNEE_NM, TOTAL_PKG_QTY, PKG_TYPE_CD, GROSS_WEIGHT_KG, VOLUME_CBM, BL_TYPE_CD, ORIGINAL_BL_COUNT, STATUS_CD)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        """, m)
-        cursor.execute("SELECT LAST_INSERT_ID()")
-        mbl_ids.append(cursor.fetchone()[0])
+    mbl_ids = keys.allocate('BL_MASTER_BL', [m[0] for m in mbls])
+    cursor.executemany("""
+        INSERT INTO BL_MASTER_BL (MBL_ID, MBL_NO, SHIPMENT_ID, BOOKING_ID, CARRIER_ID, VESSEL_NM, VOYAGE_NO, POL_PORT_CD, POD_PORT_CD,
+            ETD_DT, ETA_DT, SHIPPER_NM, CONSIGNEE_NM, TOTAL_PKG_QTY, PKG_TYPE_CD, GROSS_WEIGHT_KG, VOLUME_CBM, BL_TYPE_CD, ORIGINAL_BL_COUNT, STATUS_CD)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+    """, [(k,) + m for k, m in zip(mbl_ids, mbls)])
     print("  [OK] BL_MASTER_BL")
 
     # BL_HOUSE_BL
     hbls = [
-        ('IGSHBL20260001', mbl_ids[0], shipment_map.get('SHP20260001'), 'Samsung Electronics', '서울시 서초구 서초대로 74길 11', 'ABC Trading Co.', '1234 Main Street, Los Angeles, CA', 'Same as Consignee', 'FOB', 'KRPUS', 'USLAX', 'Semiconductor Chips', 100, 'CTN', 5000.000, 150.000, 'ORIGINAL', 3, 'RELEASED'),
-        ('IGSHBL20260002', mbl_ids[1], shipment_map.get('SHP20260002'), 'LG Electronics', '서울시 영등포구 여의대로 128', 'XYZ Import GmbH', 'Hauptstrasse 123, Hamburg', 'Same as Consignee', 'CIF', 'KRPUS', 'DEHAM', 'LED TV', 200, 'CTN', 8000.000, 400.000, 'ORIGINAL', 3, 'ISSUED'),
-        ('IGSHBL20260003', mbl_ids[2], shipment_map.get('SHP20260004'), 'Shanghai Supplier', 'Shanghai, China', 'SK Hynix Inc.', '경기도 이천시 부발읍 경충대로 2091', 'Same as Consignee', 'CIF', 'CNSHA', 'KRPUS', 'Memory Chips', 500, 'CTN', 2000.000, 50.000, 'ORIGINAL', 3, 'ARRIVED')
-    ]
-    for h in hbls:
-        cursor.execute("""
-            INSERT INTO BL_HOUSE_BL (HBL_NO, MBL_ID, SHIPMENT_ID, SHIPPER_NM, SHIPPER_ADDR, CONSIGNEE_NM, CONSIGNEE_ADDR,
-                NOTIFY_PARTY, INCOTERMS_CD, POL_PORT_CD, POD_PORT_CD, COMMODITY_DESC, TOTAL_PKG_QTY, PKG_TYPE_CD,
-                GROSS_WEIGHT_KG, VOLUME_CBM, BL_TYPE_CD, ORIGINAL_BL_COUNT, STATUS_CD)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        """, h)
+        ('IGSHBL20260001', mbl_ids[0], keys.get('ORD_SHIPMENT', 'SHP20260001'), keys.get('MST_CUSTOMER', 'CUST001'), 'Samsung Electronics', '서울시 서초구 서초대로 74길 11', 'ABC Trading Co.', '1234 Main Street, Los Angeles, CA', 'Same as Consignee', 'COLLECT', 'KRPUS', 'USLAX', 'Semiconductor Chips', 100, 'CTN', 5000.000, 150.000, 'ORIGINAL', 3, 'RELEASED'),
+        ('IGSHBL20260002', mbl_ids[1], keys.get('ORD_SHIPMENT', 'SHP20260002'), keys.get('MST_CUSTOMER', 'CUST002'), 'LG Electronics', '서울시 영등포구 여의대로 128', 'XYZ Import GmbH', 'Hauptstrasse 123, Hamburg', 'Same as Consignee', 'PREPAID', 'KRPUS', 'DEHAM', 'LED TV', 200, 'CTN', 8000.000, 400.000, 'ORIGINAL', 3, 'ISSUED'),
+        ('IGSHBL20260003', mbl_ids[2], keys.get('ORD_SHIPMENT', 'SHP20260004'), keys.get('MST_CUSTOMER', 'CUST004'), 'Shanghai Supplier', 'Shanghai, China', 'SK Hynix Inc.', '경기도 이천시 부발읍 경충대로 2091', 'Same as Consignee', 'PREPAID', 'CNSHA', 'KRPUS', 'Memory Chips', 500, 'CTN', 2000.000, 50.000, 'ORIGINAL', 3, 'ARRIVED')
+    ]
+    # Incoterms stay on ORD_SHIPMENT; the B/L carries the freight term (FOB: collect, CIF: prepaid)
+    cursor.executemany("""
+        INSERT INTO BL_HOUSE_BL (HBL_NO, MBL_ID, SHIPMENT_ID, CUSTOMER_ID, SHIPPER_NM, SHIPPER_ADDR, CONSIGNEE_NM, CONSIGNEE_ADDR,
+            NOTIFY_PARTY, FREIGHT_TERM_CD, POL_PORT_CD, POD_PORT_CD, COMMODITY_DESC, TOTAL_PKG_QTY, PKG_TYPE_CD,
+            GROSS_WEIGHT_KG, VOLUME_CBM, BL_TYPE_CD, ORIGINAL_BL_COUNT, STATUS_CD)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+    """, hbls)
     print("  [OK] BL_HOUSE_BL")
 
     # BL_CONTAINER
     bl_containers = [
-        (mbl_ids[0], 'HDMU1234567', '40', 'HC', 'SL12345', 5000.000, 150.000, 30000.000, 4200.000),
-        (mbl_ids[0], 'HDMU2345678', '40', 'HC', 'SL12346', 5000.000, 150.000, 30000.000, 4200.000),
-        (mbl_ids[2], 'COSU9876543', '20', 'GP', 'SL99887', 18000.000, 28.000, 24000.000, 2350.000)
-    ]
-    for c in bl_containers:
-        cursor.execute("""
-            INSERT INTO BL_CONTAINER (MBL_ID, CNTR_NO, CNTR_SIZE_CD, CNTR_TYPE_CD, SEAL_NO, GROSS_WEIGHT_KG, VOLUME_CBM, MAX_WEIGHT_KG, TARE_WEIGHT_KG)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-        """, c)
+        (mbl_ids[0], 'HDMU1234567', '40', 'HC', 'SL12345', 5000.000, 150.000, 4200.000),
+        (mbl_ids[0], 'HDMU2345678', '40', 'HC', 'SL12346', 5000.000, 150.000, 4200.000),
+        (mbl_ids[2], 'COSU9876543', '20', 'GP', 'SL99887', 18000.000, 28.000, 2350.000)
+    ]
+    cursor.executemany("""
+        INSERT INTO BL_CONTAINER (MBL_ID, CNTR_NO, CNTR_SIZE_CD, CNTR_TYPE_CD, SEAL_NO, GROSS_WEIGHT_KG, VOLUME_CBM, TARE_WEIGHT_KG)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+    """, bl_containers)
     print("  [OK] BL_CONTAINER")
 
     # BL_MASTER_AWB
     mawbs = [
-        ('180-12345670', shipment_map.get('SHP20260003'), carrier_map.get('KE'), 'KE001', 'KRINC', 'USLXP', today.strftime('%Y-%m-%d'), (today + timedelta(days=1)).strftime('%Y-%m-%d'), 'Hyundai Motor Company', 'Global Parts Inc.', 2500.000, 75.000, 'DEPARTED'),
-        ('160-11112220', shipment_map.get('SHP20260005'), carrier_map.get('CX'), 'CX417', 'VKHKG', 'KRINC', (today + timedelta(days=1)).strftime('%Y-%m-%d'), (today + timedelta(days=1)).strftime('%Y-%m-%d'), 'HK Supplier Ltd.', 'Samsung Electronics', 500.000, 5.000, 'PENDING')
+        ('180-12345670', keys.get('ORD_SHIPMENT', 'SHP20260003'), keys.get('MST_CARRIER', 'KE'), 'KE001', 'KRINC', 'USLXP', today.strftime('%Y-%m-%d'), (today + timedelta(days=1)).strftime('%Y-%m-%d'), 'Hyundai Motor Company', 'Global Parts Inc.', 2500.000, 75.000, 'DEPARTED'),
+        ('160-11112220', keys.get('ORD_SHIPMENT', 'SHP20260005'), keys.get('MST_CARRIER', 'CX'), 'CX417', 'VKHKG', 'KRINC', (today + timedelta(days=1)).strftime('%Y-%m-%d'), (today + timedelta(days=1)).strftime('%Y-%m-%d'), 'HK Supplier Ltd.', 'Samsung Electronics', 500.000, 5.000, 'PENDING')
     ]
 
-    mawb_ids = []
-    for m in mawbs:
-        cursor.execute("""
-            INSERT INTO BL_MASTER_AWB (MAWB_NO, SHIPMENT_ID, CARRIER_ID, FLIGHT_NO, ORIGIN_PORT_CD, DEST_PORT_CD,
-                ETD_DT, ETA_DT, SHIPPER_NM, CONSIGNEE_NM, GROSS_WEIGHT_KG, VOLUME_CBM, STATUS_CD)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        """, m)
-        cursor.execute("SELECT LAST_INSERT_ID()")
-        mawb_ids.append(cursor.fetchone()[0])
+    mawb_ids = keys.allocate('BL_MASTER_AWB', [m[0] for m in mawbs])
+    cursor.executemany("""
+        INSERT INTO BL_MASTER_AWB (MAWB_ID, MAWB_NO, SHIPMENT_ID, CARRIER_ID, FLIGHT_NO, ORIGIN_PORT_CD, DEST_PORT_CD,
+            ETD_DTM, ETA_DTM, SHIPPER_NM, CONSIGNEE_NM, GROSS_WEIGHT_KG, VOLUME_CBM, STATUS_CD)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+    """, [(k,) + m for k, m in zip(mawb_ids, mawbs)])
     print("  [OK] BL_MASTER_AWB")
 
     # BL_HOUSE_AWB
     hawbs = [
-        ('IGSHAWB20260001', mawb_ids[0], shipment_map.get('SHP20260003'), 'Hyundai Motor Company', '서울시 서초구 헌릉로 12', 'Global Parts Inc.', '5678 Industrial Blvd, Chicago, IL', 'Same as Consignee', 'Engine Parts', 50, 'PLT', 2500.000, 75.000, 150000.00, 'USD', 'DEPARTED'),
-        ('IGSHAWB20260002', mawb_ids[1], shipment_map.get('SHP20260005'), 'HK Supplier Ltd.', 'Kowloon, Hong Kong', 'Samsung Electronics', '서울시 서초구 서초대로 74길 11', 'Same as Consignee', 'IC Components', 10, 'CTN', 500.000, 5.000, 800000.00, 'USD', 'PENDING')
-    ]
-    for h in hawbs:
-        cursor.execute("""
-            INSERT INTO BL_HOUSE_AWB (HAWB_NO, MAWB_ID, SHIPMENT_ID, SHIPPER_NM, SHIPPER_ADDR, CONSIGNEE_NM,
-                CONSIGNEE_ADDR, NOTIFY_PARTY, COMMODITY_DESC, TOTAL_PKG_QTY, PKG_TYPE_CD, GROSS_WEIGHT_KG,
-                VOLUME_CBM, DECLARED_VALUE_AMT, DECLARED_VALUE_CURR, STATUS_CD)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        """, h)
+        ('IGSHAWB20260001', mawb_ids[0], keys.get('ORD_SHIPMENT', 'SHP20260003'), keys.get('MST_CUSTOMER', 'CUST003'), 'KRINC', 'USLXP', 'Hyundai Motor Company', '서울시 서초구 헌릉로 12', 'Global Parts Inc.', '5678 Industrial Blvd, Chicago, IL', 'Same as Consignee', 'Engine Parts', 50, 'PLT', 2500.000, 75.000, 150000.00, 'USD', 'DEPARTED'),
+        ('IGSHAWB20260002', mawb_ids[1], keys.get('ORD_SHIPMENT', 'SHP20260005'), keys.get('MST_CUSTOMER', 'CUST001'), 'VKHKG', 'KRINC', 'HK Supplier Ltd.', 'Kowloon, Hong Kong', 'Samsung Electronics', '서울시 서초구 서초대로 74길 11', 'Same as Consignee', 'IC Components', 10, 'CTN', 500.000, 5.000, 800000.00, 'USD', 'PENDING')
+    ]
+    cursor.executemany("""
+        INSERT INTO BL_HOUSE_AWB (HAWB_NO, MAWB_ID, SHIPMENT_ID, CUSTOMER_ID, ORIGIN_PORT_CD, DEST_PORT_CD, SHIPPER_NM,
+            SHIPPER_ADDR, CONSIGNEE_NM, CONSIGNEE_ADDR, NOTIFY_PARTY, COMMODITY_DESC, TOTAL_PKG_QTY, PKG_TYPE_CD,
+            GROSS_WEIGHT_KG, VOLUME_CBM, DECLARED_VALUE, DECLARED_VALUE_CURR, STATUS_CD)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+    """, hawbs)
     print("  [OK] BL_HOUSE_AWB")
 
     return mbl_ids, mawb_ids
 
 
-def insert_tracking_data(cursor, shipment_map):
+def insert_tracking_data(cursor, keys):
     """05. Tracking & Transport Tables Sample Data"""
     print("\n=== 05. Shipment & Transport Tables ===")
 
@@ -564,70 +536,66 @@ def insert_tracking_data(cursor, shipment_map):
 
     # SHP_TRACKING_EVENT
     events = [
-        (shipment_map.get('SHP20260001'), (today - timedelta(days=2)).strftime('%Y-%m-%d %H:%M:%S'), 'BKD', 'Booking Confirmed', 'KRPUS', None),
-        (shipment_map.get('SHP20260001'), (today - timedelta(days=1)).strftime('%Y-%m-%d %H:%M:%S'), 'GIN', 'Gate In at Terminal', 'KRPUS', 'HDMU1234567'),
-        (shipment_map.get('SHP20260001'), today.strftime('%Y-%m-%d %H:%M:%S'), 'LOD', 'Loaded on Vessel', 'KRPUS', 'HDMU1234567'),
-        (shipment_map.get('SHP20260001'), today.strftime('%Y-%m-%d %H:%M:%S'), 'DEP', 'Vessel Departed', 'KRPUS', None),
-        (shipment_map.get('SHP20260003'), (today - timedelta(days=1)).strftime('%Y-%m-%d %H:%M:%S'), 'BKD', 'Booking Confirmed', 'KRINC', None),
-        (shipment_map.get('SHP20260003'), today.strftime('%Y-%m-%d %H:%M:%S'), 'DEP', 'Flight Departed', 'KRINC', None),
-        (shipment_map.get('SHP20260004'), (today - timedelta(days=5)).strftime('%Y-%m-%d %H:%M:%S'), 'DEP', 'Vessel Departed', 'CNSHA', None),
-        (shipment_map.get('SHP20260004'), today.strftime('%Y-%m-%d %H:%M:%S'), 'ARR', 'Vessel Arrived', 'KRPUS', None),
-        (shipment_map.get('SHP20260004'), today.strftime('%Y-%m-%d %H:%M:%S'), 'DIS', 'Discharged from Vessel', 'KRPUS', 'COSU9876543')
-    ]
-    for e in events:
-        if e[0]:
-            cursor.execute("""
-                INSERT INTO SHP_TRACKING_EVENT (SHIPMENT_ID, EVENT_DTM, EVENT_CD, EVENT_DESC, LOCATION_CD, CNTR_NO)
-                VALUES (%s, %s, %s, %s, %s, %s)
-            """, e)
+        (keys.get('ORD_SHIPMENT', 'SHP20260001'), (today - timedelta(days=2)).strftime('%Y-%m-%d %H:%M:%S'), 'BKD', 'Booking Confirmed', 'KRPUS', None),
+        (keys.get('ORD_SHIPMENT', 'SHP20260001'), (today - timedelta(days=1)).strftime('%Y-%m-%d %H:%M:%S'), 'GIN', 'Gate In at Terminal', 'KRPUS', 'HDMU1234567'),
+        (keys.get('ORD_SHIPMENT', 'SHP20260001'), today.strftime('%Y-%m-%d %H:%M:%S'), 'LOD', 'Loaded on Vessel', 'KRPUS', 'HDMU1234567'),
+        (keys.get('ORD_SHIPMENT', 'SHP20260001'), today.strftime('%Y-%m-%d %H:%M:%S'), 'DEP', 'Vessel Departed', 'KRPUS', None),
+        (keys.get('ORD_SHIPMENT', 'SHP20260003'), (today - timedelta(days=1)).strftime('%Y-%m-%d %H:%M:%S'), 'BKD', 'Booking Confirmed', 'KRINC', None),
+        (keys.get('ORD_SHIPMENT', 'SHP20260003'), today.strftime('%Y-%m-%d %H:%M:%S'), 'DEP', 'Flight Departed', 'KRINC', None),
+        (keys.get('ORD_SHIPMENT', 'SHP20260004'), (today - timedelta(days=5)).strftime('%Y-%m-%d %H:%M:%S'), 'DEP', 'Vessel Departed', 'CNSHA', None),
+        (keys.get('ORD_SHIPMENT', 'SHP20260004'), today.strftime('%Y-%m-%d %H:%M:%S'), 'ARR', 'Vessel Arrived', 'KRPUS', None),
+        (keys.get('ORD_SHIPMENT', 'SHP20260004'), today.strftime('%Y-%m-%d %H:%M:%S'), 'DIS', 'Discharged from Vessel', 'KRPUS', 'COSU9876543')
+    ]
+    # Container events point at the BL_CONTAINER row of the container number
+    cursor.executemany("""
+        INSERT INTO SHP_TRACKING_EVENT (SHIPMENT_ID, EVENT_DTM, EVENT_CD, EVENT_NM, LOCATION_CD, CONTAINER_ID)
+        VALUES (%s, %s, %s, %s, %s, (SELECT MAX(CONTAINER_ID) FROM BL_CONTAINER WHERE CNTR_NO = %s))
+    """, [e for e in events if e[0]])
     print("  [OK] SHP_TRACKING_EVENT")
 
     # TRN_WAREHOUSE
     warehouses = [
-        ('WH001', 'Busan CFS', 'Busan CFS', 'CFS', '부산시 중구 부두로', 'Busan', 'KR', '김창고', '051-123-4567', 'wh@busancfs.kr'),
-        ('WH002', 'Incheon Bonded', 'Incheon Bonded WH', 'BONDED', '인천시 중구 공항로', 'Incheon', 'KR', '이창고', '032-234-5678', 'wh@incheonbonded.kr'),
-        ('WH003', 'Seoul Distribution', 'Seoul Distribution Center', 'GENERAL', '서울시 강서구 공항대로', 'Seoul', 'KR', '박창고', '02-345-6789', 'wh@seouldist.kr')
-    ]
-    for w in warehouses:
-        cursor.execute("""
-            INSERT INTO TRN_WAREHOUSE (WAREHOUSE_CD, WAREHOUSE_NM, WAREHOUSE_NM_EN, WAREHOUSE_TYPE_CD, ADDR, CITY, COUNTRY_CD, CONTACT_NM, TEL_NO, EMAIL, USE_YN)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, 'Y')
-            ON DUPLICATE KEY UPDATE WAREHOUSE_NM=VALUES(WAREHOUSE_NM)
-        """, w)
+        ('WH001', 'Busan CFS', 'CFS', '부산시 중구 부두로', 'Busan', 'KR', '김창고', '051-123-4567', 'wh@busancfs.kr'),
+        ('WH002', 'Incheon Bonded WH', 'BONDED', '인천시 중구 공항로', 'Incheon', 'KR', '이창고', '032-234-5678', 'wh@incheonbonded.kr'),
+        ('WH003', 'Seoul Distribution Center', 'GENERAL', '서울시 강서구 공항대로', 'Seoul', 'KR', '박창고', '02-345-6789', 'wh@seouldist.kr')
+    ]
+    cursor.executemany("""
+        INSERT INTO TRN_WAREHOUSE (WAREHOUSE_ID, WAREHOUSE_NAME, WAREHOUSE_TYPE, ADDRESS, CITY, COUNTRY_CODE, CONTACT_NAME, CONTACT_TEL, CONTACT_EMAIL, ACTIVE_YN)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, 'Y')
+        ON DUPLICATE KEY UPDATE WAREHOUSE_NAME=VALUES(WAREHOUSE_NAME)
+    """, warehouses)
     print("  [OK] TRN_WAREHOUSE")
 
     # TRN_TRANSPORT_ORDER
     transport_orders = [
-        (shipment_map.get('SHP20260001'), 'PICKUP', 'TRUCK', 'TRUCK001', '12가1234', '김기사', '010-1111-2222', '서울시 서초구 서초대로 74길 11', (today - timedelta(days=2)).strftime('%Y-%m-%d'), '09:00:00', '부산시 중구 부두로 CY', (today - timedelta(days=2)).strftime('%Y-%m-%d'), '15:00:00', 'COMPLETED'),
-        (shipment_map.get('SHP20260004'), 'DELIVERY', 'TRUCK', 'TRUCK002', '34나5678', '이기사', '010-3333-4444', '부산항 CY', today.strftime('%Y-%m-%d'), '10:00:00', '경기도 이천시 부발읍 경충대로 2091', today.strftime('%Y-%m-%d'), '16:00:00', 'IN_TRANSIT')
-    ]
-    for t in transport_orders:
-        if t[0]:
-            cursor.execute("""
-                INSERT INTO TRN_TRANSPORT_ORDER (SHIPMENT_ID, TRANSPORT_TYPE_CD, TRANSPORT_MODE_CD, TRUCKER_CD, VEHICLE_NO,
-                    DRIVER_NM, DRIVER_MOBILE, PICKUP_ADDR, PICKUP_DT, PICKUP_TIME, DELIVERY_ADDR, DELIVERY_DT, DELIVERY_TIME, STATUS_CD)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """, t)
+        ('TO-SHP20260001', keys.get('ORD_SHIPMENT', 'SHP20260001'), 'PICKUP', 'TRUCK', keys.get('MST_TRUCKER', 'TRUCK001'), '12가1234', '김기사', '010-1111-2222', '서울시 서초구 서초대로 74길 11', (today - timedelta(days=2)).strftime('%Y-%m-%d'), '09:00:00', '부산시 중구 부두로 CY', (today - timedelta(days=2)).strftime('%Y-%m-%d'), '15:00:00', 'COMPLETED'),
+        ('TO-SHP20260004', keys.get('ORD_SHIPMENT', 'SHP20260004'), 'DELIVERY', 'TRUCK', keys.get('MST_TRUCKER', 'TRUCK002'), '34나5678', '이기사', '010-3333-4444', '부산항 CY', today.strftime('%Y-%m-%d'), '10:00:00', '경기도 이천시 부발읍 경충대로 2091', today.strftime('%Y-%m-%d'), '16:00:00', 'IN_TRANSIT')
+    ]
+    cursor.executemany("""
+        INSERT INTO TRN_TRANSPORT_ORDER (TRN_ORDER_ID, SHIPMENT_ID, TRANSPORT_TYPE, TRANSPORT_MODE, TRUCKER_ID, VEHICLE_NO,
+            DRIVER_NAME, DRIVER_MOBILE, PICKUP_ADDR, PICKUP_DATE, PICKUP_TIME, DELIVERY_ADDR, DELIVERY_DATE, DELIVERY_TIME, STATUS)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+        ON DUPLICATE KEY UPDATE STATUS=VALUES(STATUS)
+    """, [t for t in transport_orders if t[1]])
     print("  [OK] TRN_TRANSPORT_ORDER")
 
     # TRN_CONTAINER_MOVEMENT
     movements = [
-        ('HDMU1234567', shipment_map.get('SHP20260001'), 'GATE_IN', 'CY', 'KRPUS', 'Busan New Port', (today - timedelta(days=1)).strftime('%Y-%m-%d'), '10:30:00', 'SL12345', 'N'),
-        ('HDMU1234567', shipment_map.get('SHP20260001'), 'LOAD', 'PORT', 'KRPUS', 'Busan New Port', today.strftime('%Y-%m-%d'), '08:00:00', 'SL12345', 'N'),
-        ('COSU9876543', shipment_map.get('SHP20260004'), 'DISCHARGE', 'PORT', 'KRPUS', 'Busan New Port', today.strftime('%Y-%m-%d'), '06:00:00', 'SL99887', 'N'),
-        ('COSU9876543', shipment_map.get('SHP20260004'), 'GATE_OUT', 'CY', 'KRPUS', 'Busan New Port', today.strftime('%Y-%m-%d'), '11:00:00', 'SL99887', 'N')
-    ]
-    for m in movements:
-        if m[1]:
-            cursor.execute("""
-                INSERT INTO TRN_CONTAINER_MOVEMENT (CNTR_NO, SHIPMENT_ID, MOVEMENT_TYPE_CD, LOCATION_TYPE_CD,
-                    LOCATION_CD, LOCATION_NM, MOVEMENT_DT, MOVEMENT_TIME, SEAL_NO, DAMAGE_YN)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """, m)
+        ('MV-HDMU1234567-1', 'HDMU1234567', keys.get('ORD_SHIPMENT', 'SHP20260001'), 'GATE_IN', 'CY', 'KRPUS', 'Busan New Port', (today - timedelta(days=1)).strftime('%Y-%m-%d'), '10:30:00', 'SL12345', 'N'),
+        ('MV-HDMU1234567-2', 'HDMU1234567', keys.get('ORD_SHIPMENT', 'SHP20260001'), 'LOAD', 'PORT', 'KRPUS', 'Busan New Port', today.strftime('%Y-%m-%d'), '08:00:00', 'SL12345', 'N'),
+        ('MV-COSU9876543-1', 'COSU9876543', keys.get('ORD_SHIPMENT', 'SHP20260004'), 'DISCHARGE', 'PORT', 'KRPUS', 'Busan New Port', today.strftime('%Y-%m-%d'), '06:00:00', 'SL99887', 'N'),
+        ('MV-COSU9876543-2', 'COSU9876543', keys.get('ORD_SHIPMENT', 'SHP20260004'), 'GATE_OUT', 'CY', 'KRPUS', 'Busan New Port', today.strftime('%Y-%m-%d'), '11:00:00', 'SL99887', 'N')
+    ]
+    cursor.executemany("""
+        INSERT INTO TRN_CONTAINER_MOVEMENT (MOVEMENT_ID, CONTAINER_NO, SHIPMENT_ID, MOVEMENT_TYPE, LOCATION_TYPE,
+            LOCATION_CODE, LOCATION_NAME, MOVEMENT_DATE, MOVEMENT_TIME, SEAL_NO, DAMAGE_YN)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+        ON DUPLICATE KEY UPDATE MOVEMENT_DATE=VALUES(MOVEMENT_DATE)
+    """, [m for m in movements if m[2]])
     print("  [OK] TRN_CONTAINER_MOVEMENT")
 
 
-def insert_customs_data(cursor, shipment_map):
+def insert_customs_data(cursor, keys):
     """06. Customs Tables Sample Data"""
     print("\n=== 06. Customs Tables ===")
 
@@ -635,53 +603,48 @@ def insert_customs_data(cursor, shipment_map):
 
     # CUS_DECLARATION
     declarations = [
-        (shipment_map.get('SHP20260001'), '20260116-001234', 'EXPORT', today.strftime('%Y-%m-%d'), 'BROKER001', '홍길동', 'Samsung Electronics', '124-81-00998', '8542310000', 'Semiconductor Chips', 'KR', 100, 5000.000, 1500000.00, 'USD', 0.00, 0.00, 0.00, 'CLEARED', today.strftime('%Y-%m-%d'), today.strftime('%Y-%m-%d')),
-        (shipment_map.get('SHP20260004'), '20260116-005678', 'IMPORT', today.strftime('%Y-%m-%d'), 'BROKER002', '김통관', 'SK Hynix Inc.', '214-86-05453', '8542320000', 'Memory Chips', 'CN', 500, 2000.000, 2500000.00, 'USD', 0.00, 250000.00, 250000.00, 'CLEARED', today.strftime('%Y-%m-%d'), today.strftime('%Y-%m-%d'))
-    ]
-
-    decl_ids = []
-    for d in declarations:
-        if d[0]:
-            cursor.execute("""
-                INSERT INTO CUS_DECLARATION (SHIPMENT_ID, DECLARATION_NO, DECLARATION_TYPE_CD, DECLARATION_DT,
-                    BROKER_CD, DECLARANT_NM, IMPORTER_EXPORTER_NM, BIZ_REG_NO, HS_CD, COMMODITY_DESC,
-                    COUNTRY_ORIGIN_CD, PKG_QTY, GROSS_WEIGHT_KG, DECLARED_VALUE_AMT, CURRENCY_CD,
-                    DUTY_AMT, VAT_AMT, TOTAL_TAX_AMT, STATUS_CD, CLEARANCE_DT, RELEASE_DT)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """, d)
-            cursor.execute("SELECT LAST_INSERT_ID()")
-            decl_ids.append(cursor.fetchone()[0])
+        (keys.get('ORD_SHIPMENT', 'SHP20260001'), '20260116-001234', 'EXPORT', today.strftime('%Y-%m-%d'), keys.get('MST_CUSTOMS_BROKER', 'BROKER001'), '홍길동', 'Samsung Electronics', '124-81-00998', '8542310000', 'Semiconductor Chips', 'KR', 100, 5000.000, 1500000.00, 'USD', 0.00, 0.00, 0.00, 'CLEARED', today.strftime('%Y-%m-%d'), today.strftime('%Y-%m-%d')),
+        (keys.get('ORD_SHIPMENT', 'SHP20260004'), '20260116-005678', 'IMPORT', today.strftime('%Y-%m-%d'), keys.get('MST_CUSTOMS_BROKER', 'BROKER002'), '김통관', 'SK Hynix Inc.', '214-86-05453', '8542320000', 'Memory Chips', 'CN', 500, 2000.000, 2500000.00, 'USD', 0.00, 250000.00, 250000.00, 'CLEARED', today.strftime('%Y-%m-%d'), today.strftime('%Y-%m-%d'))
+    ]
+
+    declarations = [d for d in declarations if d[0]]
+    decl_ids = key_range(cursor, 'CUS_DECLARATION', 'DECLARATION_ID', len(declarations), prefix='DCL')
+    cursor.executemany("""
+        INSERT INTO CUS_DECLARATION (DECLARATION_ID, SHIPMENT_ID, DECLARATION_NO, DECLARATION_TYPE, DECLARATION_DATE,
+            CUSTOMS_BROKER_ID, DECLARANT, IMPORTER_EXPORTER, IMPORTER_EXPORTER_BRN, HS_CODE, GOODS_DESC,
+            COUNTRY_ORIGIN, PACKAGE_QTY, GROSS_WEIGHT, DECLARED_VALUE, CURRENCY,
+            DUTY_AMOUNT, VAT_AMOUNT, TOTAL_TAX, STATUS, CLEARANCE_DATE, RELEASE_DATE)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+    """, [(k,) + d for k, d in zip(decl_ids, declarations)])
     print("  [OK] CUS_DECLARATION")
 
     # CUS_DECLARATION_ITEM
     if len(decl_ids) >= 2:
         items = [
-            (decl_ids[0], 1, '8542310000', 'Semiconductor Chips - Processors', 'KR', 100.000, 'EA', 15000.0000, 1500000.00, 'USD', 0.0000, 0.00, 0.0000, 0.00),
-            (decl_ids[1], 1, '8542320000', 'Memory Chips - DRAM', 'CN', 300.000, 'EA', 5000.0000, 1500000.00, 'USD', 0.0000, 0.00, 10.0000, 150000.00),
-            (decl_ids[1], 2, '8542320000', 'Memory Chips - NAND', 'CN', 200.000, 'EA', 5000.0000, 1000000.00, 'USD', 0.0000, 0.00, 10.0000, 100000.00)
+            (f"{decl_ids[0]}-1", decl_ids[0], 1, '8542310000', 'Semiconductor Chips - Processors', 'KR', 100.000, 'EA', 15000.0000, 1500000.00, 'USD', 0.0000, 0.00, 0.0000, 0.00),
+            (f"{decl_ids[1]}-1", decl_ids[1], 1, '8542320000', 'Memory Chips - DRAM', 'CN', 300.000, 'EA', 5000.0000, 1500000.00, 'USD', 0.0000, 0.00, 10.0000, 150000.00),
+            (f"{decl_ids[1]}-2", decl_ids[1], 2, '8542320000', 'Memory Chips - NAND', 'CN', 200.000, 'EA', 5000.0000, 1000000.00, 'USD', 0.0000, 0.00, 10.0000, 100000.00)
         ]
-        for i in items:
-            cursor.execute("""
-                INSERT INTO CUS_DECLARATION_ITEM (DECLARATION_ID, LINE_NO, HS_CD, COMMODITY_DESC, COUNTRY_ORIGIN_CD,
-                    QTY, UNIT_CD, UNIT_PRICE, AMT, CURRENCY_CD, DUTY_RATE, DUTY_AMT, VAT_RATE, VAT_AMT)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """, i)
+        cursor.executemany("""
+            INSERT INTO CUS_DECLARATION_ITEM (ITEM_ID, DECLARATION_ID, LINE_NO, HS_CODE, GOODS_DESC, COUNTRY_ORIGIN,
+                QUANTITY, UNIT, UNIT_PRICE, AMOUNT, CURRENCY, DUTY_RATE, DUTY_AMOUNT, VAT_RATE, VAT_AMOUNT)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+        """, items)
         print("  [OK] CUS_DECLARATION_ITEM")
 
         # CUS_DUTY_PAYMENT
         payments = [
-            (decl_ids[1], 'VAT', today.strftime('%Y-%m-%d'), (today + timedelta(days=15)).strftime('%Y-%m-%d'), 250000.00, 'KRW', 'BANK_TRANSFER', 'KEB Hana Bank', '123-456789-01', 'PAY20260116001', 'PAID')
+            (f"{decl_ids[1]}-VAT", decl_ids[1], 'VAT', today.strftime('%Y-%m-%d'), (today + timedelta(days=15)).strftime('%Y-%m-%d'), 250000.00, 'KRW', 'BANK_TRANSFER', 'KEB Hana Bank', '123-456789-01', 'PAY20260116001', 'PAID')
         ]
-        for p in payments:
-            cursor.execute("""
-                INSERT INTO CUS_DUTY_PAYMENT (DECLARATION_ID, PAYMENT_TYPE_CD, PAYMENT_DT, DUE_DT, AMT,
-                    CURRENCY_CD, PAYMENT_METHOD_CD, BANK_NM, ACCOUNT_NO, REFERENCE_NO, STATUS_CD)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """, p)
+        cursor.executemany("""
+            INSERT INTO CUS_DUTY_PAYMENT (PAYMENT_ID, DECLARATION_ID, PAYMENT_TYPE, PAYMENT_DATE, DUE_DATE, AMOUNT,
+                CURRENCY, PAYMENT_METHOD, BANK_NAME, ACCOUNT_NO, REFERENCE_NO, STATUS)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+        """, payments)
         print("  [OK] CUS_DUTY_PAYMENT")
 
 
-def insert_billing_data(cursor, shipment_map, customer_map):
+def insert_billing_data(cursor, keys):
     """07. Billing Tables Sample Data"""
     print("\n=== 07. Billing Tables ===")
 
@@ -689,21 +652,18 @@ def insert_billing_data(cursor, shipment_map, customer_map):
 
     # BIL_CONTRACT
     contracts = [
-        (customer_map.get('CUST001'), 'CT-2026-001', 'Samsung Forwarding Contract', 'STANDARD', (today - timedelta(days=180)).strftime('%Y-%m-%d'), (today + timedelta(days=185)).strftime('%Y-%m-%d'), 'Y', 30, 500000000.00, 'KRW', 'ACTIVE'),
-        (customer_map.get('CUST002'), 'CT-2026-002', 'LG Logistics Contract', 'STANDARD', (today - timedelta(days=90)).strftime('%Y-%m-%d'), (today + timedelta(days=275)).strftime('%Y-%m-%d'), 'Y', 45, 300000000.00, 'KRW', 'ACTIVE'),
-        (customer_map.get('CUST003'), 'CT-2026-003', 'Hyundai Transport Contract', 'PREMIUM', (today - timedelta(days=365)).strftime('%Y-%m-%d'), today.strftime('%Y-%m-%d'), 'N', 60, 1000000000.00, 'KRW', 'ACTIVE')
-    ]
-
-    contract_ids = []
-    for c in contracts:
-        if c[0]:
-            cursor.execute("""
-                INSERT INTO BIL_CONTRACT (CUSTOMER_ID, CONTRACT_NO, CONTRACT_NM, CONTRACT_TYPE_CD, START_DT, END_DT,
-                    AUTO_RENEW_YN, PAYMENT_TERM_DAYS, CREDIT_LIMIT_AMT, CURRENCY_CD, STATUS_CD)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """, c)
-            cursor.execute("SELECT LAST_INSERT_ID()")
-            contract_ids.append(cursor.fetchone()[0])
+        (keys.get('MST_CUSTOMER', 'CUST001'), 'CT-2026-001', 'Samsung Forwarding Contract', 'STANDARD', (today - timedelta(days=180)).strftime('%Y-%m-%d'), (today + timedelta(days=185)).strftime('%Y-%m-%d'), 'Y', 30, 500000000.00, 'KRW', 'ACTIVE'),
+        (keys.get('MST_CUSTOMER', 'CUST002'), 'CT-2026-002', 'LG Logistics Contract', 'STANDARD', (today - timedelta(days=90)).strftime('%Y-%m-%d'), (today + timedelta(days=275)).strftime('%Y-%m-%d'), 'Y', 45, 300000000.00, 'KRW', 'ACTIVE'),
+        (keys.get('MST_CUSTOMER', 'CUST003'), 'CT-2026-003', 'Hyundai Transport Contract', 'PREMIUM', (today - timedelta(days=365)).strftime('%Y-%m-%d'), today.strftime('%Y-%m-%d'), 'N', 60, 1000000000.00, 'KRW', 'ACTIVE')
+    ]
+
+    contracts = [c for c in contracts if c[0]]
+    contract_ids = key_range(cursor, 'BIL_CONTRACT', 'CONTRACT_ID', len(contracts), prefix='CT')
+    cursor.executemany("""
+        INSERT INTO BIL_CONTRACT (CONTRACT_ID, CUSTOMER_ID, CONTRACT_NO, CONTRACT_NAME, CONTRACT_TYPE, START_DATE, END_DATE,
+            AUTO_RENEW_YN, PAYMENT_TERM, CREDIT_LIMIT, CURRENCY, STATUS)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+    """, [(k,) + c for k, c in zip(contract_ids, contracts)])
     print("  [OK] BIL_CONTRACT")
 
     # BIL_TARIFF
@@ -714,77 +674,70 @@ def insert_billing_data(cursor, shipment_map, customer_map):
         (None, 'AIR', 'EXPORT', 'AFR', 'Air Freight', 'PER_UNIT', 'KG', 5.5000, 'USD', 100.00, None, 'KRINC', 'USLXP', 'KE', None, (today - timedelta(days=90)).strftime('%Y-%m-%d'), (today + timedelta(days=275)).strftime('%Y-%m-%d')),
         (contract_ids[0] if len(contract_ids) > 0 else None, 'SEA', 'EXPORT', 'OFR', 'Ocean Freight (Contract)', 'PER_UNIT', 'CNTR', 1400.0000, 'USD', 1400.00, None, 'KRPUS', 'USLAX', 'HDMU', '40HC', (today - timedelta(days=90)).strftime('%Y-%m-%d'), (today + timedelta(days=275)).strftime('%Y-%m-%d'))
     ]
-    for t in tariffs:
-        cursor.execute("""
-            INSERT INTO BIL_TARIFF (CONTRACT_ID, TARIFF_TYPE_CD, SERVICE_TYPE_CD, CHARGE_CD, CHARGE_NM,
-                CALCULATION_TYPE_CD, UNIT_TYPE_CD, RATE, CURRENCY_CD, MIN_AMT, MAX_AMT, ORIGIN_PORT_CD,
-                DEST_PORT_CD, CARRIER_CD, CNTR_TYPE_CD, EFFECTIVE_FROM_DT, EFFECTIVE_TO_DT, USE_YN)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, 'Y')
-        """, t)
+    tariff_ids = key_range(cursor, 'BIL_TARIFF', 'TARIFF_ID', len(tariffs), prefix='TRF')
+    cursor.executemany("""
+        INSERT INTO BIL_TARIFF (TARIFF_ID, CONTRACT_ID, TARIFF_TYPE, SERVICE_TYPE, CHARGE_CODE, CHARGE_NAME,
+            CALCULATION_TYPE, UNIT_TYPE, RATE, CURRENCY, MIN_AMOUNT, MAX_AMOUNT, ORIGIN_PORT,
+            DEST_PORT, CARRIER_CODE, CONTAINER_TYPE, EFFECTIVE_FROM, EFFECTIVE_TO, ACTIVE_YN)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, 'Y')
+    """, [(k,) + t for k, t in zip(tariff_ids, tariffs)])
     print("  [OK] BIL_TARIFF")
 
     # BIL_CHARGE
     charges = [
-        (shipment_map.get('SHP20260001'), 'AR', 'OFR', 'Ocean Freight', customer_map.get('CUST001'), 2.000, 'CNTR', 1400.0000, 2800.00, 'USD', 1350.000000, 3780000.00, 'N', 0.0000, 0.00, 3780000.00, 'INVOICED', 'Y'),
-        (shipment_map.get('SHP20260001'), 'AR', 'THC', 'Terminal Handling', customer_map.get('CUST001'), 2.000, 'CNTR', 150000.0000, 300000.00, 'KRW', 1.000000, 300000.00, 'Y', 10.0000, 30000.00, 330000.00, 'INVOICED', 'Y'),
-        (shipment_map.get('SHP20260001'), 'AR', 'DOC', 'Documentation Fee', customer_map.get('CUST001'), 1.000, 'BL', 50000.0000, 50000.00, 'KRW', 1.000000, 50000.00, 'Y', 10.0000, 5000.00, 55000.00, 'INVOICED', 'Y'),
-        (shipment_map.get('SHP20260003'), 'AR', 'AFR', 'Air Freight', customer_map.get('CUST003'), 2500.000, 'KG', 5.5000, 13750.00, 'USD', 1350.000000, 18562500.00, 'N', 0.0000, 0.00, 18562500.00, 'PENDING', 'Y')
-    ]
-
-    charge_ids = []
-    for c in charges:
-        if c[0] and c[4]:
-            cursor.execute("""
-                INSERT INTO BIL_CHARGE (SHIPMENT_ID, CHARGE_TYPE_CD, CHARGE_CD, CHARGE_NM, CUSTOMER_ID,
-                    QTY, UNIT_TYPE_CD, UNIT_PRICE, AMT, CURRENCY_CD, EXCHANGE_RATE, LOCAL_AMT,
-                    TAX_YN, TAX_RATE, TAX_AMT, TOTAL_AMT, STATUS_CD, AUTO_RATED_YN)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """, c)
-            cursor.execute("SELECT LAST_INSERT_ID()")
-            charge_ids.append(cursor.fetchone()[0])
+        (keys.get('ORD_SHIPMENT', 'SHP20260001'), 'AR', 'OFR', 'Ocean Freight', keys.get('MST_CUSTOMER', 'CUST001'), 2.000, 'CNTR', 1400.0000, 2800.00, 'USD', 1350.000000, 3780000.00, 'N', 0.0000, 0.00, 3780000.00, 'INVOICED', 'Y'),
+        (keys.get('ORD_SHIPMENT', 'SHP20260001'), 'AR', 'THC', 'Terminal Handling', keys.get('MST_CUSTOMER', 'CUST001'), 2.000, 'CNTR', 150000.0000, 300000.00, 'KRW', 1.000000, 300000.00, 'Y', 10.0000, 30000.00, 330000.00, 'INVOICED', 'Y'),
+        (keys.get('ORD_SHIPMENT', 'SHP20260001'), 'AR', 'DOC', 'Documentation Fee', keys.get('MST_CUSTOMER', 'CUST001'), 1.000, 'BL', 50000.0000, 50000.00, 'KRW', 1.000000, 50000.00, 'Y', 10.0000, 5000.00, 55000.00, 'INVOICED', 'Y'),
+        (keys.get('ORD_SHIPMENT', 'SHP20260003'), 'AR', 'AFR', 'Air Freight', keys.get('MST_CUSTOMER', 'CUST003'), 2500.000, 'KG', 5.5000, 13750.00, 'USD', 1350.000000, 18562500.00, 'N', 0.0000, 0.00, 18562500.00, 'PENDING', 'Y')
+    ]
+
+    charges = [c for c in charges if c[0] and c[4]]
+    charge_ids = key_range(cursor, 'BIL_CHARGE', 'CHARGE_ID', len(charges), prefix='CHG')
+    cursor.executemany("""
+        INSERT INTO BIL_CHARGE (CHARGE_ID, SHIPMENT_ID, CHARGE_TYPE, CHARGE_CODE, CHARGE_NAME, CUSTOMER_ID,
+            QUANTITY, UNIT_TYPE, UNIT_PRICE, AMOUNT, CURRENCY, EXCHANGE_RATE, LOCAL_AMOUNT,
+            TAX_YN, TAX_RATE, TAX_AMOUNT, TOTAL_AMOUNT, STATUS, AUTO_RATED_YN)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+    """, [(k,) + c for k, c in zip(charge_ids, charges)])
     print("  [OK] BIL_CHARGE")
 
     # BIL_INVOICE
     invoices = [
-        ('INV-2026-0001', 'AR', today.strftime('%Y-%m-%d'), (today + timedelta(days=30)).strftime('%Y-%m-%d'), customer_map.get('CUST001'), 'Samsung Electronics', '서울시 서초구 서초대로 74길 11', 4130000.00, 35000.00, 4165000.00, 'KRW', 0.00, 4165000.00, 'ISSUED', today.strftime('%Y-%m-%d')),
-        ('INV-2026-0002', 'AR', today.strftime('%Y-%m-%d'), (today + timedelta(days=60)).strftime('%Y-%m-%d'), customer_map.get('CUST003'), 'Hyundai Motor Company', '서울시 서초구 헌릉로 12', 18562500.00, 0.00, 18562500.00, 'KRW', 0.00, 18562500.00, 'DRAFT', None)
-    ]
-
-    invoice_ids = []
-    for i in invoices:
-        if i[4]:
-            cursor.execute("""
-                INSERT INTO BIL_INVOICE (INVOICE_NO, INVOICE_TYPE_CD, INVOICE_DT, DUE_DT, CUSTOMER_ID,
-                    CUSTOMER_NM, BILL_TO_ADDR, SUBTOTAL_AMT, TAX_AMT, TOTAL_AMT, CURRENCY_CD,
-                    PAID_AMT, BALANCE_AMT, STATUS_CD, ISSUED_DT)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """, i)
-            cursor.execute("SELECT LAST_INSERT_ID()")
-            invoice_ids.append(cursor.fetchone()[0])
+        ('INV-2026-0001', 'AR', today.strftime('%Y-%m-%d'), (today + timedelta(days=30)).strftime('%Y-%m-%d'), keys.get('MST_CUSTOMER', 'CUST001'), 'Samsung Electronics', '서울시 서초구 서초대로 74길 11', 4130000.00, 35000.00, 4165000.00, 'KRW', 0.00, 4165000.00, 'ISSUED', today.strftime('%Y-%m-%d')),
+        ('INV-2026-0002', 'AR', today.strftime('%Y-%m-%d'), (today + timedelta(days=60)).strftime('%Y-%m-%d'), keys.get('MST_CUSTOMER', 'CUST003'), 'Hyundai Motor Company', '서울시 서초구 헌릉로 12', 18562500.00, 0.00, 18562500.00, 'KRW', 0.00, 18562500.00, 'DRAFT', None)
+    ]
+
+    invoices = [i for i in invoices if i[4]]
+    invoice_ids = key_range(cursor, 'BIL_INVOICE', 'INVOICE_ID', len(invoices), prefix='INV')
+    cursor.executemany("""
+        INSERT INTO BIL_INVOICE (INVOICE_ID, INVOICE_NO, INVOICE_TYPE, INVOICE_DATE, DUE_DATE, CUSTOMER_ID,
+            CUSTOMER_NAME, BILL_TO_ADDR, SUBTOTAL, TAX_AMOUNT, TOTAL_AMOUNT, CURRENCY,
+            PAID_AMOUNT, BALANCE, STATUS, ISSUED_DATE)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+    """, [(k,) + i for k, i in zip(invoice_ids, invoices)])
     print("  [OK] BIL_INVOICE")
 
     # BIL_INVOICE_DETAIL
     if len(invoice_ids) > 0 and len(charge_ids) >= 3:
         inv_details = [
-            (invoice_ids[0], 1, charge_ids[0], shipment_map.get('SHP20260001'), 'Ocean Freight (2x40HC)', 2.000, 1890000.0000, 3780000.00, 0.00, 3780000.00),
-            (invoice_ids[0], 2, charge_ids[1], shipment_map.get('SHP20260001'), 'Terminal Handling (2x40HC)', 2.000, 150000.0000, 300000.00, 30000.00, 330000.00),
-            (invoice_ids[0], 3, charge_ids[2], shipment_map.get('SHP20260001'), 'Documentation Fee', 1.000, 50000.0000, 50000.00, 5000.00, 55000.00)
+            (f"{invoice_ids[0]}-1", invoice_ids[0], 1, charge_ids[0], keys.get('ORD_SHIPMENT', 'SHP20260001'), 'Ocean Freight (2x40HC)', 2.000, 1890000.0000, 3780000.00, 0.00, 3780000.00),
+            (f"{invoice_ids[0]}-2", invoice_ids[0], 2, charge_ids[1], keys.get('ORD_SHIPMENT', 'SHP20260001'), 'Terminal Handling (2x40HC)', 2.000, 150000.0000, 300000.00, 30000.00, 330000.00),
+            (f"{invoice_ids[0]}-3", invoice_ids[0], 3, charge_ids[2], keys.get('ORD_SHIPMENT', 'SHP20260001'), 'Documentation Fee', 1.000, 50000.0000, 50000.00, 5000.00, 55000.00)
         ]
-        for d in inv_details:
-            cursor.execute("""
-                INSERT INTO BIL_INVOICE_DETAIL (INVOICE_ID, LINE_NO, CHARGE_ID, SHIPMENT_ID, DESCRIPTION,
-                    QTY, UNIT_PRICE, AMT, TAX_AMT, TOTAL_AMT)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """, d)
+        cursor.executemany("""
+            INSERT INTO BIL_INVOICE_DETAIL (DETAIL_ID, INVOICE_ID, LINE_NO, CHARGE_ID, SHIPMENT_ID, DESCRIPTION,
+                QUANTITY, UNIT_PRICE, AMOUNT, TAX_AMOUNT, TOTAL_AMOUNT)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+        """, inv_details)
         print("  [OK] BIL_INVOICE_DETAIL")
 
     # BIL_PROFIT_ANALYSIS
-    if shipment_map.get('SHP20260001'):
+    if keys.get('ORD_SHIPMENT', 'SHP20260001'):
         cursor.execute("""
-            INSERT INTO BIL_PROFIT_ANALYSIS (SHIPMENT_ID, ANALYSIS_DT, REVENUE_TOTAL_AMT, COST_TOTAL_AMT,
-                GROSS_PROFIT_AMT, PROFIT_MARGIN_RATE, CURRENCY_CD)
+            INSERT INTO BIL_PROFIT_ANALYSIS (SHIPMENT_ID, ANALYSIS_DATE, REVENUE_TOTAL, COST_TOTAL,
+                GROSS_PROFIT, PROFIT_MARGIN, CURRENCY)
             VALUES (%s, %s, %s, %s, %s, %s, %s)
-        """, (shipment_map.get('SHP20260001'), today.strftime('%Y-%m-%d'), 4165000.00, 3645000.00, 520000.00, 12.4940, 'KRW'))
+        """, (keys.get('ORD_SHIPMENT', 'SHP20260001'), today.strftime('%Y-%m-%d'), 4165000.00, 3645000.00, 520000.00, 12.4940, 'KRW'))
         print("  [OK] BIL_PROFIT_ANALYSIS")
 
 
@@ -795,27 +748,28 @@ def main():
 
     conn = get_connection()
     cursor = conn.cursor()
+    keys = KeyCache(cursor)
 
     try:
         insert_master_data(cursor)
         conn.commit()
 
-        insert_schedule_data(cursor)
+        insert_schedule_data(cursor, keys)
         conn.commit()
 
-        shipment_map, carrier_map, customer_map, booking_ids_db = insert_order_shipment_data(cursor)
+        booking_ids_db = insert_order_shipment_data(cursor, keys)
         conn.commit()
 
-        mbl_ids, mawb_ids = insert_bl_awb_data(cursor, shipment_map, carrier_map, booking_ids_db)
+        mbl_ids, mawb_ids = insert_bl_awb_data(cursor, keys, booking_ids_db)
         conn.commit()
 
-        insert_tracking_data(cursor, shipment_map)
+        insert_tracking_data(cursor, keys)
         conn.commit()
 
-        insert_customs_data(cursor, shipment_map)
+        insert_customs_data(cursor, keys)
         conn.commit()
 
-        insert_billing_data(cursor, shipment_map, customer_map)
+        insert_billing_data(cursor, keys)
         conn.commit()
 
         print("\n" + "=" * 60)
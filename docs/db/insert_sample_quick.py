@@ -5,8 +5,11 @@
 import pymysql
 from datetime import datetime, timedelta
 
+from key_cache import KeyCache
+
 conn = pymysql.connect(host='211.236.174.220', port=53306, user='user', password='P@ssw0rd', database='logstic', charset='utf8mb4')
 cursor = conn.cursor()
+keys = KeyCache(cursor)
 today = datetime.now()
 
 print('=== Inserting Sample Data ===')
@@ -77,20 +80,21 @@ try:
 except Exception as e:
     print(f'[SKIP] MST_CUSTOMER: {e}')
 
-# Get IDs for foreign keys
-cursor.execute('SELECT CARRIER_ID, CARRIER_CD FROM MST_CARRIER')
-carrier_map = {row[1]: row[0] for row in cursor.fetchall()}
-cursor.execute('SELECT CUSTOMER_ID, CUSTOMER_CD FROM MST_CUSTOMER')
-customer_map = {row[1]: row[0] for row in cursor.fetchall()}
-
 # SCH_OCEAN_SCHEDULE
 try:
     schedules = [
         ('HDMU', 'HYUNDAI SINGAPORE', 'V.001E', 'KRPUS', 'USLAX', today.strftime('%Y-%m-%d'), (today + timedelta(days=14)).strftime('%Y-%m-%d'), 14, (today - timedelta(days=3)).strftime('%Y-%m-%d'), (today - timedelta(days=1)).strftime('%Y-%m-%d')),
         ('MAEU', 'MAERSK SEALAND', 'V.002W', 'KRPUS', 'DEHAM', today.strftime('%Y-%m-%d'), (today + timedelta(days=28)).strftime('%Y-%m-%d'), 28, (today - timedelta(days=5)).strftime('%Y-%m-%d'), (today - timedelta(days=2)).strftime('%Y-%m-%d'))
     ]
-    for s in schedules:
-        cursor.execute('INSERT IGNORE INTO SCH_OCEAN_SCHEDULE (CARRIER_CD, VESSEL_NM, VOYAGE_NO, POL_PORT_CD, POD_PORT_CD, ETD_DT, ETA_DT, TRANSIT_DAYS, DOC_CUTOFF_DT, CARGO_CUTOFF_DT, USE_YN) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, "Y")', s)
+    for carrier_cd, vessel_nm, voyage_no, *schedule in schedules:
+        if keys.get('SCH_VOYAGE', voyage_no) is None:
+            cursor.execute('INSERT INTO SCH_VOYAGE (CARRIER_ID, VESSEL_NM, VOYAGE_NO) VALUES (%s, %s, %s)',
+                (keys.get('MST_CARRIER', carrier_cd), vessel_nm, voyage_no))
+            keys.inserted('SCH_VOYAGE', voyage_no)
+        if keys.get('SCH_OCEAN_SCHEDULE', voyage_no) is None:
+            cursor.execute('INSERT INTO SCH_OCEAN_SCHEDULE (VOYAGE_ID, CARRIER_ID, VESSEL_NM, VOYAGE_NO, POL_PORT_CD, POD_PORT_CD, ETD_DTM, ETA_DTM, TRANSIT_DAYS, CUT_OFF_DTM, CARGO_CUT_OFF_DTM) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)',
+                (keys.get('SCH_VOYAGE', voyage_no), keys.get('MST_CARRIER', carrier_cd), vessel_nm, voyage_no, *schedule))
+            keys.inserted('SCH_OCEAN_SCHEDULE', voyage_no)
     conn.commit()
     print('[OK] SCH_OCEAN_SCHEDULE')
 except Exception as e:
@@ -99,61 +103,56 @@ except Exception as e:
 # ORD_SHIPMENT
 try:
     shipments = [
-        ('SHP20260001', 'SEA', 'EXPORT', 'CY-CY', 'FOB', customer_map.get('CUST001'), customer_map.get('CUST001'), customer_map.get('CUST004'), carrier_map.get('HDMU'), 'KR', 'KRPUS', 'US', 'USLAX', today.strftime('%Y-%m-%d'), (today + timedelta(days=14)).strftime('%Y-%m-%d'), 100, 'CTN', 5000.000, 150.000, 1500000.00, 'USD', 'SHIPPED'),
-        ('SHP20260002', 'SEA', 'EXPORT', 'CFS-CFS', 'CIF', customer_map.get('CUST002'), customer_map.get('CUST002'), customer_map.get('CUST004'), carrier_map.get('MAEU'), 'KR', 'KRPUS', 'DE', 'DEHAM', today.strftime('%Y-%m-%d'), (today + timedelta(days=28)).strftime('%Y-%m-%d'), 200, 'CTN', 8000.000, 400.000, 200000.00, 'USD', 'BOOKED'),
-        ('SHP20260003', 'AIR', 'EXPORT', 'D2D', 'FOB', customer_map.get('CUST003'), customer_map.get('CUST003'), customer_map.get('CUST004'), carrier_map.get('KE'), 'KR', 'KRINC', 'US', 'USLAX', today.strftime('%Y-%m-%d'), (today + timedelta(days=1)).strftime('%Y-%m-%d'), 50, 'PLT', 2500.000, 75.000, 150000.00, 'USD', 'DEPARTED')
+        ('SHP20260001', 'SEA', 'EXPORT', 'CY-CY', 'FOB', keys.get('MST_CUSTOMER', 'CUST001'), keys.get('MST_CUSTOMER', 'CUST001'), keys.get('MST_CUSTOMER', 'CUST004'), keys.get('MST_CARRIER', 'HDMU'), 'KR', 'KRPUS', 'US', 'USLAX', today.strftime('%Y-%m-%d'), (today + timedelta(days=14)).strftime('%Y-%m-%d'), 100, 'CTN', 5000.000, 150.000, 1500000.00, 'USD', 'SHIPPED'),
+        ('SHP20260002', 'SEA', 'EXPORT', 'CFS-CFS', 'CIF', keys.get('MST_CUSTOMER', 'CUST002'), keys.get('MST_CUSTOMER', 'CUST002'), keys.get('MST_CUSTOMER', 'CUST004'), keys.get('MST_CARRIER', 'MAEU'), 'KR', 'KRPUS', 'DE', 'DEHAM', today.strftime('%Y-%m-%d'), (today + timedelta(days=28)).strftime('%Y-%m-%d'), 200, 'CTN', 8000.000, 400.000, 200000.00, 'USD', 'BOOKED'),
+        ('SHP20260003', 'AIR', 'EXPORT', 'D2D', 'FOB', keys.get('MST_CUSTOMER', 'CUST003'), keys.get('MST_CUSTOMER', 'CUST003'), keys.get('MST_CUSTOMER', 'CUST004'), keys.get('MST_CARRIER', 'KE'), 'KR', 'KRINC', 'US', 'USLAX', today.strftime('%Y-%m-%d'), (today + timedelta(days=1)).strftime('%Y-%m-%d'), 50, 'PLT', 2500.000, 75.000, 150000.00, 'USD', 'DEPARTED')
     ]
     for s in shipments:
         cursor.execute('''INSERT IGNORE INTO ORD_SHIPMENT (SHIPMENT_NO, TRANSPORT_MODE_CD, TRADE_TYPE_CD, SERVICE_TYPE_CD, INCOTERMS_CD,
             CUSTOMER_ID, SHIPPER_ID, CONSIGNEE_ID, CARRIER_ID, ORIGIN_COUNTRY_CD, ORIGIN_PORT_CD,
             DEST_COUNTRY_CD, DEST_PORT_CD, ETD_DT, ETA_DT, TOTAL_PKG_QTY, PKG_TYPE_CD, GROSS_WEIGHT_KG,
             VOLUME_CBM, DECLARED_VALUE_AMT, DECLARED_VALUE_CURR, STATUS_CD) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)''', s)
+        keys.inserted('ORD_SHIPMENT', s[0])
     conn.commit()
     print('[OK] ORD_SHIPMENT')
 except Exception as e:
     print(f'[SKIP] ORD_SHIPMENT: {e}')
 
-# Get shipment IDs
-cursor.execute('SELECT SHIPMENT_ID, SHIPMENT_NO FROM ORD_SHIPMENT')
-shipment_map = {row[1]: row[0] for row in cursor.fetchall()}
-cursor.execute('SELECT SCHEDULE_ID FROM SCH_OCEAN_SCHEDULE LIMIT 2')
-schedule_ids = [row[0] for row in cursor.fetchall()]
-
 # ORD_OCEAN_BOOKING
+schedule_id = keys.get('SCH_OCEAN_SCHEDULE', 'V.001E')
+booking_id = None
 try:
-    if shipment_map.get('SHP20260001') and schedule_ids:
-        cursor.execute('INSERT INTO ORD_OCEAN_BOOKING (SHIPMENT_ID, SCHEDULE_ID, CARRIER_ID, VESSEL_NM, VOYAGE_NO, POL_PORT_CD, POD_PORT_CD, ETD_DT, ETA_DT, STATUS_CD) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)',
-            (shipment_map.get('SHP20260001'), schedule_ids[0], carrier_map.get('HDMU'), 'HYUNDAI SINGAPORE', 'V.001E', 'KRPUS', 'USLAX', today.strftime('%Y-%m-%d'), (today + timedelta(days=14)).strftime('%Y-%m-%d'), 'CONFIRMED'))
+    if keys.get('ORD_SHIPMENT', 'SHP20260001') and schedule_id:
+        cursor.execute('INSERT INTO ORD_OCEAN_BOOKING (BOOKING_NO, SHIPMENT_ID, OCEAN_SCHEDULE_ID, CARRIER_ID, VESSEL_NM, VOYAGE_NO, POL_PORT_CD, POD_PORT_CD, ETD_DT, ETA_DT, STATUS_CD) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s) ON DUPLICATE KEY UPDATE BOOKING_ID = LAST_INSERT_ID(BOOKING_ID)',
+            ('BKG20260001', keys.get('ORD_SHIPMENT', 'SHP20260001'), schedule_id, keys.get('MST_CARRIER', 'HDMU'), 'HYUNDAI SINGAPORE', 'V.001E', 'KRPUS', 'USLAX', today.strftime('%Y-%m-%d'), (today + timedelta(days=14)).strftime('%Y-%m-%d'), 'CONFIRMED'))
+        booking_id = cursor.lastrowid
     conn.commit()
     print('[OK] ORD_OCEAN_BOOKING')
 except Exception as e:
     print(f'[SKIP] ORD_OCEAN_BOOKING: {e}')
 
 # BL_MASTER_BL
-cursor.execute('SELECT BOOKING_ID FROM ORD_OCEAN_BOOKING LIMIT 1')
-booking = cursor.fetchone()
-booking_id = booking[0] if booking else None
 try:
-    if shipment_map.get('SHP20260001'):
+    if keys.get('ORD_SHIPMENT', 'SHP20260001'):
         cursor.execute('''INSERT INTO BL_MASTER_BL (MBL_NO, SHIPMENT_ID, BOOKING_ID, CARRIER_ID, VESSEL_NM, VOYAGE_NO, POL_PORT_CD, POD_PORT_CD,
             ETD_DT, ETA_DT, SHIPPER_NM, CONSIGNEE_NM, TOTAL_PKG_QTY, PKG_TYPE_CD, GROSS_WEIGHT_KG, VOLUME_CBM, BL_TYPE_CD, ORIGINAL_BL_COUNT, STATUS_CD)
             VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)''',
-            ('HDMUPUS12345678', shipment_map.get('SHP20260001'), booking_id, carrier_map.get('HDMU'), 'HYUNDAI SINGAPORE', 'V.001E', 'KRPUS', 'USLAX', today.strftime('%Y-%m-%d'), (today + timedelta(days=14)).strftime('%Y-%m-%d'), 'Samsung Electronics', 'ABC Trading Co.', 100, 'CTN', 5000.000, 150.000, 'ORIGINAL', 3, 'RELEASED'))
+            ('HDMUPUS12345678', keys.get('ORD_SHIPMENT', 'SHP20260001'), booking_id, keys.get('MST_CARRIER', 'HDMU'), 'HYUNDAI SINGAPORE', 'V.001E', 'KRPUS', 'USLAX', today.strftime('%Y-%m-%d'), (today + timedelta(days=14)).strftime('%Y-%m-%d'), 'Samsung Electronics', 'ABC Trading Co.', 100, 'CTN', 5000.000, 150.000, 'ORIGINAL', 3, 'RELEASED'))
+        keys.inserted('BL_MASTER_BL', 'HDMUPUS12345678')
     conn.commit()
     print('[OK] BL_MASTER_BL')
 except Exception as e:
     print(f'[SKIP] BL_MASTER_BL: {e}')
 
 # BL_HOUSE_BL
-cursor.execute('SELECT MBL_ID FROM BL_MASTER_BL LIMIT 1')
-mbl = cursor.fetchone()
-mbl_id = mbl[0] if mbl else None
+mbl_id = keys.get('BL_MASTER_BL', 'HDMUPUS12345678')
 try:
     if mbl_id:
-        cursor.execute('''INSERT INTO BL_HOUSE_BL (HBL_NO, MBL_ID, SHIPMENT_ID, SHIPPER_NM, SHIPPER_ADDR, CONSIGNEE_NM, CONSIGNEE_ADDR,
-            NOTIFY_PARTY, INCOTERMS_CD, POL_PORT_CD, POD_PORT_CD, COMMODITY_DESC, TOTAL_PKG_QTY, PKG_TYPE_CD,
-            GROSS_WEIGHT_KG, VOLUME_CBM, BL_TYPE_CD, ORIGINAL_BL_COUNT, STATUS_CD) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)''',
-            ('IGSHBL20260001', mbl_id, shipment_map.get('SHP20260001'), 'Samsung Electronics', 'Seoul, Korea', 'ABC Trading Co.', 'Los Angeles, CA', 'Same as Consignee', 'FOB', 'KRPUS', 'USLAX', 'Semiconductor Chips', 100, 'CTN', 5000.000, 150.000, 'ORIGINAL', 3, 'RELEASED'))
+        # FOB: freight collect at destination
+        cursor.execute('''INSERT INTO BL_HOUSE_BL (HBL_NO, MBL_ID, SHIPMENT_ID, CUSTOMER_ID, SHIPPER_NM, SHIPPER_ADDR, CONSIGNEE_NM, CONSIGNEE_ADDR,
+            NOTIFY_PARTY, FREIGHT_TERM_CD, POL_PORT_CD, POD_PORT_CD, COMMODITY_DESC, TOTAL_PKG_QTY, PKG_TYPE_CD,
+            GROSS_WEIGHT_KG, VOLUME_CBM, BL_TYPE_CD, ORIGINAL_BL_COUNT, STATUS_CD) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)''',
+            ('IGSHBL20260001', mbl_id, keys.get('ORD_SHIPMENT', 'SHP20260001'), keys.get('MST_CUSTOMER', 'CUST001'), 'Samsung Electronics', 'Seoul, Korea', 'ABC Trading Co.', 'Los Angeles, CA', 'Same as Consignee', 'COLLECT', 'KRPUS', 'USLAX', 'Semiconductor Chips', 100, 'CTN', 5000.000, 150.000, 'ORIGINAL', 3, 'RELEASED'))
     conn.commit()
     print('[OK] BL_HOUSE_BL')
 except Exception as e:
@@ -162,8 +161,8 @@ except Exception as e:
 # BL_CONTAINER
 try:
     if mbl_id:
-        cursor.execute('INSERT INTO BL_CONTAINER (MBL_ID, CNTR_NO, CNTR_SIZE_CD, CNTR_TYPE_CD, SEAL_NO, GROSS_WEIGHT_KG, VOLUME_CBM, MAX_WEIGHT_KG, TARE_WEIGHT_KG) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)', (mbl_id, 'HDMU1234567', '40', 'HC', 'SL12345', 5000.000, 150.000, 30000.000, 4200.000))
-        cursor.execute('INSERT INTO BL_CONTAINER (MBL_ID, CNTR_NO, CNTR_SIZE_CD, CNTR_TYPE_CD, SEAL_NO, GROSS_WEIGHT_KG, VOLUME_CBM, MAX_WEIGHT_KG, TARE_WEIGHT_KG) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)', (mbl_id, 'HDMU2345678', '40', 'HC', 'SL12346', 5000.000, 150.000, 30000.000, 4200.000))
+        cursor.execute('INSERT INTO BL_CONTAINER (MBL_ID, CNTR_NO, CNTR_SIZE_CD, CNTR_TYPE_CD, SEAL_NO, GROSS_WEIGHT_KG, VOLUME_CBM, TARE_WEIGHT_KG) VALUES (%s, %s, %s, %s, %s, %s, %s, %s)', (mbl_id, 'HDMU1234567', '40', 'HC', 'SL12345', 5000.000, 150.000, 4200.000))
+        cursor.execute('INSERT INTO BL_CONTAINER (MBL_ID, CNTR_NO, CNTR_SIZE_CD, CNTR_TYPE_CD, SEAL_NO, GROSS_WEIGHT_KG, VOLUME_CBM, TARE_WEIGHT_KG) VALUES (%s, %s, %s, %s, %s, %s, %s, %s)', (mbl_id, 'HDMU2345678', '40', 'HC', 'SL12346', 5000.000, 150.000, 4200.000))
     conn.commit()
     print('[OK] BL_CONTAINER')
 except Exception as e:
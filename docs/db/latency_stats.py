@@ -0,0 +1,23 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+FMS Latency Stats
+Summary statistics shared by the benchmark and log analysis scripts.
+Standard library only, so log tools can use it without a database driver
+"""
+
+
+def percentile(values, pct):
+    """Linearly interpolated percentile, pct on a 0-100 scale (0.0 for no values)"""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    k = (len(ordered) - 1) * pct / 100.0
+    lower = int(k)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (k - lower)
+
+
+def mean(values):
+    """Arithmetic mean (0.0 for no values)"""
+    return sum(values) / len(values) if values else 0.0
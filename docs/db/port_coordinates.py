@@ -0,0 +1,245 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+FMS Port Coordinates
+Fills MST_PORT.LATITUDE / LONGITUDE / TIMEZONE from the bundled
+port_coordinates.csv and, optionally, the UN/LOCODE code list CSVs and the
+OurAirports airports.csv (IATA codes). Sources are merged in memory, the
+bundled file winning, staged with multi-row INSERTs and applied with two
+set-based statements: an UPDATE ... JOIN for codes already in MST_PORT, then
+an INSERT ... SELECT ... LEFT JOIN for the rest, so tens of thousands of
+locations load in one pass. Locations new to MST_PORT are added with
+USE_YN = 'N': the tracking map can look them up, the port pickers do not list
+them
+"""
+
+import argparse
+import csv
+import os
+import re
+import time
+from datetime import datetime
+
+import pymysql
+
+from provision_schema import DB_CONFIG
+from schema_model import LiveSchema
+
+SEED_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'port_coordinates.csv')
+STAGE_TABLE = 'PORT_COORD_STAGE'
+BATCH = 5000
+NAME_LENGTH = 100
+
+# UN/LOCODE "Function" positions: 1 = port, 4 = airport
+FUNCTION_PATTERN = re.compile(r'^[0-9B-]{8}$')
+COORDINATE_PATTERN = re.compile(r'^(\d{2})(\d{2})([NS])\s+(\d{3})(\d{2})([EW])$')
+AIRPORT_TYPES = {'large_airport': 0, 'medium_airport': 1, 'small_airport': 2}
+
+# Codes referenced by B/L and AWB masters, checked for coverage after the load
+REFERENCES = [
+    ('BL_MASTER_BL', 'POL_PORT_CD'), ('BL_MASTER_BL', 'POD_PORT_CD'),
+    ('AWB_MASTER_AWB', 'ORIGIN_AIRPORT_CD'), ('AWB_MASTER_AWB', 'DEST_AIRPORT_CD'),
+]
+
+
+def get_connection():
+    return pymysql.connect(**DB_CONFIG)
+
+
+def location(code, name, country, port_type, lat, lng, timezone=None):
+    return (code, (name or code)[:NAME_LENGTH], country, port_type, round(lat, 7), round(lng, 7), timezone)
+
+
+# ============================================================
+# Sources (code -> (PORT_CD, PORT_NM_EN, COUNTRY_CD, PORT_TYPE_CD, LATITUDE, LONGITUDE, TIMEZONE))
+# ============================================================
+def read_seed(path):
+    """Bundled coordinates, one row per code with a header line"""
+    locations = {}
+    with open(path, encoding='utf-8', newline='') as f:
+        for row in csv.DictReader(f):
+            locations[row['PORT_CD']] = location(
+                row['PORT_CD'], row['PORT_NM_EN'], row['COUNTRY_CD'], row['PORT_TYPE_CD'],
+                float(row['LATITUDE']), float(row['LONGITUDE']), row['TIMEZONE'] or None)
+    return locations
+
+
+def unlocode_coordinates(text):
+    """'3506N 12903E' (degrees and minutes) -> (35.1, 129.05), or None"""
+    match = COORDINATE_PATTERN.match(text.strip())
+    if not match:
+        return None
+    lat_d, lat_m, ns, lng_d, lng_m, ew = match.groups()
+    lat = int(lat_d) + int(lat_m) / 60
+    lng = int(lng_d) + int(lng_m) / 60
+    return (-lat if ns == 'S' else lat), (-lng if ew == 'W' else lng)
+
+
+def read_unlocode(paths, encoding):
+    """
+    Seaports and airports of the UN/LOCODE code list CSVs (no header line).
+    Country rows, rows marked for removal and rows without coordinates are skipped.
+    The Status / Function column order differs between releases, so the function
+    column is recognised by its pattern.
+    """
+    locations = {}
+    for path in paths:
+        with open(path, encoding=encoding, newline='') as f:
+            for row in csv.reader(f):
+                if len(row) < 11 or not row[2] or row[0] == 'X':
+                    continue
+                function = next((v for v in row[6:8] if FUNCTION_PATTERN.match(v)), '')
+                if function[:1] == '1':
+                    port_type = 'SEA'
+                elif function[3:4] == '4':
+                    port_type = 'AIR'
+                else:
+                    continue
+                coordinates = unlocode_coordinates(row[10])
+                if coordinates is None:
+                    continue
+                code = row[1] + row[2]
+                locations[code] = location(code, row[4] or row[3], row[1], port_type, *coordinates)
+    return locations
+
+
+def read_airports(path):
+    """IATA-coded airports of OurAirports airports.csv; the busiest airport wins a shared code"""
+    ranked = {}
+    with open(path, encoding='utf-8', newline='') as f:
+        for row in csv.DictReader(f):
+            code = (row.get('iata_code') or '').strip().upper()
+            if len(code) != 3 or row['type'] not in AIRPORT_TYPES:
+                continue
+            rank = (row.get('scheduled_service') != 'yes', AIRPORT_TYPES[row['type']])
+            if code in ranked and ranked[code][0] <= rank:
+                continue
+            ranked[code] = (rank, location(code, row['name'], row['iso_country'], 'AIR',
+                                           float(row['latitude_deg']), float(row['longitude_deg'])))
+    return {code: entry for code, (_, entry) in ranked.items()}
+
+
+# ============================================================
+# Load
+# ============================================================
+def stage(cursor, locations):
+    cursor.execute(f"""
+        CREATE TEMPORARY TABLE {STAGE_TABLE} (
+            PORT_CD             VARCHAR(10)     PRIMARY KEY,
+            PORT_NM_EN          VARCHAR(100),
+            COUNTRY_CD          CHAR(2),
+            PORT_TYPE_CD        VARCHAR(10),
+            LATITUDE            DECIMAL(10,7),
+            LONGITUDE           DECIMAL(10,7),
+            TIMEZONE            VARCHAR(50)
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+    """)
+    rows = list(locations.values())
+    for start in range(0, len(rows), BATCH):
+        cursor.executemany(f"""
+            INSERT INTO {STAGE_TABLE} (PORT_CD, PORT_NM_EN, COUNTRY_CD, PORT_TYPE_CD, LATITUDE, LONGITUDE, TIMEZONE)
+            VALUES (%s, %s, %s, %s, %s, %s, %s)
+        """, rows[start:start + BATCH])
+
+
+def apply_stage(cursor, update_only):
+    """Returns (updated, added)"""
+    cursor.execute(f"""
+        UPDATE MST_PORT p
+        JOIN {STAGE_TABLE} s ON s.PORT_CD = p.PORT_CD
+        SET p.LATITUDE = s.LATITUDE, p.LONGITUDE = s.LONGITUDE,
+            p.TIMEZONE = COALESCE(s.TIMEZONE, p.TIMEZONE),
+            p.PORT_NM_EN = COALESCE(p.PORT_NM_EN, s.PORT_NM_EN),
+            p.PORT_TYPE_CD = COALESCE(p.PORT_TYPE_CD, s.PORT_TYPE_CD),
+            p.UPDATED_BY = 'system'
+    """)
+    updated = cursor.rowcount
+    if update_only:
+        return updated, 0
+
+    cursor.execute(f"""
+        INSERT INTO MST_PORT (PORT_CD, PORT_NM, PORT_NM_EN, COUNTRY_CD, PORT_TYPE_CD,
+                              TIMEZONE, LATITUDE, LONGITUDE, USE_YN, CREATED_BY)
+        SELECT s.PORT_CD, s.PORT_NM_EN, s.PORT_NM_EN, s.COUNTRY_CD, s.PORT_TYPE_CD,
+               s.TIMEZONE, s.LATITUDE, s.LONGITUDE, 'N', 'system'
+        FROM {STAGE_TABLE} s
+        LEFT JOIN MST_PORT p ON p.PORT_CD = s.PORT_CD
+        WHERE p.PORT_CD IS NULL
+    """)
+    return updated, cursor.rowcount
+
+
+def report_coverage(cursor, live):
+    """Distinct codes used by B/L and AWB masters that still have no coordinates"""
+    for table, column in REFERENCES:
+        if table not in live.tables:
+            print(f"  [SKIP] {table}.{column} (table not found)")
+            continue
+        cursor.execute(f"""
+            SELECT COUNT(DISTINCT r.{column}),
+                   COUNT(DISTINCT CASE WHEN p.LATITUDE IS NULL THEN r.{column} END)
+            FROM {table} r
+            LEFT JOIN MST_PORT p ON p.PORT_CD = r.{column}
+            WHERE r.{column} IS NOT NULL AND r.DEL_YN = 'N'
+        """)
+        used, missing = cursor.fetchone()
+        status = "[OK]" if missing == 0 else "[MISS]"
+        print(f"  {status} {table}.{column}: {used:,} codes, {missing:,} without coordinates")
+
+
+def load_coordinates(seed, unlocode, encoding, airports, update_only, dry_run):
+    started = time.perf_counter()
+    print("\n=== Sources ===")
+    locations = {}
+    sources = []
+    if unlocode:
+        sources.append(("UN/LOCODE", read_unlocode(unlocode, encoding)))
+    if airports:
+        sources.append(("OurAirports", read_airports(airports)))
+    sources.append(("Bundled", read_seed(seed)))
+    for name, found in sources:
+        print(f"  {name:<12} {len(found):>8,} locations")
+        locations.update(found)
+    print(f"  {'Merged':<12} {len(locations):>8,} codes")
+
+    if dry_run:
+        return
+
+    conn = get_connection()
+    try:
+        live = LiveSchema.read(conn)
+        with conn.cursor() as cursor:
+            print("\n=== MST_PORT ===")
+            stage(cursor, locations)
+            updated, added = apply_stage(cursor, update_only)
+            conn.commit()
+            print(f"  [OK] {updated:,} updated, {added:,} added ({time.perf_counter() - started:.1f}s)")
+
+            print("\n=== Coverage ===")
+            report_coverage(cursor, live)
+    finally:
+        conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load port and airport coordinates into MST_PORT")
+    parser.add_argument('--seed', default=SEED_FILE, help='bundled coordinate CSV (default: port_coordinates.csv)')
+    parser.add_argument('--unlocode', nargs='+', metavar='CSV', help='UN/LOCODE code list CSV files')
+    parser.add_argument('--encoding', default='latin-1', help='encoding of the UN/LOCODE files')
+    parser.add_argument('--airports', metavar='CSV', help='OurAirports airports.csv')
+    parser.add_argument('--update-only', action='store_true', help='only fill ports already in MST_PORT')
+    parser.add_argument('--dry-run', action='store_true', help='read the sources and print counts only')
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print(f"FMS Port Coordinates ({datetime.now():%Y-%m-%d %H:%M})")
+    print("=" * 60)
+
+    try:
+        load_coordinates(args.seed, args.unlocode, args.encoding, args.airports, args.update_only, args.dry_run)
+    except Exception as e:
+        print(f"\nError: {e}")
+
+
+if __name__ == "__main__":
+    main()
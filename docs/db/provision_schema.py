@@ -0,0 +1,293 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+FMS Schema Provisioning Script for MariaDB
+Runs the DDL of create_tables.py / create_tables_part2.py / create_tables_part3.py
+concurrently, ordered by the table dependency graph
+"""
+
+import argparse
+import contextlib
+import io
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+import pymysql
+
+import create_tables
+import create_tables_part2
+import create_tables_part3
+
+# Database connection settings
+DB_CONFIG = {
+    'host': '211.236.174.220',
+    'port': 53306,
+    'user': 'user',
+    'password': 'P@ssw0rd',
+    'database': 'logstic',
+    'charset': 'utf8mb4'
+}
+
+DEFAULT_WORKERS = 8
+
+TABLE_NAME_RE = re.compile(r'CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?`?(\w+)`?', re.I)
+INLINE_PK_RE = re.compile(r'^\s*`?(\w+)`?\s+\w+[^,\n]*\bPRIMARY\s+KEY\b', re.I | re.M)
+TABLE_PK_RE = re.compile(r'\bPRIMARY\s+KEY\s*\(([^)]*)\)', re.I)
+COLUMN_RE = re.compile(r'^\s*`?(\w+)`?\s+(?:BIGINT|INT|VARCHAR|CHAR)\b', re.I | re.M)
+
+
+def get_connection():
+    return pymysql.connect(**DB_CONFIG)
+
+
+class RecordingCursor:
+    """Cursor stand-in that records DDL instead of executing it"""
+
+    def __init__(self):
+        self.statements = []
+
+    def execute(self, sql, args=None):
+        self.statements.append(sql.strip())
+        return 0
+
+
+def collect_ddl():
+    """Collect (domain, table, sql) from the three create scripts, in script order"""
+    domains = [
+        ("01. Master Tables", create_tables.create_master_tables),
+        ("02. Schedule Tables", create_tables.create_schedule_tables),
+        ("03. Order Tables", create_tables.create_order_tables),
+        ("04. B/L Tables", create_tables_part2.create_bl_tables),
+        ("05. Shipment Tables", create_tables_part2.create_shipment_tables),
+    ]
+
+    ddl = []
+    for domain, create_fn in domains:
+        recorder = RecordingCursor()
+        # execute_sql() prints [OK] per statement; keep the recording pass quiet
+        with contextlib.redirect_stdout(io.StringIO()):
+            create_fn(recorder)
+        for sql in recorder.statements:
+            ddl.append((domain, table_name_of(sql), sql))
+
+    for domain, tables in [
+        ("06. Transport Tables", create_tables_part3.TRANSPORT_TABLES),
+        ("07. Customs Tables", create_tables_part3.CUSTOMS_TABLES),
+        ("08. Billing Tables", create_tables_part3.BILLING_TABLES),
+    ]:
+        for table_name, sql in tables.items():
+            ddl.append((domain, table_name, sql.strip()))
+
+    return ddl
+
+
+def table_name_of(sql):
+    match = TABLE_NAME_RE.search(sql)
+    if not match:
+        raise ValueError(f"Not a CREATE TABLE statement: {sql[:60]}")
+    return match.group(1).upper()
+
+
+def primary_key_of(sql):
+    """Return the primary key column list of a CREATE TABLE statement"""
+    match = TABLE_PK_RE.search(sql)
+    if match:
+        return [c.strip(' `').upper() for c in match.group(1).split(',')]
+    match = INLINE_PK_RE.search(sql)
+    if match:
+        return [match.group(1).upper()]
+    return []
+
+
+def build_dependency_graph(ddl):
+    """
+    Build table -> set(referenced tables).
+    No FOREIGN KEY constraints are declared, so a column named like another
+    table's single-column primary key (SHIPMENT_ID, CUSTOMER_ID, MBL_ID, ...)
+    is treated as a reference to that table.
+    """
+    pk_owners = {}
+    for _, table, sql in ddl:
+        pk = primary_key_of(sql)
+        if len(pk) == 1:
+            pk_owners.setdefault(pk[0], set()).add(table)
+
+    graph = {}
+    for _, table, sql in ddl:
+        own_pk = set(primary_key_of(sql))
+        deps = set()
+        for column in COLUMN_RE.findall(sql):
+            column = column.upper()
+            if column in own_pk:
+                continue
+            deps |= pk_owners.get(column, set())
+        deps.discard(table)
+        graph[table] = deps
+    return graph
+
+
+def break_cycles(graph, order):
+    """Drop back edges (depth-first, script order) so the graph is a DAG"""
+    dropped = []
+    state = {}  # table -> 1 visiting, 2 done
+
+    def visit(table):
+        state[table] = 1
+        for dep in sorted(graph[table], key=order.index):
+            if state.get(dep) == 1:
+                graph[table].discard(dep)
+                dropped.append((table, dep))
+            elif dep not in state:
+                visit(dep)
+        state[table] = 2
+
+    for table in order:
+        if table not in state:
+            visit(table)
+    return dropped
+
+
+class DDLExecutor:
+    """Runs DDL over a small pool of per-thread connections in dependency order"""
+
+    def __init__(self, workers=DEFAULT_WORKERS):
+        self.workers = workers
+        self._local = threading.local()
+        self._connections = []
+        self._lock = threading.Lock()
+
+    def _connection(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = get_connection()
+            with conn.cursor() as cursor:
+                cursor.execute("SET FOREIGN_KEY_CHECKS = 0")
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def _run(self, table, statements):
+        started = time.perf_counter()
+        try:
+            conn = self._connection()
+            with conn.cursor() as cursor:
+                for sql in statements:
+                    cursor.execute(sql)
+            conn.commit()
+            return table, time.perf_counter() - started, None
+        except Exception as e:
+            return table, time.perf_counter() - started, e
+
+    def run(self, jobs, graph):
+        """
+        jobs:  ordered dict table -> list of SQL statements
+        graph: table -> set(tables that must finish first)
+        Returns list of (table, seconds, error) in completion order.
+        """
+        pending = {t: set(d) & set(jobs) for t, d in graph.items() if t in jobs}
+        for table in jobs:
+            pending.setdefault(table, set())
+        dependents = {t: set() for t in pending}
+        for table, deps in pending.items():
+            for dep in deps:
+                dependents[dep].add(table)
+
+        results = []
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                running = {}
+
+                def submit_ready():
+                    for table in list(jobs):
+                        if table in pending and not pending[table]:
+                            del pending[table]
+                            running[pool.submit(self._run, table, jobs[table])] = table
+
+                submit_ready()
+                while running:
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        table = running.pop(future)
+                        results.append(future.result())
+                        # No FK constraints exist, so a failed table still releases its dependents
+                        for child in dependents[table]:
+                            if child in pending:
+                                pending[child].discard(table)
+                    submit_ready()
+        finally:
+            for conn in self._connections:
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+        return results
+
+
+def print_report(ddl, results, wall):
+    timings = {table: (seconds, error) for table, seconds, error in results}
+
+    current = None
+    for domain, table, _ in ddl:
+        if domain != current:
+            current = domain
+            print(f"\n=== {domain} ===")
+        seconds, error = timings[table]
+        if error is None:
+            print(f"  [OK] {table:<32} {seconds * 1000:8.1f} ms")
+        else:
+            print(f"  [FAIL] {table}: {error}")
+
+    serial = sum(seconds for seconds, _ in timings.values())
+    failed = [t for t, (_, e) in timings.items() if e is not None]
+    slowest = sorted(timings.items(), key=lambda kv: kv[1][0], reverse=True)[:5]
+
+    print("\n" + "=" * 60)
+    print(f"Tables: {len(timings)}  Failed: {len(failed)}")
+    print(f"Wall time: {wall:.2f}s  (sum of per-table time: {serial:.2f}s)")
+    print("Slowest: " + ", ".join(f"{t} ({s * 1000:.0f} ms)" for t, (s, _) in slowest))
+    print("=" * 60)
+
+
+def provision(workers=DEFAULT_WORKERS, dry_run=False):
+    """Provision every table of the three create scripts"""
+    ddl = collect_ddl()
+    order = [table for _, table, _ in ddl]
+    graph = build_dependency_graph(ddl)
+    dropped = break_cycles(graph, order)
+
+    if dry_run:
+        for domain, table, _ in ddl:
+            deps = ", ".join(sorted(graph[table])) or "-"
+            print(f"  {table:<32} <- {deps}")
+        for table, dep in dropped:
+            print(f"  [CYCLE] {table} -> {dep} ignored")
+        return []
+
+    jobs = {table: [sql] for _, table, sql in ddl}
+    started = time.perf_counter()
+    results = DDLExecutor(workers).run(jobs, graph)
+    print_report(ddl, results, time.perf_counter() - started)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Provision the FMS schema in parallel")
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS, help='DDL connections')
+    parser.add_argument('--dry-run', action='store_true', help='print the dependency graph only')
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print(f"FMS Schema Provisioning (workers={args.workers})")
+    print("=" * 60)
+
+    try:
+        provision(args.workers, args.dry_run)
+    except Exception as e:
+        print(f"\nError: {e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+FMS Query Log Stats
+Reads the boxed query logs that queryWithLog (fms-web/src/lib/db.ts) prints,
+from a file, stdin or a growing log (--follow), and aggregates the statements
+by fingerprint (literals stripped) over a rolling window of log time: count,
+total and p50/p95/p99 duration and rows per fingerprint, printed as a top-N
+of the most expensive queries. No slow log is needed on the server
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import sys
+import time
+from collections import deque
+from datetime import datetime
+
+from latency_stats import mean, percentile
+
+DEFAULT_WINDOW = 300
+DEFAULT_TOP = 10
+DEFAULT_INTERVAL = 10
+SORT_KEYS = ('total', 'p95', 'count', 'rows')
+SQL_WIDTH = 90
+
+START_RE = re.compile(r"│ \[(\S+)\] SQL Query")
+RESULT_RE = re.compile(r"│ Result: (\d+) rows (returned|affected)")
+DURATION_RE = re.compile(r"│ Duration: (\d+)ms")
+
+LITERALS = [
+    (re.compile(r"'(?:[^'\\]|\\.|'')*'"), "?"),
+    (re.compile(r'"(?:[^"\\]|\\.)*"'), "?"),
+    (re.compile(r"\b0x[0-9a-fA-F]+\b"), "?"),
+    (re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?\b"), "?"),
+    (re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)"), "(?+)"),
+    (re.compile(r"(\(\?\+\)\s*,\s*)+\(\?\+\)"), "(?+)"),
+    (re.compile(r"\s+"), " "),
+]
+
+
+def fingerprint(sql):
+    """Statement with string/number literals and IN/VALUES lists folded to placeholders"""
+    text = sql.strip().rstrip(';')
+    for pattern, replacement in LITERALS:
+        text = pattern.sub(replacement, text)
+    return text
+
+
+def fingerprint_id(text):
+    return hashlib.md5(text.encode('utf-8')).hexdigest()[:12]
+
+
+class Query:
+    """One logged statement; rows is None for an error"""
+
+    __slots__ = ('logged', 'sql', 'params', 'rows', 'duration', 'error')
+
+    def __init__(self, logged, sql):
+        self.logged = logged
+        self.sql = sql
+        self.params = None
+        self.rows = None
+        self.duration = None
+        self.error = None
+
+
+class LogParser:
+    """
+    Line-by-line state machine over queryWithLog output. Each half of a box (timestamp,
+    SQL and params / result and duration) is printed in one go, but concurrent requests
+    interleave the halves and the log carries no id to pair them; a closing half is
+    matched to the oldest open query
+    """
+
+    def __init__(self):
+        self.open = deque()
+        self.current = None     # query whose opening half is being read
+        self.closing = None     # query whose closing half is being read
+        self.expect_sql = False
+
+    def feed(self, line):
+        """Returns the completed Query, or None"""
+        # Process managers may prefix each line (time, app name); the box starts at its first glyph
+        start = min((i for i in (line.find('│'), line.find('├'), line.find('└')) if i >= 0), default=-1)
+        if start < 0:
+            return None
+        line = line[start:].rstrip('\n')
+
+        match = START_RE.match(line)
+        if match:
+            self.current = Query(datetime.fromisoformat(match.group(1).replace('Z', '+00:00')), None)
+            self.open.append(self.current)
+            self.expect_sql = False
+            return None
+        if line.startswith('├'):
+            if self.current and self.current.sql is None:
+                self.expect_sql = True
+            elif self.open:
+                # A second separator after the SQL opens the closing half
+                self.closing = self.open.popleft()
+                self.current = None
+            return None
+        if line.startswith('└'):
+            done, self.closing = self.closing, None
+            return done if done and done.duration is not None else None
+
+        body = line[2:] if line.startswith('│ ') else line[1:]
+        if self.expect_sql and self.current:
+            self.current.sql = body
+            self.expect_sql = False
+        elif self.current and body.startswith('Params: '):
+            try:
+                self.current.params = json.loads(body[len('Params: '):])
+            except ValueError:
+                self.current.params = body[len('Params: '):]
+        elif self.closing:
+            result = RESULT_RE.match(line)
+            duration = DURATION_RE.match(line)
+            if result:
+                self.closing.rows = int(result.group(1))
+            elif duration:
+                self.closing.duration = int(duration.group(1))
+            elif body.startswith('ERROR: '):
+                self.closing.error = body[len('ERROR: '):]
+        return None
+
+
+class RollingStats:
+    """Per-fingerprint aggregates over the last window seconds of log time"""
+
+    def __init__(self, window=DEFAULT_WINDOW):
+        self.window = window
+        self.queries = deque()
+        self.newest = None
+        self.seen = 0
+
+    def add(self, query):
+        self.queries.append((query.logged, fingerprint(query.sql or ''), query))
+        self.newest = max(self.newest, query.logged) if self.newest else query.logged
+        self.seen += 1
+        self.expire()
+
+    def expire(self):
+        while self.queries and (self.newest - self.queries[0][0]).total_seconds() > self.window:
+            self.queries.popleft()
+
+    def groups(self):
+        """fingerprint -> dict of count, errors, total/p50/p95/p99 ms and rows"""
+        grouped = {}
+        for _, text, query in self.queries:
+            grouped.setdefault(text, []).append(query)
+        result = {}
+        for text, queries in grouped.items():
+            durations = [q.duration for q in queries]
+            rows = [q.rows for q in queries if q.rows is not None]
+            result[text] = dict(
+                count=len(queries), errors=sum(1 for q in queries if q.error), total=sum(durations),
+                p50=percentile(durations, 50), p95=percentile(durations, 95), p99=percentile(durations, 99),
+                rows=sum(rows), avg_rows=mean(rows),
+            )
+        return result
+
+
+def print_top(stats, top=DEFAULT_TOP, sort='total'):
+    groups = stats.groups()
+    span = f"{stats.window}s to {stats.newest:%H:%M:%S}" if stats.newest else "empty"
+    print(f"\n=== Top {min(top, len(groups))} of {len(groups)} fingerprints "
+          f"({len(stats.queries):,} queries, {span}, by {sort}) ===")
+    if not groups:
+        return
+    print(f"  {'id':<13}{'count':>8}{'total':>11}{'p50':>9}{'p95':>9}{'p99':>9}{'rows':>12}{'avg rows':>10}")
+    ranked = sorted(groups.items(), key=lambda item: -item[1][sort])
+    for text, g in ranked[:top]:
+        errors = f"  [FAIL] {g['errors']} errors" if g['errors'] else ""
+        print(f"  {fingerprint_id(text):<13}{g['count']:>8,}{g['total']:>9,}ms{g['p50']:>7.0f}ms{g['p95']:>7.0f}ms"
+              f"{g['p99']:>7.0f}ms{g['rows']:>12,}{g['avg_rows']:>10,.0f}{errors}")
+        print(f"    {text if len(text) <= SQL_WIDTH else text[:SQL_WIDTH - 3] + '...'}")
+
+
+def follow(f, poll=0.5):
+    """Lines of a growing file, like tail -f; yields None while idle so reports keep coming"""
+    while True:
+        line = f.readline()
+        if line:
+            yield line
+        else:
+            yield None
+            time.sleep(poll)
+
+
+def analyze(f, window=DEFAULT_WINDOW, top=DEFAULT_TOP, sort='total', tail=False, interval=DEFAULT_INTERVAL):
+    parser = LogParser()
+    stats = RollingStats(window)
+    last_report = time.monotonic()
+    lines = follow(f) if tail else f
+    for line in lines:
+        if line is not None:
+            query = parser.feed(line)
+            if query:
+                stats.add(query)
+        if time.monotonic() - last_report >= interval:
+            print_top(stats, top, sort)
+            last_report = time.monotonic()
+    print_top(stats, top, sort)
+    print(f"\nParsed {stats.seen:,} queries ({len(parser.open)} still open)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Aggregate queryWithLog output into a top-N of query fingerprints")
+    parser.add_argument('log', nargs='?', default='-', help="log file, '-' for stdin (default)")
+    parser.add_argument('--follow', '-f', action='store_true', help='keep reading as the file grows')
+    parser.add_argument('--window', type=int, default=DEFAULT_WINDOW, help='seconds of log time aggregated')
+    parser.add_argument('--top', type=int, default=DEFAULT_TOP, help='fingerprints printed')
+    parser.add_argument('--sort', choices=SORT_KEYS, default='total', help='ranking column')
+    parser.add_argument('--interval', type=int, default=DEFAULT_INTERVAL, help='seconds between reports while reading')
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print(f"FMS Query Log Stats ({'stdin' if args.log == '-' else args.log}, {args.window}s window)")
+    print("=" * 60)
+
+    try:
+        if args.log == '-':
+            analyze(sys.stdin, args.window, args.top, args.sort, False, args.interval)
+        else:
+            with open(args.log, encoding='utf-8', errors='replace') as f:
+                if args.follow:
+                    f.seek(0, 2)
+                analyze(f, args.window, args.top, args.sort, args.follow, args.interval)
+    except KeyboardInterrupt:
+        pass
+    except Exception as e:
+        print(f"\nError: {e}")
+
+
+if __name__ == "__main__":
+    main()
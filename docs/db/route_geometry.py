@@ -0,0 +1,479 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+FMS Route Geometry
+Precomputes the map polyline of every active POL/POD pair of BL_MASTER_BL and
+origin/destination airport pair of AWB_MASTER_AWB into SHP_ROUTE_GEOMETRY, so
+the tracking API returns cached geometry instead of the browser rebuilding
+each path on every render. Sea routes follow the sea-lane waypoints of
+fms-web WorldMapGlobe.tsx, air routes the great circle; every leg is densified
+along the great circle, then stored twice: as one path with continuous
+longitudes in the map frame (PACIFIC_ROUTE_FIX_PLAN.md) and simplified and
+split at the antimeridian with longitudes in -180..180. Rows are keyed by pair
+and GEOMETRY_VERSION; bump the version when the algorithm changes. The geohash
+cells each split segment passes through go to SHP_ROUTE_GEOCELL, the spatial
+index behind the tracking API viewport query (fms-web/src/lib/viewport.ts)
+"""
+
+import argparse
+import json
+import math
+import time
+from datetime import datetime
+
+import pymysql
+
+from provision_schema import DB_CONFIG
+from schema_model import LiveSchema
+
+GEOMETRY_TABLE = 'SHP_ROUTE_GEOMETRY'
+CELL_TABLE = 'SHP_ROUTE_GEOCELL'
+# Must match ROUTE_GEOMETRY_VERSION in fms-web/src/lib/routeGeometry.ts
+GEOMETRY_VERSION = 1
+DENSIFY_KM = 250
+SIMPLIFY_DEG = 0.05
+EARTH_KM = 6371.0088
+# Must match CELL_PRECISION in fms-web/src/lib/viewport.ts (3 characters = 1.40625 degree cells)
+CELL_PRECISION = 3
+GEOHASH_BASE32 = '0123456789bcdefghjkmnpqrstuvwxyz'
+# Longitude window of the tracking map (WorldMapGlobe.tsx VIEW_CONFIGS.maxBounds)
+MAP_LNG = (-30, 290)
+BATCH = 500
+
+# (table, mode, origin column, destination column)
+SOURCES = [
+    ('BL_MASTER_BL', 'SEA', 'POL_PORT_CD', 'POD_PORT_CD'),
+    ('AWB_MASTER_AWB', 'AIR', 'ORIGIN_AIRPORT_CD', 'DEST_AIRPORT_CD'),
+]
+
+# ============================================================
+# Sea lanes (same waypoints and regions as WorldMapGlobe.tsx)
+# ============================================================
+SEA_WAYPOINTS = {
+    'KOREA_EXIT': (33.0, 130.0),
+    'JAPAN_SOUTH': (30.0, 135.0),
+    'TAIWAN_STRAIT': (24.0, 120.0),
+    'SOUTH_CHINA_SEA': (15.0, 115.0),
+    'MALACCA_EAST': (1.3, 104.0),
+    'MALACCA_WEST': (5.0, 95.0),
+    'INDIAN_OCEAN_EAST': (5.0, 80.0),
+    'ARABIAN_SEA': (15.0, 55.0),
+    'ADEN_GULF': (12.5, 45.0),
+    'RED_SEA_SOUTH': (13.0, 43.0),
+    'RED_SEA_NORTH': (27.5, 34.0),
+    'SUEZ_SOUTH': (29.9, 32.5),
+    'SUEZ_NORTH': (31.3, 32.3),
+    'MEDITERRANEAN_EAST': (33.0, 32.0),
+    'MEDITERRANEAN_CENTRAL': (36.0, 15.0),
+    'GIBRALTAR': (36.0, -6.0),
+    'ATLANTIC_IBERIA': (38.0, -10.0),
+    'ATLANTIC_BISCAY': (45.0, -8.0),
+    'ENGLISH_CHANNEL': (50.0, -2.0),
+    'NORTH_SEA': (54.0, 4.0),
+    'PACIFIC_NORTH': (40.0, 170.0),
+    'PACIFIC_HAWAII': (22.0, -158.0),
+    'US_WEST_APPROACH': (32.0, -125.0),
+    'PANAMA_PACIFIC': (8.0, -80.0),
+    'PANAMA_ATLANTIC': (9.5, -80.0),
+    'US_EAST_APPROACH': (35.0, -75.0),
+    'AUSTRALIA_NORTH': (-12.0, 130.0),
+}
+
+_ASIA_EUROPE = ['KOREA_EXIT', 'TAIWAN_STRAIT', 'SOUTH_CHINA_SEA']
+_SUEZ_WEST = ['MALACCA_EAST', 'MALACCA_WEST', 'INDIAN_OCEAN_EAST', 'ARABIAN_SEA', 'ADEN_GULF',
+              'RED_SEA_SOUTH', 'RED_SEA_NORTH', 'SUEZ_SOUTH', 'SUEZ_NORTH', 'MEDITERRANEAN_EAST']
+_NORTH_EUROPE = ['MEDITERRANEAN_CENTRAL', 'GIBRALTAR', 'ATLANTIC_IBERIA', 'ATLANTIC_BISCAY',
+                 'ENGLISH_CHANNEL', 'NORTH_SEA']
+_PACIFIC_EAST = ['JAPAN_SOUTH', 'PACIFIC_NORTH', 'PACIFIC_HAWAII']
+
+SEA_LANES = {
+    ('EAST_ASIA', 'US_WEST'): ['KOREA_EXIT'] + _PACIFIC_EAST + ['US_WEST_APPROACH'],
+    ('EAST_ASIA', 'US_EAST'): (['KOREA_EXIT'] + _PACIFIC_EAST
+                               + ['PANAMA_PACIFIC', 'PANAMA_ATLANTIC', 'US_EAST_APPROACH']),
+    ('EAST_ASIA', 'EUROPE_MED'): _ASIA_EUROPE + _SUEZ_WEST,
+    ('EAST_ASIA', 'EUROPE_NORTH'): _ASIA_EUROPE + _SUEZ_WEST + _NORTH_EUROPE,
+    ('EAST_ASIA', 'SOUTHEAST_ASIA'): _ASIA_EUROPE,
+    ('EAST_ASIA', 'AUSTRALIA'): _ASIA_EUROPE + ['AUSTRALIA_NORTH'],
+    ('SOUTHEAST_ASIA', 'US_WEST'): ['SOUTH_CHINA_SEA', 'TAIWAN_STRAIT'] + _PACIFIC_EAST + ['US_WEST_APPROACH'],
+    ('SOUTHEAST_ASIA', 'EUROPE_MED'): _SUEZ_WEST,
+    ('SOUTHEAST_ASIA', 'EUROPE_NORTH'): _SUEZ_WEST,
+    ('EUROPE_MED', 'EAST_ASIA'): _SUEZ_WEST[::-1] + _ASIA_EUROPE[::-1],
+    ('EUROPE_NORTH', 'EAST_ASIA'): _NORTH_EUROPE[::-1] + _SUEZ_WEST[::-1] + _ASIA_EUROPE[::-1],
+    ('EUROPE_MED', 'SOUTHEAST_ASIA'): _SUEZ_WEST[::-1] + ['SOUTH_CHINA_SEA'],
+    ('EUROPE_NORTH', 'SOUTHEAST_ASIA'): _NORTH_EUROPE[::-1] + _SUEZ_WEST[::-1] + ['SOUTH_CHINA_SEA'],
+    ('EUROPE_MED', 'US_EAST'): ['ATLANTIC_BISCAY', 'ATLANTIC_IBERIA', 'US_EAST_APPROACH'],
+    ('EUROPE_NORTH', 'US_EAST'): ['NORTH_SEA', 'ENGLISH_CHANNEL', 'ATLANTIC_BISCAY', 'ATLANTIC_IBERIA',
+                                  'US_EAST_APPROACH'],
+    ('US_WEST', 'EAST_ASIA'): ['US_WEST_APPROACH'] + _PACIFIC_EAST[::-1] + ['KOREA_EXIT'],
+}
+
+
+def get_connection():
+    return pymysql.connect(**DB_CONFIG)
+
+
+def region(lat, lng):
+    if 20 <= lat <= 55 and 100 <= lng <= 150:
+        return 'EAST_ASIA'
+    if -10 <= lat < 20 and 95 <= lng <= 140:
+        return 'SOUTHEAST_ASIA'
+    if 5 <= lat <= 35 and 65 <= lng < 95:
+        return 'SOUTH_ASIA'
+    if 10 <= lat <= 40 and 30 <= lng < 65:
+        return 'MIDDLE_EAST'
+    if 30 <= lat <= 50 and -10 <= lng < 30:
+        return 'EUROPE_MED'
+    if 50 < lat <= 70 and -10 <= lng <= 30:
+        return 'EUROPE_NORTH'
+    if -35 <= lat < 30 and -20 <= lng <= 50:
+        return 'AFRICA'
+    if 20 <= lat <= 60 and -130 <= lng < -100:
+        return 'US_WEST'
+    if 20 <= lat <= 55 and -100 <= lng <= -60:
+        return 'US_EAST'
+    if -55 <= lat < 15 and -85 <= lng <= -30:
+        return 'SOUTH_AMERICA'
+    if -50 <= lat < -10 and 110 <= lng <= 180:
+        return 'AUSTRALIA'
+    return 'UNKNOWN'
+
+
+def sea_waypoints(origin, dest):
+    lane = SEA_LANES.get((region(*origin), region(*dest)), [])
+    return [SEA_WAYPOINTS[name] for name in lane]
+
+
+# ============================================================
+# Geometry
+# ============================================================
+def to_vector(point):
+    lat, lng = map(math.radians, point)
+    return math.cos(lat) * math.cos(lng), math.cos(lat) * math.sin(lng), math.sin(lat)
+
+
+def to_point(x, y, z):
+    return math.degrees(math.atan2(z, math.hypot(x, y))), math.degrees(math.atan2(y, x))
+
+
+def arc_angle(a, b):
+    dot = sum(p * q for p, q in zip(a, b))
+    return math.acos(max(-1.0, min(1.0, dot)))
+
+
+def densify(points, step_km=DENSIFY_KM):
+    """Great circle legs between consecutive points, each cut into equal parts of at most step_km.
+    Returns (points with longitudes in -180..180, distance in km)"""
+    result = [points[0]]
+    distance = 0.0
+    for start, end in zip(points, points[1:]):
+        a, b = to_vector(start), to_vector(end)
+        angle = arc_angle(a, b)
+        distance += angle * EARTH_KM
+        parts = max(1, math.ceil(angle * EARTH_KM / step_km))
+        for i in range(1, parts + 1):
+            if angle < 1e-12:
+                result.append(end)
+                continue
+            f = i / parts
+            wa, wb = math.sin((1 - f) * angle) / math.sin(angle), math.sin(f * angle) / math.sin(angle)
+            result.append(to_point(*(wa * p + wb * q for p, q in zip(a, b))))
+    return result, distance
+
+
+def unwrap(points):
+    """Continuous longitudes: no step between neighbours is larger than 180 degrees"""
+    result = [points[0]]
+    for lat, lng in points[1:]:
+        previous = result[-1][1]
+        lng += 360 * round((previous - lng) / 360)
+        result.append((lat, lng))
+    return result
+
+
+def fit_map_frame(path):
+    """Shifts a continuous path by whole turns so most of it lies inside MAP_LNG"""
+    def inside(shift):
+        return sum(MAP_LNG[0] <= lng + shift <= MAP_LNG[1] for _, lng in path)
+    base = -360 * math.floor((path[0][1] - MAP_LNG[0]) / 360)
+    shift = max((base - 360, base, base + 360), key=inside)
+    return [(lat, lng + shift) for lat, lng in path]
+
+
+def simplify(points, tolerance=SIMPLIFY_DEG):
+    """Douglas-Peucker in degrees on a continuous path; endpoints are always kept"""
+    if len(points) < 3:
+        return list(points)
+    keep = [False] * len(points)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(points) - 1)]
+    while stack:
+        first, last = stack.pop()
+        (y1, x1), (y2, x2) = points[first], points[last]
+        length = math.hypot(x2 - x1, y2 - y1)
+        farthest, index = 0.0, None
+        for i in range(first + 1, last):
+            y, x = points[i]
+            if length == 0:
+                offset = math.hypot(x - x1, y - y1)
+            else:
+                offset = abs((x2 - x1) * (y1 - y) - (x1 - x) * (y2 - y1)) / length
+            if offset > farthest:
+                farthest, index = offset, i
+        if index is not None and farthest > tolerance:
+            keep[index] = True
+            stack.extend([(first, index), (index, last)])
+    return [p for p, kept in zip(points, keep) if kept]
+
+
+def split_antimeridian(path):
+    """Splits a continuous path where it crosses +-180; longitudes come back in -180..180"""
+    def turn(lng):
+        return math.floor((lng + 180) / 360)
+
+    segments = [[]]
+    for i, (lat, lng) in enumerate(path):
+        if i > 0:
+            prev_lat, prev_lng = path[i - 1]
+            prev_turn, this_turn = turn(prev_lng), turn(lng)
+            step = 1 if this_turn > prev_turn else -1
+            for boundary_turn in range(prev_turn, this_turn, step):
+                edge = 180 + 360 * (boundary_turn if step > 0 else boundary_turn - 1)
+                f = (edge - prev_lng) / (lng - prev_lng)
+                edge_lat = round(prev_lat + (lat - prev_lat) * f, 5)
+                segments[-1].append([edge_lat, 180.0 * step])
+                segments.append([[edge_lat, -180.0 * step]])
+        segments[-1].append([lat, round(lng - 360 * turn(lng), 5)])
+    return [segment for segment in segments if len(segment) > 1]
+
+
+def route_geometry(mode, origin, dest):
+    """Returns (path, segments, distance_km)"""
+    stops = [origin] + (sea_waypoints(origin, dest) if mode == 'SEA' else []) + [dest]
+    dense, distance = densify(stops)
+    path = fit_map_frame(unwrap(dense))
+    rounded = [[round(lat, 5), round(lng, 5)] for lat, lng in path]
+    return rounded, split_antimeridian(simplify(rounded)), distance
+
+
+# ============================================================
+# Geohash cells
+# ============================================================
+def grid_size(precision):
+    """(columns, rows) of the geohash grid; longitude takes the odd bit"""
+    bits = 5 * precision
+    return 1 << ((bits + 1) // 2), 1 << (bits // 2)
+
+
+def cell_column(lng, precision=CELL_PRECISION):
+    columns, _ = grid_size(precision)
+    return min(max(int((lng + 180) / 360 * columns), 0), columns - 1)
+
+
+def cell_row(lat, precision=CELL_PRECISION):
+    _, rows = grid_size(precision)
+    return min(max(int((lat + 90) / 180 * rows), 0), rows - 1)
+
+
+def geohash(column, row, precision=CELL_PRECISION):
+    """Geohash of a grid cell: column and row bits interleaved, longitude first"""
+    columns, rows = grid_size(precision)
+    column_bits, row_bits = columns.bit_length() - 1, rows.bit_length() - 1
+    value = 0
+    for i in range(5 * precision):
+        if i % 2 == 0:
+            column_bits -= 1
+            value = value << 1 | (column >> column_bits) & 1
+        else:
+            row_bits -= 1
+            value = value << 1 | (row >> row_bits) & 1
+    return ''.join(GEOHASH_BASE32[value >> 5 * (precision - 1 - i) & 31] for i in range(precision))
+
+
+def chord_cells(start, end, precision=CELL_PRECISION):
+    """Every cell the straight line between two points (longitudes in -180..180) passes through"""
+    (lat1, lng1), (lat2, lng2) = sorted([start, end], key=lambda point: point[1])
+    columns, _ = grid_size(precision)
+    width = 360 / columns
+
+    def lat_at(lng):
+        return lat1 + (lat2 - lat1) * (lng - lng1) / (lng2 - lng1)
+
+    cells = set()
+    for column in range(cell_column(lng1, precision), cell_column(lng2, precision) + 1):
+        left, right = max(lng1, column * width - 180), min(lng2, (column + 1) * width - 180)
+        top = lat1 if left == lng1 else lat_at(left)
+        bottom = lat2 if right == lng2 else lat_at(right)
+        low, high = sorted((cell_row(top, precision), cell_row(bottom, precision)))
+        cells.update((column, row) for row in range(low, high + 1))
+    return cells
+
+
+def route_cells(segments, precision=CELL_PRECISION):
+    """Sorted geohashes covering the antimeridian-split segments of one route"""
+    cells = set()
+    for segment in segments:
+        for start, end in zip(segment, segment[1:]):
+            cells |= chord_cells(start, end, precision)
+    return sorted(geohash(column, row, precision) for column, row in cells)
+
+
+# ============================================================
+# Job
+# ============================================================
+def active_pairs(cursor, live):
+    """{(mode, origin, destination)} of non-deleted masters"""
+    pairs = set()
+    for table, mode, origin, dest in SOURCES:
+        if table not in live.tables:
+            print(f"  [SKIP] {table} (table not found)")
+            continue
+        cursor.execute(f"""
+            SELECT DISTINCT {origin}, {dest} FROM {table}
+            WHERE DEL_YN = 'N' AND {origin} IS NOT NULL AND {dest} IS NOT NULL
+        """)
+        found = {(mode, o, d) for o, d in cursor.fetchall() if o != d}
+        print(f"  {table:<16} {len(found):>8,} {mode} pairs")
+        pairs |= found
+    return pairs
+
+
+def cached_pairs(cursor):
+    """Pairs with geometry and cells at this version (geometry saved before the cell index is rebuilt)"""
+    cursor.execute(f"""
+        SELECT g.TRANSPORT_MODE_CD, g.ORIGIN_CD, g.DEST_CD FROM {GEOMETRY_TABLE} g
+        WHERE g.GEOMETRY_VER = %s
+          AND EXISTS (SELECT 1 FROM {CELL_TABLE} c
+                      WHERE c.TRANSPORT_MODE_CD = g.TRANSPORT_MODE_CD AND c.ORIGIN_CD = g.ORIGIN_CD
+                        AND c.DEST_CD = g.DEST_CD AND c.GEOMETRY_VER = g.GEOMETRY_VER)
+    """, (GEOMETRY_VERSION,))
+    return set(cursor.fetchall())
+
+
+def port_coordinates(cursor, codes):
+    coordinates = {}
+    codes = sorted(codes)
+    for start in range(0, len(codes), BATCH):
+        chunk = codes[start:start + BATCH]
+        cursor.execute(f"""
+            SELECT PORT_CD, LATITUDE, LONGITUDE FROM MST_PORT
+            WHERE PORT_CD IN ({', '.join(['%s'] * len(chunk))})
+              AND LATITUDE IS NOT NULL AND LONGITUDE IS NOT NULL
+        """, chunk)
+        coordinates.update({code: (float(lat), float(lng)) for code, lat, lng in cursor.fetchall()})
+    return coordinates
+
+
+def save(cursor, rows):
+    for start in range(0, len(rows), BATCH):
+        cursor.executemany(f"""
+            INSERT INTO {GEOMETRY_TABLE} (TRANSPORT_MODE_CD, ORIGIN_CD, DEST_CD, GEOMETRY_VER,
+                DISTANCE_KM, POINT_CNT, PATH_JSON, SEGMENTS_JSON, CROSS_DATELINE_YN)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+            ON DUPLICATE KEY UPDATE DISTANCE_KM = VALUES(DISTANCE_KM), POINT_CNT = VALUES(POINT_CNT),
+                PATH_JSON = VALUES(PATH_JSON), SEGMENTS_JSON = VALUES(SEGMENTS_JSON),
+                CROSS_DATELINE_YN = VALUES(CROSS_DATELINE_YN)
+        """, rows[start:start + BATCH])
+
+
+def save_cells(cursor, cells):
+    """cells: {(mode, origin, destination): [geohash, ...]}; replaces the cells of those pairs"""
+    pairs = sorted(cells)
+    for start in range(0, len(pairs), BATCH):
+        chunk = pairs[start:start + BATCH]
+        cursor.execute(f"""
+            DELETE FROM {CELL_TABLE} WHERE GEOMETRY_VER = %s
+              AND (TRANSPORT_MODE_CD, ORIGIN_CD, DEST_CD) IN ({', '.join(['(%s, %s, %s)'] * len(chunk))})
+        """, [GEOMETRY_VERSION] + [value for pair in chunk for value in pair])
+    rows = [(code, *pair, GEOMETRY_VERSION) for pair in pairs for code in cells[pair]]
+    for start in range(0, len(rows), BATCH * 10):
+        cursor.executemany(f"""
+            INSERT INTO {CELL_TABLE} (GEOHASH, TRANSPORT_MODE_CD, ORIGIN_CD, DEST_CD, GEOMETRY_VER)
+            VALUES (%s, %s, %s, %s, %s)
+        """, rows[start:start + BATCH * 10])
+
+
+def prune_geometry(cursor, live, pairs):
+    """Deletes geometry and cells of other versions and of pairs no longer used by any master"""
+    for table in (GEOMETRY_TABLE, CELL_TABLE):
+        cursor.execute(f"DELETE FROM {table} WHERE GEOMETRY_VER <> %s", (GEOMETRY_VERSION,))
+        print(f"  [OK] pruned {cursor.rowcount:,} {table} rows of other versions")
+
+    # Modes whose source table is missing are left alone rather than emptied
+    modes = {mode for table, mode, _, _ in SOURCES if table in live.tables}
+    cursor.execute(f"SELECT TRANSPORT_MODE_CD, ORIGIN_CD, DEST_CD FROM {GEOMETRY_TABLE}")
+    unused = sorted(pair for pair in cursor.fetchall() if pair[0] in modes and pair not in pairs)
+    for start in range(0, len(unused), BATCH):
+        chunk = unused[start:start + BATCH]
+        for table in (GEOMETRY_TABLE, CELL_TABLE):
+            cursor.execute(f"""
+                DELETE FROM {table}
+                WHERE (TRANSPORT_MODE_CD, ORIGIN_CD, DEST_CD) IN ({', '.join(['(%s, %s, %s)'] * len(chunk))})
+            """, [value for pair in chunk for value in pair])
+    print(f"  [OK] pruned {len(unused):,} pairs no longer used by any B/L or AWB")
+
+
+def build_geometry(rebuild, prune, dry_run):
+    conn = get_connection()
+    try:
+        live = LiveSchema.read(conn)
+        with conn.cursor() as cursor:
+            print("\n=== Active pairs ===")
+            pairs = active_pairs(cursor, live)
+            cached = set() if rebuild else cached_pairs(cursor)
+            todo = sorted(pairs - cached)
+            print(f"  {len(pairs):,} active, {len(pairs & cached):,} cached, {len(todo):,} to build")
+
+            print(f"\n=== Geometry (version {GEOMETRY_VERSION}) ===")
+            started = time.perf_counter()
+            coordinates = port_coordinates(cursor, {code for _, o, d in todo for code in (o, d)})
+            rows, cells, missing = [], {}, set()
+            for mode, origin, dest in todo:
+                if origin not in coordinates or dest not in coordinates:
+                    missing.update(c for c in (origin, dest) if c not in coordinates)
+                    continue
+                path, segments, distance = route_geometry(mode, coordinates[origin], coordinates[dest])
+                rows.append((mode, origin, dest, GEOMETRY_VERSION, round(distance, 1), len(path),
+                             json.dumps(path, separators=(',', ':')),
+                             json.dumps(segments, separators=(',', ':')),
+                             'Y' if len(segments) > 1 else 'N'))
+                cells[(mode, origin, dest)] = route_cells(segments)
+            points = sum(row[5] for row in rows)
+            print(f"  [OK] {len(rows):,} routes, {points:,} points ({time.perf_counter() - started:.1f}s)")
+            print(f"  [OK] {sum(map(len, cells.values())):,} geohash cells (precision {CELL_PRECISION})")
+            if missing:
+                print(f"  [SKIP] {len(todo) - len(rows):,} pairs; no MST_PORT coordinates for "
+                      f"{', '.join(sorted(missing)[:10])}{' ...' if len(missing) > 10 else ''} "
+                      f"(run port_coordinates.py)")
+
+            if dry_run:
+                print("  (dry run, nothing saved)")
+                return
+            save(cursor, rows)
+            save_cells(cursor, cells)
+            if prune:
+                prune_geometry(cursor, live, pairs)
+            conn.commit()
+    finally:
+        conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Precompute tracking map route geometry per port pair")
+    parser.add_argument('--rebuild', action='store_true', help='recompute pairs already cached at this version')
+    parser.add_argument('--prune', action='store_true',
+                        help='delete geometry and cells of other versions and of pairs no longer in use')
+    parser.add_argument('--dry-run', action='store_true', help='compute without saving')
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print(f"FMS Route Geometry ({datetime.now():%Y-%m-%d %H:%M})")
+    print("=" * 60)
+
+    try:
+        build_geometry(args.rebuild, args.prune, args.dry_run)
+    except Exception as e:
+        print(f"\nError: {e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,265 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+FMS Shipment Status Rollup
+Reconciles SHP_STATUS_COUNT, the per status / transport mode shipment counts the
+dashboard reads, with ORD_SHIPMENT. The API keeps the rollup current with
+increments; this job recounts live shipments inside one consistent snapshot and
+corrects only drift seen by two passes, as relative deltas, so increments made
+while it runs are kept. Status history rows added since the previous run are
+checked against ORD_SHIPMENT.STATUS_CD first, and with --sync-status the newest
+history status is applied to the shipment. The first completed recount
+records the STATUS_COUNT checkpoint; until then the dashboard counts
+ORD_SHIPMENT directly, since the rollup only holds the increments made so far
+"""
+
+import argparse
+import time
+from collections import Counter
+from datetime import datetime
+
+import pymysql
+
+from provision_schema import DB_CONFIG
+
+ROLLUP_TABLE = 'SHP_STATUS_COUNT'
+CHECKPOINT_TABLE = 'STATUS_ROLLUP_CHECKPOINT'
+HISTORY_JOB = 'STATUS_HIST'
+# Must match ROLLUP_READY_JOB in fms-web/src/lib/statusCount.ts
+RECOUNT_JOB = 'STATUS_COUNT'
+DEFAULT_CHUNK = 50_000
+# Seconds between the two recount passes; an API increment lands well within this
+DEFAULT_SETTLE = 2.0
+MAX_LISTED = 20
+
+UPSERT_COUNT = f"""
+    INSERT INTO {ROLLUP_TABLE} (STATUS_CD, TRANSPORT_MODE_CD, SHIPMENT_CNT, UPDATED_DTM)
+    VALUES (%s, %s, %s, NOW())
+    ON DUPLICATE KEY UPDATE SHIPMENT_CNT = SHIPMENT_CNT + VALUES(SHIPMENT_CNT), UPDATED_DTM = NOW()
+"""
+
+
+def get_connection():
+    return pymysql.connect(**DB_CONFIG)
+
+
+def ensure_checkpoint_table(cursor):
+    # Also in create_tables_part2.py; kept for databases provisioned before it was
+    cursor.execute(f"""
+        CREATE TABLE IF NOT EXISTS {CHECKPOINT_TABLE} (
+            JOB_NM              VARCHAR(50)     NOT NULL,
+            LAST_HIST_ID        BIGINT          DEFAULT 0 COMMENT '마지막 확인 이력 ID',
+            UPDATED_DTM         DATETIME        DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+            PRIMARY KEY (JOB_NM)
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='상태 건수 재집계 체크포인트'
+    """)
+
+
+def next_bound(cursor, table, pk, last, chunk):
+    """Largest key of the next keyset chunk after last, or None when there are no more rows"""
+    cursor.execute(f"""
+        SELECT MAX({pk}) FROM (
+            SELECT {pk} FROM {table} WHERE {pk} > %s ORDER BY {pk} LIMIT %s
+        ) t
+    """, (last, chunk))
+    return cursor.fetchone()[0]
+
+
+def move_count(cursor, mode, previous, status):
+    """Moves one shipment between rollup rows, locking them in the same order as the API"""
+    moves = [(code, delta) for code, delta in ((previous, -1), (status, 1)) if code is not None]
+    for code, delta in sorted(moves):
+        cursor.execute(UPSERT_COUNT, (code, mode, delta))
+
+
+# ============================================================
+# Status history
+# ============================================================
+def check_history(conn, chunk, sync, dry_run):
+    """Shipments with new history rows whose newest history status differs from STATUS_CD"""
+    checked = mismatched = 0
+    with conn.cursor() as cursor:
+        ensure_checkpoint_table(cursor)
+        cursor.execute(f"SELECT LAST_HIST_ID FROM {CHECKPOINT_TABLE} WHERE JOB_NM = %s", (HISTORY_JOB,))
+        row = cursor.fetchone()
+        last = row[0] if row else 0
+
+        while True:
+            bound = next_bound(cursor, 'ORD_SHIPMENT_STATUS_HIST', 'HIST_ID', last, chunk)
+            if bound is None:
+                break
+            cursor.execute("""
+                SELECT s.SHIPMENT_ID, s.STATUS_CD, s.TRANSPORT_MODE_CD, s.DEL_YN,
+                       (SELECT h.STATUS_CD FROM ORD_SHIPMENT_STATUS_HIST h
+                         WHERE h.SHIPMENT_ID = s.SHIPMENT_ID
+                         ORDER BY h.EVENT_DTM DESC, h.HIST_ID DESC LIMIT 1) AS LATEST_CD
+                  FROM ORD_SHIPMENT s
+                 WHERE s.SHIPMENT_ID IN (SELECT SHIPMENT_ID FROM ORD_SHIPMENT_STATUS_HIST
+                                          WHERE HIST_ID > %s AND HIST_ID <= %s)
+            """, (last, bound))
+            rows = cursor.fetchall()
+            checked += len(rows)
+
+            for shipment_id, status, mode, del_yn, latest in rows:
+                if latest == status:
+                    continue
+                mismatched += 1
+                if mismatched <= MAX_LISTED:
+                    print(f"  [DIFF] SHIPMENT_ID {shipment_id}: {status} (history {latest})")
+                if sync and not dry_run:
+                    # Only if the shipment was not changed again since it was read
+                    cursor.execute("""
+                        UPDATE ORD_SHIPMENT SET STATUS_CD = %s, UPDATED_BY = 'system', UPDATED_DTM = NOW()
+                         WHERE SHIPMENT_ID = %s AND STATUS_CD = %s
+                    """, (latest, shipment_id, status))
+                    if cursor.rowcount and del_yn == 'N':
+                        move_count(cursor, mode, status, latest)
+
+            if not dry_run:
+                # The checkpoint commits together with any status it applied
+                cursor.execute(f"""
+                    INSERT INTO {CHECKPOINT_TABLE} (JOB_NM, LAST_HIST_ID) VALUES (%s, %s)
+                    ON DUPLICATE KEY UPDATE LAST_HIST_ID = VALUES(LAST_HIST_ID)
+                """, (HISTORY_JOB, bound))
+                conn.commit()
+            last = bound
+
+    if mismatched > MAX_LISTED:
+        print(f"  ... {mismatched - MAX_LISTED:,} more")
+    return checked, mismatched
+
+
+# ============================================================
+# Rollup recount
+# ============================================================
+def snapshot_drift(conn, chunk):
+    """Returns ({(status, mode): actual - rollup}, live shipments), read in one snapshot"""
+    actual = Counter()
+    with conn.cursor() as cursor:
+        cursor.execute("START TRANSACTION WITH CONSISTENT SNAPSHOT")
+        try:
+            last = 0
+            while True:
+                bound = next_bound(cursor, 'ORD_SHIPMENT', 'SHIPMENT_ID', last, chunk)
+                if bound is None:
+                    break
+                cursor.execute("""
+                    SELECT STATUS_CD, TRANSPORT_MODE_CD, COUNT(*) FROM ORD_SHIPMENT
+                     WHERE SHIPMENT_ID > %s AND SHIPMENT_ID <= %s
+                       AND DEL_YN = 'N' AND STATUS_CD IS NOT NULL
+                     GROUP BY STATUS_CD, TRANSPORT_MODE_CD
+                """, (last, bound))
+                for status, mode, count in cursor.fetchall():
+                    actual[(status, mode)] += count
+                last = bound
+
+            cursor.execute(f"SELECT STATUS_CD, TRANSPORT_MODE_CD, SHIPMENT_CNT FROM {ROLLUP_TABLE}")
+            rollup = {(status, mode): count for status, mode, count in cursor.fetchall()}
+        finally:
+            conn.rollback()
+
+    drift = {key: actual[key] - rollup.get(key, 0) for key in set(actual) | set(rollup)}
+    return {key: delta for key, delta in drift.items() if delta}, sum(actual.values())
+
+
+def settled(first, second):
+    """Corrections both passes agree on, by the smaller amount
+
+    A shipment caught between its insert and its rollup increment shows up as
+    drift in one pass only, so the increment is not applied twice.
+    """
+    fixes = {}
+    for key, delta in first.items():
+        again = second.get(key, 0)
+        if delta * again > 0:
+            fixes[key] = min(delta, again, key=abs)
+    return fixes
+
+
+def mark_recounted(cursor):
+    """From now on the dashboard reads the rollup instead of counting ORD_SHIPMENT"""
+    ensure_checkpoint_table(cursor)
+    cursor.execute(f"""
+        INSERT INTO {CHECKPOINT_TABLE} (JOB_NM, LAST_HIST_ID) VALUES (%s, 0)
+        ON DUPLICATE KEY UPDATE UPDATED_DTM = NOW()
+    """, (RECOUNT_JOB,))
+
+
+def recount(conn, chunk, settle, dry_run):
+    first, total = snapshot_drift(conn, chunk)
+    fixes = {}
+    if first:
+        time.sleep(settle)
+        second, total = snapshot_drift(conn, chunk)
+        fixes = settled(first, second)
+
+    print(f"  Live shipments: {total:,}")
+    if not fixes:
+        print(f"  [OK] {ROLLUP_TABLE} matches ORD_SHIPMENT")
+    else:
+        for (status, mode), delta in sorted(fixes.items()):
+            print(f"  [FIX] {status:<14} {mode:<6} {delta:+,}")
+    if dry_run:
+        if fixes:
+            print("  (dry run, nothing applied)")
+        return len(fixes)
+
+    # The fixes and the checkpoint commit together
+    with conn.cursor() as cursor:
+        for (status, mode), delta in sorted(fixes.items()):
+            cursor.execute(UPSERT_COUNT, (status, mode, delta))
+        mark_recounted(cursor)
+    conn.commit()
+    return len(fixes)
+
+
+def reconcile(chunk, settle, sync, dry_run):
+    conn = get_connection()
+    try:
+        started = time.perf_counter()
+        print("\n=== Status history ===")
+        checked, mismatched = check_history(conn, chunk, sync, dry_run)
+        if mismatched == 0:
+            print(f"  [OK] {checked:,} shipments with new history rows")
+        else:
+            action = "applied" if sync and not dry_run else "reported"
+            print(f"  {mismatched:,} of {checked:,} shipments differ from their history ({action})")
+
+        print("\n=== Status counts ===")
+        recount(conn, chunk, settle, dry_run)
+        print(f"\n  Done in {time.perf_counter() - started:.1f}s")
+    finally:
+        conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Reconcile the dashboard shipment status counts")
+    parser.add_argument('--chunk', type=int, default=DEFAULT_CHUNK, help='rows per keyset chunk')
+    parser.add_argument('--settle', type=float, default=DEFAULT_SETTLE,
+                        help='seconds between the two recount passes')
+    parser.add_argument('--interval', type=int, default=0,
+                        help='repeat every N seconds until interrupted (default: run once)')
+    parser.add_argument('--sync-status', action='store_true',
+                        help='set ORD_SHIPMENT.STATUS_CD to the newest history status where they differ')
+    parser.add_argument('--dry-run', action='store_true', help='report drift without changing anything')
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print(f"FMS Shipment Status Rollup ({datetime.now():%Y-%m-%d %H:%M})")
+    print("=" * 60)
+
+    try:
+        while True:
+            reconcile(args.chunk, args.settle, args.sync_status, args.dry_run)
+            if args.interval <= 0:
+                break
+            time.sleep(args.interval)
+            print(f"\n--- {datetime.now():%Y-%m-%d %H:%M:%S} ---")
+    except KeyboardInterrupt:
+        print("\nStopped")
+    except Exception as e:
+        print(f"\nError: {e}")
+
+
+if __name__ == "__main__":
+    main()
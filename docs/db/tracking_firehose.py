@@ -0,0 +1,315 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+FMS Tracking Firehose
+Load test for the tracking tables: replays container milestone streams
+(gate-in, load, depart, transship, arrive, discharge, gate-out) for the active
+sea shipments of the database into SHP_TRACKING_EVENT and
+TRN_CONTAINER_MOVEMENT at a target events/sec rate, the way carrier EDI feeds
+would. Several writer connections insert batched rows; throughput, commit
+latency and index growth are reported so the write ceiling of the tracking
+tables is known before production traffic finds it
+"""
+
+import argparse
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import datetime, timedelta
+
+import pymysql
+
+from bulk_load import BulkLoader, MODES
+from generate_data import PORT_COUNTRY, PORT_NAME
+from latency_stats import percentile
+from provision_schema import DB_CONFIG
+from schema_model import SchemaModel
+
+TABLES = ('SHP_TRACKING_EVENT', 'TRN_CONTAINER_MOVEMENT')
+DEFAULT_SHIPMENTS = 5_000
+DEFAULT_RATE = 1_000
+DEFAULT_BATCH = 500
+DEFAULT_WRITERS = 4
+DEFAULT_SECONDS = 60
+REPORT_SECONDS = 5
+# Firehose rows are tagged so --purge can remove them again
+SOURCE_PREFIX = 'FH'
+PURGE_CHUNK = 10_000
+
+# (event code, event name, port, container movement, location type, hours after the previous milestone)
+ORIGIN = [
+    ('GIN', 'Gate In at Terminal', 'POL', 'GATE_IN', 'CY', 0),
+    ('LOD', 'Loaded on Vessel', 'POL', 'LOAD', 'PORT', 40),
+    ('DEP', 'Vessel Departed', 'POL', None, None, 4),
+]
+TRANSSHIPMENT = [
+    ('TSD', 'Discharged at Transshipment Port', 'HUB', 'DISCHARGE', 'PORT', 96),
+    ('TSL', 'Loaded at Transshipment Port', 'HUB', 'LOAD', 'PORT', 48),
+]
+DESTINATION = [
+    ('ARR', 'Vessel Arrived', 'POD', None, None, 120),
+    ('DIS', 'Discharged from Vessel', 'POD', 'DISCHARGE', 'PORT', 6),
+    ('GOT', 'Gate Out from Terminal', 'POD', 'GATE_OUT', 'CY', 48),
+]
+HUBS = ['SGSIN', 'HKHKG', 'CNSHA']
+TRANSSHIPMENT_SHARE = 0.4
+
+
+def get_connection():
+    return pymysql.connect(**DB_CONFIG)
+
+
+def load_shipments(cursor, limit):
+    """[(SHIPMENT_ID, POL, POD, MBL_ID, VESSEL_NM, VOYAGE_NO, [(CONTAINER_ID, CNTR_NO, SEAL_NO, HBL_ID)])]"""
+    cursor.execute("""
+        SELECT s.SHIPMENT_ID, s.ORIGIN_PORT_CD, s.DEST_PORT_CD, m.MBL_ID, m.VESSEL_NM, m.VOYAGE_NO
+        FROM ORD_SHIPMENT s
+        JOIN BL_MASTER_BL m ON m.SHIPMENT_ID = s.SHIPMENT_ID
+        WHERE s.TRANSPORT_MODE_CD = 'SEA' AND s.STATUS_CD <> 'DELIVERED' AND s.DEL_YN = 'N'
+        ORDER BY s.SHIPMENT_ID DESC
+        LIMIT %s
+    """, (limit,))
+    shipments = {row[3]: list(row) + [[]] for row in cursor.fetchall()}
+
+    mbl_ids = list(shipments)
+    for start in range(0, len(mbl_ids), 1000):
+        chunk = mbl_ids[start:start + 1000]
+        cursor.execute(f"""
+            SELECT MBL_ID, CONTAINER_ID, CNTR_NO, SEAL_NO, HBL_ID FROM BL_CONTAINER
+            WHERE MBL_ID IN ({', '.join(['%s'] * len(chunk))})
+        """, chunk)
+        for mbl_id, *container in cursor.fetchall():
+            shipments[mbl_id][6].append(tuple(container))
+    return list(shipments.values())
+
+
+class Voyage:
+    """Milestone stream of one shipment; restarts as the next voyage once delivered"""
+
+    __slots__ = ('sid', 'pol', 'pod', 'mbl_id', 'vessel', 'voyage_no', 'containers', 'path', 'step', 'clock')
+
+    def __init__(self, shipment, clock):
+        self.sid, self.pol, self.pod, self.mbl_id, self.vessel, self.voyage_no, self.containers = shipment
+        self.path = []
+        self.step = 0
+        self.clock = clock
+
+    def next_milestone(self, rng):
+        if self.step == len(self.path):
+            hubs = [h for h in HUBS if h not in (self.pol, self.pod)]
+            hub = rng.choice(hubs) if rng.random() < TRANSSHIPMENT_SHARE else None
+            self.path = [m[:2] + (hub if m[2] == 'HUB' else getattr(self, m[2].lower()),) + m[3:]
+                         for m in ORIGIN + (TRANSSHIPMENT if hub else []) + DESTINATION]
+            self.step = 0
+        milestone = self.path[self.step]
+        self.step += 1
+        self.clock += timedelta(minutes=round(milestone[-1] * 60 * rng.uniform(0.7, 1.3)))
+        return milestone
+
+
+class Feed:
+    """Round-robin over a writer's shipments, one milestone per shipment per turn"""
+
+    def __init__(self, shipments, seed, run_id, writer):
+        self.rng = random.Random(seed)
+        start = datetime.now().replace(second=0, microsecond=0)
+        # Shipments join the feed at different points of their first voyage
+        self.voyages = deque(Voyage(s, start - timedelta(minutes=self.rng.randrange(20 * 24 * 60)))
+                             for s in shipments)
+        self.prefix = f"{SOURCE_PREFIX}{run_id}{writer:02d}"
+        self.moves = 0
+
+    def batch(self, events):
+        """Rows for about events tracking events (container milestones fan out per container)"""
+        rows = {'SHP_TRACKING_EVENT': [], 'TRN_CONTAINER_MOVEMENT': []}
+        while len(rows['SHP_TRACKING_EVENT']) < events:
+            v = self.voyages[0]
+            self.voyages.rotate(-1)
+            code, name, port, move, location_type, _ = v.next_milestone(self.rng)
+            when = v.clock
+            targets = v.containers if move and v.containers else [(None, None, None, None)]
+            for container_id, cntr_no, seal_no, hbl_id in targets:
+                rows['SHP_TRACKING_EVENT'].append(dict(
+                    SHIPMENT_ID=v.sid, MBL_ID=v.mbl_id, HBL_ID=hbl_id, CONTAINER_ID=container_id,
+                    EVENT_CD=code, EVENT_NM=name, EVENT_DTM=when, LOCATION_CD=port,
+                    LOCATION_NM=PORT_NAME.get(port), COUNTRY_CD=PORT_COUNTRY.get(port),
+                    VESSEL_FLIGHT=v.vessel, VOYAGE_NO=v.voyage_no,
+                    SOURCE_CD='EDI', SOURCE_REF=self.prefix, IS_EXCEPTION='N', CREATED_DTM=when,
+                ))
+                if move and cntr_no:
+                    self.moves += 1
+                    rows['TRN_CONTAINER_MOVEMENT'].append(dict(
+                        MOVEMENT_ID=f"{self.prefix}{self.moves:08d}", CONTAINER_NO=cntr_no, SHIPMENT_ID=v.sid,
+                        MOVEMENT_TYPE=move, LOCATION_TYPE=location_type, LOCATION_CODE=port,
+                        LOCATION_NAME=PORT_NAME.get(port), MOVEMENT_DATE=when.date(), MOVEMENT_TIME=when.time(),
+                        SEAL_NO=seal_no, DAMAGE_YN='N', CREATED_AT=when,
+                    ))
+        return rows
+
+
+class Writer:
+    """One connection inserting a Feed's batches, paced to its share of the target rate"""
+
+    def __init__(self, model, feed, rate, batch, mode):
+        self.model = model
+        self.feed = feed
+        self.rate = rate
+        self.batch = batch
+        self.mode = mode
+        self.events = 0
+        self.latencies = []
+
+    def run(self, stop):
+        conn = pymysql.connect(**DB_CONFIG, local_infile=self.mode == 'infile')
+        try:
+            loader = BulkLoader(conn, self.model, self.mode)
+            started = time.perf_counter()
+            while not stop.is_set():
+                rows = self.feed.batch(self.batch)
+                begin = time.perf_counter()
+                loader.write(rows)
+                self.latencies.append(time.perf_counter() - begin)
+                self.events += len(rows['SHP_TRACKING_EVENT'])
+                if self.rate:
+                    ahead = self.events / self.rate - (time.perf_counter() - started)
+                    if ahead > 0:
+                        stop.wait(ahead)
+            return loader.counts
+        finally:
+            conn.close()
+
+
+def index_sizes(cursor):
+    """(table, index) -> bytes, from freshly analyzed persistent InnoDB statistics"""
+    for table in TABLES:
+        cursor.execute(f"ANALYZE TABLE {table}")
+        cursor.fetchall()
+    cursor.execute(f"""
+        SELECT table_name, index_name, stat_value * @@innodb_page_size
+        FROM mysql.innodb_index_stats
+        WHERE database_name = DATABASE() AND stat_name = 'size'
+          AND table_name IN ({', '.join(['%s'] * len(TABLES))})
+    """, TABLES)
+    return {(table, index): int(size) for table, index, size in cursor.fetchall()}
+
+
+def print_index_growth(before, after, rows):
+    print("\n=== Index Growth ===")
+    for key in sorted(after):
+        grown = after[key] - before.get(key, 0)
+        per_row = grown / rows[key[0]] if rows.get(key[0]) else 0
+        print(f"  {key[0]:<24} {key[1]:<24} {before.get(key, 0) / 2 ** 20:>9.1f} MB -> "
+              f"{after[key] / 2 ** 20:>9.1f} MB (+{grown / 2 ** 20:,.1f} MB, {per_row:,.0f} B/row)")
+
+
+def firehose(shipments=DEFAULT_SHIPMENTS, rate=DEFAULT_RATE, batch=DEFAULT_BATCH, writers=DEFAULT_WRITERS,
+             seconds=DEFAULT_SECONDS, mode='insert', seed=1):
+    model = SchemaModel.from_create_scripts()
+    conn = get_connection()
+    try:
+        with conn.cursor() as cursor:
+            active = load_shipments(cursor, shipments)
+            if not active:
+                raise ValueError("no active sea shipments with a master B/L; seed with generate_data.py first")
+            before = index_sizes(cursor)
+    finally:
+        conn.close()
+
+    containers = sum(len(s[6]) for s in active)
+    print(f"\n=== Firehose ({len(active):,} shipments, {containers:,} containers, "
+          f"{f'{rate:,} events/s' if rate else 'unthrottled'}, {writers} writers x {batch} events) ===")
+
+    # Disjoint shipment slices keep every shipment's milestones in order within one writer
+    run_id = f"{int(time.time()) % 10 ** 8:08d}"
+    pool_writers = [Writer(model, Feed(active[w::writers], seed + w, run_id, w), rate / writers if rate else 0,
+                           batch, mode)
+                    for w in range(min(writers, len(active)))]
+    stop = threading.Event()
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=len(pool_writers)) as pool:
+        futures = [pool.submit(w.run, stop) for w in pool_writers]
+        last_events, last_time = 0, started
+        try:
+            while True:
+                done, _ = wait(futures, timeout=REPORT_SECONDS)
+                now = time.perf_counter()
+                events = sum(w.events for w in pool_writers)
+                print(f"  {now - started:6.0f}s {events:>12,} events "
+                      f"{(events - last_events) / (now - last_time):>10,.0f} events/s")
+                last_events, last_time = events, now
+                if done or now - started >= seconds:
+                    break
+        except KeyboardInterrupt:
+            print("  interrupted")
+        stop.set()
+        counts = {}
+        for future in futures:
+            for table, count in future.result().items():
+                counts[table] = counts.get(table, 0) + count
+    elapsed = time.perf_counter() - started
+
+    latencies = [l for w in pool_writers for l in w.latencies]
+    print("\n=== Throughput ===")
+    for table in TABLES:
+        rows = counts.get(table, 0)
+        print(f"  {table:<24} {rows:>12,} rows {rows / elapsed if elapsed else 0:>10,.0f} rows/s")
+    print(f"  commit latency: p50 {percentile(latencies, 50) * 1000:.1f} ms, "
+          f"p99 {percentile(latencies, 99) * 1000:.1f} ms ({len(latencies):,} batches)")
+
+    conn = get_connection()
+    try:
+        with conn.cursor() as cursor:
+            print_index_growth(before, index_sizes(cursor), counts)
+    finally:
+        conn.close()
+
+
+def purge():
+    """Delete every row written by the firehose, in chunks"""
+    conn = get_connection()
+    try:
+        with conn.cursor() as cursor:
+            for table, column in (('SHP_TRACKING_EVENT', 'SOURCE_REF'), ('TRN_CONTAINER_MOVEMENT', 'MOVEMENT_ID')):
+                total = 0
+                while True:
+                    cursor.execute(f"DELETE FROM {table} WHERE {column} LIKE %s LIMIT {PURGE_CHUNK}",
+                                   (SOURCE_PREFIX + '%',))
+                    conn.commit()
+                    total += cursor.rowcount
+                    if cursor.rowcount < PURGE_CHUNK:
+                        break
+                print(f"  [OK] {table}: {total:,} rows deleted")
+    finally:
+        conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate a carrier tracking feed into the FMS tracking tables")
+    parser.add_argument('--shipments', type=int, default=DEFAULT_SHIPMENTS, help='active shipments to replay')
+    parser.add_argument('--rate', type=int, default=DEFAULT_RATE, help='target events/s (0 = unthrottled)')
+    parser.add_argument('--batch', type=int, default=DEFAULT_BATCH, help='events per commit')
+    parser.add_argument('--writers', type=int, default=DEFAULT_WRITERS, help='writer connections')
+    parser.add_argument('--seconds', type=int, default=DEFAULT_SECONDS, help='run time')
+    parser.add_argument('--mode', choices=MODES, default='insert',
+                        help='insert: multi-row INSERT, infile: LOAD DATA LOCAL INFILE')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--purge', action='store_true', help='delete the rows of earlier runs and exit')
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("FMS Tracking Firehose")
+    print("=" * 60)
+
+    try:
+        if args.purge:
+            purge()
+        else:
+            firehose(args.shipments, args.rate, args.batch, args.writers, args.seconds, args.mode, args.seed)
+    except Exception as e:
+        print(f"\nError: {e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,426 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+FMS Tracking Snapshot
+Maintains SHP_TRACKING_SNAPSHOT, one row per MBL / MAWB with its house counts
+and weights, latest SHP_TRACKING_EVENT milestone, progress percent and route
+key, so the tracking map reads one indexed table. Each run refreshes only the
+masters whose B/L or AWB rows changed (UPDATED_DTM / CREATED_DTM positions, the
+same feed as fms-web lib/changeFeed.ts) or that got new tracking events since
+the previous run, with set-based INSERT ... SELECT per chunk of masters.
+Progress of in-transit rows is recomputed by a periodic sweep, deleted masters
+are kept as DEL_YN = 'Y' rows for the incremental map feed and purged later
+"""
+
+import argparse
+import time
+from datetime import datetime
+
+import pymysql
+
+from provision_schema import DB_CONFIG
+from status_rollup import next_bound
+
+SNAPSHOT_TABLE = 'SHP_TRACKING_SNAPSHOT'
+CHECKPOINT_TABLE = 'TRACKING_SNAPSHOT_CHECKPOINT'
+EVENT_JOB = 'EVENT'
+DEFAULT_CHUNK = 1000
+SCAN_CHUNK = 50_000
+# lib/changeFeed.ts CHANGE_SETTLE_SECONDS: changes newer than this are left for the next run
+SETTLE_SECONDS = 2
+DEFAULT_SWEEP = 600
+DEFAULT_KEEP_DAYS = 7
+
+# Master / house tables per transport mode and the snapshot column expressions that differ
+MODES = {
+    'SEA': dict(master='BL_MASTER_BL', id='MBL_ID', no='MBL_NO', origin='POL_PORT_CD', dest='POD_PORT_CD',
+                carrier='cr.CARRIER_NM', vessel='m.VESSEL_NM', voyage='m.VOYAGE_NO', trade='m.BL_TYPE_CD',
+                pkg_qty='m.TOTAL_PKG_QTY', pkg_type='m.PKG_TYPE_CD',
+                join='LEFT JOIN MST_CARRIER cr ON cr.CARRIER_ID = m.CARRIER_ID',
+                house='BL_HOUSE_BL', house_id='HBL_ID', house_no='HBL_NO', house_pkg='TOTAL_PKG_QTY'),
+    'AIR': dict(master='AWB_MASTER_AWB', id='MAWB_ID', no='MAWB_NO', origin='ORIGIN_AIRPORT_CD',
+                dest='DEST_AIRPORT_CD', carrier='m.AIRLINE_CODE',
+                vessel="CONCAT(COALESCE(m.AIRLINE_CODE, ''), COALESCE(m.FLIGHT_NO, ''))",
+                voyage='NULL', trade="'AIR'", pkg_qty='m.PIECES', pkg_type='NULL', join='',
+                house='AWB_HOUSE_AWB', house_id='HAWB_ID', house_no='HAWB_NO', house_pkg='PIECES'),
+}
+
+# Progress of the latest milestone for masters without ETD / ETA (tracking_firehose.py event codes)
+MILESTONE_PROGRESS = {'GIN': 5, 'LOD': 10, 'DEP': 15, 'TSD': 50, 'TSL': 55, 'ARR': 95, 'DIS': 98, 'GOT': 100}
+
+# Progress percent over the snapshot columns; ETD..ETA elapsed time, clamped to 5..95 while under way
+PROGRESS_SQL = f"""
+    CASE
+        WHEN ATA_DT IS NOT NULL OR STATUS_CD IN ('ARRIVED', 'DELIVERED') THEN 100
+        WHEN ETD_DT IS NULL OR ETA_DT IS NULL THEN
+            CASE MILESTONE_CD {' '.join(f"WHEN '{code}' THEN {pct}" for code, pct in MILESTONE_PROGRESS.items())}
+            ELSE 50 END
+        WHEN NOW() < ETD_DT THEN 5
+        WHEN NOW() > ETA_DT THEN 95
+        ELSE LEAST(95, GREATEST(5, ROUND(TIMESTAMPDIFF(SECOND, ETD_DT, NOW()) * 100
+                                         / GREATEST(TIMESTAMPDIFF(SECOND, ETD_DT, ETA_DT), 1))))
+    END"""
+
+SNAPSHOT_COLUMNS = [
+    'TRANSPORT_MODE_CD', 'MASTER_ID', 'MASTER_NO', 'SHIPMENT_ID', 'MASTER_CREATED_DTM',
+    'ORIGIN_CD', 'DEST_CD', 'ROUTE_KEY', 'STATUS_CD', 'CARRIER_NM', 'VESSEL_FLIGHT', 'VOYAGE_NO',
+    'TRADE_TYPE_CD', 'SHIPPER_NM', 'ETD_DT', 'ATD_DT', 'ETA_DT', 'ATA_DT',
+    'PKG_QTY', 'PKG_TYPE_CD', 'GROSS_WEIGHT_KG', 'VOLUME_CBM',
+    'HOUSE_CNT', 'HOUSE_PKG_QTY', 'HOUSE_WEIGHT_KG', 'FIRST_HOUSE_ID', 'FIRST_HOUSE_NO',
+    'MILESTONE_CD', 'MILESTONE_NM', 'MILESTONE_DTM', 'MILESTONE_LOCATION_CD', 'DEL_YN',
+]
+
+
+def get_connection():
+    return pymysql.connect(**DB_CONFIG)
+
+
+def ensure_checkpoint_table(cursor):
+    cursor.execute(f"""
+        CREATE TABLE IF NOT EXISTS {CHECKPOINT_TABLE} (
+            JOB_NM              VARCHAR(50)     NOT NULL,
+            LAST_DTM            DATETIME        COMMENT '마지막 반영 변경 시각',
+            LAST_ID             BIGINT          DEFAULT 0 COMMENT '마지막 반영 ID',
+            UPDATED_DTM         DATETIME        DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+            PRIMARY KEY (JOB_NM)
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='추적 지도 요약 체크포인트'
+    """)
+
+
+def read_checkpoints(cursor):
+    cursor.execute(f"SELECT JOB_NM, LAST_DTM, LAST_ID FROM {CHECKPOINT_TABLE}")
+    return {job: (last_dtm, last_id) for job, last_dtm, last_id in cursor.fetchall()}
+
+
+def save_checkpoint(cursor, job, last_dtm, last_id):
+    cursor.execute(f"""
+        INSERT INTO {CHECKPOINT_TABLE} (JOB_NM, LAST_DTM, LAST_ID) VALUES (%s, %s, %s)
+        ON DUPLICATE KEY UPDATE LAST_DTM = VALUES(LAST_DTM), LAST_ID = VALUES(LAST_ID)
+    """, (job, last_dtm, last_id))
+
+
+def change_horizon(cursor):
+    cursor.execute("SELECT NOW() - INTERVAL %s SECOND", (SETTLE_SECONDS,))
+    return cursor.fetchone()[0]
+
+
+# ============================================================
+# Refresh
+# ============================================================
+def refresh(cursor, mode, master_ids):
+    """Rewrites the snapshot rows of master_ids; masters deleted or gone become DEL_YN = 'Y'"""
+    spec = MODES[mode]
+    ids = sorted(set(master_ids))
+    if not ids:
+        return
+    placeholders = ', '.join(['%s'] * len(ids))
+    updates = ', '.join(f"{column} = VALUES({column})" for column in SNAPSHOT_COLUMNS[2:])
+
+    cursor.execute(f"""
+        INSERT INTO {SNAPSHOT_TABLE} ({', '.join(SNAPSHOT_COLUMNS)})
+        SELECT '{mode}', m.{spec['id']}, m.{spec['no']}, m.SHIPMENT_ID, m.CREATED_DTM,
+               m.{spec['origin']}, m.{spec['dest']}, CONCAT('{mode}:', m.{spec['origin']}, '-', m.{spec['dest']}),
+               m.STATUS_CD, {spec['carrier']}, {spec['vessel']}, {spec['voyage']}, {spec['trade']}, m.SHIPPER_NM,
+               m.ETD_DT, m.ATD_DT, m.ETA_DT, m.ATA_DT,
+               {spec['pkg_qty']}, {spec['pkg_type']}, m.GROSS_WEIGHT_KG, m.VOLUME_CBM,
+               COALESCE(h.HOUSE_CNT, 0), COALESCE(h.PKG_QTY, 0), COALESCE(h.WEIGHT_KG, 0),
+               h.FIRST_ID, fh.{spec['house_no']},
+               e.EVENT_CD, e.EVENT_NM, e.EVENT_DTM, e.LOCATION_CD, 'N'
+        FROM {spec['master']} m
+        {spec['join']}
+        LEFT JOIN (
+            SELECT {spec['id']}, COUNT(*) AS HOUSE_CNT, SUM({spec['house_pkg']}) AS PKG_QTY,
+                   SUM(GROSS_WEIGHT_KG) AS WEIGHT_KG, MIN({spec['house_id']}) AS FIRST_ID
+            FROM {spec['house']}
+            WHERE {spec['id']} IN ({placeholders}) AND DEL_YN = 'N'
+            GROUP BY {spec['id']}
+        ) h ON h.{spec['id']} = m.{spec['id']}
+        LEFT JOIN {spec['house']} fh ON fh.{spec['house_id']} = h.FIRST_ID
+        LEFT JOIN SHP_TRACKING_EVENT e ON e.TRACKING_ID = (
+            SELECT t.TRACKING_ID FROM SHP_TRACKING_EVENT t
+             WHERE t.{spec['id']} = m.{spec['id']}
+             ORDER BY t.EVENT_DTM DESC, t.TRACKING_ID DESC LIMIT 1)
+        WHERE m.{spec['id']} IN ({placeholders}) AND m.DEL_YN = 'N'
+        ON DUPLICATE KEY UPDATE {updates}
+    """, ids + ids)
+
+    cursor.execute(f"""
+        UPDATE {SNAPSHOT_TABLE} s
+        LEFT JOIN {spec['master']} m ON m.{spec['id']} = s.MASTER_ID AND m.DEL_YN = 'N'
+        SET s.DEL_YN = 'Y'
+        WHERE s.TRANSPORT_MODE_CD = %s AND s.MASTER_ID IN ({placeholders})
+          AND s.DEL_YN = 'N' AND m.{spec['id']} IS NULL
+    """, [mode] + ids)
+
+    cursor.execute(f"""
+        UPDATE {SNAPSHOT_TABLE} SET PROGRESS_PCT = {PROGRESS_SQL}
+        WHERE TRANSPORT_MODE_CD = %s AND MASTER_ID IN ({placeholders})
+          AND PROGRESS_PCT <> {PROGRESS_SQL}
+    """, [mode] + ids)
+
+
+def read_changes(cursor, table, id_column, parent_column, position, horizon, limit):
+    """
+    (id, parent id) of rows changed after position (change time, id) and before horizon,
+    the next position and whether more rows are left; see lib/changeFeed.ts readChanges
+    """
+    changed_dtm, last_id = position
+    parent = parent_column or 'NULL'
+    cursor.execute(f"""
+        SELECT ID, PARENT_ID, CHANGED_DTM FROM (
+          (SELECT {id_column} AS ID, {parent} AS PARENT_ID, UPDATED_DTM AS CHANGED_DTM
+             FROM {table}
+            WHERE UPDATED_DTM >= %s AND UPDATED_DTM < %s AND (UPDATED_DTM > %s OR {id_column} > %s)
+            ORDER BY UPDATED_DTM, {id_column} LIMIT {limit + 1})
+          UNION ALL
+          (SELECT {id_column}, {parent}, CREATED_DTM
+             FROM {table}
+            WHERE DEL_YN = 'N' AND CREATED_DTM >= %s AND CREATED_DTM < %s AND (CREATED_DTM > %s OR {id_column} > %s)
+              AND UPDATED_DTM IS NULL
+            ORDER BY CREATED_DTM, {id_column} LIMIT {limit + 1})
+        ) c
+        ORDER BY CHANGED_DTM, ID
+        LIMIT {limit + 1}
+    """, (changed_dtm, horizon, changed_dtm, last_id) * 2)
+    rows = cursor.fetchall()
+    if len(rows) > limit:
+        rows = rows[:limit]
+        return [(row[0], row[1]) for row in rows], (rows[-1][2], rows[-1][0]), True
+    return [(row[0], row[1]) for row in rows], (horizon, 0), False
+
+
+# ============================================================
+# Jobs
+# ============================================================
+def rebuild(conn, chunk, dry_run):
+    """Snapshot rows for every live master; checkpoints are set first so later changes are not lost"""
+    with conn.cursor() as cursor:
+        ensure_checkpoint_table(cursor)
+        horizon = change_horizon(cursor)
+        cursor.execute("SELECT COALESCE(MAX(TRACKING_ID), 0) FROM SHP_TRACKING_EVENT")
+        last_event = cursor.fetchone()[0]
+        if not dry_run:
+            for mode in MODES:
+                save_checkpoint(cursor, f"{mode}_MASTER", horizon, 0)
+                save_checkpoint(cursor, f"{mode}_HOUSE", horizon, 0)
+            save_checkpoint(cursor, EVENT_JOB, None, last_event)
+            conn.commit()
+
+        for mode, spec in MODES.items():
+            started = time.perf_counter()
+            total = last = 0
+            while True:
+                cursor.execute(f"""
+                    SELECT {spec['id']} FROM {spec['master']}
+                    WHERE {spec['id']} > %s AND DEL_YN = 'N'
+                    ORDER BY {spec['id']} LIMIT %s
+                """, (last, chunk))
+                ids = [row[0] for row in cursor.fetchall()]
+                if not ids:
+                    break
+                if not dry_run:
+                    refresh(cursor, mode, ids)
+                    conn.commit()
+                total += len(ids)
+                last = ids[-1]
+
+            # Rows of masters deleted since they were captured
+            removed = 0
+            if not dry_run:
+                last = 0
+                while True:
+                    bound = next_bound(cursor, SNAPSHOT_TABLE, 'SNAPSHOT_ID', last, SCAN_CHUNK)
+                    if bound is None:
+                        break
+                    cursor.execute(f"""
+                        UPDATE {SNAPSHOT_TABLE} s
+                        LEFT JOIN {spec['master']} m ON m.{spec['id']} = s.MASTER_ID AND m.DEL_YN = 'N'
+                        SET s.DEL_YN = 'Y'
+                        WHERE s.SNAPSHOT_ID > %s AND s.SNAPSHOT_ID <= %s
+                          AND s.TRANSPORT_MODE_CD = %s AND s.DEL_YN = 'N' AND m.{spec['id']} IS NULL
+                    """, (last, bound, mode))
+                    removed += cursor.rowcount
+                    conn.commit()
+                    last = bound
+            print(f"  [OK] {mode}: {total:,} masters, {removed:,} removed "
+                  f"({time.perf_counter() - started:.1f}s)")
+
+
+def apply_changes(conn, chunk, dry_run):
+    """Refreshes masters changed since the checkpoints; returns the number of masters refreshed"""
+    refreshed = 0
+    with conn.cursor() as cursor:
+        ensure_checkpoint_table(cursor)
+        checkpoints = read_checkpoints(cursor)
+        horizon = change_horizon(cursor)
+
+        for mode, spec in MODES.items():
+            feeds = [
+                (f"{mode}_MASTER", spec['master'], spec['id'], None),
+                (f"{mode}_HOUSE", spec['house'], spec['house_id'], spec['id']),
+            ]
+            for job, table, id_column, parent_column in feeds:
+                last_dtm, last_id = checkpoints.get(job, (horizon, 0))
+                position = (last_dtm or horizon, last_id)
+                changed = 0
+                while True:
+                    rows, position, more = read_changes(
+                        cursor, table, id_column, parent_column, position, horizon, chunk)
+                    master_ids = [parent if parent_column else row_id for row_id, parent in rows]
+                    master_ids = [master_id for master_id in master_ids if master_id is not None]
+                    changed += len(rows)
+                    if dry_run:
+                        refreshed += len(set(master_ids))
+                        if not more:
+                            break
+                        continue
+                    refresh(cursor, mode, master_ids)
+                    save_checkpoint(cursor, job, *position)
+                    conn.commit()
+                    refreshed += len(set(master_ids))
+                    if not more:
+                        break
+                print(f"  [OK] {job:<12} {changed:>8,} changed rows")
+
+        # New tracking events move the milestone of their master
+        last_event = checkpoints.get(EVENT_JOB, (None, None))[1]
+        if last_event is None:
+            cursor.execute("SELECT COALESCE(MAX(TRACKING_ID), 0) FROM SHP_TRACKING_EVENT")
+            last_event = cursor.fetchone()[0]
+        events = 0
+        while True:
+            cursor.execute("""
+                SELECT TRACKING_ID, MBL_ID, MAWB_ID FROM SHP_TRACKING_EVENT
+                WHERE TRACKING_ID > %s ORDER BY TRACKING_ID LIMIT %s
+            """, (last_event, chunk))
+            rows = cursor.fetchall()
+            if not rows:
+                break
+            events += len(rows)
+            last_event = rows[-1][0]
+            sea = [mbl_id for _, mbl_id, _ in rows if mbl_id is not None]
+            air = [mawb_id for _, _, mawb_id in rows if mawb_id is not None]
+            refreshed += len(set(sea)) + len(set(air))
+            if not dry_run:
+                refresh(cursor, 'SEA', sea)
+                refresh(cursor, 'AIR', air)
+                save_checkpoint(cursor, EVENT_JOB, None, last_event)
+                conn.commit()
+        print(f"  [OK] {EVENT_JOB:<12} {events:>8,} new events")
+    return refreshed
+
+
+def sweep_progress(conn, dry_run):
+    """Recomputes PROGRESS_PCT of rows still under way; only rows whose value moves are written"""
+    updated = 0
+    with conn.cursor() as cursor:
+        last = 0
+        while True:
+            bound = next_bound(cursor, SNAPSHOT_TABLE, 'SNAPSHOT_ID', last, SCAN_CHUNK)
+            if bound is None:
+                break
+            condition = f"""
+                WHERE SNAPSHOT_ID > %s AND SNAPSHOT_ID <= %s AND DEL_YN = 'N'
+                  AND PROGRESS_PCT < 100 AND PROGRESS_PCT <> {PROGRESS_SQL}
+            """
+            if dry_run:
+                cursor.execute(f"SELECT COUNT(*) FROM {SNAPSHOT_TABLE} {condition}", (last, bound))
+                updated += cursor.fetchone()[0]
+            else:
+                cursor.execute(f"UPDATE {SNAPSHOT_TABLE} SET PROGRESS_PCT = {PROGRESS_SQL} {condition}",
+                               (last, bound))
+                updated += cursor.rowcount
+                conn.commit()
+            last = bound
+    return updated
+
+
+def purge_tombstones(conn, keep_days, dry_run):
+    """Removes DEL_YN = 'Y' rows older than keep_days (map clients have long caught up by then)"""
+    purged = 0
+    with conn.cursor() as cursor:
+        if dry_run:
+            cursor.execute(f"""
+                SELECT COUNT(*) FROM {SNAPSHOT_TABLE}
+                WHERE DEL_YN = 'Y' AND UPDATED_DTM < NOW() - INTERVAL %s DAY
+            """, (keep_days,))
+            return cursor.fetchone()[0]
+        while True:
+            cursor.execute(f"""
+                DELETE FROM {SNAPSHOT_TABLE}
+                WHERE DEL_YN = 'Y' AND UPDATED_DTM < NOW() - INTERVAL %s DAY
+                LIMIT %s
+            """, (keep_days, SCAN_CHUNK))
+            conn.commit()
+            purged += cursor.rowcount
+            if cursor.rowcount < SCAN_CHUNK:
+                break
+    return purged
+
+
+def run(chunk, sweep, keep_days, full, dry_run):
+    conn = get_connection()
+    try:
+        started = time.perf_counter()
+        with conn.cursor() as cursor:
+            ensure_checkpoint_table(cursor)
+            if not read_checkpoints(cursor):
+                full = True     # first run: nothing to continue from
+        if full:
+            print("\n=== Rebuild ===")
+            rebuild(conn, chunk, dry_run)
+        else:
+            print("\n=== Changes ===")
+            refreshed = apply_changes(conn, chunk, dry_run)
+            action = "to refresh" if dry_run else "refreshed"
+            print(f"  {refreshed:,} masters {action}")
+
+        if sweep:
+            print("\n=== Progress ===")
+            print(f"  [OK] {sweep_progress(conn, dry_run):,} rows moved")
+            print("\n=== Tombstones ===")
+            print(f"  [OK] {purge_tombstones(conn, keep_days, dry_run):,} rows older than {keep_days} days purged")
+        print(f"\n  Done in {time.perf_counter() - started:.1f}s")
+    finally:
+        conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Refresh the tracking map snapshot")
+    parser.add_argument('--chunk', type=int, default=DEFAULT_CHUNK, help='masters / changed rows per statement')
+    parser.add_argument('--interval', type=int, default=0,
+                        help='repeat every N seconds until interrupted (default: run once)')
+    parser.add_argument('--sweep', type=int, default=DEFAULT_SWEEP,
+                        help='seconds between progress sweeps and tombstone purges when repeating')
+    parser.add_argument('--keep-days', type=int, default=DEFAULT_KEEP_DAYS,
+                        help='days deleted masters stay in the snapshot as DEL_YN = Y')
+    parser.add_argument('--rebuild', action='store_true',
+                        help='capture every live master and reset the change checkpoints')
+    parser.add_argument('--dry-run', action='store_true', help='count pending work without changing anything')
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print(f"FMS Tracking Snapshot ({datetime.now():%Y-%m-%d %H:%M})")
+    print("=" * 60)
+
+    try:
+        full = args.rebuild
+        last_sweep = None
+        while True:
+            sweep = last_sweep is None or time.monotonic() - last_sweep >= args.sweep
+            if sweep:
+                last_sweep = time.monotonic()
+            run(args.chunk, sweep, args.keep_days, full, args.dry_run)
+            full = False
+            if args.interval <= 0:
+                break
+            time.sleep(args.interval)
+            print(f"\n--- {datetime.now():%Y-%m-%d %H:%M:%S} ---")
+    except KeyboardInterrupt:
+        print("\nStopped")
+    except Exception as e:
+        print(f"\nError: {e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -387,13 +387,17 @@ COMMENT ON TABLE ORD_ATTACHMENT IS '첨부파일';
 -- ----------------------------------------------------------------------------
 -- 인덱스 생성
 -- ----------------------------------------------------------------------------
-CREATE INDEX IDX_ORD_SHIPMENT_CUSTOMER ON ORD_SHIPMENT(CUSTOMER_ID);
+CREATE INDEX IDX_ORD_SHIPMENT_CUSTOMER ON ORD_SHIPMENT(CUSTOMER_ID, DEL_YN, CREATED_DTM);
 CREATE INDEX IDX_ORD_SHIPMENT_CARRIER ON ORD_SHIPMENT(CARRIER_ID);
 CREATE INDEX IDX_ORD_SHIPMENT_ETD ON ORD_SHIPMENT(ETD_DT);
 CREATE INDEX IDX_ORD_SHIPMENT_STATUS ON ORD_SHIPMENT(STATUS_CD);
+CREATE INDEX IDX_ORD_SHIPMENT_DEL_CREATED ON ORD_SHIPMENT(DEL_YN, CREATED_DTM);
+CREATE INDEX IDX_ORD_SHIPMENT_DEL_STATUS ON ORD_SHIPMENT(DEL_YN, STATUS_CD, CREATED_DTM);
+CREATE INDEX IDX_ORD_SHIPMENT_DEL_MODE ON ORD_SHIPMENT(DEL_YN, TRANSPORT_MODE_CD, CREATED_DTM);
 CREATE INDEX IDX_ORD_ORDER_CUSTOMER ON ORD_CUSTOMER_ORDER(CUSTOMER_ID);
 CREATE INDEX IDX_ORD_OCEAN_BKG_CARRIER ON ORD_OCEAN_BOOKING(CARRIER_ID);
 CREATE INDEX IDX_ORD_OCEAN_BKG_SHIPMENT ON ORD_OCEAN_BOOKING(SHIPMENT_ID);
 CREATE INDEX IDX_ORD_AIR_BKG_CARRIER ON ORD_AIR_BOOKING(CARRIER_ID);
 CREATE INDEX IDX_ORD_AIR_BKG_SHIPMENT ON ORD_AIR_BOOKING(SHIPMENT_ID);
+CREATE INDEX IDX_ORD_STATUS_HIST_SHIPMENT ON ORD_SHIPMENT_STATUS_HIST(SHIPMENT_ID, EVENT_DTM);
 CREATE INDEX IDX_ORD_ATTACHMENT_REF ON ORD_ATTACHMENT(REF_TYPE_CD, REF_ID);
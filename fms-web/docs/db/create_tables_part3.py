@@ -5,27 +5,15 @@ FMS Database Table Creation Script - Part 3
 Transport, Customs, Billing Tables
 """
 
-import pymysql
-
-# Database connection info
-DB_CONFIG = {
-    'host': '211.236.174.220',
-    'port': 53306,
-    'user': 'user',
-    'password': 'P@ssw0rd',
-    'database': 'logstic',
-    'charset': 'utf8mb4'
-}
-
 # 06. Transport Tables
 TRANSPORT_TABLES = {
     'TRN_TRANSPORT_ORDER': '''
         CREATE TABLE IF NOT EXISTS TRN_TRANSPORT_ORDER (
             TRN_ORDER_ID VARCHAR(20) NOT NULL COMMENT 'Transport Order ID',
-            SHIPMENT_ID VARCHAR(20) NOT NULL COMMENT 'Shipment Reference',
+            SHIPMENT_ID BIGINT NOT NULL COMMENT 'Shipment Reference',
             TRANSPORT_TYPE VARCHAR(20) COMMENT 'Transport Type (PICKUP/DELIVERY/SHUTTLE)',
             TRANSPORT_MODE VARCHAR(20) COMMENT 'Mode (TRUCK/RAIL/BARGE)',
-            TRUCKER_ID VARCHAR(20) COMMENT 'Trucker Company',
+            TRUCKER_ID BIGINT COMMENT 'Trucker Company',
             VEHICLE_NO VARCHAR(20) COMMENT 'Vehicle Number',
             DRIVER_NAME VARCHAR(100) COMMENT 'Driver Name',
             DRIVER_MOBILE VARCHAR(20) COMMENT 'Driver Mobile',
@@ -41,7 +29,9 @@ TRANSPORT_TABLES = {
             CREATED_AT TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             UPDATED_BY VARCHAR(50),
             UPDATED_AT TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-            PRIMARY KEY (TRN_ORDER_ID)
+            PRIMARY KEY (TRN_ORDER_ID),
+            INDEX IDX_TRN_ORDER_SHIPMENT (SHIPMENT_ID),
+            INDEX IDX_TRN_ORDER_TRUCKER (TRUCKER_ID)
         ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='Transport Order'
     ''',
 
@@ -60,7 +50,8 @@ TRANSPORT_TABLES = {
             STATUS VARCHAR(20) DEFAULT 'PENDING' COMMENT 'Status',
             CREATED_AT TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             UPDATED_AT TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-            PRIMARY KEY (SCHEDULE_ID)
+            PRIMARY KEY (SCHEDULE_ID),
+            INDEX IDX_TRN_SCH_ORDER (TRN_ORDER_ID, SEQUENCE_NO)
         ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='Transport Schedule'
     ''',
 
@@ -68,7 +59,7 @@ TRANSPORT_TABLES = {
         CREATE TABLE IF NOT EXISTS TRN_CONTAINER_MOVEMENT (
             MOVEMENT_ID VARCHAR(20) NOT NULL COMMENT 'Movement ID',
             CONTAINER_NO VARCHAR(20) NOT NULL COMMENT 'Container Number',
-            SHIPMENT_ID VARCHAR(20) COMMENT 'Shipment Reference',
+            SHIPMENT_ID BIGINT COMMENT 'Shipment Reference',
             MOVEMENT_TYPE VARCHAR(20) COMMENT 'Movement Type (GATE_IN/GATE_OUT/LOAD/DISCHARGE)',
             LOCATION_TYPE VARCHAR(20) COMMENT 'Location Type (CY/CFS/DEPOT/PORT)',
             LOCATION_CODE VARCHAR(20) COMMENT 'Location Code',
@@ -80,14 +71,16 @@ TRANSPORT_TABLES = {
             DAMAGE_DESC TEXT COMMENT 'Damage Description',
             CREATED_BY VARCHAR(50),
             CREATED_AT TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            PRIMARY KEY (MOVEMENT_ID)
+            PRIMARY KEY (MOVEMENT_ID),
+            INDEX IDX_CNTR_MOVE_CNTR (CONTAINER_NO, MOVEMENT_DATE),
+            INDEX IDX_CNTR_MOVE_SHIPMENT (SHIPMENT_ID)
         ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='Container Movement History'
     ''',
 
     'TRN_DEMURRAGE': '''
         CREATE TABLE IF NOT EXISTS TRN_DEMURRAGE (
             DEMURRAGE_ID VARCHAR(20) NOT NULL COMMENT 'Demurrage ID',
-            SHIPMENT_ID VARCHAR(20) NOT NULL COMMENT 'Shipment Reference',
+            SHIPMENT_ID BIGINT NOT NULL COMMENT 'Shipment Reference',
             CONTAINER_NO VARCHAR(20) COMMENT 'Container Number',
             DEMURRAGE_TYPE VARCHAR(20) COMMENT 'Type (DEMURRAGE/DETENTION/STORAGE)',
             FREE_DAYS INT DEFAULT 0 COMMENT 'Free Days',
@@ -100,7 +93,9 @@ TRANSPORT_TABLES = {
             STATUS VARCHAR(20) DEFAULT 'CALCULATED' COMMENT 'Status',
             CREATED_AT TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             UPDATED_AT TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-            PRIMARY KEY (DEMURRAGE_ID)
+            PRIMARY KEY (DEMURRAGE_ID),
+            INDEX IDX_DEMURRAGE_SHIPMENT (SHIPMENT_ID),
+            INDEX IDX_DEMURRAGE_CNTR (CONTAINER_NO)
         ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='Demurrage/Detention Charges'
     ''',
 
@@ -125,7 +120,7 @@ TRANSPORT_TABLES = {
     'TRN_CARGO_RECEIPT': '''
         CREATE TABLE IF NOT EXISTS TRN_CARGO_RECEIPT (
             RECEIPT_ID VARCHAR(20) NOT NULL COMMENT 'Receipt ID',
-            SHIPMENT_ID VARCHAR(20) COMMENT 'Shipment Reference',
+            SHIPMENT_ID BIGINT COMMENT 'Shipment Reference',
             WAREHOUSE_ID VARCHAR(20) COMMENT 'Warehouse Reference',
             RECEIPT_DATE DATE COMMENT 'Receipt Date',
             RECEIPT_TYPE VARCHAR(20) COMMENT 'Type (IN/OUT)',
@@ -138,7 +133,9 @@ TRANSPORT_TABLES = {
             RECEIVED_BY VARCHAR(100) COMMENT 'Received By',
             REMARKS TEXT COMMENT 'Remarks',
             CREATED_AT TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            PRIMARY KEY (RECEIPT_ID)
+            PRIMARY KEY (RECEIPT_ID),
+            INDEX IDX_RECEIPT_SHIPMENT (SHIPMENT_ID),
+            INDEX IDX_RECEIPT_WAREHOUSE (WAREHOUSE_ID, RECEIPT_DATE)
         ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='Cargo Receipt'
     '''
 }
@@ -148,11 +145,11 @@ CUSTOMS_TABLES = {
     'CUS_DECLARATION': '''
         CREATE TABLE IF NOT EXISTS CUS_DECLARATION (
             DECLARATION_ID VARCHAR(20) NOT NULL COMMENT 'Declaration ID',
-            SHIPMENT_ID VARCHAR(20) NOT NULL COMMENT 'Shipment Reference',
+            SHIPMENT_ID BIGINT NOT NULL COMMENT 'Shipment Reference',
             DECLARATION_NO VARCHAR(50) COMMENT 'Customs Declaration Number',
             DECLARATION_TYPE VARCHAR(20) COMMENT 'Type (IMPORT/EXPORT)',
             DECLARATION_DATE DATE COMMENT 'Declaration Date',
-            CUSTOMS_BROKER_ID VARCHAR(20) COMMENT 'Customs Broker',
+            CUSTOMS_BROKER_ID BIGINT COMMENT 'Customs Broker',
             DECLARANT VARCHAR(100) COMMENT 'Declarant Name',
             IMPORTER_EXPORTER VARCHAR(200) COMMENT 'Importer/Exporter Name',
             IMPORTER_EXPORTER_BRN VARCHAR(20) COMMENT 'Business Registration No',
@@ -174,7 +171,10 @@ CUSTOMS_TABLES = {
             CREATED_AT TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             UPDATED_BY VARCHAR(50),
             UPDATED_AT TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-            PRIMARY KEY (DECLARATION_ID)
+            PRIMARY KEY (DECLARATION_ID),
+            INDEX IDX_DECL_SHIPMENT (SHIPMENT_ID),
+            INDEX IDX_DECL_NO (DECLARATION_NO),
+            INDEX IDX_DECL_STATUS (STATUS, DECLARATION_DATE)
         ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='Customs Declaration'
     ''',
 
@@ -196,14 +196,15 @@ CUSTOMS_TABLES = {
             VAT_RATE DECIMAL(10,4) DEFAULT 10.0000 COMMENT 'VAT Rate (%)',
             VAT_AMOUNT DECIMAL(18,2) COMMENT 'VAT Amount',
             CREATED_AT TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            PRIMARY KEY (ITEM_ID)
+            PRIMARY KEY (ITEM_ID),
+            INDEX IDX_DECL_ITEM_DECL (DECLARATION_ID, LINE_NO)
         ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='Customs Declaration Items'
     ''',
 
     'CUS_AMS_MANIFEST': '''
         CREATE TABLE IF NOT EXISTS CUS_AMS_MANIFEST (
             AMS_ID VARCHAR(20) NOT NULL COMMENT 'AMS ID',
-            SHIPMENT_ID VARCHAR(20) COMMENT 'Shipment Reference',
+            SHIPMENT_ID BIGINT COMMENT 'Shipment Reference',
             MBL_NO VARCHAR(50) COMMENT 'Master B/L Number',
             HBL_NO VARCHAR(50) COMMENT 'House B/L Number',
             AMS_TYPE VARCHAR(20) COMMENT 'Type (AMS/ISF/ACI)',
@@ -227,7 +228,9 @@ CUSTOMS_TABLES = {
             CREATED_BY VARCHAR(50),
             CREATED_AT TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             UPDATED_AT TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-            PRIMARY KEY (AMS_ID)
+            PRIMARY KEY (AMS_ID),
+            INDEX IDX_AMS_SHIPMENT (SHIPMENT_ID),
+            INDEX IDX_AMS_MBL (MBL_NO)
         ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='AMS/ISF Manifest'
     ''',
 
@@ -235,7 +238,7 @@ CUSTOMS_TABLES = {
         CREATE TABLE IF NOT EXISTS CUS_INSPECTION (
             INSPECTION_ID VARCHAR(20) NOT NULL COMMENT 'Inspection ID',
             DECLARATION_ID VARCHAR(20) COMMENT 'Declaration Reference',
-            SHIPMENT_ID VARCHAR(20) COMMENT 'Shipment Reference',
+            SHIPMENT_ID BIGINT COMMENT 'Shipment Reference',
             INSPECTION_TYPE VARCHAR(20) COMMENT 'Inspection Type (X-RAY/PHYSICAL/DOCUMENT)',
             INSPECTION_DATE DATE COMMENT 'Inspection Date',
             INSPECTION_LOCATION VARCHAR(200) COMMENT 'Inspection Location',
@@ -245,7 +248,9 @@ CUSTOMS_TABLES = {
             ACTION_REQUIRED TEXT COMMENT 'Action Required',
             CREATED_AT TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             UPDATED_AT TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-            PRIMARY KEY (INSPECTION_ID)
+            PRIMARY KEY (INSPECTION_ID),
+            INDEX IDX_INSPECTION_DECL (DECLARATION_ID),
+            INDEX IDX_INSPECTION_SHIPMENT (SHIPMENT_ID)
         ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='Customs Inspection'
     ''',
 
@@ -263,7 +268,8 @@ CUSTOMS_TABLES = {
             UNIT VARCHAR(10) COMMENT 'Unit',
             REMARKS TEXT COMMENT 'Remarks',
             CREATED_AT TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            PRIMARY KEY (PERMIT_ID)
+            PRIMARY KEY (PERMIT_ID),
+            INDEX IDX_PERMIT_DECL (DECLARATION_ID)
         ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='Import/Export Licenses and Permits'
     ''',
 
@@ -283,7 +289,8 @@ CUSTOMS_TABLES = {
             PREFERENTIAL_RATE DECIMAL(10,4) COMMENT 'Preferential Rate (%)',
             DUTY_SAVED DECIMAL(18,2) COMMENT 'Duty Saved',
             CREATED_AT TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            PRIMARY KEY (CERT_ID)
+            PRIMARY KEY (CERT_ID),
+            INDEX IDX_FTA_DECL (DECLARATION_ID)
         ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='FTA Certificate of Origin'
     ''',
 
@@ -303,7 +310,8 @@ CUSTOMS_TABLES = {
             RELEASE_DATE DATE COMMENT 'Release Date',
             CREATED_AT TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             UPDATED_AT TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-            PRIMARY KEY (BOND_ID)
+            PRIMARY KEY (BOND_ID),
+            INDEX IDX_BOND_DECL (DECLARATION_ID)
         ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='Customs Bond'
     ''',
 
@@ -323,7 +331,8 @@ CUSTOMS_TABLES = {
             STATUS VARCHAR(20) DEFAULT 'PENDING' COMMENT 'Status',
             CREATED_AT TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             UPDATED_AT TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-            PRIMARY KEY (PAYMENT_ID)
+            PRIMARY KEY (PAYMENT_ID),
+            INDEX IDX_DUTY_PAY_DECL (DECLARATION_ID)
         ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='Duty Payment'
     ''',
 
@@ -343,7 +352,9 @@ CUSTOMS_TABLES = {
             RECEIVED_AT DATETIME COMMENT 'Received DateTime',
             STATUS VARCHAR(20) COMMENT 'Status',
             CREATED_AT TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            PRIMARY KEY (LOG_ID)
+            PRIMARY KEY (LOG_ID),
+            INDEX IDX_EDI_REF (REFERENCE_ID, REFERENCE_TYPE),
+            INDEX IDX_EDI_MESSAGE (MESSAGE_ID)
         ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='Customs EDI Log'
     '''
 }
@@ -353,7 +364,7 @@ BILLING_TABLES = {
     'BIL_CONTRACT': '''
         CREATE TABLE IF NOT EXISTS BIL_CONTRACT (
             CONTRACT_ID VARCHAR(20) NOT NULL COMMENT 'Contract ID',
-            CUSTOMER_ID VARCHAR(20) NOT NULL COMMENT 'Customer Reference',
+            CUSTOMER_ID BIGINT NOT NULL COMMENT 'Customer Reference',
             CONTRACT_NO VARCHAR(50) COMMENT 'Contract Number',
             CONTRACT_NAME VARCHAR(200) COMMENT 'Contract Name',
             CONTRACT_TYPE VARCHAR(20) COMMENT 'Contract Type',
@@ -369,7 +380,8 @@ BILLING_TABLES = {
             CREATED_AT TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             UPDATED_BY VARCHAR(50),
             UPDATED_AT TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-            PRIMARY KEY (CONTRACT_ID)
+            PRIMARY KEY (CONTRACT_ID),
+            INDEX IDX_CONTRACT_CUSTOMER (CUSTOMER_ID)
         ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='Customer Contract'
     ''',
 
@@ -396,18 +408,20 @@ BILLING_TABLES = {
             ACTIVE_YN CHAR(1) DEFAULT 'Y' COMMENT 'Active Flag',
             CREATED_AT TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             UPDATED_AT TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-            PRIMARY KEY (TARIFF_ID)
+            PRIMARY KEY (TARIFF_ID),
+            INDEX IDX_TARIFF_CONTRACT (CONTRACT_ID),
+            INDEX IDX_TARIFF_CHARGE (CHARGE_CODE)
         ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='Tariff/Rate Master'
     ''',
 
     'BIL_CHARGE': '''
         CREATE TABLE IF NOT EXISTS BIL_CHARGE (
             CHARGE_ID VARCHAR(20) NOT NULL COMMENT 'Charge ID',
-            SHIPMENT_ID VARCHAR(20) NOT NULL COMMENT 'Shipment Reference',
+            SHIPMENT_ID BIGINT NOT NULL COMMENT 'Shipment Reference',
             CHARGE_TYPE VARCHAR(20) COMMENT 'Charge Type (AR/AP)',
             CHARGE_CODE VARCHAR(20) COMMENT 'Charge Code',
             CHARGE_NAME VARCHAR(100) COMMENT 'Charge Name',
-            CUSTOMER_ID VARCHAR(20) COMMENT 'Customer/Vendor ID',
+            CUSTOMER_ID BIGINT COMMENT 'Customer/Vendor ID',
             QUANTITY DECIMAL(15,3) DEFAULT 1 COMMENT 'Quantity',
             UNIT_TYPE VARCHAR(20) COMMENT 'Unit Type',
             UNIT_PRICE DECIMAL(18,4) COMMENT 'Unit Price',
@@ -427,7 +441,10 @@ BILLING_TABLES = {
             CREATED_AT TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             UPDATED_BY VARCHAR(50),
             UPDATED_AT TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-            PRIMARY KEY (CHARGE_ID)
+            PRIMARY KEY (CHARGE_ID),
+            INDEX IDX_CHARGE_SHIPMENT (SHIPMENT_ID),
+            INDEX IDX_CHARGE_INVOICE (INVOICE_ID),
+            INDEX IDX_CHARGE_CUSTOMER (CUSTOMER_ID)
         ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='Shipment Charges'
     ''',
 
@@ -438,7 +455,7 @@ BILLING_TABLES = {
             INVOICE_TYPE VARCHAR(20) COMMENT 'Invoice Type (AR/AP)',
             INVOICE_DATE DATE COMMENT 'Invoice Date',
             DUE_DATE DATE COMMENT 'Due Date',
-            CUSTOMER_ID VARCHAR(20) COMMENT 'Customer/Vendor ID',
+            CUSTOMER_ID BIGINT COMMENT 'Customer/Vendor ID',
             CUSTOMER_NAME VARCHAR(200) COMMENT 'Customer/Vendor Name',
             BILL_TO_ADDR TEXT COMMENT 'Bill To Address',
             SUBTOTAL DECIMAL(18,2) COMMENT 'Subtotal',
@@ -455,7 +472,9 @@ BILLING_TABLES = {
             CREATED_AT TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             UPDATED_BY VARCHAR(50),
             UPDATED_AT TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-            PRIMARY KEY (INVOICE_ID)
+            PRIMARY KEY (INVOICE_ID),
+            INDEX IDX_INVOICE_CUSTOMER (CUSTOMER_ID, INVOICE_DATE),
+            INDEX IDX_INVOICE_STATUS (STATUS, DUE_DATE)
         ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='Invoice Header'
     ''',
 
@@ -465,7 +484,7 @@ BILLING_TABLES = {
             INVOICE_ID VARCHAR(20) NOT NULL COMMENT 'Invoice Reference',
             LINE_NO INT COMMENT 'Line Number',
             CHARGE_ID VARCHAR(20) COMMENT 'Charge Reference',
-            SHIPMENT_ID VARCHAR(20) COMMENT 'Shipment Reference',
+            SHIPMENT_ID BIGINT COMMENT 'Shipment Reference',
             DESCRIPTION VARCHAR(200) COMMENT 'Description',
             QUANTITY DECIMAL(15,3) DEFAULT 1 COMMENT 'Quantity',
             UNIT_PRICE DECIMAL(18,4) COMMENT 'Unit Price',
@@ -473,7 +492,10 @@ BILLING_TABLES = {
             TAX_AMOUNT DECIMAL(18,2) COMMENT 'Tax Amount',
             TOTAL_AMOUNT DECIMAL(18,2) COMMENT 'Total Amount',
             CREATED_AT TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            PRIMARY KEY (DETAIL_ID)
+            PRIMARY KEY (DETAIL_ID),
+            INDEX IDX_INV_DTL_INVOICE (INVOICE_ID, LINE_NO),
+            INDEX IDX_INV_DTL_CHARGE (CHARGE_ID),
+            INDEX IDX_INV_DTL_SHIPMENT (SHIPMENT_ID)
         ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='Invoice Detail'
     ''',
 
@@ -483,7 +505,7 @@ BILLING_TABLES = {
             PAYMENT_NO VARCHAR(50) COMMENT 'Payment Number',
             PAYMENT_TYPE VARCHAR(20) COMMENT 'Payment Type (RECEIPT/DISBURSEMENT)',
             PAYMENT_DATE DATE COMMENT 'Payment Date',
-            CUSTOMER_ID VARCHAR(20) COMMENT 'Customer/Vendor ID',
+            CUSTOMER_ID BIGINT COMMENT 'Customer/Vendor ID',
             PAYMENT_METHOD VARCHAR(20) COMMENT 'Method (BANK/CASH/CHECK/CARD)',
             BANK_NAME VARCHAR(100) COMMENT 'Bank Name',
             ACCOUNT_NO VARCHAR(50) COMMENT 'Account Number',
@@ -499,7 +521,8 @@ BILLING_TABLES = {
             CREATED_BY VARCHAR(50),
             CREATED_AT TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             UPDATED_AT TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-            PRIMARY KEY (PAYMENT_ID)
+            PRIMARY KEY (PAYMENT_ID),
+            INDEX IDX_PAYMENT_CUSTOMER (CUSTOMER_ID, PAYMENT_DATE)
         ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='Payment Header'
     ''',
 
@@ -511,7 +534,9 @@ BILLING_TABLES = {
             APPLIED_AMOUNT DECIMAL(18,2) COMMENT 'Applied Amount',
             DISCOUNT_AMOUNT DECIMAL(18,2) DEFAULT 0 COMMENT 'Discount Amount',
             CREATED_AT TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            PRIMARY KEY (DETAIL_ID)
+            PRIMARY KEY (DETAIL_ID),
+            INDEX IDX_PAY_DTL_PAYMENT (PAYMENT_ID),
+            INDEX IDX_PAY_DTL_INVOICE (INVOICE_ID)
         ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='Payment Application Detail'
     ''',
 
@@ -519,7 +544,7 @@ BILLING_TABLES = {
         CREATE TABLE IF NOT EXISTS BIL_AR_AGING (
             AGING_ID BIGINT NOT NULL AUTO_INCREMENT COMMENT 'Aging ID',
             SNAPSHOT_DATE DATE NOT NULL COMMENT 'Snapshot Date',
-            CUSTOMER_ID VARCHAR(20) NOT NULL COMMENT 'Customer ID',
+            CUSTOMER_ID BIGINT NOT NULL COMMENT 'Customer ID',
             INVOICE_ID VARCHAR(20) COMMENT 'Invoice Reference',
             INVOICE_DATE DATE COMMENT 'Invoice Date',
             DUE_DATE DATE COMMENT 'Due Date',
@@ -529,7 +554,9 @@ BILLING_TABLES = {
             DAYS_OVERDUE INT COMMENT 'Days Overdue',
             AGING_BUCKET VARCHAR(20) COMMENT 'Aging Bucket (CURRENT/30/60/90/120+)',
             CREATED_AT TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            PRIMARY KEY (AGING_ID)
+            PRIMARY KEY (AGING_ID),
+            INDEX IDX_AR_AGING_SNAPSHOT (SNAPSHOT_DATE, CUSTOMER_ID),
+            INDEX IDX_AR_AGING_INVOICE (INVOICE_ID)
         ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='AR Aging Snapshot'
     ''',
 
@@ -547,14 +574,16 @@ BILLING_TABLES = {
             DAYS_OVERDUE INT COMMENT 'Days Overdue',
             AGING_BUCKET VARCHAR(20) COMMENT 'Aging Bucket (CURRENT/30/60/90/120+)',
             CREATED_AT TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            PRIMARY KEY (AGING_ID)
+            PRIMARY KEY (AGING_ID),
+            INDEX IDX_AP_AGING_SNAPSHOT (SNAPSHOT_DATE, VENDOR_ID),
+            INDEX IDX_AP_AGING_INVOICE (INVOICE_ID)
         ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='AP Aging Snapshot'
     ''',
 
     'BIL_PROFIT_ANALYSIS': '''
         CREATE TABLE IF NOT EXISTS BIL_PROFIT_ANALYSIS (
             ANALYSIS_ID BIGINT NOT NULL AUTO_INCREMENT COMMENT 'Analysis ID',
-            SHIPMENT_ID VARCHAR(20) NOT NULL COMMENT 'Shipment Reference',
+            SHIPMENT_ID BIGINT NOT NULL COMMENT 'Shipment Reference',
             ANALYSIS_DATE DATE COMMENT 'Analysis Date',
             REVENUE_TOTAL DECIMAL(18,2) COMMENT 'Total Revenue',
             COST_TOTAL DECIMAL(18,2) COMMENT 'Total Cost',
@@ -563,14 +592,15 @@ BILLING_TABLES = {
             CURRENCY VARCHAR(3) DEFAULT 'KRW' COMMENT 'Currency',
             CREATED_AT TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             UPDATED_AT TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-            PRIMARY KEY (ANALYSIS_ID)
+            PRIMARY KEY (ANALYSIS_ID),
+            INDEX IDX_PROFIT_SHIPMENT (SHIPMENT_ID)
         ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='Profit Analysis by Shipment'
     ''',
 
     'BIL_CREDIT_CHECK': '''
         CREATE TABLE IF NOT EXISTS BIL_CREDIT_CHECK (
             CHECK_ID BIGINT NOT NULL AUTO_INCREMENT COMMENT 'Check ID',
-            CUSTOMER_ID VARCHAR(20) NOT NULL COMMENT 'Customer ID',
+            CUSTOMER_ID BIGINT NOT NULL COMMENT 'Customer ID',
             CHECK_DATE DATETIME NOT NULL COMMENT 'Check DateTime',
             CREDIT_LIMIT DECIMAL(18,2) COMMENT 'Credit Limit',
             CURRENT_AR DECIMAL(18,2) COMMENT 'Current AR Balance',
@@ -582,7 +612,8 @@ BILLING_TABLES = {
             OVERRIDE_BY VARCHAR(50) COMMENT 'Override By',
             OVERRIDE_REASON TEXT COMMENT 'Override Reason',
             CREATED_AT TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            PRIMARY KEY (CHECK_ID)
+            PRIMARY KEY (CHECK_ID),
+            INDEX IDX_CREDIT_CUSTOMER (CUSTOMER_ID, CHECK_DATE)
         ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='Credit Check Log'
     ''',
 
@@ -600,45 +631,23 @@ BILLING_TABLES = {
             GAIN_LOSS DECIMAL(18,2) COMMENT 'Exchange Gain/Loss',
             RECORD_DATE DATE COMMENT 'Record Date',
             CREATED_AT TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            PRIMARY KEY (RECORD_ID)
+            PRIMARY KEY (RECORD_ID),
+            INDEX IDX_FX_GL_REF (REFERENCE_ID, REFERENCE_TYPE)
         ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='Exchange Gain/Loss'
     '''
 }
 
 def create_tables():
+    from schema_model import sync
+
     print("=" * 60)
     print("FMS Database Table Creation - Part 3")
     print("=" * 60)
 
-    conn = pymysql.connect(**DB_CONFIG)
-    cursor = conn.cursor()
-
-    all_tables = [
-        ("06. Transport Tables", TRANSPORT_TABLES),
-        ("07. Customs Tables", CUSTOMS_TABLES),
-        ("08. Billing Tables", BILLING_TABLES)
-    ]
-
-    for section_name, tables in all_tables:
-        print(f"\n=== {section_name} ===")
-        for table_name, create_sql in tables.items():
-            try:
-                cursor.execute(create_sql)
-                conn.commit()
-                print(f"  [OK] {table_name}")
-            except Exception as e:
-                print(f"  [FAIL] {table_name}: {e}")
-
-    # Get total table count
-    cursor.execute("SELECT COUNT(*) FROM information_schema.tables WHERE table_schema = 'logstic'")
-    total = cursor.fetchone()[0]
-
-    print(f"\n{'=' * 60}")
-    print(f"Total tables: {total}")
-    print("=" * 60)
-
-    cursor.close()
-    conn.close()
+    try:
+        sync(domains=["06. Transport Tables", "07. Customs Tables", "08. Billing Tables"])
+    except Exception as e:
+        print(f"\nError: {e}")
 
 if __name__ == "__main__":
     create_tables()
@@ -0,0 +1,475 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+FMS Route EXPLAIN
+Extracts the SQL literals of fms-web/src/app/api/**/route.ts, runs EXPLAIN
+FORMAT=JSON for every SELECT/UPDATE/DELETE against the current (scaled) data
+and flags full scans, filesorts and temporary tables. Each finding gets a
+composite index suggestion (equality columns, then the ORDER BY or range
+column) checked against the schema model and the live indexes; --apply adds
+them with the same online ALTER as schema_model.sync()
+"""
+
+import argparse
+import glob
+import json
+import os
+import re
+
+import pymysql
+
+from provision_schema import DB_CONFIG, DEFAULT_WORKERS, DDLExecutor
+from schema_model import SchemaModel, LiveSchema, Index
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+# docs/db is kept both at the repository root and under fms-web/
+ROUTE_DIRS = [os.path.join(HERE, '..', '..', 'src', 'app', 'api'),
+              os.path.join(HERE, '..', '..', 'fms-web', 'src', 'app', 'api')]
+# Scans of tables smaller than this (masters) are not worth an index
+DEFAULT_MIN_ROWS = 1000
+# lib/pagination.ts DEFAULT_PAGE_SIZE; list statements are explained as their first page
+PAGE_SIZE = 100
+MAX_INDEX_NAME = 64
+# Interpolated placeholder lists (${ids.map(() => '?').join(', ')}) are explained with this many entries
+SAMPLE_LIST = 2
+
+SQL_START_RE = re.compile(r'^\s*(SELECT|WITH|UPDATE|DELETE|INSERT)\s', re.S)
+METHOD_RE = re.compile(r'export\s+async\s+function\s+(GET|POST|PUT|PATCH|DELETE)\b')
+TABLE_REF_RE = re.compile(r'\b(?:FROM|JOIN|UPDATE)\s+`?(\w+)`?(?:\s+(?:AS\s+)?`?(\w+)`?)?', re.I)
+NOT_ALIAS = {'ON', 'WHERE', 'LEFT', 'RIGHT', 'INNER', 'OUTER', 'CROSS', 'JOIN', 'ORDER', 'GROUP', 'LIMIT',
+             'SET', 'USING', 'HAVING', 'UNION', 'STRAIGHT_JOIN', 'FOR', 'WINDOW'}
+CLAUSE_END_RE = re.compile(r'\b(?:GROUP\s+BY|ORDER\s+BY|LIMIT|HAVING|UNION|FOR\s+UPDATE)\b', re.I)
+EQUALITY_RE = re.compile(r"(?<![\w.!<>])(?:(\w+)\.)?(\w+)\s*(?:=\s*(?:\?|'[^']*'|-?\d+)|IN\s*\()", re.I)
+RANGE_RE = re.compile(r"(?<![\w.])(?:(\w+)\.)?(\w+)\s*(?:>=|<=|>|<|BETWEEN\b|LIKE\s+'[^%_'])", re.I)
+ORDER_RE = re.compile(r'\bORDER\s+BY\s+(.+?)(?:\bLIMIT\b|\)|$)', re.I | re.S)
+PLACEHOLDER_LIST_RE = re.compile(r"""^\w+\.map\(\s*\(\)\s*=>\s*(['"])(.*?)\1\s*\)\.join\(\s*(['"])(.*?)\3\s*\)$""", re.S)
+
+
+def get_connection():
+    return pymysql.connect(**DB_CONFIG)
+
+
+# ---------------------------------------------------------------- extraction
+
+def skip_quoted(src, i, quote):
+    """Index after the closing quote of a '...' or "..." literal starting at src[i]"""
+    i += 1
+    while i < len(src) and src[i] != quote:
+        i += 2 if src[i] == '\\' else 1
+    return i + 1
+
+
+def read_template(src, i):
+    """Parts of the template literal opening at src[i]: ('text', s) / ('expr', s); returns (parts, end)"""
+    parts, buf = [], []
+    i += 1
+    while i < len(src):
+        c = src[i]
+        if c == '\\':
+            buf.append(src[i + 1:i + 2])
+            i += 2
+        elif c == '`':
+            parts.append(('text', ''.join(buf)))
+            return parts, i + 1
+        elif src.startswith('${', i):
+            parts.append(('text', ''.join(buf)))
+            buf = []
+            end = skip_expression(src, i + 2)
+            parts.append(('expr', src[i + 2:end - 1].strip()))
+            i = end
+        else:
+            buf.append(c)
+            i += 1
+    return parts, i
+
+
+def skip_expression(src, i):
+    """Index after the '}' closing a ${...} expression"""
+    depth = 1
+    while i < len(src):
+        c = src[i]
+        if c in '\'"':
+            i = skip_quoted(src, i, c)
+            continue
+        if c == '`':
+            i = read_template(src, i)[1]
+            continue
+        if c == '{':
+            depth += 1
+        elif c == '}':
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+    return i
+
+
+def string_literals(src):
+    """(offset, parts) of every string literal outside comments"""
+    i = 0
+    while i < len(src):
+        c = src[i]
+        if src.startswith('//', i):
+            i = src.find('\n', i)
+            i = len(src) if i < 0 else i
+        elif src.startswith('/*', i):
+            i = src.find('*/', i)
+            i = len(src) if i < 0 else i + 2
+        elif c in '\'"':
+            end = skip_quoted(src, i, c)
+            yield i, [('text', src[i + 1:end - 1])]
+            i = end
+        elif c == '`':
+            parts, end = read_template(src, i)
+            yield i, parts
+            i = end
+        else:
+            i += 1
+
+
+def placeholder_list(text):
+    """'?, ?' for a `${ids.map(() => '?').join(', ')}` interpolation, or None"""
+    match = PLACEHOLDER_LIST_RE.match(text)
+    return match.group(4).join([match.group(2)] * SAMPLE_LIST) if match else None
+
+
+def closest_before(pattern, src, before):
+    """Last match of pattern starting before offset, or None"""
+    found = None
+    for match in re.finditer(pattern, src):
+        if match.start() > before:
+            break
+        found = match
+    return found
+
+
+def assigned_value(src, name, before):
+    """Initial string value of `let/const name = '...'` closest before offset, or None"""
+    value = None
+    for match in re.finditer(r'\b(?:let|const|var)\s+%s\s*(?::\s*\w+\s*)?=\s*([\'"`])' % re.escape(name), src):
+        if match.start() > before:
+            break
+        quote_at = match.end() - 1
+        if src[quote_at] == '`':
+            parts, _ = read_template(src, quote_at)
+            # Other interpolations are dropped; placeholder lists get sample entries
+            value = ''.join(text if kind == 'text' else placeholder_list(text) or '' for kind, text in parts)
+        else:
+            value = src[quote_at + 1:skip_quoted(src, quote_at, src[quote_at]) - 1]
+    return value
+
+
+def column_map(src, name):
+    """Select list of a `const NAME: Record<string, string> = { alias: 'sql', ... }` column map, or None"""
+    match = re.search(r'\bconst\s+%s\b[^=]*=\s*\{' % re.escape(name), src)
+    if not match:
+        return None
+    columns, i = [], match.end()
+    while True:
+        entry = re.compile(r'\s*(\w+)\s*:\s*([\'"])').match(src, i)
+        if not entry:
+            break
+        quote_at = entry.end() - 1
+        i = skip_quoted(src, quote_at, src[quote_at])
+        columns.append(f"{src[quote_at + 1:i - 1]} as {entry.group(1)}")
+        comma = re.compile(r'\s*,').match(src, i)
+        if not comma:
+            break
+        i = comma.end()
+    return ', '.join(columns) or None
+
+
+def pagination_value(src, text, before):
+    """First-page SQL of a lib/pagination.ts helper interpolation, or None (helpers bound closest before offset)"""
+    call = re.match(r"cursorColumns\(\s*'([^']+)'\s*,\s*'([^']+)'\s*\)$", text)
+    if call:
+        return f"{call.group(1)} as _cursor_dtm, {call.group(2)} as _cursor_id"
+    member = re.match(r'(\w+)\.(condition|orderLimit)\b', text)
+    if member:
+        if member.group(2) == 'condition':
+            return ''     # no cursor on the first page
+        keyset = closest_before(r"\b%s\s*=\s*keysetClause\(\s*\w+\s*,\s*'([^']+)'\s*,\s*'([^']+)'"
+                                % re.escape(member.group(1)), src, before)
+        if keyset:
+            return f"ORDER BY {keyset.group(1)} DESC, {keyset.group(2)} DESC LIMIT {PAGE_SIZE + 1}"
+        return None
+    fields = closest_before(r'\b(?:const|let)\s+%s\s*=\s*selectFields\(\s*\w+\s*,\s*(\w+)\s*\)'
+                            % re.escape(text), src, before)
+    if fields:
+        return column_map(src, fields.group(1))
+    return None
+
+
+def resolve(src, offset, parts):
+    """SQL text of a literal, or (None, expression) when an interpolation cannot be resolved"""
+    sql = ''
+    for kind, text in parts:
+        if kind == 'text':
+            sql += text
+        elif text == 'placeholders':
+            sql += '?'
+        elif placeholder_list(text):
+            sql += placeholder_list(text)
+        elif sql.count("'") % 2:
+            # Inside a SQL string ('${year}%'): any value gives the same plan
+            sql += '0'
+        else:
+            value = assigned_value(src, text, offset)
+            if value is None:
+                value = pagination_value(src, text, offset)
+            if value is None:
+                return None, text
+            sql += value
+    return sql, None
+
+
+class Statement:
+    def __init__(self, route, line, method, sql, skipped=None):
+        self.route = route
+        self.line = line
+        self.method = method
+        self.sql = sql
+        self.skipped = skipped
+
+    @property
+    def label(self):
+        return f"{self.route}:{self.line} {self.method or ''}".strip()
+
+
+def extract(routes_dir):
+    """Statements of every route.ts under routes_dir, in file order"""
+    statements = []
+    for path in sorted(glob.glob(os.path.join(routes_dir, '**', 'route.ts'), recursive=True)):
+        with open(path, encoding='utf-8') as f:
+            src = f.read()
+        route = os.path.relpath(os.path.dirname(path), os.path.join(routes_dir, '..')).replace(os.sep, '/')
+        methods = [(m.start(), m.group(1)) for m in METHOD_RE.finditer(src)]
+        for offset, parts in string_literals(src):
+            head = ''.join(text for kind, text in parts if kind == 'text')
+            if not SQL_START_RE.match(head) or not re.search(r'\b(FROM|INTO|SET)\b', head):
+                continue
+            line = src.count('\n', 0, offset) + 1
+            method = next((name for start, name in reversed(methods) if start < offset), None)
+            sql, unresolved = resolve(src, offset, parts)
+            skipped = f"unresolved ${{{unresolved}}}" if unresolved else None
+            if sql and sql.lstrip().upper().startswith('INSERT') and not re.search(r'\bSELECT\b', sql, re.I):
+                skipped = "INSERT ... VALUES"
+            statements.append(Statement(route, line, method, sql, skipped))
+    return statements
+
+
+def explainable(sql):
+    """Route SQL with its ? placeholders bound to literals EXPLAIN accepts"""
+    sql = re.sub(r'\b(LIMIT|OFFSET)\s+\?', r'\1 10', sql, flags=re.I)
+    sql = re.sub(r'\bLIKE\s+\?', "LIKE '%0%'", sql, flags=re.I)
+    return sql.replace('?', "'0'")
+
+
+# ---------------------------------------------------------------- analysis
+
+def first_table(node):
+    if isinstance(node, dict):
+        if 'table' in node and isinstance(node['table'], dict):
+            return node['table']
+        node = list(node.values())
+    if isinstance(node, list):
+        for child in node:
+            found = first_table(child)
+            if found:
+                return found
+    return None
+
+
+def plan_findings(node, min_rows, found=None):
+    """[(kind, alias, rows)] of full scans, filesorts and temporary tables in an EXPLAIN FORMAT=JSON plan"""
+    found = [] if found is None else found
+    if isinstance(node, list):
+        for child in node:
+            plan_findings(child, min_rows, found)
+        return found
+    if not isinstance(node, dict):
+        return found
+
+    # MariaDB nests the sorted/grouped tables under "filesort" / "temporary_table";
+    # MySQL flags the enclosing block with using_filesort / using_temporary_table
+    for kind, keys in (('filesort', ('filesort', 'using_filesort')),
+                       ('temporary', ('temporary_table', 'using_temporary_table'))):
+        if any(node.get(k) for k in keys):
+            table = first_table(node)
+            if table:
+                found.append((kind, table.get('table_name'), table.get('rows', 0)))
+    table = node.get('table')
+    if isinstance(table, dict) and table.get('access_type') in ('ALL', 'index'):
+        rows = table.get('rows', 0)
+        if rows >= min_rows:
+            found.append(('full scan' if table['access_type'] == 'ALL' else 'index scan',
+                          table.get('table_name'), rows))
+    for value in node.values():
+        if isinstance(value, (dict, list)):
+            plan_findings(value, min_rows, found)
+    return found
+
+
+def table_aliases(sql):
+    """alias -> table for the FROM/JOIN/UPDATE references"""
+    aliases = {}
+    for table, alias in TABLE_REF_RE.findall(sql):
+        table = table.upper()
+        aliases[table] = table
+        if alias and alias.upper() not in NOT_ALIAS:
+            aliases[alias.upper()] = table
+    return aliases
+
+
+def columns_of(matches, alias, aliases, table):
+    """Columns of table among (prefix, column) matches; unprefixed ones count when the table is alone"""
+    alone = len(set(aliases.values())) == 1
+    return [column.upper() for prefix, column in matches
+            if column.upper() in table.columns
+            and (prefix.upper() == alias if prefix else alone)]
+
+
+def suggest(sql, alias, model):
+    """(table, columns) of a composite index for the table behind alias, or None"""
+    aliases = table_aliases(sql)
+    name = aliases.get((alias or '').upper())
+    if not name or name not in model.tables:
+        return None
+    table = model.tables[name]
+    key = (alias or '').upper()
+
+    where = re.search(r'\bWHERE\b(.*)', sql, re.I | re.S)
+    where = CLAUSE_END_RE.split(where.group(1))[0] if where else ''
+    columns = list(dict.fromkeys(columns_of(EQUALITY_RE.findall(where), key, aliases, table)))
+
+    order = ORDER_RE.search(sql)
+    order_columns = []
+    if order:
+        terms = [re.sub(r'\s+(ASC|DESC)$', '', t.strip(), flags=re.I) for t in order.group(1).split(',')]
+        matches = [t.split('.', 1) if '.' in t else ('', t) for t in terms]
+        order_columns = columns_of(matches, key, aliases, table)
+        # An index only serves the sort when every ORDER BY term is on this table
+        if len(order_columns) != len(terms):
+            order_columns = []
+    if order_columns:
+        columns += [c for c in order_columns if c not in columns]
+    else:
+        columns += [c for c in columns_of(RANGE_RE.findall(where), key, aliases, table) if c not in columns][:1]
+    return (name, columns) if columns else None
+
+
+def covering_index(indexes, columns):
+    """Name of an index whose leading columns are columns, or None"""
+    for index_name, index_columns in indexes.items():
+        if index_columns[:len(columns)] == columns:
+            return index_name
+    return None
+
+
+def index_name(table, columns):
+    short = table.split('_', 1)[1] if '_' in table else table
+    return f"IDX_{short}_{'_'.join(columns)}"[:MAX_INDEX_NAME].rstrip('_')
+
+
+# ---------------------------------------------------------------- main
+
+def explain_routes(routes_dir, min_rows=DEFAULT_MIN_ROWS, apply=False, workers=DEFAULT_WORKERS, verbose=False):
+    statements = extract(routes_dir)
+    model = SchemaModel.from_create_scripts()
+    conn = get_connection()
+    try:
+        live = LiveSchema.read(conn)
+        print(f"\n=== EXPLAIN ({len(statements)} statements) ===")
+        suggestions = {}
+        flagged = 0
+        with conn.cursor() as cursor:
+            for statement in statements:
+                if statement.skipped:
+                    if verbose:
+                        print(f"  [SKIP] {statement.label}: {statement.skipped}")
+                    continue
+                try:
+                    cursor.execute("EXPLAIN FORMAT=JSON " + explainable(statement.sql))
+                    plan = json.loads(cursor.fetchone()[0])
+                except Exception as e:
+                    print(f"  [FAIL] {statement.label}: {e}")
+                    continue
+                findings = plan_findings(plan, min_rows)
+                if not findings:
+                    if verbose:
+                        print(f"  [OK] {statement.label}")
+                    continue
+                flagged += 1
+                notes = ", ".join(f"{kind} {alias} ({rows:,} rows)" for kind, alias, rows in findings)
+                print(f"  [FAIL] {statement.label}: {notes}")
+                for _, alias, _ in findings:
+                    suggestion = suggest(statement.sql, alias, model)
+                    if suggestion:
+                        table, columns = suggestion
+                        suggestions.setdefault((table, tuple(columns)), []).append(statement.label)
+    finally:
+        conn.close()
+
+    skipped = sum(1 for s in statements if s.skipped)
+    print(f"\n  {flagged} flagged, {skipped} skipped (dynamic SQL or INSERT ... VALUES)")
+    print(f"\n=== Index suggestions ({len(suggestions)}) ===")
+    changes = {}
+    for (table, columns), labels in sorted(suggestions.items()):
+        columns = list(columns)
+        model_index = covering_index({n: i.columns for n, i in model.tables[table].indexes.items()}, columns)
+        live_index = covering_index({n: c for n, (c, _) in live.indexes.get(table, {}).items()}, columns)
+        used_by = f"{len(labels)} statements: {', '.join(labels[:3])}{' ...' if len(labels) > 3 else ''}"
+        if live_index:
+            print(f"  [SKIP] {table} ({', '.join(columns)}): {live_index} exists; the optimizer chose not to use it")
+        elif model_index:
+            print(f"  [SKIP] {table} ({', '.join(columns)}): {model_index} is in the model but not live "
+                  f"(run schema_model.py {table})")
+        else:
+            index = Index(index_name(table, columns), columns)
+            print(f"  [ADD] {table}: {index.ddl()}  -- {used_by}")
+            changes.setdefault(table, []).append(f"ADD {index.ddl()}")
+
+    if not changes:
+        return
+    print("\n  Add to the create script to keep the model in step:")
+    for table, clauses in changes.items():
+        for clause in clauses:
+            print(f"    {table}: {clause[len('ADD '):]},")
+    if not apply:
+        return
+
+    print("\n=== Apply ===")
+    # Same online build as schema_model.diff_table()
+    jobs = {table: [f"ALTER TABLE {table} " + ", ".join(clauses) + ", ALGORITHM=INPLACE, LOCK=NONE"]
+            for table, clauses in changes.items()}
+    for name, seconds, error in DDLExecutor(workers).run(jobs, {}):
+        if error is None:
+            print(f"  [OK] {name:<32} {seconds:8.1f}s")
+        else:
+            print(f"  [FAIL] {name}: {error}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="EXPLAIN the SQL of the fms-web API routes and suggest indexes")
+    parser.add_argument('--routes', help='route directory (default: fms-web/src/app/api)')
+    parser.add_argument('--min-rows', type=int, default=DEFAULT_MIN_ROWS,
+                        help='ignore scans of tables estimated below this many rows')
+    parser.add_argument('--apply', action='store_true', help='build the suggested indexes online')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS, help='DDL connections for --apply')
+    parser.add_argument('--verbose', '-v', action='store_true', help='also list clean and skipped statements')
+    args = parser.parse_args()
+
+    routes_dir = args.routes or next((d for d in ROUTE_DIRS if os.path.isdir(d)), ROUTE_DIRS[0])
+
+    print("=" * 60)
+    print(f"FMS Route EXPLAIN ({os.path.normpath(routes_dir)})")
+    print("=" * 60)
+
+    try:
+        explain_routes(routes_dir, args.min_rows, args.apply, args.workers, args.verbose)
+    except Exception as e:
+        print(f"\nError: {e}")
+
+
+if __name__ == "__main__":
+    main()
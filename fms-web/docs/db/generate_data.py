@@ -0,0 +1,700 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+FMS Synthetic Data Generator
+Generates referentially consistent data across all eight domains
+(customers, schedules, shipments, bookings, B/L & AWB, containers, tracking,
+transport, customs, billing) for 10k ~ 10M shipments.
+Customers, lanes and carriers are skewed like production traffic and ETDs
+follow a seasonal calendar; the same seed and anchor reproduce byte-identical
+tables on an empty schema
+"""
+
+import argparse
+import bisect
+import random
+import time
+from collections import defaultdict
+from itertools import accumulate
+from datetime import datetime, timedelta
+
+import pymysql
+
+from insert_sample_data import (
+    COUNTRIES, PORTS, CURRENCIES, CARRIERS, CUSTOMERS, TRUCKERS, BROKERS, HS_CODES
+)
+from bulk_load import BulkLoader, MODES, DEFAULT_MODE
+from key_cache import KeyCache
+from provision_schema import DB_CONFIG
+from schema_model import SchemaModel
+
+MIN_SHIPMENTS = 10_000
+MAX_SHIPMENTS = 10_000_000
+DEFAULT_BATCH = 2_000
+DEFAULT_SEED = 1
+# Generated keys start above anything entered by hand or by insert_sample_data.py
+DEFAULT_ID_BASE = 100_000_000
+# Child rows of shipment i get keys id_base + i * CHILD_STRIDE + k
+CHILD_STRIDE = 10
+
+HISTORY_DAYS = 180
+FUTURE_DAYS = 30
+HOME_COUNTRY = 'KR'
+KRW_RATE = {'USD': 1350.00, 'KRW': 1.00}
+# Dates are relative to a fixed anchor (not now()) so reruns are comparable
+DEFAULT_ANCHOR = datetime(2026, 1, 1)
+AUDIT_USER = 'generator'
+AUDIT_COLUMNS = ('CREATED_DTM', 'UPDATED_DTM', 'CREATED_AT', 'UPDATED_AT')
+
+# Production skew
+CUSTOMER_SKEW = 1.1     # Zipf exponent over customers
+LANE_SKEW = 1.0         # Zipf exponent over port pairs
+CARRIER_SHARE = {       # relative volume per carrier
+    'MSCU': 20, 'MAEU': 15, 'COSU': 11, 'EGLV': 9, 'ONEY': 7, 'HDMU': 12, 'YMLU': 4,
+    'KE': 35, 'OZ': 20, 'CX': 18, 'SQ': 15, 'LH': 12,
+}
+# Departures per day: peak season Aug ~ Oct, Lunar New Year dip in Feb, quiet weekends
+MONTH_WEIGHT = (0.95, 0.70, 0.90, 0.95, 1.00, 1.05, 1.10, 1.25, 1.30, 1.25, 1.15, 1.05)
+WEEKDAY_WEIGHT = (1.10, 1.15, 1.15, 1.10, 1.20, 0.45, 0.25)
+
+SEA_PORTS = [p[0] for p in PORTS if p[4] == 'SEA']
+AIR_PORTS = [p[0] for p in PORTS if p[4] == 'AIR']
+PORT_COUNTRY = {p[0]: p[3] for p in PORTS}
+PORT_NAME = {p[0]: p[2] for p in PORTS}
+AWB_PREFIX = {'KE': '180', 'OZ': '988', 'CX': '160', 'SQ': '618', 'LH': '020'}
+VESSEL_NAMES = ['ALGECIRAS', 'COPENHAGEN', 'GALAXY', 'COMPETENCE', 'HARMONY', 'PIONEER', 'TRIUMPH', 'UNITY']
+CNTR_TYPES = [('GP', '20'), ('GP', '40'), ('HC', '40'), ('RF', '20')]
+
+# (event code, event name, offset, relative to ETD/ETA, shipment status after the event)
+SEA_MILESTONES = [
+    ('BKD', 'Booking Confirmed', timedelta(days=-10), 'ETD', 'BOOKED'),
+    ('GIN', 'Gate In at Terminal', timedelta(days=-2), 'ETD', 'BOOKED'),
+    ('LOD', 'Loaded on Vessel', timedelta(hours=-4), 'ETD', 'BOOKED'),
+    ('DEP', 'Vessel Departed', timedelta(0), 'ETD', 'DEPARTED'),
+    ('ARR', 'Vessel Arrived', timedelta(0), 'ETA', 'ARRIVED'),
+    ('DIS', 'Discharged from Vessel', timedelta(hours=6), 'ETA', 'ARRIVED'),
+    ('GOT', 'Gate Out from Terminal', timedelta(days=2), 'ETA', 'ARRIVED'),
+    ('DLV', 'Delivered', timedelta(days=4), 'ETA', 'DELIVERED'),
+]
+AIR_MILESTONES = [
+    ('BKD', 'Booking Confirmed', timedelta(days=-3), 'ETD', 'BOOKED'),
+    ('RCS', 'Cargo Received', timedelta(hours=-8), 'ETD', 'BOOKED'),
+    ('DEP', 'Flight Departed', timedelta(0), 'ETD', 'DEPARTED'),
+    ('ARR', 'Flight Arrived', timedelta(0), 'ETA', 'ARRIVED'),
+    ('RCF', 'Cargo Received from Flight', timedelta(hours=3), 'ETA', 'ARRIVED'),
+    ('DLV', 'Delivered', timedelta(days=1), 'ETA', 'DELIVERED'),
+]
+
+# (charge code, charge name, unit type, unit price, currency)
+SEA_CHARGES = [
+    ('OFR', 'Ocean Freight', 'CNTR', 1400.00, 'USD'),
+    ('THC', 'Terminal Handling', 'CNTR', 150000.00, 'KRW'),
+    ('DOC', 'Documentation Fee', 'BL', 50000.00, 'KRW'),
+]
+AIR_CHARGES = [
+    ('AFR', 'Air Freight', 'KG', 5.50, 'USD'),
+    ('FSC', 'Fuel Surcharge', 'KG', 1.20, 'USD'),
+    ('DOC', 'Documentation Fee', 'AWB', 30000.00, 'KRW'),
+]
+
+
+def get_connection(local_infile=False):
+    return pymysql.connect(**DB_CONFIG, local_infile=local_infile)
+
+
+def zipf_weights(n, exponent):
+    return [1 / (rank + 1) ** exponent for rank in range(n)]
+
+
+class WeightedPicker:
+    """Draws an index with fixed relative weights (cumulative table + bisect)"""
+
+    def __init__(self, weights):
+        self.cumulative = list(accumulate(weights))
+
+    def __call__(self, rng):
+        index = bisect.bisect_right(self.cumulative, rng.random() * self.cumulative[-1])
+        return min(index, len(self.cumulative) - 1)
+
+
+def stamp(rows, when):
+    """Fill audit columns explicitly so they do not fall back to CURRENT_TIMESTAMP"""
+    for table_rows in rows.values():
+        for r in table_rows:
+            for column in AUDIT_COLUMNS:
+                r.setdefault(column, when)
+            r.setdefault('CREATED_BY', AUDIT_USER)
+    return rows
+
+
+def reference_rows():
+    """Master rows built from the insert_sample_data.py lists"""
+    return {
+        'MST_COUNTRY': [
+            dict(COUNTRY_CD=c[0], COUNTRY_CD3=c[1], COUNTRY_NM=c[2], COUNTRY_NM_EN=c[3],
+                 CONTINENT_CD=c[4], CURRENCY_CD=c[5], USE_YN='Y') for c in COUNTRIES],
+        'MST_CURRENCY': [
+            dict(CURRENCY_CD=c[0], CURRENCY_NM=c[1], CURRENCY_SYMBOL=c[3], DECIMAL_PLACES=c[4],
+                 USE_YN='Y') for c in CURRENCIES],
+        'MST_PORT': [
+            dict(PORT_CD=p[0], PORT_NM=p[1], PORT_NM_EN=p[2], COUNTRY_CD=p[3], PORT_TYPE_CD=p[4],
+                 USE_YN='Y') for p in PORTS],
+        'MST_CARRIER': [
+            dict(CARRIER_CD=c[0], CARRIER_NM=c[1], CARRIER_NM_EN=c[2], CARRIER_TYPE_CD=c[3],
+                 SCAC_CD=c[4], IATA_CD=c[5], ICAO_CD=c[6], COUNTRY_CD=c[7], USE_YN='Y') for c in CARRIERS],
+        'MST_TRUCKER': [
+            dict(TRUCKER_CD=t[0], TRUCKER_NM=t[1], TRUCKER_NM_EN=t[2], BIZ_REG_NO=t[3], ADDR=t[4],
+                 TEL_NO=t[5], EMAIL=t[6], COUNTRY_CD=HOME_COUNTRY, USE_YN='Y') for t in TRUCKERS],
+        'MST_CUSTOMS_BROKER': [
+            dict(BROKER_CD=b[0], BROKER_NM=b[1], BIZ_REG_NO=b[3], ADDR=b[4], TEL_NO=b[5], EMAIL=b[6],
+                 COUNTRY_CD=HOME_COUNTRY, USE_YN='Y') for b in BROKERS],
+        'MST_HS_CODE': [
+            dict(HS_CODE=h[0], HS_CODE_NM=h[2], HS_CODE_NM_EN=h[1], TARIFF_RATE=h[3], USE_YN='Y')
+            for h in HS_CODES],
+    }
+
+
+def load_reference_ids(cursor):
+    """code -> id for the masters whose ids are assigned by the database"""
+    keys = KeyCache(cursor)
+    return {table: keys.map(table) for table in ('MST_CARRIER', 'MST_TRUCKER', 'MST_CUSTOMS_BROKER')}
+
+
+class Dataset:
+    """Sizing and key layout of a synthetic data set of N shipments"""
+
+    def __init__(self, shipments, id_base=DEFAULT_ID_BASE, seed=DEFAULT_SEED, anchor=None):
+        if not MIN_SHIPMENTS <= shipments <= MAX_SHIPMENTS:
+            raise ValueError(f"shipments must be between {MIN_SHIPMENTS:,} and {MAX_SHIPMENTS:,}")
+        self.shipments = shipments
+        self.id_base = id_base
+        self.seed = seed
+        self.anchor = (anchor or DEFAULT_ANCHOR).replace(minute=0, second=0, microsecond=0)
+        self.start = self.anchor - timedelta(days=HISTORY_DAYS)
+        days = [self.start + timedelta(days=d) for d in range(HISTORY_DAYS + FUTURE_DAYS)]
+        self.calendar = list(accumulate(MONTH_WEIGHT[d.month - 1] * WEEKDAY_WEIGHT[d.weekday()] for d in days))
+        self.customers = max(len(CUSTOMERS), shipments // 50)
+        self.voyages = max(50, shipments // 200)
+        self.flights = max(50, shipments // 100)
+
+    def key(self, i):
+        return self.id_base + i
+
+    def child_key(self, i, k):
+        return self.id_base + i * CHILD_STRIDE + k
+
+    def rng(self, scope, i):
+        """Independent random stream per row, so any key range can be generated on its own"""
+        return random.Random(f"{self.seed}:{scope}:{i}")
+
+    def departure(self, n, count):
+        """n-th of count departures over the HISTORY_DAYS + FUTURE_DAYS window, denser in busy days"""
+        position = (n + 0.5) / count * self.calendar[-1]
+        day = bisect.bisect_right(self.calendar, position)
+        before = self.calendar[day - 1] if day else 0.0
+        hour = int(24 * (position - before) / (self.calendar[day] - before))
+        return self.start + timedelta(days=day, hours=hour)
+
+
+class Shipment:
+    """Facts of one generated shipment shared by all of its child rows"""
+
+    def __init__(self, **fields):
+        self.__dict__.update(fields)
+
+
+class SyntheticData:
+    """Builds row dicts (DDL column names) for a Dataset"""
+
+    def __init__(self, dataset, reference_ids):
+        self.ds = dataset
+        carriers = reference_ids['MST_CARRIER']
+        self.sea_carriers = [(c[0], carriers[c[0]]) for c in CARRIERS if c[3] == 'SEA' and c[0] in carriers]
+        self.air_carriers = [(c[0], carriers[c[0]]) for c in CARRIERS if c[3] == 'AIR' and c[0] in carriers]
+        self.truckers = [reference_ids['MST_TRUCKER'][t[0]] for t in TRUCKERS
+                         if t[0] in reference_ids['MST_TRUCKER']]
+        self.brokers = [reference_ids['MST_CUSTOMS_BROKER'][b[0]] for b in BROKERS
+                        if b[0] in reference_ids['MST_CUSTOMS_BROKER']]
+        if not (self.sea_carriers and self.air_carriers and self.truckers and self.brokers):
+            raise ValueError("Reference masters are missing (carrier/trucker/broker)")
+
+        self.sea_carrier_pick = WeightedPicker([CARRIER_SHARE.get(c[0], 1) for c in self.sea_carriers])
+        self.air_carrier_pick = WeightedPicker([CARRIER_SHARE.get(c[0], 1) for c in self.air_carriers])
+        self.customer_pick = WeightedPicker(zipf_weights(dataset.customers, CUSTOMER_SKEW))
+        self.sea_lanes = self.lanes(SEA_PORTS, 'sea')
+        self.air_lanes = self.lanes(AIR_PORTS, 'air')
+        self.sea_lane_pick = WeightedPicker(zipf_weights(len(self.sea_lanes), LANE_SKEW))
+        self.air_lane_pick = WeightedPicker(zipf_weights(len(self.air_lanes), LANE_SKEW))
+
+    def lanes(self, ports, scope):
+        """(origin, destination) pairs with the home country on one end, in seeded popularity order"""
+        home = [p for p in ports if PORT_COUNTRY[p] == HOME_COUNTRY]
+        abroad = [p for p in ports if PORT_COUNTRY[p] != HOME_COUNTRY]
+        lanes = [(h, a) for h in home for a in abroad] + [(a, h) for h in home for a in abroad]
+        self.ds.rng('lanes', scope).shuffle(lanes)
+        return lanes
+
+    def voyage(self, v):
+        rng = self.ds.rng('voyage', v)
+        carrier_cd, carrier_id = self.sea_carriers[self.sea_carrier_pick(rng)]
+        pol, pod = self.sea_lanes[self.sea_lane_pick(rng)]
+        etd = self.ds.departure(v, self.ds.voyages)
+        transit = rng.randint(3, 35)
+        return dict(
+            schedule_id=self.ds.key(v), carrier_cd=carrier_cd, carrier_id=carrier_id,
+            vessel=f"{carrier_cd} {VESSEL_NAMES[v % len(VESSEL_NAMES)]}",
+            voyage_no=f"G{v:06d}{'E' if PORT_COUNTRY[pol] == HOME_COUNTRY else 'W'}",
+            pol=pol, pod=pod, etd=etd, eta=etd + timedelta(days=transit), transit=transit,
+        )
+
+    def flight(self, f):
+        rng = self.ds.rng('flight', f)
+        carrier_cd, carrier_id = self.air_carriers[self.air_carrier_pick(rng)]
+        pol, pod = self.air_lanes[self.air_lane_pick(rng)]
+        etd = self.ds.departure(f, self.ds.flights)
+        hours = rng.randint(2, 14)
+        return dict(
+            schedule_id=self.ds.key(f), carrier_cd=carrier_cd, carrier_id=carrier_id,
+            flight_no=f"{carrier_cd}{f % 900 + 100}", pol=pol, pod=pod,
+            etd=etd, eta=etd + timedelta(hours=hours), transit=hours,
+        )
+
+    # ---------------------------------------------------------------- masters
+
+    def customer_rows(self):
+        rows = []
+        for c in range(self.ds.customers):
+            t = CUSTOMERS[c % len(CUSTOMERS)]
+            rows.append(dict(
+                CUSTOMER_ID=self.ds.key(c), CUSTOMER_CD=f"GC{c:08d}",
+                CUSTOMER_NM=f"{t[1]} #{c}", CUSTOMER_NM_EN=f"{t[2]} #{c}", CUSTOMER_TYPE_CD=t[3],
+                BIZ_REG_NO=t[4], CEO_NM=t[5], COUNTRY_CD=t[6], ADDR=t[7], TEL_NO=t[8], EMAIL=t[9],
+                CURRENCY_CD='KRW' if t[6] == HOME_COUNTRY else 'USD', STATUS_CD='ACTIVE', USE_YN='Y',
+            ))
+        return stamp({'MST_CUSTOMER': rows}, self.ds.start)
+
+    def schedule_rows(self):
+        rows = defaultdict(list)
+        for v in range(self.ds.voyages):
+            s = self.voyage(v)
+            rows['SCH_VOYAGE'].append(dict(
+                VOYAGE_ID=s['schedule_id'], CARRIER_ID=s['carrier_id'], VESSEL_NM=s['vessel'],
+                VOYAGE_NO=s['voyage_no'], SERVICE_ROUTE_CD=s['pol'][2:] + s['pod'][2:], STATUS_CD='ACTIVE',
+            ))
+            rows['SCH_OCEAN_SCHEDULE'].append(dict(
+                OCEAN_SCHEDULE_ID=s['schedule_id'], VOYAGE_ID=s['schedule_id'], CARRIER_ID=s['carrier_id'],
+                VESSEL_NM=s['vessel'], VOYAGE_NO=s['voyage_no'], POL_PORT_CD=s['pol'], POD_PORT_CD=s['pod'],
+                ETD_DTM=s['etd'], ETA_DTM=s['eta'], CUT_OFF_DTM=s['etd'] - timedelta(days=3),
+                CARGO_CUT_OFF_DTM=s['etd'] - timedelta(days=2), TRANSIT_DAYS=s['transit'],
+                TS_YN='N', STATUS_CD='ACTIVE',
+            ))
+        for f in range(self.ds.flights):
+            s = self.flight(f)
+            rows['SCH_AIR_SCHEDULE'].append(dict(
+                AIR_SCHEDULE_ID=s['schedule_id'], CARRIER_ID=s['carrier_id'], FLIGHT_NO=s['flight_no'],
+                ORIGIN_PORT_CD=s['pol'], DEST_PORT_CD=s['pod'], ETD_DTM=s['etd'], ETA_DTM=s['eta'],
+                TRANSIT_HOURS=s['transit'], TS_YN='N', STATUS_CD='ACTIVE',
+            ))
+        return stamp(rows, self.ds.start)
+
+    # -------------------------------------------------------------- shipments
+
+    def plan(self, i):
+        """Core facts of shipment i"""
+        ds = self.ds
+        rng = ds.rng('shipment', i)
+        sea = rng.random() < 0.7
+        if sea:
+            schedule = self.voyage(rng.randrange(ds.voyages))
+        else:
+            schedule = self.flight(rng.randrange(ds.flights))
+        customer = self.customer_pick(rng)
+        hs_code, commodity, _, duty_rate = rng.choice(HS_CODES)
+        weight = round(rng.uniform(50, 20000 if sea else 3000), 3)
+
+        # Milestones that have already happened at the anchor time
+        events = []
+        status = 'PENDING'
+        for code, name, offset, base, after in (SEA_MILESTONES if sea else AIR_MILESTONES):
+            when = schedule['etd' if base == 'ETD' else 'eta'] + offset
+            if when > ds.anchor:
+                break
+            events.append((code, name, when, schedule['pol' if base == 'ETD' else 'pod'], after))
+            status = after
+        if status == 'DEPARTED' and ds.anchor - schedule['etd'] > timedelta(days=1):
+            status = 'IN_TRANSIT'
+        codes = {e[0] for e in events}
+
+        return Shipment(
+            i=i, sid=ds.key(i), rng=rng, sea=sea, status=status, events=events,
+            export=PORT_COUNTRY[schedule['pol']] == HOME_COUNTRY,
+            customer_id=ds.key(customer), customer=CUSTOMERS[customer % len(CUSTOMERS)],
+            hs_code=hs_code, commodity=commodity, duty_rate=duty_rate,
+            pkg_qty=rng.randint(1, 500), weight=weight, volume=round(weight / rng.uniform(150, 400), 4),
+            value=round(rng.uniform(10_000, 3_000_000), 2),
+            atd=schedule['etd'] if 'DEP' in codes else None,
+            ata=schedule['eta'] if 'ARR' in codes else None,
+            created=min(ds.anchor, schedule['etd'] - timedelta(days=14 if sea else 5)),
+            **schedule
+        )
+
+    def shipment_rows(self, i, rows):
+        """Append every row belonging to shipment i to rows (table -> list)"""
+        s = self.plan(i)
+        own = defaultdict(list)
+        self.order(s, own)
+        containers = self.sea_documents(s, own) if s.sea else self.air_documents(s, own)
+        self.tracking(s, own, containers)
+        self.inland_transport(s, own, containers)
+        self.customs(s, own)
+        self.billing(s, own, containers)
+        for table, table_rows in stamp(own, s.created).items():
+            rows[table].extend(table_rows)
+
+    def order(self, s, rows):
+        rows['ORD_SHIPMENT'].append(dict(
+            SHIPMENT_ID=s.sid, SHIPMENT_NO=f"GS{s.sid:012d}", TRANSPORT_MODE_CD='SEA' if s.sea else 'AIR',
+            TRADE_TYPE_CD='EXPORT' if s.export else 'IMPORT', SERVICE_TYPE_CD='CY-CY' if s.sea else 'D2D',
+            INCOTERMS_CD=s.rng.choice(['FOB', 'CIF', 'EXW', 'DDP', 'CFR']),
+            CUSTOMER_ID=s.customer_id, SHIPPER_ID=s.customer_id if s.export else None,
+            CONSIGNEE_ID=None if s.export else s.customer_id, CARRIER_ID=s.carrier_id,
+            ORIGIN_COUNTRY_CD=PORT_COUNTRY[s.pol], ORIGIN_PORT_CD=s.pol,
+            DEST_COUNTRY_CD=PORT_COUNTRY[s.pod], DEST_PORT_CD=s.pod,
+            OCEAN_SCHEDULE_ID=s.schedule_id if s.sea else None,
+            AIR_SCHEDULE_ID=None if s.sea else s.schedule_id,
+            CARGO_READY_DT=(s.etd - timedelta(days=7)).date(), ETD_DT=s.etd.date(), ETA_DT=s.eta.date(),
+            ATD_DT=s.atd.date() if s.atd else None, ATA_DT=s.ata.date() if s.ata else None,
+            TOTAL_PKG_QTY=s.pkg_qty, PKG_TYPE_CD='CTN', GROSS_WEIGHT_KG=s.weight, VOLUME_CBM=s.volume,
+            CHARGEABLE_WEIGHT=max(s.weight, round(s.volume * 167, 3)),
+            DECLARED_VALUE_AMT=s.value, DECLARED_VALUE_CURR='USD', STATUS_CD=s.status,
+            CUSTOMS_STATUS_CD='CLEARED' if s.atd else 'PENDING',
+        ))
+
+        previous = None
+        for k, (code, name, when, location, status) in enumerate(s.events):
+            if status == previous:
+                continue
+            previous = status
+            rows['ORD_SHIPMENT_STATUS_HIST'].append(dict(
+                HIST_ID=self.ds.child_key(s.i, k), SHIPMENT_ID=s.sid, STATUS_CD=status, STATUS_NM=name,
+                EVENT_DTM=when, LOCATION_CD=location, LOCATION_NM=PORT_NAME[location], SOURCE_CD='SYSTEM',
+            ))
+
+    def sea_documents(self, s, rows):
+        """Ocean booking, MBL/HBL and containers; returns [(CONTAINER_ID, CNTR_NO, SEAL_NO)]"""
+        ds = self.ds
+        lines = [s.rng.choice(CNTR_TYPES) for _ in range(s.rng.randint(1, 3))]
+        rows['ORD_OCEAN_BOOKING'].append(dict(
+            BOOKING_ID=s.sid, BOOKING_NO=f"GB{s.sid:012d}", CARRIER_BOOKING_NO=f"{s.carrier_cd}{s.sid:010d}",
+            SHIPMENT_ID=s.sid, OCEAN_SCHEDULE_ID=s.schedule_id, CARRIER_ID=s.carrier_id,
+            VESSEL_NM=s.vessel, VOYAGE_NO=s.voyage_no, POL_PORT_CD=s.pol, POD_PORT_CD=s.pod,
+            ETD_DT=s.etd.date(), ETA_DT=s.eta.date(),
+            CNTR_20GP_QTY=lines.count(('GP', '20')), CNTR_40GP_QTY=lines.count(('GP', '40')),
+            CNTR_40HC_QTY=lines.count(('HC', '40')), CNTR_REEFER_QTY=lines.count(('RF', '20')),
+            TOTAL_CNTR_QTY=len(lines), COMMODITY_DESC=s.commodity,
+            GROSS_WEIGHT_KG=s.weight, VOLUME_CBM=s.volume, STATUS_CD='CONFIRMED',
+            REQUEST_DTM=s.etd - timedelta(days=14), CONFIRM_DTM=s.etd - timedelta(days=10),
+        ))
+        for k, (cntr_type, size) in enumerate(lines):
+            rows['ORD_OCEAN_BOOKING_CNTR'].append(dict(
+                BOOKING_CNTR_ID=ds.child_key(s.i, k), BOOKING_ID=s.sid, LINE_NO=k + 1,
+                CNTR_TYPE_CD=cntr_type, CNTR_SIZE_CD=size, CNTR_QTY=1, IS_SOC='N',
+            ))
+
+        status = 'ISSUED' if s.atd else 'DRAFT'
+        rows['BL_MASTER_BL'].append(dict(
+            MBL_ID=s.sid, MBL_NO=f"{s.carrier_cd}{s.sid:011d}", SHIPMENT_ID=s.sid, BOOKING_ID=s.sid,
+            CARRIER_ID=s.carrier_id, VESSEL_NM=s.vessel, VOYAGE_NO=s.voyage_no,
+            OCEAN_SCHEDULE_ID=s.schedule_id, POL_PORT_CD=s.pol, POD_PORT_CD=s.pod,
+            ETD_DT=s.etd.date(), ETA_DT=s.eta.date(),
+            ATD_DT=s.atd.date() if s.atd else None, ATA_DT=s.ata.date() if s.ata else None,
+            SHIPPER_NM=s.customer[2], CONSIGNEE_NM=s.customer[2], TOTAL_PKG_QTY=s.pkg_qty,
+            GROSS_WEIGHT_KG=s.weight, VOLUME_CBM=s.volume, COMMODITY_DESC=s.commodity,
+            CNTR_COUNT=len(lines), BL_TYPE_CD='ORIGINAL', ORIGINAL_BL_COUNT=3, STATUS_CD=status,
+        ))
+        hbl_id = ds.child_key(s.i, 0)
+        rows['BL_HOUSE_BL'].append(dict(
+            HBL_ID=hbl_id, HBL_NO=f"GHBL{hbl_id:012d}", SHIPMENT_ID=s.sid, MBL_ID=s.sid,
+            CUSTOMER_ID=s.customer_id, CARRIER_ID=s.carrier_id, VESSEL_NM=s.vessel, VOYAGE_NO=s.voyage_no,
+            POL_PORT_CD=s.pol, POD_PORT_CD=s.pod, ETD_DT=s.etd.date(), ETA_DT=s.eta.date(),
+            ATD_DT=s.atd.date() if s.atd else None, ATA_DT=s.ata.date() if s.ata else None,
+            SHIPPER_NM=s.customer[2], SHIPPER_ADDR=s.customer[7],
+            CONSIGNEE_NM=s.customer[2], CONSIGNEE_ADDR=s.customer[7],
+            TOTAL_PKG_QTY=s.pkg_qty, GROSS_WEIGHT_KG=s.weight, VOLUME_CBM=s.volume,
+            COMMODITY_DESC=s.commodity, HS_CODE=s.hs_code, DECLARED_VALUE=s.value, DECLARED_VALUE_CURR='USD',
+            BL_TYPE_CD='ORIGINAL', ORIGINAL_BL_COUNT=3, SERVICE_TYPE_CD='CY-CY', STATUS_CD=status,
+        ))
+
+        containers = []
+        for k, (cntr_type, size) in enumerate(lines):
+            container_id = ds.child_key(s.i, k)
+            cntr_no = f"{s.carrier_cd[:3]}U{container_id % 10 ** 7:07d}"
+            seal_no = f"SL{container_id % 10 ** 8:08d}"
+            containers.append((container_id, cntr_no, seal_no))
+            rows['BL_CONTAINER'].append(dict(
+                CONTAINER_ID=container_id, CNTR_NO=cntr_no, MBL_ID=s.sid, HBL_ID=hbl_id, BOOKING_ID=s.sid,
+                CNTR_TYPE_CD=cntr_type, CNTR_SIZE_CD=size, SEAL_NO=seal_no,
+                TARE_WEIGHT_KG=2200 if size == '20' else 3800,
+                GROSS_WEIGHT_KG=round(s.weight / len(lines), 3), VOLUME_CBM=round(s.volume / len(lines), 4),
+                PKG_QTY=s.pkg_qty, COMMODITY_DESC=s.commodity, IS_SOC='N', DG_YN='N', STATUS_CD=s.status,
+                GATE_IN_DTM=s.etd - timedelta(days=2) if s.atd else None,
+                LOADING_DTM=s.atd, DISCHARGE_DTM=s.ata,
+            ))
+        return containers
+
+    def air_documents(self, s, rows):
+        """Air booking and MAWB/HAWB; air shipments carry no containers"""
+        chargeable = max(s.weight, round(s.volume * 167, 3))
+        rows['ORD_AIR_BOOKING'].append(dict(
+            BOOKING_ID=s.sid, BOOKING_NO=f"GA{s.sid:012d}", SHIPMENT_ID=s.sid,
+            AIR_SCHEDULE_ID=s.schedule_id, CARRIER_ID=s.carrier_id, FLIGHT_NO=s.flight_no,
+            FLIGHT_DT=s.etd.date(), ORIGIN_PORT_CD=s.pol, DEST_PORT_CD=s.pod,
+            ETD_DTM=s.etd, ETA_DTM=s.eta, COMMODITY_DESC=s.commodity, PKG_QTY=s.pkg_qty, PKG_TYPE_CD='CTN',
+            GROSS_WEIGHT_KG=s.weight, CHARGEABLE_WEIGHT=chargeable, VOLUME_CBM=s.volume,
+            STATUS_CD='CONFIRMED', REQUEST_DTM=s.etd - timedelta(days=5), CONFIRM_DTM=s.etd - timedelta(days=3),
+        ))
+        rows['BL_MASTER_AWB'].append(dict(
+            MAWB_ID=s.sid, MAWB_NO=f"{AWB_PREFIX.get(s.carrier_cd, '999')}-{s.sid % 10 ** 8:08d}",
+            SHIPMENT_ID=s.sid, BOOKING_ID=s.sid, CARRIER_ID=s.carrier_id, FLIGHT_NO=s.flight_no,
+            FLIGHT_DT=s.etd.date(), AIR_SCHEDULE_ID=s.schedule_id, ORIGIN_PORT_CD=s.pol, DEST_PORT_CD=s.pod,
+            ETD_DTM=s.etd, ETA_DTM=s.eta, ATD_DTM=s.atd, ATA_DTM=s.ata,
+            SHIPPER_NM=s.customer[2], CONSIGNEE_NM=s.customer[2], TOTAL_PKG_QTY=s.pkg_qty,
+            GROSS_WEIGHT_KG=s.weight, CHARGEABLE_WEIGHT=chargeable, VOLUME_CBM=s.volume,
+            COMMODITY_DESC=s.commodity, CURRENCY_CD='USD', STATUS_CD=s.status,
+        ))
+        hawb_id = self.ds.child_key(s.i, 0)
+        rows['BL_HOUSE_AWB'].append(dict(
+            HAWB_ID=hawb_id, HAWB_NO=f"GHAWB{hawb_id:012d}", SHIPMENT_ID=s.sid, MAWB_ID=s.sid,
+            CUSTOMER_ID=s.customer_id, CARRIER_ID=s.carrier_id, FLIGHT_NO=s.flight_no,
+            FLIGHT_DT=s.etd.date(), ORIGIN_PORT_CD=s.pol, DEST_PORT_CD=s.pod,
+            ETD_DTM=s.etd, ETA_DTM=s.eta, ATD_DTM=s.atd, ATA_DTM=s.ata,
+            SHIPPER_NM=s.customer[2], SHIPPER_ADDR=s.customer[7],
+            CONSIGNEE_NM=s.customer[2], CONSIGNEE_ADDR=s.customer[7],
+            TOTAL_PKG_QTY=s.pkg_qty, PKG_TYPE_CD='CTN', GROSS_WEIGHT_KG=s.weight,
+            CHARGEABLE_WEIGHT=chargeable, VOLUME_CBM=s.volume, COMMODITY_DESC=s.commodity,
+            HS_CODE=s.hs_code, DECLARED_VALUE=s.value, DECLARED_VALUE_CURR='USD', STATUS_CD=s.status,
+        ))
+        return []
+
+    def tracking(self, s, rows, containers):
+        house_id = self.ds.child_key(s.i, 0)
+        for k, (code, name, when, location, _) in enumerate(s.events):
+            rows['SHP_TRACKING_EVENT'].append(dict(
+                TRACKING_ID=self.ds.child_key(s.i, k), SHIPMENT_ID=s.sid,
+                MBL_ID=s.sid if s.sea else None, HBL_ID=house_id if s.sea else None,
+                MAWB_ID=None if s.sea else s.sid, HAWB_ID=None if s.sea else house_id,
+                CONTAINER_ID=containers[0][0] if containers and code in ('GIN', 'LOD', 'DIS', 'GOT') else None,
+                EVENT_CD=code, EVENT_NM=name, EVENT_DTM=when, LOCATION_CD=location,
+                LOCATION_NM=PORT_NAME[location], COUNTRY_CD=PORT_COUNTRY[location],
+                VESSEL_FLIGHT=s.vessel if s.sea else s.flight_no, VOYAGE_NO=s.voyage_no if s.sea else None,
+                SOURCE_CD='EDI', IS_EXCEPTION='N',
+            ))
+
+    def inland_transport(self, s, rows, containers):
+        """Pickup truck for exports, delivery truck for imports, plus terminal container moves"""
+        ds = self.ds
+        port = s.pol if s.export else s.pod
+        day = (s.etd - timedelta(days=2)) if s.export else (s.eta + timedelta(days=2))
+        done = day <= ds.anchor
+        rows['TRN_TRANSPORT_ORDER'].append(dict(
+            TRN_ORDER_ID=f"GT{s.sid:012d}", SHIPMENT_ID=s.sid,
+            TRANSPORT_TYPE='PICKUP' if s.export else 'DELIVERY', TRANSPORT_MODE='TRUCK',
+            TRUCKER_ID=self.truckers[s.i % len(self.truckers)],
+            VEHICLE_NO=f"{s.i % 90 + 10}가{s.i % 9000 + 1000}",
+            PICKUP_ADDR=s.customer[7] if s.export else PORT_NAME[port], PICKUP_DATE=day.date(),
+            DELIVERY_ADDR=PORT_NAME[port] if s.export else s.customer[7], DELIVERY_DATE=day.date(),
+            STATUS='COMPLETED' if done else 'PLANNED',
+        ))
+
+        moves = []
+        if s.atd:
+            moves += [('GATE_IN', 'CY', s.pol, s.etd - timedelta(days=2)), ('LOAD', 'PORT', s.pol, s.etd)]
+        if s.ata:
+            moves += [('DISCHARGE', 'PORT', s.pod, s.eta + timedelta(hours=6))]
+            if s.eta + timedelta(days=2) <= ds.anchor:
+                moves += [('GATE_OUT', 'CY', s.pod, s.eta + timedelta(days=2))]
+        for container_id, cntr_no, seal_no in containers:
+            for m, (move, location_type, location, when) in enumerate(moves):
+                rows['TRN_CONTAINER_MOVEMENT'].append(dict(
+                    MOVEMENT_ID=f"GM{container_id:012d}{m}", CONTAINER_NO=cntr_no, SHIPMENT_ID=s.sid,
+                    MOVEMENT_TYPE=move, LOCATION_TYPE=location_type, LOCATION_CODE=location,
+                    LOCATION_NAME=PORT_NAME[location], MOVEMENT_DATE=when.date(), MOVEMENT_TIME=when.time(),
+                    SEAL_NO=seal_no, DAMAGE_YN='N',
+                ))
+
+    def customs(self, s, rows):
+        """Export declaration before departure, import declaration on arrival"""
+        ds = self.ds
+        filed = (s.etd - timedelta(days=3)) if s.export else s.eta
+        if filed > ds.anchor:
+            return
+        cleared = filed + timedelta(days=1) <= ds.anchor
+        lines = s.rng.randint(1, 3)
+        vat_rate = 0.0 if s.export else 10.0
+        duty = 0.0 if s.export else round(s.value * float(s.duty_rate) / 100, 2)
+        vat = round((s.value + duty) * vat_rate / 100, 2)
+        declaration_id = f"GD{s.sid:012d}"
+        rows['CUS_DECLARATION'].append(dict(
+            DECLARATION_ID=declaration_id, SHIPMENT_ID=s.sid,
+            DECLARATION_NO=f"{filed:%Y%m%d}-{s.sid % 10 ** 6:06d}",
+            DECLARATION_TYPE='EXPORT' if s.export else 'IMPORT', DECLARATION_DATE=filed.date(),
+            CUSTOMS_BROKER_ID=self.brokers[s.i % len(self.brokers)], IMPORTER_EXPORTER=s.customer[2],
+            IMPORTER_EXPORTER_BRN=s.customer[4], HS_CODE=s.hs_code, GOODS_DESC=s.commodity,
+            COUNTRY_ORIGIN=PORT_COUNTRY[s.pol], PACKAGE_QTY=s.pkg_qty, GROSS_WEIGHT=s.weight,
+            DECLARED_VALUE=s.value, CURRENCY='USD', DUTY_AMOUNT=duty, VAT_AMOUNT=vat, TOTAL_TAX=duty + vat,
+            STATUS='CLEARED' if cleared else 'SUBMITTED',
+            CLEARANCE_DATE=(filed + timedelta(days=1)).date() if cleared else None,
+            RELEASE_DATE=(filed + timedelta(days=1)).date() if cleared else None,
+        ))
+        for k in range(lines):
+            amount = round(s.value / lines, 2)
+            rows['CUS_DECLARATION_ITEM'].append(dict(
+                ITEM_ID=f"GI{s.sid:012d}{k}", DECLARATION_ID=declaration_id, LINE_NO=k + 1,
+                HS_CODE=s.hs_code, GOODS_DESC=s.commodity, COUNTRY_ORIGIN=PORT_COUNTRY[s.pol],
+                QUANTITY=s.pkg_qty, UNIT='EA', UNIT_PRICE=round(amount / s.pkg_qty, 4), AMOUNT=amount,
+                CURRENCY='USD', DUTY_RATE=0 if s.export else s.duty_rate, DUTY_AMOUNT=round(duty / lines, 2),
+                VAT_RATE=vat_rate, VAT_AMOUNT=round(vat / lines, 2),
+            ))
+
+    def billing(self, s, rows, containers):
+        """Selling charges for every shipment; departed shipments are invoiced"""
+        invoice_id = f"GV{s.sid:012d}" if s.atd else None
+        subtotal = tax_total = 0.0
+        details = []
+        for k, (code, name, unit, price, currency) in enumerate(SEA_CHARGES if s.sea else AIR_CHARGES):
+            qty = {'CNTR': len(containers), 'KG': s.weight}.get(unit, 1)
+            amount = round(qty * price, 2)
+            local = round(amount * KRW_RATE[currency], 2)
+            tax = round(local * 0.1, 2) if currency == 'KRW' else 0.0
+            charge_id = f"GR{s.sid:012d}{k}"
+            rows['BIL_CHARGE'].append(dict(
+                CHARGE_ID=charge_id, SHIPMENT_ID=s.sid, CHARGE_TYPE='AR', CHARGE_CODE=code, CHARGE_NAME=name,
+                CUSTOMER_ID=s.customer_id, QUANTITY=qty, UNIT_TYPE=unit, UNIT_PRICE=price, AMOUNT=amount,
+                CURRENCY=currency, EXCHANGE_RATE=KRW_RATE[currency], LOCAL_AMOUNT=local,
+                TAX_YN='Y' if tax else 'N', TAX_RATE=10.0 if tax else 0.0, TAX_AMOUNT=tax,
+                TOTAL_AMOUNT=local + tax, INVOICE_ID=invoice_id,
+                STATUS='INVOICED' if invoice_id else 'PENDING', AUTO_RATED_YN='Y',
+            ))
+            subtotal += local
+            tax_total += tax
+            details.append((k, charge_id, name, qty, price, local, tax))
+
+        if not invoice_id:
+            return
+        total = round(subtotal + tax_total, 2)
+        paid = total if s.status == 'DELIVERED' else 0.0
+        rows['BIL_INVOICE'].append(dict(
+            INVOICE_ID=invoice_id, INVOICE_NO=f"INV-G{s.sid:012d}", INVOICE_TYPE='AR',
+            INVOICE_DATE=s.atd.date(), DUE_DATE=(s.atd + timedelta(days=30)).date(),
+            CUSTOMER_ID=s.customer_id, CUSTOMER_NAME=s.customer[2], BILL_TO_ADDR=s.customer[7],
+            SUBTOTAL=round(subtotal, 2), TAX_AMOUNT=round(tax_total, 2), TOTAL_AMOUNT=total, CURRENCY='KRW',
+            PAID_AMOUNT=paid, BALANCE=round(total - paid, 2), STATUS='PAID' if paid else 'ISSUED',
+            ISSUED_DATE=s.atd.date(), ISSUED_BY='generator',
+        ))
+        for k, charge_id, name, qty, price, local, tax in details:
+            rows['BIL_INVOICE_DETAIL'].append(dict(
+                DETAIL_ID=f"GL{s.sid:012d}{k}", INVOICE_ID=invoice_id, LINE_NO=k + 1, CHARGE_ID=charge_id,
+                SHIPMENT_ID=s.sid, DESCRIPTION=name, QUANTITY=qty, UNIT_PRICE=price, AMOUNT=local,
+                TAX_AMOUNT=tax, TOTAL_AMOUNT=local + tax,
+            ))
+
+    def batches(self, start, stop, size):
+        """Yield table -> rows for shipments [start, stop) in chunks of size shipments"""
+        for chunk in range(start, stop, size):
+            rows = defaultdict(list)
+            for i in range(chunk, min(chunk + size, stop)):
+                self.shipment_rows(i, rows)
+            yield min(chunk + size, stop) - chunk, rows
+
+
+def load_masters(conn, model, dataset, mode=DEFAULT_MODE):
+    """Reference masters, customers and schedules; returns the SyntheticData for the shipment rows"""
+    print("\n=== 01. Master Tables ===")
+    BulkLoader(conn, model, 'insert', ignore=True).write(stamp(reference_rows(), dataset.start))
+    with conn.cursor() as cursor:
+        data = SyntheticData(dataset, load_reference_ids(cursor))
+
+    writer = BulkLoader(conn, model, mode)
+    writer.write(data.customer_rows())
+    print(f"  [OK] MST_CUSTOMER ({dataset.customers:,} customers)")
+
+    print("\n=== 02. Schedule Tables ===")
+    writer.write(data.schedule_rows())
+    print(f"  [OK] SCH_OCEAN_SCHEDULE ({dataset.voyages:,}), SCH_AIR_SCHEDULE ({dataset.flights:,})")
+    return data
+
+
+def print_counts(model, counts, warnings=None):
+    warnings = warnings or {}
+    print("\n" + "=" * 60)
+    for table in model.tables:
+        if counts.get(table) or warnings.get(table):
+            skipped = f"  ({warnings[table]:,} warnings)" if warnings.get(table) else ''
+            print(f"  {table:<32} {counts.get(table, 0):>12,}{skipped}")
+    print(f"Total: {sum(counts.values()):,} rows")
+    print("=" * 60)
+
+
+def print_checksums(conn, tables):
+    """CHECKSUM TABLE of the loaded tables; equal output across runs means identical content"""
+    print("\n=== Checksums ===")
+    with conn.cursor() as cursor:
+        cursor.execute(f"CHECKSUM TABLE {', '.join(tables)} EXTENDED")
+        for table, checksum in cursor.fetchall():
+            print(f"  {table:<40} {checksum}")
+
+
+def generate(shipments, batch=DEFAULT_BATCH, id_base=DEFAULT_ID_BASE, seed=DEFAULT_SEED, mode=DEFAULT_MODE,
+             anchor=None, checksum=False):
+    dataset = Dataset(shipments, id_base, seed, anchor)
+    model = SchemaModel.from_create_scripts()
+    conn = get_connection(local_infile=mode == 'infile')
+    try:
+        data = load_masters(conn, model, dataset, mode)
+
+        print("\n=== 03 ~ 08. Shipments ===")
+        writer = BulkLoader(conn, model, mode)
+        started = time.perf_counter()
+        done = 0
+        for count, rows in data.batches(0, shipments, batch):
+            writer.write(rows)
+            done += count
+            elapsed = time.perf_counter() - started
+            rows_per_sec = sum(writer.counts.values()) / elapsed
+            print(f"    {done:,} / {shipments:,} shipments ({rows_per_sec:,.0f} rows/s)", end='\r')
+        print()
+        if checksum:
+            print_checksums(conn, [t for t in model.tables if t.startswith(('MST_', 'SCH_')) or t in writer.counts])
+    finally:
+        conn.close()
+
+    print_counts(model, writer.counts, writer.warnings)
+    print(f"Keys: {id_base:,} ~ {id_base + shipments * CHILD_STRIDE:,}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic FMS data")
+    parser.add_argument('--shipments', type=int, default=MIN_SHIPMENTS,
+                        help=f'{MIN_SHIPMENTS:,} ~ {MAX_SHIPMENTS:,}')
+    parser.add_argument('--batch', type=int, default=DEFAULT_BATCH, help='shipments per commit')
+    parser.add_argument('--id-base', type=int, default=DEFAULT_ID_BASE, help='first generated key')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    parser.add_argument('--anchor', type=datetime.fromisoformat, default=DEFAULT_ANCHOR,
+                        help=f'date the data is "as of" (default {DEFAULT_ANCHOR:%Y-%m-%d})')
+    parser.add_argument('--mode', choices=MODES, default=DEFAULT_MODE,
+                        help='insert: multi-row INSERT, infile: LOAD DATA LOCAL INFILE')
+    parser.add_argument('--checksum', action='store_true', help='print CHECKSUM TABLE of the loaded tables')
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print(f"FMS Synthetic Data Generator ({args.shipments:,} shipments, {args.mode})")
+    print("=" * 60)
+
+    try:
+        generate(args.shipments, args.batch, args.id_base, args.seed, args.mode, args.anchor, args.checksum)
+    except Exception as e:
+        print(f"\nError: {e}")
+
+
+if __name__ == "__main__":
+    main()
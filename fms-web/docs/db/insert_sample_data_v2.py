@@ -3,11 +3,14 @@
 """
 FMS Database Sample Data Insertion Script v2
 - Adapted for actual table structure
+- Code -> key lookups through one shared key_cache.KeyCache (each table read at most once)
 """
 
 import pymysql
 from datetime import datetime, timedelta
 
+from key_cache import KeyCache
+
 DB_CONFIG = {
     'host': '211.236.174.220',
     'port': 53306,
@@ -109,12 +112,14 @@ def insert_master_data(cursor):
         ('CNY', 'KRW', today, 185.00, 186.00, 184.00),
         ('HKD', 'KRW', today, 173.00, 174.00, 172.00)
     ]
-    for r in rates:
-        cursor.execute("""
-            INSERT INTO MST_EXCHANGE_RATE (BASE_CURRENCY_CD, QUOTE_CURRENCY_CD, RATE_DT, RATE, SELL_RATE, BUY_RATE, USE_YN)
-            VALUES (%s, %s, %s, %s, %s, %s, 'Y')
-            ON DUPLICATE KEY UPDATE RATE=VALUES(RATE)
-        """, r)
+    # Mid, sell and buy rates are separate rows (RATE_TYPE_CD is part of the unique key)
+    for base, target, day, *values in rates:
+        for rate_type, rate in zip(('MID', 'SELL', 'BUY'), values):
+            cursor.execute("""
+                INSERT INTO MST_EXCHANGE_RATE (BASE_CURRENCY_CD, TARGET_CURRENCY_CD, RATE_DT, RATE_TYPE_CD, EXCHANGE_RATE)
+                VALUES (%s, %s, %s, %s, %s)
+                ON DUPLICATE KEY UPDATE EXCHANGE_RATE=VALUES(EXCHANGE_RATE)
+            """, (base, target, day, rate_type, rate))
     print("  [OK] MST_EXCHANGE_RATE")
 
     # MST_CARRIER
@@ -195,10 +200,10 @@ def insert_master_data(cursor):
     ]
     for b in brokers:
         cursor.execute("""
-            INSERT INTO MST_CUSTOMS_BROKER (BROKER_CD, BROKER_NM, BROKER_NM_EN, BIZ_REG_NO, ADDR, TEL_NO, EMAIL, USE_YN)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, 'Y')
+            INSERT INTO MST_CUSTOMS_BROKER (BROKER_CD, BROKER_NM, BIZ_REG_NO, ADDR, TEL_NO, EMAIL, COUNTRY_CD, USE_YN)
+            VALUES (%s, %s, %s, %s, %s, %s, 'KR', 'Y')
             ON DUPLICATE KEY UPDATE BROKER_NM=VALUES(BROKER_NM)
-        """, b)
+        """, (b[0], b[1], *b[3:]))
     print("  [OK] MST_CUSTOMS_BROKER")
 
     # MST_HS_CODE
@@ -214,9 +219,9 @@ def insert_master_data(cursor):
     ]
     for h in hs_codes:
         cursor.execute("""
-            INSERT INTO MST_HS_CODE (HS_CD, DESCRIPTION_EN, DESCRIPTION_KR, DUTY_RATE, USE_YN)
+            INSERT INTO MST_HS_CODE (HS_CODE, HS_CODE_NM_EN, HS_CODE_NM, TARIFF_RATE, USE_YN)
             VALUES (%s, %s, %s, %s, 'Y')
-            ON DUPLICATE KEY UPDATE DESCRIPTION_EN=VALUES(DESCRIPTION_EN)
+            ON DUPLICATE KEY UPDATE HS_CODE_NM_EN=VALUES(HS_CODE_NM_EN)
         """, h)
     print("  [OK] MST_HS_CODE")
 
@@ -290,7 +295,7 @@ def insert_master_data(cursor):
     print("  [OK] MST_USER")
 
 
-def insert_schedule_data(cursor):
+def insert_schedule_data(cursor, keys):
     """02. Schedule Tables Sample Data"""
     print("\n=== 02. Schedule Tables ===")
 
@@ -298,16 +303,17 @@ def insert_schedule_data(cursor):
 
     # SCH_VOYAGE
     voyages = [
-        ('VOY20260101', 'HDMU', 'HYUNDAI SINGAPORE', 'V.001E', today.strftime('%Y-%m-%d'), (today + timedelta(days=14)).strftime('%Y-%m-%d'), 'KRPUS', 'USLAX', 'ACTIVE'),
-        ('VOY20260102', 'MAEU', 'MAERSK SEALAND', 'V.002W', today.strftime('%Y-%m-%d'), (today + timedelta(days=21)).strftime('%Y-%m-%d'), 'KRPUS', 'NLRTM', 'ACTIVE'),
-        ('VOY20260103', 'COSU', 'COSCO SHIPPING', 'V.003E', (today + timedelta(days=3)).strftime('%Y-%m-%d'), (today + timedelta(days=10)).strftime('%Y-%m-%d'), 'CNSHA', 'KRPUS', 'ACTIVE')
+        ('HDMU', 'HYUNDAI SINGAPORE', 'V.001E', 'KRPUS-USLAX', 'E', 'ACTIVE'),
+        ('MAEU', 'MAERSK SEALAND', 'V.002W', 'KRPUS-NLRTM', 'W', 'ACTIVE'),
+        ('COSU', 'COSCO GALAXY', 'V.003E', 'CNSHA-KRPUS', 'E', 'ACTIVE')
     ]
-    for v in voyages:
-        cursor.execute("""
-            INSERT INTO SCH_VOYAGE (VOYAGE_NO, CARRIER_CD, VESSEL_NM, VOYAGE_LEG, DEPARTURE_DT, ARRIVAL_DT, ORIGIN_PORT_CD, DEST_PORT_CD, STATUS_CD)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-            ON DUPLICATE KEY UPDATE VESSEL_NM=VALUES(VESSEL_NM)
-        """, v)
+    for carrier_cd, *voyage in voyages:
+        if keys.get('SCH_VOYAGE', voyage[1]) is None:
+            cursor.execute("""
+                INSERT INTO SCH_VOYAGE (CARRIER_ID, VESSEL_NM, VOYAGE_NO, SERVICE_ROUTE_CD, DIRECTION_CD, STATUS_CD)
+                VALUES (%s, %s, %s, %s, %s, %s)
+            """, (keys.get('MST_CARRIER', carrier_cd), *voyage))
+            keys.inserted('SCH_VOYAGE', voyage[1])
     print("  [OK] SCH_VOYAGE")
 
     # SCH_OCEAN_SCHEDULE
@@ -316,11 +322,15 @@ def insert_schedule_data(cursor):
         ('MAEU', 'MAERSK SEALAND', 'V.002W', 'KRPUS', 'NLRTM', today.strftime('%Y-%m-%d'), (today + timedelta(days=28)).strftime('%Y-%m-%d'), 28, (today - timedelta(days=5)).strftime('%Y-%m-%d'), (today - timedelta(days=2)).strftime('%Y-%m-%d')),
         ('COSU', 'COSCO GALAXY', 'V.003E', 'CNSHA', 'KRPUS', (today + timedelta(days=3)).strftime('%Y-%m-%d'), (today + timedelta(days=6)).strftime('%Y-%m-%d'), 3, (today + timedelta(days=1)).strftime('%Y-%m-%d'), (today + timedelta(days=2)).strftime('%Y-%m-%d'))
     ]
-    for s in ocean_schedules:
-        cursor.execute("""
-            INSERT INTO SCH_OCEAN_SCHEDULE (CARRIER_CD, VESSEL_NM, VOYAGE_NO, POL_PORT_CD, POD_PORT_CD, ETD_DT, ETA_DT, TRANSIT_DAYS, DOC_CUTOFF_DT, CARGO_CUTOFF_DT, USE_YN)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, 'Y')
-        """, s)
+    # Schedules are keyed by voyage; existing ones are kept so reruns do not duplicate them
+    for carrier_cd, vessel_nm, voyage_no, *schedule in ocean_schedules:
+        if keys.get('SCH_OCEAN_SCHEDULE', voyage_no) is None:
+            cursor.execute("""
+                INSERT INTO SCH_OCEAN_SCHEDULE (VOYAGE_ID, CARRIER_ID, VESSEL_NM, VOYAGE_NO, POL_PORT_CD, POD_PORT_CD,
+                    ETD_DTM, ETA_DTM, TRANSIT_DAYS, CUT_OFF_DTM, CARGO_CUT_OFF_DTM)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+            """, (keys.get('SCH_VOYAGE', voyage_no), keys.get('MST_CARRIER', carrier_cd), vessel_nm, voyage_no, *schedule))
+            keys.inserted('SCH_OCEAN_SCHEDULE', voyage_no)
     print("  [OK] SCH_OCEAN_SCHEDULE")
 
     # SCH_AIR_SCHEDULE
@@ -329,11 +339,14 @@ def insert_schedule_data(cursor):
         ('OZ', 'OZ201', 'KRINC', 'CNPVG', today.strftime('%Y-%m-%d %H:%M:%S'), today.strftime('%Y-%m-%d %H:%M:%S')),
         ('CX', 'CX417', 'VKHKG', 'KRINC', (today + timedelta(days=1)).strftime('%Y-%m-%d %H:%M:%S'), (today + timedelta(days=1)).strftime('%Y-%m-%d %H:%M:%S'))
     ]
-    for a in air_schedules:
-        cursor.execute("""
-            INSERT INTO SCH_AIR_SCHEDULE (CARRIER_CD, FLIGHT_NO, ORIGIN_PORT_CD, DEST_PORT_CD, ETD_DTM, ETA_DTM, USE_YN)
-            VALUES (%s, %s, %s, %s, %s, %s, 'Y')
-        """, a)
+    # Flights are keyed by flight number like the ocean schedules by voyage
+    for carrier_cd, flight_no, *schedule in air_schedules:
+        if keys.get('SCH_AIR_SCHEDULE', flight_no) is None:
+            cursor.execute("""
+                INSERT INTO SCH_AIR_SCHEDULE (CARRIER_ID, FLIGHT_NO, ORIGIN_PORT_CD, DEST_PORT_CD, ETD_DTM, ETA_DTM, STATUS_CD)
+                VALUES (%s, %s, %s, %s, %s, %s, 'ACTIVE')
+            """, (keys.get('MST_CARRIER', carrier_cd), flight_no, *schedule))
+            keys.inserted('SCH_AIR_SCHEDULE', flight_no)
     print("  [OK] SCH_AIR_SCHEDULE")
 
     # SCH_MAWB_STOCK
@@ -342,39 +355,29 @@ def insert_schedule_data(cursor):
         ('OZ', '988', '98765430', '98765439', 10, 5, 5),
         ('CX', '160', '11112220', '11112229', 10, 2, 8)
     ]
-    for m in mawb_stocks:
+    # No unique key on the stock table: a range already on file is not added again
+    for carrier_cd, *m in mawb_stocks:
         cursor.execute("""
-            INSERT INTO SCH_MAWB_STOCK (CARRIER_CD, PREFIX, START_NO, END_NO, TOTAL_CNT, USED_CNT, REMAIN_CNT, USE_YN)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, 'Y')
-        """, m)
+            INSERT INTO SCH_MAWB_STOCK (CARRIER_ID, AIRLINE_PREFIX, SERIAL_START, SERIAL_END, TOTAL_QTY, USED_QTY, AVAILABLE_QTY, STATUS_CD)
+            SELECT %s, %s, %s, %s, %s, %s, %s, 'ACTIVE' FROM DUAL
+            WHERE NOT EXISTS (SELECT 1 FROM SCH_MAWB_STOCK WHERE AIRLINE_PREFIX = %s AND SERIAL_START = %s)
+        """, (keys.get('MST_CARRIER', carrier_cd), *m, m[0], m[1]))
     print("  [OK] SCH_MAWB_STOCK")
 
 
-def insert_shipment_data(cursor):
+def insert_shipment_data(cursor, keys):
     """03. Shipment & Related Tables Sample Data"""
     print("\n=== 03. Shipment & Related Tables ===")
 
     today = datetime.now()
 
-    # Get carrier IDs
-    cursor.execute("SELECT CARRIER_ID, CARRIER_CD FROM MST_CARRIER")
-    carrier_map = {row[1]: row[0] for row in cursor.fetchall()}
-
-    # Get customer IDs
-    cursor.execute("SELECT CUSTOMER_ID, CUSTOMER_CD FROM MST_CUSTOMER")
-    customer_map = {row[1]: row[0] for row in cursor.fetchall()}
-
-    # Get schedule IDs
-    cursor.execute("SELECT SCHEDULE_ID FROM SCH_OCEAN_SCHEDULE LIMIT 3")
-    schedule_ids = [row[0] for row in cursor.fetchall()]
-
     # ORD_SHIPMENT - 5 sample shipments
     shipments = [
-        ('SHP20260001', 'SEA', 'EXPORT', 'CY-CY', 'FOB', customer_map.get('CUST001'), customer_map.get('CUST001'), customer_map.get('CUST005'), carrier_map.get('HDMU'), 'KR', 'KRPUS', 'US', 'USLAX', today.strftime('%Y-%m-%d'), (today + timedelta(days=14)).strftime('%Y-%m-%d'), 100, 'CTN', 5000.000, 150.000, 1500000.00, 'USD', 'SHIPPED'),
-        ('SHP20260002', 'SEA', 'EXPORT', 'CFS-CFS', 'CIF', customer_map.get('CUST002'), customer_map.get('CUST002'), customer_map.get('CUST006'), carrier_map.get('MAEU'), 'KR', 'KRPUS', 'DE', 'DEHAM', today.strftime('%Y-%m-%d'), (today + timedelta(days=28)).strftime('%Y-%m-%d'), 200, 'CTN', 8000.000, 400.000, 200000.00, 'USD', 'BOOKED'),
-        ('SHP20260003', 'AIR', 'EXPORT', 'D2D', 'FOB', customer_map.get('CUST003'), customer_map.get('CUST003'), customer_map.get('CUST007'), carrier_map.get('KE'), 'KR', 'KRINC', 'US', 'USLXP', today.strftime('%Y-%m-%d'), (today + timedelta(days=1)).strftime('%Y-%m-%d'), 50, 'PLT', 2500.000, 75.000, 150000.00, 'USD', 'DEPARTED'),
-        ('SHP20260004', 'SEA', 'IMPORT', 'CY-CY', 'CIF', customer_map.get('CUST004'), None, customer_map.get('CUST004'), carrier_map.get('COSU'), 'CN', 'CNSHA', 'KR', 'KRPUS', (today - timedelta(days=3)).strftime('%Y-%m-%d'), today.strftime('%Y-%m-%d'), 500, 'CTN', 2000.000, 50.000, 2500000.00, 'USD', 'ARRIVED'),
-        ('SHP20260005', 'AIR', 'IMPORT', 'D2D', 'DDP', customer_map.get('CUST001'), None, customer_map.get('CUST001'), carrier_map.get('CX'), 'HK', 'VKHKG', 'KR', 'KRINC', (today + timedelta(days=1)).strftime('%Y-%m-%d'), (today + timedelta(days=1)).strftime('%Y-%m-%d'), 10, 'CTN', 500.000, 5.000, 800000.00, 'USD', 'PENDING')
+        ('SHP20260001', 'SEA', 'EXPORT', 'CY-CY', 'FOB', keys.get('MST_CUSTOMER', 'CUST001'), keys.get('MST_CUSTOMER', 'CUST001'), keys.get('MST_CUSTOMER', 'CUST005'), keys.get('MST_CARRIER', 'HDMU'), 'KR', 'KRPUS', 'US', 'USLAX', today.strftime('%Y-%m-%d'), (today + timedelta(days=14)).strftime('%Y-%m-%d'), 100, 'CTN', 5000.000, 150.000, 1500000.00, 'USD', 'SHIPPED'),
+        ('SHP20260002', 'SEA', 'EXPORT', 'CFS-CFS', 'CIF', keys.get('MST_CUSTOMER', 'CUST002'), keys.get('MST_CUSTOMER', 'CUST002'), keys.get('MST_CUSTOMER', 'CUST006'), keys.get('MST_CARRIER', 'MAEU'), 'KR', 'KRPUS', 'DE', 'DEHAM', today.strftime('%Y-%m-%d'), (today + timedelta(days=28)).strftime('%Y-%m-%d'), 200, 'CTN', 8000.000, 400.000, 200000.00, 'USD', 'BOOKED'),
+        ('SHP20260003', 'AIR', 'EXPORT', 'D2D', 'FOB', keys.get('MST_CUSTOMER', 'CUST003'), keys.get('MST_CUSTOMER', 'CUST003'), keys.get('MST_CUSTOMER', 'CUST007'), keys.get('MST_CARRIER', 'KE'), 'KR', 'KRINC', 'US', 'USLXP', today.strftime('%Y-%m-%d'), (today + timedelta(days=1)).strftime('%Y-%m-%d'), 50, 'PLT', 2500.000, 75.000, 150000.00, 'USD', 'DEPARTED'),
+        ('SHP20260004', 'SEA', 'IMPORT', 'CY-CY', 'CIF', keys.get('MST_CUSTOMER', 'CUST004'), None, keys.get('MST_CUSTOMER', 'CUST004'), keys.get('MST_CARRIER', 'COSU'), 'CN', 'CNSHA', 'KR', 'KRPUS', (today - timedelta(days=3)).strftime('%Y-%m-%d'), today.strftime('%Y-%m-%d'), 500, 'CTN', 2000.000, 50.000, 2500000.00, 'USD', 'ARRIVED'),
+        ('SHP20260005', 'AIR', 'IMPORT', 'D2D', 'DDP', keys.get('MST_CUSTOMER', 'CUST001'), None, keys.get('MST_CUSTOMER', 'CUST001'), keys.get('MST_CARRIER', 'CX'), 'HK', 'VKHKG', 'KR', 'KRINC', (today + timedelta(days=1)).strftime('%Y-%m-%d'), (today + timedelta(days=1)).strftime('%Y-%m-%d'), 10, 'CTN', 500.000, 5.000, 800000.00, 'USD', 'PENDING')
     ]
     for s in shipments:
         cursor.execute("""
@@ -384,46 +387,43 @@ def insert_shipment_data(cursor):
                 VOLUME_CBM, DECLARED_VALUE_AMT, DECLARED_VALUE_CURR, STATUS_CD)
             VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
         """, s)
+        keys.inserted('ORD_SHIPMENT', s[0])
     print("  [OK] ORD_SHIPMENT")
 
-    # Get shipment IDs
-    cursor.execute("SELECT SHIPMENT_ID, SHIPMENT_NO FROM ORD_SHIPMENT")
-    shipment_map = {row[1]: row[0] for row in cursor.fetchall()}
-
     # ORD_OCEAN_BOOKING
     bookings = [
-        (shipment_map.get('SHP20260001'), schedule_ids[0] if schedule_ids else None, carrier_map.get('HDMU'), 'HYUNDAI SINGAPORE', 'V.001E', 'KRPUS', 'USLAX', today.strftime('%Y-%m-%d'), (today + timedelta(days=14)).strftime('%Y-%m-%d'), 'CONFIRMED'),
-        (shipment_map.get('SHP20260002'), schedule_ids[1] if len(schedule_ids) > 1 else None, carrier_map.get('MAEU'), 'MAERSK SEALAND', 'V.002W', 'KRPUS', 'NLRTM', today.strftime('%Y-%m-%d'), (today + timedelta(days=28)).strftime('%Y-%m-%d'), 'CONFIRMED')
+        (keys.get('ORD_SHIPMENT', 'SHP20260001'), keys.get('SCH_OCEAN_SCHEDULE', 'V.001E'), keys.get('MST_CARRIER', 'HDMU'), 'HYUNDAI SINGAPORE', 'V.001E', 'KRPUS', 'USLAX', today.strftime('%Y-%m-%d'), (today + timedelta(days=14)).strftime('%Y-%m-%d'), 'CONFIRMED'),
+        (keys.get('ORD_SHIPMENT', 'SHP20260002'), keys.get('SCH_OCEAN_SCHEDULE', 'V.002W'), keys.get('MST_CARRIER', 'MAEU'), 'MAERSK SEALAND', 'V.002W', 'KRPUS', 'NLRTM', today.strftime('%Y-%m-%d'), (today + timedelta(days=28)).strftime('%Y-%m-%d'), 'CONFIRMED')
     ]
+    booking_ids = []
     for b in bookings:
         if b[0]:
+            # One booking per shipment; a rerun updates it and LAST_INSERT_ID() still reports its key
             cursor.execute("""
-                INSERT INTO ORD_OCEAN_BOOKING (SHIPMENT_ID, SCHEDULE_ID, CARRIER_ID, VESSEL_NM, VOYAGE_NO, POL_PORT_CD, POD_PORT_CD, ETD_DT, ETA_DT, STATUS_CD)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """, b)
+                INSERT INTO ORD_OCEAN_BOOKING (BOOKING_NO, SHIPMENT_ID, OCEAN_SCHEDULE_ID, CARRIER_ID, VESSEL_NM, VOYAGE_NO, POL_PORT_CD, POD_PORT_CD, ETD_DT, ETA_DT, STATUS_CD)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                ON DUPLICATE KEY UPDATE BOOKING_ID=LAST_INSERT_ID(BOOKING_ID)
+            """, (f"OBK{b[0]:010d}",) + b)
+            booking_ids.append(cursor.lastrowid)
     print("  [OK] ORD_OCEAN_BOOKING")
 
-    # Get booking IDs
-    cursor.execute("SELECT BOOKING_ID FROM ORD_OCEAN_BOOKING")
-    booking_ids = [row[0] for row in cursor.fetchall()]
-
     # ORD_OCEAN_BOOKING_CNTR
+    # Booked equipment per line; container numbers are assigned on the B/L (BL_CONTAINER)
     containers = [
-        (booking_ids[0] if booking_ids else None, 'HDMU1234567', '40', 'HC', 1, 25000.000, 'SL12345'),
-        (booking_ids[0] if booking_ids else None, 'HDMU2345678', '40', 'HC', 2, 25000.000, 'SL12346')
+        (booking_ids[0] if booking_ids else None, 1, '40', 'HC', 2)
     ]
     for c in containers:
         if c[0]:
             cursor.execute("""
-                INSERT INTO ORD_OCEAN_BOOKING_CNTR (BOOKING_ID, CNTR_NO, CNTR_SIZE_CD, CNTR_TYPE_CD, SEQ_NO, MAX_WEIGHT_KG, SEAL_NO)
-                VALUES (%s, %s, %s, %s, %s, %s, %s)
+                INSERT INTO ORD_OCEAN_BOOKING_CNTR (BOOKING_ID, LINE_NO, CNTR_SIZE_CD, CNTR_TYPE_CD, CNTR_QTY)
+                VALUES (%s, %s, %s, %s, %s)
             """, c)
     print("  [OK] ORD_OCEAN_BOOKING_CNTR")
 
     # BL_MASTER_BL
     mbls = [
-        ('HDMUPUS12345678', shipment_map.get('SHP20260001'), booking_ids[0] if booking_ids else None, carrier_map.get('HDMU'), 'HYUNDAI SINGAPORE', 'V.001E', 'KRPUS', 'USLAX', today.strftime('%Y-%m-%d'), (today + timedelta(days=14)).strftime('%Y-%m-%d'), 'Samsung Electronics', 'ABC Trading Co.', 100, 'CTN', 5000.000, 150.000, 'ORIGINAL', 3, 'RELEASED'),
-        ('MAEULAX98765432', shipment_map.get('SHP20260002'), booking_ids[1] if len(booking_ids) > 1 else None, carrier_map.get('MAEU'), 'MAERSK SEALAND', 'V.002W', 'KRPUS', 'NLRTM', today.strftime('%Y-%m-%d'), (today + timedelta(days=28)).strftime('%Y-%m-%d'), 'LG Electronics', 'XYZ Import GmbH', 200, 'CTN', 8000.000, 400.000, 'ORIGINAL', 3, 'ISSUED')
+        ('HDMUPUS12345678', keys.get('ORD_SHIPMENT', 'SHP20260001'), booking_ids[0] if booking_ids else None, keys.get('MST_CARRIER', 'HDMU'), 'HYUNDAI SINGAPORE', 'V.001E', 'KRPUS', 'USLAX', today.strftime('%Y-%m-%d'), (today + timedelta(days=14)).strftime('%Y-%m-%d'), 'Samsung Electronics', 'ABC Trading Co.', 100, 'CTN', 5000.000, 150.000, 'ORIGINAL', 3, 'RELEASED'),
+        ('MAEULAX98765432', keys.get('ORD_SHIPMENT', 'SHP20260002'), booking_ids[1] if len(booking_ids) > 1 else None, keys.get('MST_CARRIER', 'MAEU'), 'MAERSK SEALAND', 'V.002W', 'KRPUS', 'NLRTM', today.strftime('%Y-%m-%d'), (today + timedelta(days=28)).strftime('%Y-%m-%d'), 'LG Electronics', 'XYZ Import GmbH', 200, 'CTN', 8000.000, 400.000, 'ORIGINAL', 3, 'ISSUED')
     ]
     for m in mbls:
         if m[1]:
@@ -432,91 +432,83 @@ def insert_shipment_data(cursor):
                     ETD_DT, ETA_DT, SHIPPER_NM, CONSIGNEE_NM, TOTAL_PKG_QTY, PKG_TYPE_CD, GROSS_WEIGHT_KG, VOLUME_CBM, BL_TYPE_CD, ORIGINAL_BL_COUNT, STATUS_CD)
                 VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
             """, m)
+            keys.inserted('BL_MASTER_BL', m[0])
     print("  [OK] BL_MASTER_BL")
 
-    # Get MBL IDs
-    cursor.execute("SELECT MBL_ID, MBL_NO FROM BL_MASTER_BL")
-    mbl_map = {row[1]: row[0] for row in cursor.fetchall()}
-
     # BL_HOUSE_BL
     hbls = [
-        ('IGSHBL20260001', mbl_map.get('HDMUPUS12345678'), shipment_map.get('SHP20260001'), 'Samsung Electronics', '서울시 서초구 서초대로', 'ABC Trading Co.', 'Los Angeles, CA', 'Same as Consignee', 'FOB', 'KRPUS', 'USLAX', 'Semiconductor Chips', 100, 'CTN', 5000.000, 150.000, 'ORIGINAL', 3, 'RELEASED'),
-        ('IGSHBL20260002', mbl_map.get('MAEULAX98765432'), shipment_map.get('SHP20260002'), 'LG Electronics', '서울시 영등포구', 'XYZ Import GmbH', 'Hamburg, Germany', 'Same as Consignee', 'CIF', 'KRPUS', 'DEHAM', 'LED TV', 200, 'CTN', 8000.000, 400.000, 'ORIGINAL', 3, 'ISSUED')
+        ('IGSHBL20260001', keys.get('BL_MASTER_BL', 'HDMUPUS12345678'), keys.get('ORD_SHIPMENT', 'SHP20260001'), keys.get('MST_CUSTOMER', 'CUST001'), 'Samsung Electronics', '서울시 서초구 서초대로', 'ABC Trading Co.', 'Los Angeles, CA', 'Same as Consignee', 'COLLECT', 'KRPUS', 'USLAX', 'Semiconductor Chips', 100, 'CTN', 5000.000, 150.000, 'ORIGINAL', 3, 'RELEASED'),
+        ('IGSHBL20260002', keys.get('BL_MASTER_BL', 'MAEULAX98765432'), keys.get('ORD_SHIPMENT', 'SHP20260002'), keys.get('MST_CUSTOMER', 'CUST002'), 'LG Electronics', '서울시 영등포구', 'XYZ Import GmbH', 'Hamburg, Germany', 'Same as Consignee', 'PREPAID', 'KRPUS', 'DEHAM', 'LED TV', 200, 'CTN', 8000.000, 400.000, 'ORIGINAL', 3, 'ISSUED')
     ]
+    # Incoterms stay on ORD_SHIPMENT; the B/L carries the freight term (FOB: collect, CIF: prepaid)
     for h in hbls:
         if h[1]:
             cursor.execute("""
-                INSERT INTO BL_HOUSE_BL (HBL_NO, MBL_ID, SHIPMENT_ID, SHIPPER_NM, SHIPPER_ADDR, CONSIGNEE_NM, CONSIGNEE_ADDR,
-                    NOTIFY_PARTY, INCOTERMS_CD, POL_PORT_CD, POD_PORT_CD, COMMODITY_DESC, TOTAL_PKG_QTY, PKG_TYPE_CD,
+                INSERT INTO BL_HOUSE_BL (HBL_NO, MBL_ID, SHIPMENT_ID, CUSTOMER_ID, SHIPPER_NM, SHIPPER_ADDR, CONSIGNEE_NM, CONSIGNEE_ADDR,
+                    NOTIFY_PARTY, FREIGHT_TERM_CD, POL_PORT_CD, POD_PORT_CD, COMMODITY_DESC, TOTAL_PKG_QTY, PKG_TYPE_CD,
                     GROSS_WEIGHT_KG, VOLUME_CBM, BL_TYPE_CD, ORIGINAL_BL_COUNT, STATUS_CD)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
             """, h)
     print("  [OK] BL_HOUSE_BL")
 
     # BL_CONTAINER
     bl_containers = [
-        (mbl_map.get('HDMUPUS12345678'), 'HDMU1234567', '40', 'HC', 'SL12345', 5000.000, 150.000, 30000.000, 4200.000),
-        (mbl_map.get('HDMUPUS12345678'), 'HDMU2345678', '40', 'HC', 'SL12346', 5000.000, 150.000, 30000.000, 4200.000)
+        (keys.get('BL_MASTER_BL', 'HDMUPUS12345678'), 'HDMU1234567', '40', 'HC', 'SL12345', 5000.000, 150.000, 4200.000),
+        (keys.get('BL_MASTER_BL', 'HDMUPUS12345678'), 'HDMU2345678', '40', 'HC', 'SL12346', 5000.000, 150.000, 4200.000)
     ]
     for c in bl_containers:
         if c[0]:
             cursor.execute("""
-                INSERT INTO BL_CONTAINER (MBL_ID, CNTR_NO, CNTR_SIZE_CD, CNTR_TYPE_CD, SEAL_NO, GROSS_WEIGHT_KG, VOLUME_CBM, MAX_WEIGHT_KG, TARE_WEIGHT_KG)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+                INSERT INTO BL_CONTAINER (MBL_ID, CNTR_NO, CNTR_SIZE_CD, CNTR_TYPE_CD, SEAL_NO, GROSS_WEIGHT_KG, VOLUME_CBM, TARE_WEIGHT_KG)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
             """, c)
     print("  [OK] BL_CONTAINER")
 
     # BL_MASTER_AWB
-    cursor.execute("SELECT SCHEDULE_ID FROM SCH_AIR_SCHEDULE LIMIT 2")
-    air_schedule_ids = [row[0] for row in cursor.fetchall()]
-
     mawbs = [
-        ('180-12345670', shipment_map.get('SHP20260003'), carrier_map.get('KE'), 'KE001', 'KRINC', 'USLXP', today.strftime('%Y-%m-%d'), (today + timedelta(days=1)).strftime('%Y-%m-%d'), 'Hyundai Motor', 'Global Parts Inc.', 2500.000, 75.000, 'DEPARTED')
+        ('180-12345670', keys.get('ORD_SHIPMENT', 'SHP20260003'), keys.get('MST_CARRIER', 'KE'), 'KE001', 'KRINC', 'USLXP', today.strftime('%Y-%m-%d'), (today + timedelta(days=1)).strftime('%Y-%m-%d'), 'Hyundai Motor', 'Global Parts Inc.', 2500.000, 75.000, 'DEPARTED')
     ]
     for m in mawbs:
         if m[1]:
             cursor.execute("""
                 INSERT INTO BL_MASTER_AWB (MAWB_NO, SHIPMENT_ID, CARRIER_ID, FLIGHT_NO, ORIGIN_PORT_CD, DEST_PORT_CD,
-                    ETD_DT, ETA_DT, SHIPPER_NM, CONSIGNEE_NM, GROSS_WEIGHT_KG, VOLUME_CBM, STATUS_CD)
+                    ETD_DTM, ETA_DTM, SHIPPER_NM, CONSIGNEE_NM, GROSS_WEIGHT_KG, VOLUME_CBM, STATUS_CD)
                 VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
             """, m)
+            keys.inserted('BL_MASTER_AWB', m[0])
     print("  [OK] BL_MASTER_AWB")
 
-    # Get MAWB ID
-    cursor.execute("SELECT MAWB_ID FROM BL_MASTER_AWB LIMIT 1")
-    mawb_result = cursor.fetchone()
-    mawb_id = mawb_result[0] if mawb_result else None
+    mawb_id = keys.get('BL_MASTER_AWB', '180-12345670')
 
     # BL_HOUSE_AWB
     if mawb_id:
         cursor.execute("""
-            INSERT INTO BL_HOUSE_AWB (HAWB_NO, MAWB_ID, SHIPMENT_ID, SHIPPER_NM, SHIPPER_ADDR, CONSIGNEE_NM,
-                CONSIGNEE_ADDR, NOTIFY_PARTY, COMMODITY_DESC, TOTAL_PKG_QTY, PKG_TYPE_CD, GROSS_WEIGHT_KG,
-                VOLUME_CBM, DECLARED_VALUE_AMT, DECLARED_VALUE_CURR, STATUS_CD)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        """, ('IGSHAWB20260001', mawb_id, shipment_map.get('SHP20260003'), 'Hyundai Motor', 'Seoul, Korea', 'Global Parts Inc.', 'Chicago, IL', 'Same as Consignee', 'Engine Parts', 50, 'PLT', 2500.000, 75.000, 150000.00, 'USD', 'DEPARTED'))
+            INSERT INTO BL_HOUSE_AWB (HAWB_NO, MAWB_ID, SHIPMENT_ID, CUSTOMER_ID, ORIGIN_PORT_CD, DEST_PORT_CD, SHIPPER_NM,
+                SHIPPER_ADDR, CONSIGNEE_NM, CONSIGNEE_ADDR, NOTIFY_PARTY, COMMODITY_DESC, TOTAL_PKG_QTY, PKG_TYPE_CD,
+                GROSS_WEIGHT_KG, VOLUME_CBM, DECLARED_VALUE, DECLARED_VALUE_CURR, STATUS_CD)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+        """, ('IGSHAWB20260001', mawb_id, keys.get('ORD_SHIPMENT', 'SHP20260003'), keys.get('MST_CUSTOMER', 'CUST003'), 'KRINC', 'USLXP', 'Hyundai Motor', 'Seoul, Korea', 'Global Parts Inc.', 'Chicago, IL', 'Same as Consignee', 'Engine Parts', 50, 'PLT', 2500.000, 75.000, 150000.00, 'USD', 'DEPARTED'))
         print("  [OK] BL_HOUSE_AWB")
 
     # SHP_TRACKING_EVENT
     events = [
-        (shipment_map.get('SHP20260001'), (today - timedelta(days=2)).strftime('%Y-%m-%d %H:%M:%S'), 'BKD', 'Booking Confirmed', 'KRPUS', None),
-        (shipment_map.get('SHP20260001'), (today - timedelta(days=1)).strftime('%Y-%m-%d %H:%M:%S'), 'GIN', 'Gate In at Terminal', 'KRPUS', 'HDMU1234567'),
-        (shipment_map.get('SHP20260001'), today.strftime('%Y-%m-%d %H:%M:%S'), 'DEP', 'Vessel Departed', 'KRPUS', None),
-        (shipment_map.get('SHP20260003'), today.strftime('%Y-%m-%d %H:%M:%S'), 'DEP', 'Flight Departed', 'KRINC', None),
-        (shipment_map.get('SHP20260004'), today.strftime('%Y-%m-%d %H:%M:%S'), 'ARR', 'Vessel Arrived', 'KRPUS', None)
+        (keys.get('ORD_SHIPMENT', 'SHP20260001'), (today - timedelta(days=2)).strftime('%Y-%m-%d %H:%M:%S'), 'BKD', 'Booking Confirmed', 'KRPUS', None),
+        (keys.get('ORD_SHIPMENT', 'SHP20260001'), (today - timedelta(days=1)).strftime('%Y-%m-%d %H:%M:%S'), 'GIN', 'Gate In at Terminal', 'KRPUS', 'HDMU1234567'),
+        (keys.get('ORD_SHIPMENT', 'SHP20260001'), today.strftime('%Y-%m-%d %H:%M:%S'), 'DEP', 'Vessel Departed', 'KRPUS', None),
+        (keys.get('ORD_SHIPMENT', 'SHP20260003'), today.strftime('%Y-%m-%d %H:%M:%S'), 'DEP', 'Flight Departed', 'KRINC', None),
+        (keys.get('ORD_SHIPMENT', 'SHP20260004'), today.strftime('%Y-%m-%d %H:%M:%S'), 'ARR', 'Vessel Arrived', 'KRPUS', None)
     ]
+    # Container events point at the BL_CONTAINER row of the container number
     for e in events:
         if e[0]:
             cursor.execute("""
-                INSERT INTO SHP_TRACKING_EVENT (SHIPMENT_ID, EVENT_DTM, EVENT_CD, EVENT_DESC, LOCATION_CD, CNTR_NO)
-                VALUES (%s, %s, %s, %s, %s, %s)
+                INSERT INTO SHP_TRACKING_EVENT (SHIPMENT_ID, EVENT_DTM, EVENT_CD, EVENT_NM, LOCATION_CD, CONTAINER_ID)
+                VALUES (%s, %s, %s, %s, %s, (SELECT MAX(CONTAINER_ID) FROM BL_CONTAINER WHERE CNTR_NO = %s))
             """, e)
     print("  [OK] SHP_TRACKING_EVENT")
 
-    return shipment_map, customer_map
-
 
-def insert_billing_data(cursor, shipment_map, customer_map):
+def insert_billing_data(cursor, keys):
     """04. Billing Tables Sample Data"""
     print("\n=== 04. Billing Tables ===")
 
@@ -524,16 +516,18 @@ def insert_billing_data(cursor, shipment_map, customer_map):
 
     # BIL_CONTRACT
     contracts = [
-        (customer_map.get('CUST001'), 'CT-2026-001', 'Samsung Forwarding Contract', 'STANDARD', (today - timedelta(days=180)).strftime('%Y-%m-%d'), (today + timedelta(days=185)).strftime('%Y-%m-%d'), 'Y', 30, 500000000.00, 'KRW', 'ACTIVE'),
-        (customer_map.get('CUST002'), 'CT-2026-002', 'LG Logistics Contract', 'STANDARD', (today - timedelta(days=90)).strftime('%Y-%m-%d'), (today + timedelta(days=275)).strftime('%Y-%m-%d'), 'Y', 45, 300000000.00, 'KRW', 'ACTIVE')
+        (keys.get('MST_CUSTOMER', 'CUST001'), 'CT-2026-001', 'Samsung Forwarding Contract', 'STANDARD', (today - timedelta(days=180)).strftime('%Y-%m-%d'), (today + timedelta(days=185)).strftime('%Y-%m-%d'), 'Y', 30, 500000000.00, 'KRW', 'ACTIVE'),
+        (keys.get('MST_CUSTOMER', 'CUST002'), 'CT-2026-002', 'LG Logistics Contract', 'STANDARD', (today - timedelta(days=90)).strftime('%Y-%m-%d'), (today + timedelta(days=275)).strftime('%Y-%m-%d'), 'Y', 45, 300000000.00, 'KRW', 'ACTIVE')
     ]
+    # Billing tables have VARCHAR keys without a generator: the sample rows use their document numbers
     for c in contracts:
         if c[0]:
             cursor.execute("""
-                INSERT INTO BIL_CONTRACT (CUSTOMER_ID, CONTRACT_NO, CONTRACT_NM, CONTRACT_TYPE_CD, START_DT, END_DT,
-                    AUTO_RENEW_YN, PAYMENT_TERM_DAYS, CREDIT_LIMIT_AMT, CURRENCY_CD, STATUS_CD)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """, c)
+                INSERT INTO BIL_CONTRACT (CONTRACT_ID, CUSTOMER_ID, CONTRACT_NO, CONTRACT_NAME, CONTRACT_TYPE, START_DATE, END_DATE,
+                    AUTO_RENEW_YN, PAYMENT_TERM, CREDIT_LIMIT, CURRENCY, STATUS)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                ON DUPLICATE KEY UPDATE STATUS=VALUES(STATUS)
+            """, (c[1],) + c)
     print("  [OK] BIL_CONTRACT")
 
     # BIL_TARIFF
@@ -542,51 +536,54 @@ def insert_billing_data(cursor, shipment_map, customer_map):
         (None, 'SEA', 'EXPORT', 'THC', 'Terminal Handling', 'PER_UNIT', 'CNTR', 150000.0000, 'KRW', 150000.00, None, 'KRPUS', None, None, '40HC', (today - timedelta(days=90)).strftime('%Y-%m-%d'), (today + timedelta(days=275)).strftime('%Y-%m-%d')),
         (None, 'AIR', 'EXPORT', 'AFR', 'Air Freight', 'PER_UNIT', 'KG', 5.5000, 'USD', 100.00, None, 'KRINC', 'USLXP', 'KE', None, (today - timedelta(days=90)).strftime('%Y-%m-%d'), (today + timedelta(days=275)).strftime('%Y-%m-%d'))
     ]
-    for t in tariffs:
+    for n, t in enumerate(tariffs, 1):
         cursor.execute("""
-            INSERT INTO BIL_TARIFF (CONTRACT_ID, TARIFF_TYPE_CD, SERVICE_TYPE_CD, CHARGE_CD, CHARGE_NM,
-                CALCULATION_TYPE_CD, UNIT_TYPE_CD, RATE, CURRENCY_CD, MIN_AMT, MAX_AMT, ORIGIN_PORT_CD,
-                DEST_PORT_CD, CARRIER_CD, CNTR_TYPE_CD, EFFECTIVE_FROM_DT, EFFECTIVE_TO_DT, USE_YN)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, 'Y')
-        """, t)
+            INSERT INTO BIL_TARIFF (TARIFF_ID, CONTRACT_ID, TARIFF_TYPE, SERVICE_TYPE, CHARGE_CODE, CHARGE_NAME,
+                CALCULATION_TYPE, UNIT_TYPE, RATE, CURRENCY, MIN_AMOUNT, MAX_AMOUNT, ORIGIN_PORT,
+                DEST_PORT, CARRIER_CODE, CONTAINER_TYPE, EFFECTIVE_FROM, EFFECTIVE_TO, ACTIVE_YN)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, 'Y')
+            ON DUPLICATE KEY UPDATE RATE=VALUES(RATE)
+        """, (f"TRF-2026-{n:03d}",) + t)
     print("  [OK] BIL_TARIFF")
 
     # BIL_CHARGE
     charges = [
-        (shipment_map.get('SHP20260001'), 'AR', 'OFR', 'Ocean Freight', customer_map.get('CUST001'), 2.000, 'CNTR', 1400.0000, 2800.00, 'USD', 1350.000000, 3780000.00, 'N', 0.0000, 0.00, 3780000.00, 'INVOICED', 'Y'),
-        (shipment_map.get('SHP20260001'), 'AR', 'THC', 'Terminal Handling', customer_map.get('CUST001'), 2.000, 'CNTR', 150000.0000, 300000.00, 'KRW', 1.000000, 300000.00, 'Y', 10.0000, 30000.00, 330000.00, 'INVOICED', 'Y')
+        (keys.get('ORD_SHIPMENT', 'SHP20260001'), 'AR', 'OFR', 'Ocean Freight', keys.get('MST_CUSTOMER', 'CUST001'), 2.000, 'CNTR', 1400.0000, 2800.00, 'USD', 1350.000000, 3780000.00, 'N', 0.0000, 0.00, 3780000.00, 'INVOICED', 'Y'),
+        (keys.get('ORD_SHIPMENT', 'SHP20260001'), 'AR', 'THC', 'Terminal Handling', keys.get('MST_CUSTOMER', 'CUST001'), 2.000, 'CNTR', 150000.0000, 300000.00, 'KRW', 1.000000, 300000.00, 'Y', 10.0000, 30000.00, 330000.00, 'INVOICED', 'Y')
     ]
     for c in charges:
         if c[0] and c[4]:
             cursor.execute("""
-                INSERT INTO BIL_CHARGE (SHIPMENT_ID, CHARGE_TYPE_CD, CHARGE_CD, CHARGE_NM, CUSTOMER_ID,
-                    QTY, UNIT_TYPE_CD, UNIT_PRICE, AMT, CURRENCY_CD, EXCHANGE_RATE, LOCAL_AMT,
-                    TAX_YN, TAX_RATE, TAX_AMT, TOTAL_AMT, STATUS_CD, AUTO_RATED_YN)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """, c)
+                INSERT INTO BIL_CHARGE (CHARGE_ID, SHIPMENT_ID, CHARGE_TYPE, CHARGE_CODE, CHARGE_NAME, CUSTOMER_ID,
+                    QUANTITY, UNIT_TYPE, UNIT_PRICE, AMOUNT, CURRENCY, EXCHANGE_RATE, LOCAL_AMOUNT,
+                    TAX_YN, TAX_RATE, TAX_AMOUNT, TOTAL_AMOUNT, STATUS, AUTO_RATED_YN)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                ON DUPLICATE KEY UPDATE STATUS=VALUES(STATUS)
+            """, (f"CHG{c[0]:010d}{c[2]}",) + c)
     print("  [OK] BIL_CHARGE")
 
     # BIL_INVOICE
     invoices = [
-        ('INV-2026-0001', 'AR', today.strftime('%Y-%m-%d'), (today + timedelta(days=30)).strftime('%Y-%m-%d'), customer_map.get('CUST001'), 'Samsung Electronics', '서울시 서초구', 4110000.00, 30000.00, 4140000.00, 'KRW', 0.00, 4140000.00, 'ISSUED', today.strftime('%Y-%m-%d'))
+        ('INV-2026-0001', 'AR', today.strftime('%Y-%m-%d'), (today + timedelta(days=30)).strftime('%Y-%m-%d'), keys.get('MST_CUSTOMER', 'CUST001'), 'Samsung Electronics', '서울시 서초구', 4110000.00, 30000.00, 4140000.00, 'KRW', 0.00, 4140000.00, 'ISSUED', today.strftime('%Y-%m-%d'))
     ]
     for i in invoices:
         if i[4]:
             cursor.execute("""
-                INSERT INTO BIL_INVOICE (INVOICE_NO, INVOICE_TYPE_CD, INVOICE_DT, DUE_DT, CUSTOMER_ID,
-                    CUSTOMER_NM, BILL_TO_ADDR, SUBTOTAL_AMT, TAX_AMT, TOTAL_AMT, CURRENCY_CD,
-                    PAID_AMT, BALANCE_AMT, STATUS_CD, ISSUED_DT)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """, i)
+                INSERT INTO BIL_INVOICE (INVOICE_ID, INVOICE_NO, INVOICE_TYPE, INVOICE_DATE, DUE_DATE, CUSTOMER_ID,
+                    CUSTOMER_NAME, BILL_TO_ADDR, SUBTOTAL, TAX_AMOUNT, TOTAL_AMOUNT, CURRENCY,
+                    PAID_AMOUNT, BALANCE, STATUS, ISSUED_DATE)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                ON DUPLICATE KEY UPDATE STATUS=VALUES(STATUS)
+            """, (i[0],) + i)
     print("  [OK] BIL_INVOICE")
 
     # BIL_PROFIT_ANALYSIS
-    if shipment_map.get('SHP20260001'):
+    if keys.get('ORD_SHIPMENT', 'SHP20260001'):
         cursor.execute("""
-            INSERT INTO BIL_PROFIT_ANALYSIS (SHIPMENT_ID, ANALYSIS_DT, REVENUE_TOTAL_AMT, COST_TOTAL_AMT,
-                GROSS_PROFIT_AMT, PROFIT_MARGIN_RATE, CURRENCY_CD)
+            INSERT INTO BIL_PROFIT_ANALYSIS (SHIPMENT_ID, ANALYSIS_DATE, REVENUE_TOTAL, COST_TOTAL,
+                GROSS_PROFIT, PROFIT_MARGIN, CURRENCY)
             VALUES (%s, %s, %s, %s, %s, %s, %s)
-        """, (shipment_map.get('SHP20260001'), today.strftime('%Y-%m-%d'), 4140000.00, 3600000.00, 540000.00, 13.04, 'KRW'))
+        """, (keys.get('ORD_SHIPMENT', 'SHP20260001'), today.strftime('%Y-%m-%d'), 4140000.00, 3600000.00, 540000.00, 13.04, 'KRW'))
         print("  [OK] BIL_PROFIT_ANALYSIS")
 
 
@@ -597,18 +594,19 @@ def main():
 
     conn = get_connection()
     cursor = conn.cursor()
+    keys = KeyCache(cursor)
 
     try:
         insert_master_data(cursor)
         conn.commit()
 
-        insert_schedule_data(cursor)
+        insert_schedule_data(cursor, keys)
         conn.commit()
 
-        shipment_map, customer_map = insert_shipment_data(cursor)
+        insert_shipment_data(cursor, keys)
         conn.commit()
 
-        insert_billing_data(cursor, shipment_map, customer_map)
+        insert_billing_data(cursor, keys)
         conn.commit()
 
         # Summary
@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+FMS Key Cache
+Business code -> generated key resolution shared by the seeding and ETL
+scripts. Each table is read at most once per run (streamed in chunks); keys
+of rows inserted afterwards are recorded from the insert itself instead of
+re-selecting the table
+"""
+
+import pymysql.cursors
+
+from bulk_load import key_range
+
+# table -> (key column, business code column)
+LOOKUPS = {
+    'MST_CARRIER': ('CARRIER_ID', 'CARRIER_CD'),
+    'MST_CUSTOMER': ('CUSTOMER_ID', 'CUSTOMER_CD'),
+    'MST_TRUCKER': ('TRUCKER_ID', 'TRUCKER_CD'),
+    'MST_CUSTOMS_BROKER': ('BROKER_ID', 'BROKER_CD'),
+    'SCH_VOYAGE': ('VOYAGE_ID', 'VOYAGE_NO'),
+    'SCH_OCEAN_SCHEDULE': ('OCEAN_SCHEDULE_ID', 'VOYAGE_NO'),
+    'SCH_AIR_SCHEDULE': ('AIR_SCHEDULE_ID', 'FLIGHT_NO'),
+    'ORD_SHIPMENT': ('SHIPMENT_ID', 'SHIPMENT_NO'),
+    'BL_MASTER_BL': ('MBL_ID', 'MBL_NO'),
+    'BL_MASTER_AWB': ('MAWB_ID', 'MAWB_NO'),
+}
+FETCH_SIZE = 10_000
+
+
+class KeyCache:
+    """
+    Lazily loaded code -> key dicts for the LOOKUPS tables, bound to one cursor.
+    Codes that are not unique (VOYAGE_NO, FLIGHT_NO) resolve to the first key read.
+    """
+
+    def __init__(self, cursor):
+        self.cursor = cursor
+        self.maps = {}
+        self.loaded = set()
+
+    def map(self, table):
+        """Full code -> key dict of table, read from the database on first use"""
+        if table not in self.loaded:
+            key, code = LOOKUPS[table]
+            keys = self.maps.setdefault(table, {})
+            # Unbuffered cursor: rows are folded into the map as they arrive
+            with self.cursor.connection.cursor(pymysql.cursors.SSCursor) as stream:
+                stream.execute(f"SELECT {code}, {key} FROM {table} ORDER BY {key}")
+                while True:
+                    rows = stream.fetchmany(FETCH_SIZE)
+                    if not rows:
+                        break
+                    for c, k in rows:
+                        if c not in keys:
+                            keys[c] = k
+            self.loaded.add(table)
+        return self.maps[table]
+
+    def get(self, table, code):
+        keys = self.maps.get(table)
+        if keys is not None and code in keys:
+            return keys[code]
+        return self.map(table).get(code)
+
+    def allocate(self, table, codes):
+        """
+        Keys for rows about to be inserted with explicit keys: codes already in the
+        table keep their key (so ON DUPLICATE KEY UPDATE hits the same row), new
+        codes get keys above the current maximum.
+        """
+        keys = self.map(table)
+        new = [c for c in dict.fromkeys(codes) if c not in keys]
+        for code, key in zip(new, key_range(self.cursor, table, LOOKUPS[table][0], len(new))):
+            keys[code] = key
+        return [keys[c] for c in codes]
+
+    def inserted(self, table, code):
+        """Record the AUTO_INCREMENT key of the row the cursor just inserted"""
+        key = self.cursor.lastrowid
+        if not key:
+            # INSERT IGNORE / ON DUPLICATE KEY UPDATE of an existing row reports no new key
+            key_column, code_column = LOOKUPS[table]
+            self.cursor.execute(f"SELECT {key_column} FROM {table} WHERE {code_column} = %s", (code,))
+            row = self.cursor.fetchone()
+            key = row[0] if row else None
+        if key:
+            self.maps.setdefault(table, {})[code] = key
+        return key
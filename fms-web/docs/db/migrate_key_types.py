@@ -0,0 +1,266 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+FMS Key Type Migration Script
+Converts VARCHAR(20) reference columns (SHIPMENT_ID, CUSTOMER_ID, ...) to the
+BIGINT type declared in the schema model through a shadow column, chunked and
+resumable backfill, validation pass and final swap
+"""
+
+import argparse
+import time
+
+import pymysql
+
+from provision_schema import DB_CONFIG
+from schema_model import SchemaModel, LiveSchema, plan, sync
+
+CHECKPOINT_TABLE = 'MIG_KEY_CHECKPOINT'
+SHADOW_SUFFIX = '_NEW'
+DEFAULT_CHUNK = 5000
+
+# Non-numeric legacy values are resolved through the referenced table's business code
+REFERENCE_LOOKUPS = {
+    'SHIPMENT_ID': ('ORD_SHIPMENT', 'SHIPMENT_ID', 'SHIPMENT_NO'),
+    'CUSTOMER_ID': ('MST_CUSTOMER', 'CUSTOMER_ID', 'CUSTOMER_CD'),
+    'TRUCKER_ID': ('MST_TRUCKER', 'TRUCKER_ID', 'TRUCKER_CD'),
+    'CUSTOMS_BROKER_ID': ('MST_CUSTOMS_BROKER', 'BROKER_ID', 'BROKER_CD'),
+}
+
+
+def get_connection():
+    return pymysql.connect(**DB_CONFIG)
+
+
+def ensure_checkpoint_table(cursor):
+    cursor.execute(f"""
+        CREATE TABLE IF NOT EXISTS {CHECKPOINT_TABLE} (
+            TABLE_NAME          VARCHAR(64)     NOT NULL,
+            COLUMN_NAME         VARCHAR(64)     NOT NULL,
+            LAST_PK             VARCHAR(100)    COMMENT '마지막 처리 PK',
+            ROWS_DONE           BIGINT          DEFAULT 0 COMMENT '처리 건수',
+            STATUS_CD           VARCHAR(20)     DEFAULT 'BACKFILL' COMMENT 'BACKFILL/VALIDATED/DONE',
+            UPDATED_DTM         DATETIME        DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+            PRIMARY KEY (TABLE_NAME, COLUMN_NAME)
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='키 타입 마이그레이션 체크포인트'
+    """)
+
+
+def load_checkpoint(cursor, table, column):
+    cursor.execute(f"""
+        SELECT LAST_PK, ROWS_DONE, STATUS_CD FROM {CHECKPOINT_TABLE}
+        WHERE TABLE_NAME = %s AND COLUMN_NAME = %s
+    """, (table, column))
+    row = cursor.fetchone()
+    return row if row else (None, 0, 'BACKFILL')
+
+
+def save_checkpoint(cursor, table, column, last_pk, rows, status='BACKFILL'):
+    cursor.execute(f"""
+        INSERT INTO {CHECKPOINT_TABLE} (TABLE_NAME, COLUMN_NAME, LAST_PK, ROWS_DONE, STATUS_CD)
+        VALUES (%s, %s, %s, %s, %s)
+        ON DUPLICATE KEY UPDATE LAST_PK = VALUES(LAST_PK), ROWS_DONE = ROWS_DONE + VALUES(ROWS_DONE),
+                                STATUS_CD = VALUES(STATUS_CD)
+    """, (table, column, last_pk, rows, status))
+
+
+def find_targets(model, live, tables=None):
+    """(table, column, live_type, model_type) for every pending string -> integer key change"""
+    deferred = []
+    plan(model, live, only=tables, deferred=deferred)
+    return deferred
+
+
+class KeyMigration:
+    """Migrates one table.column through a BIGINT shadow column"""
+
+    def __init__(self, conn, model, table, column, chunk=DEFAULT_CHUNK):
+        self.conn = conn
+        self.table = model.tables[table]
+        self.column = column
+        self.shadow = column + SHADOW_SUFFIX
+        self.chunk = chunk
+        if len(self.table.primary_key) != 1:
+            raise ValueError(f"{table}: single-column primary key required")
+        self.pk = self.table.primary_key[0]
+        self.lookup = REFERENCE_LOOKUPS.get(column)
+        # Backfill must not bump ON UPDATE timestamps of untouched business rows
+        self.keep = [c.name for c in self.table.columns.values() if 'ON UPDATE' in c.definition.upper()]
+
+    @property
+    def name(self):
+        return f"{self.table.name}.{self.column}"
+
+    def add_shadow(self, cursor, live):
+        if self.shadow not in live.columns.get(self.table.name, {}):
+            cursor.execute(f"ALTER TABLE {self.table.name} "
+                           f"ADD COLUMN {self.shadow} BIGINT NULL AFTER {self.column}")
+            print(f"  [OK] {self.name}: shadow column {self.shadow} added")
+
+    def resolved_value(self):
+        """SQL expression giving the BIGINT value of the legacy column"""
+        numeric = f"CAST(t.{self.column} AS UNSIGNED)"
+        if not self.lookup:
+            return f"CASE WHEN t.{self.column} REGEXP '^[0-9]+$' THEN {numeric} END"
+        _, ref_id, _ = self.lookup
+        return f"CASE WHEN t.{self.column} REGEXP '^[0-9]+$' THEN {numeric} ELSE r.{ref_id} END"
+
+    def join_clause(self):
+        if not self.lookup:
+            return ""
+        ref_table, _, ref_code = self.lookup
+        return f"LEFT JOIN {ref_table} r ON r.{ref_code} = t.{self.column}"
+
+    def backfill(self, cursor):
+        """Keyset-chunked backfill, resuming from the checkpoint"""
+        last_pk, done, status = load_checkpoint(cursor, self.table.name, self.column)
+        if status != 'BACKFILL':
+            print(f"  [SKIP] {self.name}: backfill already {status}")
+            return
+        if last_pk is not None:
+            print(f"  [RESUME] {self.name}: from {self.pk} > {last_pk} ({done:,} rows done)")
+
+        keep = "".join(f", t.{c} = t.{c}" for c in self.keep)
+        started = time.perf_counter()
+        rows = 0
+        while True:
+            lower = f"WHERE {self.pk} > %s" if last_pk is not None else ""
+            cursor.execute(f"""
+                SELECT MAX({self.pk}) FROM (
+                    SELECT {self.pk} FROM {self.table.name} {lower} ORDER BY {self.pk} LIMIT %s
+                ) c
+            """, ((last_pk,) if last_pk is not None else ()) + (self.chunk,))
+            upper = cursor.fetchone()[0]
+            if upper is None:
+                break
+
+            bounds = f"t.{self.pk} <= %s" + (f" AND t.{self.pk} > %s" if last_pk is not None else "")
+            cursor.execute(f"""
+                UPDATE {self.table.name} t {self.join_clause()}
+                SET t.{self.shadow} = {self.resolved_value()}{keep}
+                WHERE {bounds}
+            """, (upper,) + ((last_pk,) if last_pk is not None else ()))
+            count = cursor.rowcount
+            save_checkpoint(cursor, self.table.name, self.column, str(upper), count)
+            self.conn.commit()
+
+            rows += count
+            last_pk = upper
+            elapsed = time.perf_counter() - started
+            print(f"    {self.name}: {done + rows:,} rows ({rows / elapsed if elapsed else 0:,.0f} rows/s)", end='\r')
+        print()
+
+    def catch_up(self, cursor):
+        """Fill rows inserted or re-keyed by the application after their chunk was processed"""
+        keep = "".join(f", t.{c} = t.{c}" for c in self.keep)
+        cursor.execute(f"""
+            UPDATE {self.table.name} t {self.join_clause()}
+            SET t.{self.shadow} = {self.resolved_value()}{keep}
+            WHERE t.{self.column} IS NOT NULL
+              AND NOT (t.{self.shadow} <=> {self.resolved_value()})
+        """)
+        self.conn.commit()
+        return cursor.rowcount
+
+    def validate(self, cursor):
+        """Return (total, unresolved, mismatched, orphans)"""
+        cursor.execute(f"""
+            SELECT COUNT(*),
+                   COALESCE(SUM(t.{self.column} IS NOT NULL AND t.{self.shadow} IS NULL), 0),
+                   COALESCE(SUM(t.{self.column} REGEXP '^[0-9]+$'
+                                AND CAST(t.{self.column} AS UNSIGNED) <> t.{self.shadow}), 0)
+            FROM {self.table.name} t
+        """)
+        total, unresolved, mismatched = cursor.fetchone()
+
+        orphans = 0
+        if self.lookup:
+            ref_table, ref_id, _ = self.lookup
+            cursor.execute(f"""
+                SELECT COUNT(*) FROM {self.table.name} t
+                LEFT JOIN {ref_table} r ON r.{ref_id} = t.{self.shadow}
+                WHERE t.{self.shadow} IS NOT NULL AND r.{ref_id} IS NULL
+            """)
+            orphans = cursor.fetchone()[0]
+        return int(total), int(unresolved), int(mismatched), int(orphans)
+
+    def swap(self, cursor):
+        """Replace the VARCHAR column with the backfilled shadow column"""
+        columns = list(self.table.columns)
+        position = columns.index(self.column)
+        after = f" AFTER {columns[position - 1]}" if position else " FIRST"
+        definition = self.table.columns[self.column].definition
+        cursor.execute(f"""
+            ALTER TABLE {self.table.name}
+                DROP COLUMN {self.column},
+                CHANGE COLUMN {self.shadow} {definition}{after}
+        """)
+        save_checkpoint(cursor, self.table.name, self.column, None, 0, 'DONE')
+        self.conn.commit()
+
+
+def migrate(tables=None, chunk=DEFAULT_CHUNK, swap=True, allow_null=False):
+    model = SchemaModel.from_create_scripts()
+    conn = get_connection()
+    cursor = conn.cursor()
+    swapped = set()
+    try:
+        ensure_checkpoint_table(cursor)
+        live = LiveSchema.read(conn)
+        targets = find_targets(model, live, tables)
+        if not targets:
+            print("  No VARCHAR -> BIGINT key columns left to migrate")
+            return
+
+        for table, column, live_type, model_type in targets:
+            migration = KeyMigration(conn, model, table, column, chunk)
+            print(f"\n=== {migration.name}: {live_type} -> {model_type} ===")
+
+            migration.add_shadow(cursor, live)
+            migration.backfill(cursor)
+            caught = migration.catch_up(cursor)
+            if caught:
+                print(f"  [OK] catch-up: {caught:,} rows")
+
+            total, unresolved, mismatched, orphans = migration.validate(cursor)
+            print(f"  rows={total:,} unresolved={unresolved:,} mismatched={mismatched:,} orphans={orphans:,}")
+            if mismatched or (unresolved and not allow_null):
+                print(f"  [FAIL] {migration.name}: validation failed, column left unswapped")
+                continue
+            save_checkpoint(cursor, table, column, None, 0, 'VALIDATED')
+            conn.commit()
+
+            if swap:
+                migration.swap(cursor)
+                swapped.add(table)
+                print(f"  [OK] {migration.name} swapped to {model_type}")
+    finally:
+        cursor.close()
+        conn.close()
+
+    if swapped:
+        # Indexes that covered the dropped VARCHAR column are rebuilt from the model
+        print("\n=== Rebuilding indexes ===")
+        sync(only=swapped)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert VARCHAR reference keys to BIGINT")
+    parser.add_argument('tables', nargs='*', help='limit to these tables')
+    parser.add_argument('--chunk', type=int, default=DEFAULT_CHUNK, help='rows per backfill chunk')
+    parser.add_argument('--no-swap', action='store_true', help='backfill and validate only')
+    parser.add_argument('--allow-null', action='store_true', help='swap even if some values did not resolve')
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("FMS Key Type Migration (VARCHAR -> BIGINT)")
+    print("=" * 60)
+
+    try:
+        migrate({t.upper() for t in args.tables} or None, args.chunk, not args.no_swap, args.allow_null)
+    except Exception as e:
+        print(f"\nError: {e}")
+
+
+if __name__ == "__main__":
+    main()
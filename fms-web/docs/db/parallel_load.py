@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+FMS Parallel Data Loader
+Loads generate_data.py output with several worker processes, each on its own
+connection. Masters and schedules are loaded first by the parent; shipment
+rows are then loaded phase by phase (referenced domains first), every phase
+sharded by shipment key range across the workers
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+
+from bulk_load import BulkLoader, MODES, DEFAULT_MODE
+from generate_data import (
+    MIN_SHIPMENTS, MAX_SHIPMENTS, DEFAULT_BATCH, DEFAULT_SEED, DEFAULT_ID_BASE, DEFAULT_ANCHOR, CHILD_STRIDE,
+    Dataset, get_connection, load_masters, print_counts, print_checksums,
+)
+from schema_model import SchemaModel
+
+DEFAULT_WORKERS = os.cpu_count() or 4
+# Shards per worker; smaller shards even out workers that finish early
+SHARDS_PER_WORKER = 4
+
+# Rows of a phase only reference rows of earlier phases (or of the same shard)
+PHASES = [
+    ("03. Order Tables",),
+    ("04. B/L Tables",),
+    ("05. Shipment Tables", "06. Transport Tables", "07. Customs Tables", "08. Billing Tables"),
+]
+
+_model = None
+
+
+def init_worker():
+    """Parse the create scripts once per worker process"""
+    global _model
+    _model = SchemaModel.from_create_scripts()
+
+
+def load_shard(data, tables, start, stop, batch, mode):
+    """
+    Generate shipments [start, stop) and load the rows of tables only.
+    Returns (pid, counts, seconds).
+    """
+    conn = get_connection(local_infile=mode == 'infile')
+    try:
+        writer = BulkLoader(conn, _model, mode)
+        started = time.perf_counter()
+        for _, rows in data.batches(start, stop, batch):
+            writer.write({t: r for t, r in rows.items() if t in tables})
+        return os.getpid(), writer.counts, time.perf_counter() - started
+    finally:
+        conn.close()
+
+
+def shard_ranges(shipments, shards):
+    size = -(-shipments // shards)
+    return [(start, min(start + size, shipments)) for start in range(0, shipments, size)]
+
+
+def run_phase(pool, data, tables, ranges, batch, mode):
+    """Load one phase over all shards; returns per-table counts"""
+    counts = {}
+    workers = {}
+    started = time.perf_counter()
+    futures = {pool.submit(load_shard, data, tables, start, stop, batch, mode): (start, stop)
+               for start, stop in ranges}
+    for future in as_completed(futures):
+        start, stop = futures[future]
+        pid, shard_counts, seconds = future.result()
+        rows = sum(shard_counts.values())
+        print(f"  [OK] shipments {start:,} ~ {stop:,} (pid {pid}): {rows:,} rows in {seconds:.1f}s")
+        for table, count in shard_counts.items():
+            counts[table] = counts.get(table, 0) + count
+        busy = workers.setdefault(pid, [0, 0.0])
+        busy[0] += rows
+        busy[1] += seconds
+
+    elapsed = time.perf_counter() - started
+    for pid, (rows, seconds) in sorted(workers.items()):
+        print(f"    worker {pid}: {rows:,} rows, {rows / seconds if seconds else 0:,.0f} rows/s")
+    total = sum(counts.values())
+    print(f"    phase: {total:,} rows in {elapsed:.1f}s ({total / elapsed if elapsed else 0:,.0f} rows/s)")
+    return counts
+
+
+def parallel_load(shipments, workers=DEFAULT_WORKERS, batch=DEFAULT_BATCH, id_base=DEFAULT_ID_BASE,
+                  seed=DEFAULT_SEED, mode=DEFAULT_MODE, anchor=None, checksum=False):
+    # Workers receive the parent's Dataset, so they all share one anchor
+    dataset = Dataset(shipments, id_base, seed, anchor)
+    model = SchemaModel.from_create_scripts()
+    conn = get_connection(local_infile=mode == 'infile')
+    try:
+        data = load_masters(conn, model, dataset, mode)
+    finally:
+        conn.close()
+
+    ranges = shard_ranges(shipments, workers * SHARDS_PER_WORKER)
+    counts = {}
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as pool:
+        for domains in PHASES:
+            tables = {t.name for t in model.tables.values() if t.domain in domains}
+            print(f"\n=== {' / '.join(domains)} ({len(ranges)} shards, {workers} workers) ===")
+            counts.update(run_phase(pool, data, tables, ranges, batch, mode))
+    elapsed = time.perf_counter() - started
+
+    if checksum:
+        conn = get_connection()
+        try:
+            print_checksums(conn, [t for t in model.tables if t.startswith(('MST_', 'SCH_')) or t in counts])
+        finally:
+            conn.close()
+    print_counts(model, counts)
+    total = sum(counts.values())
+    print(f"Shipments: {elapsed:.1f}s ({total / elapsed if elapsed else 0:,.0f} rows/s)")
+    print(f"Keys: {id_base:,} ~ {id_base + shipments * CHILD_STRIDE:,}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load synthetic FMS data with parallel workers")
+    parser.add_argument('--shipments', type=int, default=MIN_SHIPMENTS,
+                        help=f'{MIN_SHIPMENTS:,} ~ {MAX_SHIPMENTS:,}')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS, help='worker processes')
+    parser.add_argument('--batch', type=int, default=DEFAULT_BATCH, help='shipments per commit')
+    parser.add_argument('--id-base', type=int, default=DEFAULT_ID_BASE, help='first generated key')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    parser.add_argument('--anchor', type=datetime.fromisoformat, default=DEFAULT_ANCHOR,
+                        help=f'date the data is "as of" (default {DEFAULT_ANCHOR:%Y-%m-%d})')
+    parser.add_argument('--mode', choices=MODES, default=DEFAULT_MODE,
+                        help='insert: multi-row INSERT, infile: LOAD DATA LOCAL INFILE')
+    parser.add_argument('--checksum', action='store_true', help='print CHECKSUM TABLE of the loaded tables')
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print(f"FMS Parallel Data Loader ({args.shipments:,} shipments, {args.workers} workers, {args.mode})")
+    print("=" * 60)
+
+    try:
+        parallel_load(args.shipments, args.workers, args.batch, args.id_base, args.seed, args.mode,
+                      args.anchor, args.checksum)
+    except Exception as e:
+        print(f"\nError: {e}")
+
+
+if __name__ == "__main__":
+    main()
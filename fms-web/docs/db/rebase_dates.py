@@ -0,0 +1,270 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+FMS Date Rebase
+Shifts every DATE / DATETIME / TIMESTAMP column of the schema model by a whole
+number of days, in place, so a seeded demo or benchmark database looks current
+again without a reload. Tables are updated in keyset chunks on their own
+connections; each chunk commits together with its checkpoint, so an
+interrupted run resumes without shifting any row twice
+"""
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, datetime
+
+import pymysql
+
+from provision_schema import DB_CONFIG, DEFAULT_WORKERS
+from schema_model import SchemaModel, LiveSchema, base_type
+
+DATE_TYPES = ('date', 'datetime', 'timestamp')
+CHECKPOINT_TABLE = 'REBASE_DATE_CHECKPOINT'
+DEFAULT_CHUNK = 10_000
+# The data is "as of" the newest shipment: generate_data.py caps CREATED_DTM at its
+# anchor and the sample scripts stamp it at insert time
+REFERENCE = ('ORD_SHIPMENT', 'CREATED_DTM')
+
+
+def get_connection():
+    return pymysql.connect(**DB_CONFIG)
+
+
+def ensure_checkpoint_table(cursor):
+    cursor.execute(f"""
+        CREATE TABLE IF NOT EXISTS {CHECKPOINT_TABLE} (
+            TABLE_NAME          VARCHAR(64)     NOT NULL,
+            DELTA_DAYS          INT             NOT NULL COMMENT '이동 일수',
+            LAST_PK             VARCHAR(100)    COMMENT '마지막 처리 PK',
+            ROWS_DONE           BIGINT          DEFAULT 0 COMMENT '처리 건수',
+            STATUS_CD           VARCHAR(20)     DEFAULT 'RUNNING' COMMENT 'RUNNING/DONE',
+            UPDATED_DTM         DATETIME        DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+            PRIMARY KEY (TABLE_NAME)
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='일자 이동 체크포인트'
+    """)
+
+
+def load_checkpoint(cursor, table):
+    cursor.execute(f"SELECT LAST_PK, ROWS_DONE, STATUS_CD FROM {CHECKPOINT_TABLE} WHERE TABLE_NAME = %s",
+                   (table,))
+    row = cursor.fetchone()
+    return row if row else (None, 0, 'RUNNING')
+
+
+def save_checkpoint(cursor, table, days, last_pk, rows, status='RUNNING'):
+    cursor.execute(f"""
+        INSERT INTO {CHECKPOINT_TABLE} (TABLE_NAME, DELTA_DAYS, LAST_PK, ROWS_DONE, STATUS_CD)
+        VALUES (%s, %s, %s, %s, %s)
+        ON DUPLICATE KEY UPDATE LAST_PK = VALUES(LAST_PK), ROWS_DONE = ROWS_DONE + VALUES(ROWS_DONE),
+                                STATUS_CD = VALUES(STATUS_CD)
+    """, (table, days, last_pk, rows, status))
+
+
+def pending_delta(cursor):
+    """Delta of an interrupted run, or None"""
+    cursor.execute(f"SELECT MIN(DELTA_DAYS), MAX(DELTA_DAYS) FROM {CHECKPOINT_TABLE}")
+    low, high = cursor.fetchone()
+    if low != high:
+        raise ValueError(f"{CHECKPOINT_TABLE} mixes deltas {low} and {high}; clear it by hand")
+    return low
+
+
+def reference_delta(cursor, target):
+    """Days from the newest shipment to target"""
+    table, column = REFERENCE
+    cursor.execute(f"SELECT MAX({column}) FROM {table}")
+    newest = cursor.fetchone()[0]
+    if newest is None:
+        raise ValueError(f"{table} is empty; pass --days or --from")
+    return (target - newest.date()).days
+
+
+class DateRebase:
+    """Shifts the date columns of one table"""
+
+    def __init__(self, table, columns, days, chunk=DEFAULT_CHUNK):
+        self.table = table
+        self.columns = columns
+        self.days = days
+        self.chunk = chunk
+        # Shifted columns are assigned explicitly, which already stops ON UPDATE from firing;
+        # any other ON UPDATE column must be kept as is
+        self.keep = [c.name for c in table.columns.values()
+                     if 'ON UPDATE' in c.definition.upper() and c.name not in columns]
+        # A unique key over a shifted column can collide with a row not shifted yet.
+        # Those tables are updated in one statement, walking away from the direction of the shift.
+        self.unique_dates = list(dict.fromkeys(
+            c for index in table.indexes.values() if index.unique for c in index.columns if c in columns))
+
+    @property
+    def name(self):
+        return self.table.name
+
+    def set_clause(self):
+        shifted = [f"{c} = {c} + INTERVAL {self.days} DAY" for c in self.columns]
+        return ", ".join(shifted + [f"{c} = {c}" for c in self.keep])
+
+    def run(self):
+        """Returns (table, rows, seconds, note)"""
+        conn = get_connection()
+        try:
+            with conn.cursor() as cursor:
+                last_pk, done, status = load_checkpoint(cursor, self.name)
+                if status == 'DONE':
+                    return self.name, 0, 0.0, f"already shifted ({done:,} rows)"
+                started = time.perf_counter()
+                if len(self.table.primary_key) != 1 or self.unique_dates:
+                    rows = self.whole_table(conn, cursor)
+                else:
+                    rows = self.chunked(conn, cursor, last_pk)
+                note = f"resumed after {done:,} rows" if last_pk is not None else ""
+                return self.name, rows, time.perf_counter() - started, note
+        finally:
+            conn.close()
+
+    def whole_table(self, conn, cursor):
+        direction = "DESC" if self.days > 0 else "ASC"
+        order = f" ORDER BY {', '.join(f'{c} {direction}' for c in self.unique_dates)}" if self.unique_dates else ""
+        cursor.execute(f"UPDATE {self.name} SET {self.set_clause()}{order}")
+        rows = cursor.rowcount
+        save_checkpoint(cursor, self.name, self.days, None, rows, 'DONE')
+        conn.commit()
+        return rows
+
+    def chunked(self, conn, cursor, last_pk):
+        """Keyset chunks in primary key order; the checkpoint commits with each chunk"""
+        pk = self.table.primary_key[0]
+        rows = 0
+        while True:
+            lower = f"WHERE {pk} > %s" if last_pk is not None else ""
+            cursor.execute(f"""
+                SELECT MAX({pk}) FROM (
+                    SELECT {pk} FROM {self.name} {lower} ORDER BY {pk} LIMIT %s
+                ) c
+            """, ((last_pk,) if last_pk is not None else ()) + (self.chunk,))
+            upper = cursor.fetchone()[0]
+            if upper is None:
+                break
+
+            bounds = f"{pk} <= %s" + (f" AND {pk} > %s" if last_pk is not None else "")
+            cursor.execute(f"UPDATE {self.name} SET {self.set_clause()} WHERE {bounds}",
+                           (upper,) + ((last_pk,) if last_pk is not None else ()))
+            count = cursor.rowcount
+            save_checkpoint(cursor, self.name, self.days, str(upper), count)
+            conn.commit()
+            rows += count
+            last_pk = upper
+
+        save_checkpoint(cursor, self.name, self.days, None if last_pk is None else str(last_pk), 0, 'DONE')
+        conn.commit()
+        return rows
+
+
+def find_targets(model, live, tables=None):
+    """table -> model date columns that also exist in the live table"""
+    targets = {}
+    for table in model.tables.values():
+        if tables and table.name not in tables:
+            continue
+        present = live.columns.get(table.name)
+        if not present:
+            continue
+        columns = [c.name for c in table.columns.values()
+                   if base_type(c.column_type) in DATE_TYPES and c.name in present]
+        if columns:
+            targets[table.name] = columns
+    return targets
+
+
+def rebase(days=None, target=None, reference=None, tables=None, chunk=DEFAULT_CHUNK,
+           workers=DEFAULT_WORKERS, dry_run=False):
+    model = SchemaModel.from_create_scripts()
+    conn = get_connection()
+    try:
+        live = LiveSchema.read(conn)
+        with conn.cursor() as cursor:
+            ensure_checkpoint_table(cursor)
+            conn.commit()
+            resumed = pending_delta(cursor)
+            if resumed is not None:
+                if days is not None and days != resumed:
+                    print(f"  [SKIP] --days {days}: an interrupted run of {resumed:+d} days is finished first")
+                days = resumed
+                print(f"  [RESUME] {resumed:+d} days ({CHECKPOINT_TABLE})")
+            elif days is None:
+                target = target or date.today()
+                days = (target - reference).days if reference else reference_delta(cursor, target)
+    finally:
+        conn.close()
+
+    targets = find_targets(model, live, tables)
+    print(f"\n=== Rebase {days:+d} days ({len(targets)} tables, "
+          f"{sum(len(c) for c in targets.values())} columns) ===")
+    if days == 0:
+        print("  [SKIP] dates are already current")
+        return
+    jobs = [DateRebase(model.tables[name], columns, days, chunk) for name, columns in targets.items()]
+    if dry_run:
+        for job in jobs:
+            mode = "single statement" if len(job.table.primary_key) != 1 or job.unique_dates else "chunked"
+            print(f"  {job.name:<32} {mode:<17} {', '.join(job.columns)}")
+        return
+
+    started = time.perf_counter()
+    total = 0
+    failed = []
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(job.run): job.name for job in jobs}
+        for future in as_completed(futures):
+            try:
+                table, rows, seconds, note = future.result()
+            except Exception as e:
+                failed.append(futures[future])
+                print(f"  [FAIL] {futures[future]}: {e}")
+                continue
+            total += rows
+            rate = f"{rows / seconds if seconds else 0:,.0f} rows/s"
+            print(f"  [OK] {table:<32} {rows:>12,} rows {seconds:8.1f}s ({rate}){'  ' + note if note else ''}")
+
+    elapsed = time.perf_counter() - started
+    print(f"\nShifted {total:,} rows in {elapsed:.1f}s ({total / elapsed if elapsed else 0:,.0f} rows/s)")
+    if failed:
+        print(f"Re-run to resume {len(failed)} failed tables; finished tables are not shifted again")
+        return
+
+    conn = get_connection()
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {CHECKPOINT_TABLE}")
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Shift every date column of the FMS schema by a number of days")
+    parser.add_argument('tables', nargs='*', help='limit to these tables')
+    parser.add_argument('--days', type=int, help='days to shift (negative moves dates back)')
+    parser.add_argument('--to', type=date.fromisoformat,
+                        help='date the data should be "as of" (default today)')
+    parser.add_argument('--from', dest='reference', type=date.fromisoformat,
+                        help='date the data is "as of" now (default: newest ORD_SHIPMENT.CREATED_DTM)')
+    parser.add_argument('--chunk', type=int, default=DEFAULT_CHUNK, help='rows per UPDATE')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS, help='tables updated in parallel')
+    parser.add_argument('--dry-run', action='store_true', help='print the delta and columns only')
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print(f"FMS Date Rebase ({datetime.now():%Y-%m-%d %H:%M})")
+    print("=" * 60)
+
+    try:
+        rebase(args.days, args.to, args.reference, {t.upper() for t in args.tables} or None,
+               args.chunk, args.workers, args.dry_run)
+    except Exception as e:
+        print(f"\nError: {e}")
+
+
+if __name__ == "__main__":
+    main()
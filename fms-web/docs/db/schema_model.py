@@ -0,0 +1,396 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+FMS Schema Model for MariaDB
+Parses the DDL of the create scripts into tables/columns/indexes, diffs it
+against information_schema and applies only the missing changes
+"""
+
+import argparse
+import re
+import time
+
+import pymysql
+
+from provision_schema import (
+    DB_CONFIG, DEFAULT_WORKERS, DDLExecutor,
+    collect_ddl, build_dependency_graph, break_cycles,
+)
+
+INTEGER_TYPES = ('tinyint', 'smallint', 'mediumint', 'int', 'bigint')
+STRING_TYPES = ('char', 'varchar', 'text', 'tinytext', 'mediumtext', 'longtext')
+INDEX_PREFIXES = ('PRIMARY', 'INDEX', 'KEY', 'UNIQUE', 'FULLTEXT', 'CONSTRAINT')
+
+COLUMN_HEAD_RE = re.compile(r'^`?(\w+)`?\s+(\w+(?:\s*\([^)]*\))?(?:\s+UNSIGNED)?)', re.I)
+COMMENT_RE = re.compile(r"\bCOMMENT\s*=?\s*'((?:[^'\\]|\\.|'')*)'", re.I)
+INDEX_RE = re.compile(
+    r'^(?:CONSTRAINT\s+\w+\s+)?(UNIQUE\s+|FULLTEXT\s+)?(?:INDEX|KEY)\s+`?(\w+)`?\s*\(([^)]*)\)', re.I
+)
+UNIQUE_INLINE_RE = re.compile(r'^UNIQUE\s*\(([^)]*)\)', re.I)
+PRIMARY_RE = re.compile(r'^PRIMARY\s+KEY\s*\(([^)]*)\)', re.I)
+
+
+def normalize_type(column_type):
+    """'BIGINT(20)' -> 'bigint', 'DECIMAL(12, 3)' -> 'decimal(12,3)'"""
+    t = re.sub(r'\s+', ' ', column_type.strip().lower()).replace(', ', ',')
+    base = t.split('(')[0].strip()
+    if base in INTEGER_TYPES:
+        t = re.sub(r'\(\d+\)', '', t)
+    return t.replace(' (', '(')
+
+
+def base_type(column_type):
+    return column_type.split('(')[0].split(' ')[0]
+
+
+def needs_conversion(live_type, model_type):
+    """String -> integer changes rewrite data and are left to migrate_key_types.py"""
+    return base_type(live_type) in STRING_TYPES and base_type(model_type) in INTEGER_TYPES
+
+
+def split_top_level(body):
+    """Split a CREATE TABLE body on commas outside parentheses and quotes"""
+    parts, depth, quote, current = [], 0, None, []
+    for ch in body:
+        if quote:
+            current.append(ch)
+            if ch == quote:
+                quote = None
+            continue
+        if ch in ("'", '"'):
+            quote = ch
+        elif ch == '(':
+            depth += 1
+        elif ch == ')':
+            depth -= 1
+        elif ch == ',' and depth == 0:
+            parts.append(''.join(current).strip())
+            current = []
+            continue
+        current.append(ch)
+    if ''.join(current).strip():
+        parts.append(''.join(current).strip())
+    return parts
+
+
+def matching_paren(sql, start):
+    """Index of the ')' closing the '(' at start, skipping quoted text"""
+    depth, quote = 0, None
+    for i in range(start, len(sql)):
+        ch = sql[i]
+        if quote:
+            if ch == quote:
+                quote = None
+        elif ch in ("'", '"'):
+            quote = ch
+        elif ch == '(':
+            depth += 1
+        elif ch == ')':
+            depth -= 1
+            if depth == 0:
+                return i
+    raise ValueError("Unbalanced parentheses in DDL")
+
+
+def _columns(spec):
+    return [c.strip(' `').upper() for c in spec.split(',') if c.strip()]
+
+
+class Column:
+    def __init__(self, name, column_type, definition, nullable=True, comment=''):
+        self.name = name
+        self.column_type = column_type
+        self.definition = definition
+        self.nullable = nullable
+        self.comment = comment
+
+    def __repr__(self):
+        return f"Column({self.name} {self.column_type})"
+
+
+class Index:
+    def __init__(self, name, columns, unique=False):
+        self.name = name
+        self.columns = columns
+        self.unique = unique
+
+    def ddl(self):
+        kind = 'UNIQUE INDEX' if self.unique else 'INDEX'
+        return f"{kind} {self.name} ({', '.join(self.columns)})"
+
+    def __repr__(self):
+        return f"Index({self.name} {self.columns})"
+
+
+class Table:
+    def __init__(self, name, domain, create_sql):
+        self.name = name
+        self.domain = domain
+        self.create_sql = create_sql
+        self.columns = {}
+        self.indexes = {}
+        self.primary_key = []
+        self.comment = ''
+
+    @classmethod
+    def parse(cls, domain, name, create_sql):
+        table = cls(name, domain, create_sql)
+        body_start = create_sql.index('(')
+        body_end = matching_paren(create_sql, body_start)
+        options = create_sql[body_end + 1:]
+        match = COMMENT_RE.search(options)
+        if match:
+            table.comment = match.group(1)
+
+        for part in split_top_level(create_sql[body_start + 1:body_end]):
+            first_word = re.match(r'`?(\w+)', part).group(1).upper()
+            if first_word in INDEX_PREFIXES and not part.startswith('`'):
+                table._parse_constraint(part)
+            else:
+                table._parse_column(part)
+        return table
+
+    def _parse_constraint(self, part):
+        match = PRIMARY_RE.match(part)
+        if match:
+            self.primary_key = _columns(match.group(1))
+            return
+        match = INDEX_RE.match(part)
+        if match:
+            name = match.group(2).upper()
+            self.indexes[name] = Index(name, _columns(match.group(3)), bool(match.group(1)) and 'UNIQUE' in match.group(1).upper())
+            return
+        match = UNIQUE_INLINE_RE.match(part)
+        if match:
+            columns = _columns(match.group(1))
+            self.indexes[columns[0]] = Index(columns[0], columns, True)
+
+    def _parse_column(self, part):
+        match = COLUMN_HEAD_RE.match(part)
+        name = match.group(1).upper()
+        column_type = normalize_type(match.group(2))
+        upper = part.upper()
+
+        definition = part
+        if re.search(r'\bPRIMARY\s+KEY\b', upper):
+            self.primary_key = [name]
+            definition = re.sub(r'\s+PRIMARY\s+KEY\b', '', definition, flags=re.I)
+            nullable = False
+        elif 'NOT NULL' in upper:
+            nullable = False
+        elif column_type == 'timestamp' and not re.search(r'\bNULL\b', upper):
+            # Implicit TIMESTAMP nullability depends on explicit_defaults_for_timestamp
+            nullable = None
+        else:
+            nullable = True
+        if re.search(r'\bUNIQUE\b', upper):
+            self.indexes[name] = Index(name, [name], True)
+            definition = re.sub(r'\s+UNIQUE\b', '', definition, flags=re.I)
+
+        comment = COMMENT_RE.search(part)
+        self.columns[name] = Column(
+            name, column_type, re.sub(r'\s+', ' ', definition).strip(),
+            nullable, comment.group(1) if comment else ''
+        )
+
+    def create_sql_without_indexes(self):
+        """CREATE statement with columns and primary key only; sync() adds the secondary indexes later"""
+        body_start = self.create_sql.index('(')
+        body_end = matching_paren(self.create_sql, body_start)
+        parts = [c.definition for c in self.columns.values()]
+        if self.primary_key:
+            parts.append(f"PRIMARY KEY ({', '.join(self.primary_key)})")
+        return (self.create_sql[:body_start] + "(\n    " + ",\n    ".join(parts) + "\n)"
+                + self.create_sql[body_end + 1:])
+
+    def __repr__(self):
+        return f"Table({self.name}, {len(self.columns)} columns, {len(self.indexes)} indexes)"
+
+
+class SchemaModel:
+    """All FMS tables, in create-script order"""
+
+    def __init__(self, tables):
+        self.tables = tables
+
+    @classmethod
+    def from_create_scripts(cls):
+        tables = {}
+        for domain, name, sql in collect_ddl():
+            tables[name] = Table.parse(domain, name, sql)
+        return cls(tables)
+
+    def ddl(self):
+        return [(t.domain, t.name, t.create_sql) for t in self.tables.values()]
+
+    def dependency_graph(self):
+        graph = build_dependency_graph(self.ddl())
+        break_cycles(graph, list(self.tables))
+        return graph
+
+
+class LiveSchema:
+    """information_schema snapshot, read with one query per view"""
+
+    def __init__(self, tables, columns, indexes):
+        self.tables = tables      # name -> comment
+        self.columns = columns    # name -> {column: (type, nullable, comment)}
+        self.indexes = indexes    # name -> {index: (columns, unique)}
+
+    @classmethod
+    def read(cls, conn, schema=DB_CONFIG['database']):
+        cursor = conn.cursor()
+
+        cursor.execute("""
+            SELECT TABLE_NAME, TABLE_COMMENT
+            FROM information_schema.TABLES
+            WHERE TABLE_SCHEMA = %s AND TABLE_TYPE = 'BASE TABLE'
+        """, (schema,))
+        tables = {name.upper(): comment or '' for name, comment in cursor.fetchall()}
+
+        cursor.execute("""
+            SELECT TABLE_NAME, COLUMN_NAME, COLUMN_TYPE, IS_NULLABLE, COLUMN_COMMENT
+            FROM information_schema.COLUMNS
+            WHERE TABLE_SCHEMA = %s
+            ORDER BY TABLE_NAME, ORDINAL_POSITION
+        """, (schema,))
+        columns = {}
+        for table, column, column_type, nullable, comment in cursor.fetchall():
+            columns.setdefault(table.upper(), {})[column.upper()] = (
+                normalize_type(column_type), nullable == 'YES', comment or ''
+            )
+
+        cursor.execute("""
+            SELECT TABLE_NAME, INDEX_NAME, NON_UNIQUE, COLUMN_NAME
+            FROM information_schema.STATISTICS
+            WHERE TABLE_SCHEMA = %s
+            ORDER BY TABLE_NAME, INDEX_NAME, SEQ_IN_INDEX
+        """, (schema,))
+        indexes = {}
+        for table, index, non_unique, column in cursor.fetchall():
+            entry = indexes.setdefault(table.upper(), {}).setdefault(index.upper(), ([], not non_unique))
+            entry[0].append(column.upper())
+
+        cursor.close()
+        return cls(tables, columns, indexes)
+
+
+def diff_table(table, live, deferred=None):
+    """
+    Return the statements that bring one live table up to the model.
+    Column type conversions that need a data backfill are appended to
+    deferred as (table, column, live_type, model_type) instead.
+    """
+    if table.name not in live.tables:
+        return [table.create_sql]
+
+    live_columns = live.columns.get(table.name, {})
+    live_indexes = live.indexes.get(table.name, {})
+
+    column_clauses = []
+    previous = None
+    for column in table.columns.values():
+        position = f" AFTER {previous}" if previous else " FIRST"
+        current = live_columns.get(column.name)
+        if current is None:
+            column_clauses.append(f"ADD COLUMN {column.definition}{position}")
+        elif (column.column_type, current[1] if column.nullable is None else column.nullable,
+              column.comment) != current:
+            if needs_conversion(current[0], column.column_type):
+                if deferred is not None:
+                    deferred.append((table.name, column.name, current[0], column.column_type))
+            else:
+                column_clauses.append(f"MODIFY COLUMN {column.definition}")
+        previous = column.name
+    if table.comment != live.tables[table.name]:
+        column_clauses.append("COMMENT = '%s'" % table.comment.replace("'", "''"))
+
+    index_clauses = []
+    for index in table.indexes.values():
+        current = live_indexes.get(index.name)
+        if current is None:
+            index_clauses.append(f"ADD {index.ddl()}")
+        elif current != (index.columns, index.unique):
+            index_clauses.append(f"DROP INDEX {index.name}, ADD {index.ddl()}")
+
+    statements = []
+    if column_clauses:
+        statements.append(f"ALTER TABLE {table.name} " + ", ".join(column_clauses))
+    if index_clauses:
+        # Secondary index builds run online so live traffic is not blocked
+        statements.append(
+            f"ALTER TABLE {table.name} " + ", ".join(index_clauses) + ", ALGORITHM=INPLACE, LOCK=NONE"
+        )
+    return statements
+
+
+def plan(model, live, only=None, domains=None, deferred=None):
+    """table -> list of statements; tables already in sync are omitted"""
+    changes = {}
+    for table in model.tables.values():
+        if only and table.name not in only:
+            continue
+        if domains and table.domain not in domains:
+            continue
+        statements = diff_table(table, live, deferred)
+        if statements:
+            changes[table.name] = statements
+    return changes
+
+
+def sync(only=None, domains=None, workers=DEFAULT_WORKERS, dry_run=False):
+    """Diff the model against the live schema and apply the difference"""
+    model = SchemaModel.from_create_scripts()
+
+    conn = pymysql.connect(**DB_CONFIG)
+    try:
+        live = LiveSchema.read(conn)
+    finally:
+        conn.close()
+
+    deferred = []
+    changes = plan(model, live, only, domains, deferred)
+    for name, column, live_type, model_type in deferred:
+        print(f"  [SKIP] {name}.{column} {live_type} -> {model_type} (run migrate_key_types.py)")
+    if not changes:
+        print("  Schema is up to date")
+        return {}
+
+    for name, statements in changes.items():
+        for sql in statements:
+            label = "CREATE" if sql.lstrip().upper().startswith("CREATE") else "ALTER"
+            print(f"  [{label}] {name}" + ("" if label == "CREATE" else f": {sql[len('ALTER TABLE ' + name) + 1:]}"))
+
+    if dry_run:
+        return changes
+
+    started = time.perf_counter()
+    results = DDLExecutor(workers).run(changes, model.dependency_graph())
+    for name, seconds, error in results:
+        if error is None:
+            print(f"  [OK] {name:<32} {seconds * 1000:8.1f} ms")
+        else:
+            print(f"  [FAIL] {name}: {error}")
+    print(f"\nApplied {len(results)} table changes in {time.perf_counter() - started:.2f}s")
+    return changes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Apply the FMS schema model to the live database")
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS, help='DDL connections')
+    parser.add_argument('--dry-run', action='store_true', help='print the planned statements only')
+    parser.add_argument('tables', nargs='*', help='limit to these tables')
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("FMS Schema Sync")
+    print("=" * 60)
+
+    try:
+        sync({t.upper() for t in args.tables} or None, workers=args.workers, dry_run=args.dry_run)
+    except Exception as e:
+        print(f"\nError: {e}")
+
+
+if __name__ == "__main__":
+    main()
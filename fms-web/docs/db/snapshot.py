@@ -0,0 +1,225 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+FMS Snapshot / Restore
+Dumps the seeded tables, all from one consistent snapshot, to gzip-compressed
+TSV chunks (the LOAD DATA format) and restores them in parallel: tables are
+recreated with their primary key only, every chunk is bulk loaded on its own
+connection, and the secondary indexes are built once at the end by
+schema_model.sync()
+"""
+
+import argparse
+import gzip
+import json
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+
+import pymysql
+import pymysql.cursors
+
+from bulk_load import tsv_value, load_file
+from provision_schema import DB_CONFIG, DEFAULT_WORKERS, DDLExecutor
+from schema_model import SchemaModel, LiveSchema, sync
+
+MANIFEST = 'manifest.json'
+DEFAULT_CHUNK_ROWS = 200_000
+FETCH_SIZE = 10_000
+
+
+def get_connection(local_infile=False):
+    return pymysql.connect(**DB_CONFIG, local_infile=local_infile)
+
+
+# ---------------------------------------------------------------- dump
+
+def dump_table(conn, directory, table, columns, primary_key, chunk_rows):
+    """Stream one table in primary key order into numbered .tsv.gz chunks"""
+    started = time.perf_counter()
+    os.makedirs(os.path.join(directory, table), exist_ok=True)
+    chunks = []
+    rows = 0
+    out = None
+    try:
+        with conn.cursor(pymysql.cursors.SSCursor) as cursor:
+            order = f" ORDER BY {', '.join(primary_key)}" if primary_key else ""
+            cursor.execute(f"SELECT {', '.join(columns)} FROM {table}{order}")
+            while True:
+                batch = cursor.fetchmany(FETCH_SIZE)
+                if not batch:
+                    break
+                for row in batch:
+                    if rows % chunk_rows == 0:
+                        if out:
+                            out.close()
+                        chunks.append(f"{table}/{len(chunks):06d}.tsv.gz")
+                        # Level 1: restore speed matters more than snapshot size
+                        out = gzip.open(os.path.join(directory, chunks[-1]), 'wt', encoding='utf-8',
+                                        newline='\n', compresslevel=1)
+                    out.write('\t'.join(tsv_value(v) for v in row))
+                    out.write('\n')
+                    rows += 1
+    finally:
+        if out:
+            out.close()
+    return dict(name=table, columns=columns, rows=rows, chunks=chunks), time.perf_counter() - started
+
+
+def dump(directory, tables=None, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """
+    Dump every table on one connection inside START TRANSACTION WITH CONSISTENT
+    SNAPSHOT, so child rows never refer to parents written after the parent
+    table was read (restore loads with foreign_key_checks off)
+    """
+    model = SchemaModel.from_create_scripts()
+    conn = get_connection()
+    try:
+        live = LiveSchema.read(conn)
+
+        # Live column lists, so a snapshot of a drifted schema still round-trips
+        targets = [t for t in model.tables.values()
+                   if t.name in live.tables and (not tables or t.name in tables)]
+        os.makedirs(directory, exist_ok=True)
+
+        print(f"\n=== Dump ({len(targets)} tables, one snapshot) ===")
+        started = time.perf_counter()
+        entries = []
+        with conn.cursor() as cursor:
+            cursor.execute("SET SESSION TRANSACTION ISOLATION LEVEL REPEATABLE READ")
+            cursor.execute("START TRANSACTION WITH CONSISTENT SNAPSHOT")
+        try:
+            for t in targets:
+                entry, seconds = dump_table(conn, directory, t.name, list(live.columns[t.name]),
+                                            t.primary_key, chunk_rows)
+                entries.append(entry)
+                print(f"  [OK] {entry['name']:<32} {entry['rows']:>12,} rows {seconds:8.1f}s")
+        finally:
+            conn.rollback()
+    finally:
+        conn.close()
+
+    manifest = dict(
+        database=DB_CONFIG['database'], created=datetime.now().isoformat(timespec='seconds'),
+        tables=entries,
+    )
+    with open(os.path.join(directory, MANIFEST), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+    total = sum(e['rows'] for e in entries)
+    print(f"\nDumped {total:,} rows to {directory} in {time.perf_counter() - started:.1f}s")
+
+
+# ---------------------------------------------------------------- restore
+
+def load_chunk(directory, table, columns, chunk):
+    """Decompress one chunk to a temp file (LOCAL INFILE reads a path) and bulk load it"""
+    started = time.perf_counter()
+    with tempfile.NamedTemporaryFile('wb', suffix='.tsv', delete=False) as tmp:
+        with gzip.open(os.path.join(directory, chunk), 'rb') as src:
+            shutil.copyfileobj(src, tmp)
+    conn = get_connection(local_infile=True)
+    try:
+        with conn.cursor() as cursor:
+            # Rows come from a consistent snapshot; per-row checks only slow the load down
+            cursor.execute("SET unique_checks = 0, foreign_key_checks = 0")
+            rows = load_file(cursor, table, columns, tmp.name)
+        conn.commit()
+    finally:
+        conn.close()
+        os.unlink(tmp.name)
+    return table, rows, time.perf_counter() - started
+
+
+def restore(directory, tables=None, workers=DEFAULT_WORKERS):
+    with open(os.path.join(directory, MANIFEST), encoding='utf-8') as f:
+        manifest = json.load(f)
+    model = SchemaModel.from_create_scripts()
+
+    entries = []
+    for entry in manifest['tables']:
+        if tables and entry['name'] not in tables:
+            continue
+        if entry['name'] not in model.tables:
+            print(f"  [SKIP] {entry['name']}: not in the schema model")
+            continue
+        known = model.tables[entry['name']].columns
+        dropped = [c for c in entry['columns'] if c not in known]
+        if dropped:
+            print(f"  [DROP] {entry['name']}: loading without columns not in the model: {', '.join(dropped)}")
+        # Fields of columns the model no longer has are read into a user variable and discarded
+        entry['load_columns'] = [c if c in known else '@skip' for c in entry['columns']]
+        entries.append(entry)
+
+    print(f"\n=== Tables ({len(entries)}, primary key only) ===")
+    started = time.perf_counter()
+    jobs = {e['name']: [f"DROP TABLE IF EXISTS {e['name']}",
+                        model.tables[e['name']].create_sql_without_indexes()] for e in entries}
+    failed = [(name, error) for name, _, error in DDLExecutor(workers).run(jobs, {}) if error]
+    for name, error in failed:
+        print(f"  [FAIL] {name}: {error}")
+    if failed:
+        return
+    print(f"  [OK] {len(jobs)} tables recreated ({time.perf_counter() - started:.1f}s)")
+
+    print(f"\n=== Data ({sum(len(e['chunks']) for e in entries)} chunks, {workers} workers) ===")
+    loaded = {}
+    load_started = time.perf_counter()
+    # Biggest tables first so the pool does not end on one long table
+    chunks = [(e['name'], e['load_columns'], chunk)
+              for e in sorted(entries, key=lambda e: -e['rows']) for chunk in e['chunks']]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(load_chunk, directory, table, columns, chunk) for table, columns, chunk in chunks]
+        for future in as_completed(futures):
+            table, rows, seconds = future.result()
+            loaded[table] = loaded.get(table, 0) + rows
+            done = sum(loaded.values())
+            elapsed = time.perf_counter() - load_started
+            print(f"    {done:,} rows ({done / elapsed if elapsed else 0:,.0f} rows/s)", end='\r')
+    print()
+
+    print("\n=== Indexes ===")
+    sync(only=set(jobs), workers=workers)
+
+    print("\n=== Verify ===")
+    conn = get_connection()
+    try:
+        with conn.cursor() as cursor:
+            for e in entries:
+                cursor.execute(f"SELECT COUNT(*) FROM {e['name']}")
+                count = cursor.fetchone()[0]
+                status = "OK" if count == e['rows'] else "FAIL"
+                print(f"  [{status}] {e['name']:<32} {count:>12,} / {e['rows']:,}")
+    finally:
+        conn.close()
+    print(f"\nRestored {sum(loaded.values()):,} rows in {time.perf_counter() - started:.1f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Snapshot and restore FMS table data")
+    parser.add_argument('action', choices=('dump', 'restore'))
+    parser.add_argument('directory', help='snapshot directory')
+    parser.add_argument('tables', nargs='*', help='limit to these tables')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS, help='parallel restore connections')
+    parser.add_argument('--chunk-rows', type=int, default=DEFAULT_CHUNK_ROWS, help='rows per dump chunk')
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print(f"FMS Snapshot ({args.action}: {args.directory})")
+    print("=" * 60)
+
+    tables = {t.upper() for t in args.tables} or None
+    try:
+        if args.action == 'dump':
+            dump(args.directory, tables, args.chunk_rows)
+        else:
+            restore(args.directory, tables, args.workers)
+    except Exception as e:
+        print(f"\nError: {e}")
+
+
+if __name__ == "__main__":
+    main()
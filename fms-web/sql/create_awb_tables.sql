@@ -45,7 +45,10 @@ CREATE TABLE IF NOT EXISTS AWB_MASTER_AWB (
     UPDATED_DTM DATETIME COMMENT '수정일시',
     INDEX idx_mawb_no (MAWB_NO),
     INDEX idx_status (STATUS_CD),
-    INDEX idx_etd (ETD_DT)
+    INDEX idx_etd (ETD_DT),
+    INDEX idx_del_created (DEL_YN, CREATED_DTM),
+    INDEX idx_del_status (DEL_YN, STATUS_CD, CREATED_DTM),
+    INDEX idx_updated (UPDATED_DTM)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='Master AWB 테이블';
 
 -- AWB House 테이블 생성
@@ -96,7 +99,9 @@ CREATE TABLE IF NOT EXISTS AWB_HOUSE_AWB (
     UPDATED_DTM DATETIME COMMENT '수정일시',
     FOREIGN KEY (MAWB_ID) REFERENCES AWB_MASTER_AWB(MAWB_ID),
     INDEX idx_hawb_no (HAWB_NO),
-    INDEX idx_mawb_id (MAWB_ID),
+    INDEX idx_mawb_id (MAWB_ID, DEL_YN),
     INDEX idx_status (STATUS_CD),
-    INDEX idx_etd (ETD_DT)
+    INDEX idx_etd (ETD_DT),
+    INDEX idx_del_created (DEL_YN, CREATED_DTM),
+    INDEX idx_updated (UPDATED_DTM)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='House AWB 테이블';
@@ -1,6 +1,7 @@
 import { NextRequest, NextResponse } from 'next/server';
 import pool, { queryWithLog } from '@/lib/db';
 import { RowDataPacket, ResultSetHeader } from 'mysql2';
+import { countNewShipment } from '@/lib/statusCount';
 
 // House AWB 목록 조회
 export async function GET(request: NextRequest) {
@@ -124,6 +125,7 @@ export async function POST(request: NextRequest) {
         VALUES (?, 'AIR', 'EXPORT', ?, 'PENDING', 'admin', NOW(), 'N')
       `, [`SHP${Date.now()}`, customerId]);
       shipmentId = shipResult.insertId;
+      await countNewShipment('PENDING', 'AIR');
     }
 
     const [result] = await pool.query<ResultSetHeader>(`
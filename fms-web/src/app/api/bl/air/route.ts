@@ -1,6 +1,8 @@
 import { NextRequest, NextResponse } from 'next/server';
 import pool from '@/lib/db';
 import { RowDataPacket, ResultSetHeader } from 'mysql2';
+import { parsePage, keysetClause, cursorColumns, pageResponse, CursorError } from '@/lib/pagination';
+import { nextDocumentNo } from '@/lib/sequence';
 
 // 항공 AWB 목록 조회
 export async function GET(request: NextRequest) {
@@ -59,6 +61,8 @@ export async function GET(request: NextRequest) {
     }
 
     // 목록 조회
+    const page = parsePage(searchParams);
+    const keyset = keysetClause(page, 'a.CREATED_DTM', 'a.AWB_ID');
     const [rows] = await pool.query<RowDataPacket[]>(`
       SELECT
         a.AWB_ID as id,
@@ -80,14 +84,18 @@ export async function GET(request: NextRequest) {
         a.ARRIVAL_CD as arrival,
         a.FLIGHT_NO as flightNo,
         a.IO_TYPE as ioType,
-        a.STATUS_CD as status
+        a.STATUS_CD as status,
+        ${cursorColumns('a.CREATED_DTM', 'a.AWB_ID')}
       FROM ORD_AIR_AWB a
-      WHERE a.DEL_YN = 'N'
-      ORDER BY a.CREATED_DTM DESC
-    `);
+      WHERE a.DEL_YN = 'N'${keyset.condition ? ` AND ${keyset.condition}` : ''}
+      ${keyset.orderLimit}
+    `, keyset.params);
 
-    return NextResponse.json(rows);
+    return pageResponse(rows, page);
   } catch (error) {
+    if (error instanceof CursorError) {
+      return NextResponse.json({ error: error.message }, { status: 400 });
+    }
     console.error('Database error:', error);
     return NextResponse.json({ error: 'Failed to fetch AWB data' }, { status: 500 });
   }
@@ -102,12 +110,7 @@ export async function POST(request: NextRequest) {
     // 새 JOB NO 생성
     const year = new Date().getFullYear();
     const prefix = main.ioType === 'OUT' ? 'AEX' : 'AIM';
-    const [countResult] = await pool.query<RowDataPacket[]>(
-      `SELECT COUNT(*) as cnt FROM ORD_AIR_AWB WHERE JOB_NO LIKE ?`,
-      [`${prefix}-${year}-%`]
-    );
-    const count = countResult[0].cnt + 1;
-    const jobNo = `${prefix}-${year}-${String(count).padStart(4, '0')}`;
+    const jobNo = await nextDocumentNo({ prefix: `${prefix}-${year}-`, width: 4, table: 'ORD_AIR_AWB', column: 'JOB_NO' });
 
     const [result] = await pool.query<ResultSetHeader>(`
       INSERT INTO ORD_AIR_AWB (
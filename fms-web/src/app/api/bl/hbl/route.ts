@@ -1,6 +1,8 @@
 import { NextRequest, NextResponse } from 'next/server';
 import pool, { queryWithLog } from '@/lib/db';
 import { RowDataPacket, ResultSetHeader } from 'mysql2';
+import { parsePage, keysetClause, cursorColumns, pageResponse, CursorError } from '@/lib/pagination';
+import { nextDocumentNo } from '@/lib/sequence';
 
 // House B/L 목록 조회
 export async function GET(request: NextRequest) {
@@ -8,8 +10,9 @@ export async function GET(request: NextRequest) {
     const { searchParams } = new URL(request.url);
     const status = searchParams.get('status');
     const shipmentId = searchParams.get('shipment_id');
+    const page = parsePage(searchParams);
 
-    let whereClause = 'WHERE h.DEL_YN != "Y"';
+    let whereClause = "WHERE h.DEL_YN = 'N'";
     const params: (string | number)[] = [];
 
     if (status) {
@@ -20,6 +23,11 @@ export async function GET(request: NextRequest) {
       whereClause += ' AND h.SHIPMENT_ID = ?';
       params.push(parseInt(shipmentId));
     }
+    const keyset = keysetClause(page, 'h.CREATED_DTM', 'h.HBL_ID');
+    if (keyset.condition) {
+      whereClause += ` AND ${keyset.condition}`;
+      params.push(...keyset.params);
+    }
 
     const [rows] = await queryWithLog<RowDataPacket[]>(`
       SELECT
@@ -66,7 +74,8 @@ export async function GET(request: NextRequest) {
         h.STATUS_CD as status_cd,
         h.PRINT_YN as print_yn,
         h.SURRENDER_YN as surrender_yn,
-        DATE_FORMAT(h.CREATED_DTM, '%Y-%m-%d %H:%i') as created_dtm
+        DATE_FORMAT(h.CREATED_DTM, '%Y-%m-%d %H:%i') as created_dtm,
+        ${cursorColumns('h.CREATED_DTM', 'h.HBL_ID')}
       FROM BL_HOUSE_BL h
       LEFT JOIN BL_MASTER_BL m ON h.MBL_ID = m.MBL_ID
       LEFT JOIN MST_CUSTOMER c ON h.CUSTOMER_ID = c.CUSTOMER_ID
@@ -74,11 +83,14 @@ export async function GET(request: NextRequest) {
       LEFT JOIN MST_PORT pol ON h.POL_PORT_CD = pol.PORT_CD
       LEFT JOIN MST_PORT pod ON h.POD_PORT_CD = pod.PORT_CD
       ${whereClause}
-      ORDER BY h.CREATED_DTM DESC
+      ${keyset.orderLimit}
     `, params);
 
-    return NextResponse.json(rows);
+    return pageResponse(rows, page);
   } catch (error) {
+    if (error instanceof CursorError) {
+      return NextResponse.json({ error: error.message }, { status: 400 });
+    }
     console.error('Database error:', error);
     return NextResponse.json({ error: 'Failed to fetch House B/Ls' }, { status: 500 });
   }
@@ -91,12 +103,7 @@ export async function POST(request: NextRequest) {
 
     // 새 HBL 번호 생성
     const year = new Date().getFullYear();
-    const [countResult] = await pool.query<RowDataPacket[]>(
-      `SELECT COUNT(*) as cnt FROM BL_HOUSE_BL WHERE HBL_NO LIKE ?`,
-      [`HBL${year}%`]
-    );
-    const count = countResult[0].cnt + 1;
-    const hblNo = `HBL${year}${String(count).padStart(5, '0')}`;
+    const hblNo = await nextDocumentNo({ prefix: `HBL${year}`, width: 5, table: 'BL_HOUSE_BL', column: 'HBL_NO' });
 
     const [result] = await pool.query<ResultSetHeader>(`
       INSERT INTO BL_HOUSE_BL (
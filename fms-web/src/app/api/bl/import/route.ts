@@ -1,6 +1,8 @@
 import { NextRequest, NextResponse } from 'next/server';
 import pool, { queryWithLog } from '@/lib/db';
 import { RowDataPacket, ResultSetHeader } from 'mysql2';
+import { parsePage, keysetClause, cursorColumns, selectFields, pageResponse, PageParamError } from '@/lib/pagination';
+import { nextDocumentNo } from '@/lib/sequence';
 
 // 수입 B/L 타입 정의
 interface ImportBLRequest {
@@ -89,14 +91,11 @@ interface OtherCharge {
   collect?: number;
 }
 
-// JOB NO 생성 (HBL_NO 기반)
-function generateJobNo(hblNo: string): string {
-  const now = new Date();
-  const year = now.getFullYear();
-  const month = String(now.getMonth() + 1).padStart(2, '0');
-  const day = String(now.getDate()).padStart(2, '0');
-  const random = String(Math.floor(Math.random() * 10000)).padStart(4, '0');
-  return `IMP${year}${month}${day}${random}`;
+// JOB NO 생성 (IMP + 연도 + 연도별 일련번호)
+// 발급한 번호는 BL_HOUSE_BL.PARTNER_REF_NO에 저장하며, 시퀀스 최초 생성 시 기존 번호 다음부터 시작한다.
+function generateJobNo(): Promise<string> {
+  const year = new Date().getFullYear();
+  return nextDocumentNo({ prefix: `IMP${year}`, width: 5, table: 'BL_HOUSE_BL', column: 'PARTNER_REF_NO' });
 }
 
 // MBL 번호로 기존 MBL 조회 또는 생성
@@ -190,7 +189,7 @@ export async function POST(request: NextRequest) {
     await connection.beginTransaction();
 
     // JOB NO 생성
-    const jobNo = generateJobNo(body.hblNo);
+    const jobNo = await generateJobNo();
 
     // MBL 조회 또는 생성
     const mblId = await findOrCreateMBL(body.mblNo, body);
@@ -221,7 +220,7 @@ export async function POST(request: NextRequest) {
         TOTAL_PKG_QTY, PKG_TYPE_CD,
         GROSS_WEIGHT_KG, VOLUME_CBM,
         COMMODITY_DESC, MARKS_NOS,
-        FREIGHT_TERM_CD,
+        FREIGHT_TERM_CD, PARTNER_REF_NO,
         BL_TYPE_CD, ORIGINAL_BL_COUNT,
         STATUS_CD, PRINT_YN, SURRENDER_YN, DEL_YN,
         CREATED_BY, CREATED_DTM
@@ -245,7 +244,7 @@ export async function POST(request: NextRequest) {
         ?, ?,
         ?, ?,
         ?, ?,
-        ?,
+        ?, ?,
         'ORIGINAL', 3,
         'DRAFT', 'N', 'N', 'N',
         'admin', NOW()
@@ -277,7 +276,8 @@ export async function POST(request: NextRequest) {
       body.measurement || null,
       body.cargoDescription || null,
       body.marksAndNumbers || null,
-      body.freightTerm
+      body.freightTerm,
+      jobNo
     ]);
 
     const hblId = hblResult.insertId;
@@ -363,6 +363,49 @@ export async function POST(request: NextRequest) {
   }
 }
 
+// 수입 B/L 목록 컬럼 (fields 파라미터로 선택)
+const IMPORT_COLUMNS: Record<string, string> = {
+  hbl_id: 'h.HBL_ID',
+  hbl_no: 'h.HBL_NO',
+  mbl_id: 'h.MBL_ID',
+  mbl_no: 'm.MBL_NO',
+  customer_id: 'h.CUSTOMER_ID',
+  customer_name: 'c.CUSTOMER_NM',
+  carrier_id: 'h.CARRIER_ID',
+  carrier_name: 'cr.CARRIER_NM',
+  carrier_code: 'cr.CARRIER_CD',
+  vessel_nm: 'h.VESSEL_NM',
+  voyage_no: 'h.VOYAGE_NO',
+  pol_port_cd: 'h.POL_PORT_CD',
+  pod_port_cd: 'h.POD_PORT_CD',
+  pol_port_name: 'pol.PORT_NM',
+  pod_port_name: 'pod.PORT_NM',
+  place_of_receipt: 'h.PLACE_OF_RECEIPT',
+  place_of_delivery: 'h.PLACE_OF_DELIVERY',
+  final_dest: 'h.FINAL_DEST',
+  etd_dt: "DATE_FORMAT(h.ETD_DT, '%Y-%m-%d')",
+  atd_dt: "DATE_FORMAT(h.ATD_DT, '%Y-%m-%d')",
+  eta_dt: "DATE_FORMAT(h.ETA_DT, '%Y-%m-%d')",
+  ata_dt: "DATE_FORMAT(h.ATA_DT, '%Y-%m-%d')",
+  issue_dt: "DATE_FORMAT(h.ISSUE_DT, '%Y-%m-%d')",
+  issue_place: 'h.ISSUE_PLACE',
+  shipper_nm: 'h.SHIPPER_NM',
+  shipper_addr: 'h.SHIPPER_ADDR',
+  consignee_nm: 'h.CONSIGNEE_NM',
+  consignee_addr: 'h.CONSIGNEE_ADDR',
+  notify_party: 'h.NOTIFY_PARTY',
+  total_pkg_qty: 'h.TOTAL_PKG_QTY',
+  pkg_type_cd: 'h.PKG_TYPE_CD',
+  gross_weight_kg: 'h.GROSS_WEIGHT_KG',
+  volume_cbm: 'h.VOLUME_CBM',
+  commodity_desc: 'h.COMMODITY_DESC',
+  marks_nos: 'h.MARKS_NOS',
+  freight_term_cd: 'h.FREIGHT_TERM_CD',
+  bl_type_cd: 'h.BL_TYPE_CD',
+  status_cd: 'h.STATUS_CD',
+  created_dtm: "DATE_FORMAT(h.CREATED_DTM, '%Y-%m-%d %H:%i')",
+};
+
 // 수입 B/L 목록 조회
 export async function GET(request: NextRequest) {
   try {
@@ -371,8 +414,10 @@ export async function GET(request: NextRequest) {
     const mblNo = searchParams.get('mbl_no');
     const hblNo = searchParams.get('hbl_no');
     const hblId = searchParams.get('hbl_id');
+    const page = parsePage(searchParams);
+    const columns = selectFields(searchParams, IMPORT_COLUMNS);
 
-    let whereClause = 'WHERE h.DEL_YN != "Y"';
+    let whereClause = "WHERE h.DEL_YN != 'Y'";
     const params: (string | number)[] = [];
 
     // 특정 HBL ID로 조회 (수정 화면용)
@@ -392,48 +437,16 @@ export async function GET(request: NextRequest) {
       whereClause += ' AND h.HBL_NO LIKE ?';
       params.push(`%${hblNo}%`);
     }
+    const keyset = keysetClause(page, 'h.CREATED_DTM', 'h.HBL_ID');
+    if (keyset.condition) {
+      whereClause += ` AND ${keyset.condition}`;
+      params.push(...keyset.params);
+    }
 
     const [rows] = await queryWithLog<RowDataPacket[]>(`
       SELECT
-        h.HBL_ID as hbl_id,
-        h.HBL_NO as hbl_no,
-        h.MBL_ID as mbl_id,
-        m.MBL_NO as mbl_no,
-        h.CUSTOMER_ID as customer_id,
-        c.CUSTOMER_NM as customer_name,
-        h.CARRIER_ID as carrier_id,
-        cr.CARRIER_NM as carrier_name,
-        cr.CARRIER_CD as carrier_code,
-        h.VESSEL_NM as vessel_nm,
-        h.VOYAGE_NO as voyage_no,
-        h.POL_PORT_CD as pol_port_cd,
-        h.POD_PORT_CD as pod_port_cd,
-        pol.PORT_NM as pol_port_name,
-        pod.PORT_NM as pod_port_name,
-        h.PLACE_OF_RECEIPT as place_of_receipt,
-        h.PLACE_OF_DELIVERY as place_of_delivery,
-        h.FINAL_DEST as final_dest,
-        DATE_FORMAT(h.ETD_DT, '%Y-%m-%d') as etd_dt,
-        DATE_FORMAT(h.ATD_DT, '%Y-%m-%d') as atd_dt,
-        DATE_FORMAT(h.ETA_DT, '%Y-%m-%d') as eta_dt,
-        DATE_FORMAT(h.ATA_DT, '%Y-%m-%d') as ata_dt,
-        DATE_FORMAT(h.ISSUE_DT, '%Y-%m-%d') as issue_dt,
-        h.ISSUE_PLACE as issue_place,
-        h.SHIPPER_NM as shipper_nm,
-        h.SHIPPER_ADDR as shipper_addr,
-        h.CONSIGNEE_NM as consignee_nm,
-        h.CONSIGNEE_ADDR as consignee_addr,
-        h.NOTIFY_PARTY as notify_party,
-        h.TOTAL_PKG_QTY as total_pkg_qty,
-        h.PKG_TYPE_CD as pkg_type_cd,
-        h.GROSS_WEIGHT_KG as gross_weight_kg,
-        h.VOLUME_CBM as volume_cbm,
-        h.COMMODITY_DESC as commodity_desc,
-        h.MARKS_NOS as marks_nos,
-        h.FREIGHT_TERM_CD as freight_term_cd,
-        h.BL_TYPE_CD as bl_type_cd,
-        h.STATUS_CD as status_cd,
-        DATE_FORMAT(h.CREATED_DTM, '%Y-%m-%d %H:%i') as created_dtm
+        ${columns},
+        ${cursorColumns('h.CREATED_DTM', 'h.HBL_ID')}
       FROM BL_HOUSE_BL h
       LEFT JOIN BL_MASTER_BL m ON h.MBL_ID = m.MBL_ID
       LEFT JOIN MST_CUSTOMER c ON h.CUSTOMER_ID = c.CUSTOMER_ID
@@ -441,11 +454,14 @@ export async function GET(request: NextRequest) {
       LEFT JOIN MST_PORT pol ON h.POL_PORT_CD = pol.PORT_CD
       LEFT JOIN MST_PORT pod ON h.POD_PORT_CD = pod.PORT_CD
       ${whereClause}
-      ORDER BY h.CREATED_DTM DESC
+      ${keyset.orderLimit}
     `, params);
 
-    return NextResponse.json(rows);
+    return pageResponse(rows, page);
   } catch (error) {
+    if (error instanceof PageParamError) {
+      return NextResponse.json({ error: error.message }, { status: 400 });
+    }
     console.error('Database error:', error);
     return NextResponse.json({ error: 'Failed to fetch Import B/Ls' }, { status: 500 });
   }
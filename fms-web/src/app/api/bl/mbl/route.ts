@@ -1,6 +1,50 @@
 import { NextRequest, NextResponse } from 'next/server';
 import pool, { queryWithLog } from '@/lib/db';
 import { RowDataPacket, ResultSetHeader } from 'mysql2';
+import { parsePage, keysetClause, cursorColumns, selectFields, pageResponse, PageParamError } from '@/lib/pagination';
+import { nextDocumentNo } from '@/lib/sequence';
+
+// Master B/L 목록 컬럼 (fields 파라미터로 선택)
+const MBL_COLUMNS: Record<string, string> = {
+  mbl_id: 'm.MBL_ID',
+  mbl_no: 'm.MBL_NO',
+  shipment_id: 'm.SHIPMENT_ID',
+  booking_id: 'm.BOOKING_ID',
+  carrier_id: 'm.CARRIER_ID',
+  carrier_name: 'cr.CARRIER_NM',
+  vessel_nm: 'm.VESSEL_NM',
+  voyage_no: 'm.VOYAGE_NO',
+  pol_port_cd: 'm.POL_PORT_CD',
+  pod_port_cd: 'm.POD_PORT_CD',
+  pol_port_name: 'pol.PORT_NM',
+  pod_port_name: 'pod.PORT_NM',
+  place_of_receipt: 'm.PLACE_OF_RECEIPT',
+  place_of_delivery: 'm.PLACE_OF_DELIVERY',
+  final_dest: 'm.FINAL_DEST',
+  etd_dt: "DATE_FORMAT(m.ETD_DT, '%Y-%m-%d')",
+  atd_dt: "DATE_FORMAT(m.ATD_DT, '%Y-%m-%d')",
+  eta_dt: "DATE_FORMAT(m.ETA_DT, '%Y-%m-%d')",
+  ata_dt: "DATE_FORMAT(m.ATA_DT, '%Y-%m-%d')",
+  on_board_dt: "DATE_FORMAT(m.ON_BOARD_DT, '%Y-%m-%d')",
+  issue_dt: "DATE_FORMAT(m.ISSUE_DT, '%Y-%m-%d')",
+  issue_place: 'm.ISSUE_PLACE',
+  shipper_nm: 'm.SHIPPER_NM',
+  consignee_nm: 'm.CONSIGNEE_NM',
+  notify_party: 'm.NOTIFY_PARTY',
+  total_pkg_qty: 'm.TOTAL_PKG_QTY',
+  pkg_type_cd: 'm.PKG_TYPE_CD',
+  gross_weight_kg: 'm.GROSS_WEIGHT_KG',
+  volume_cbm: 'm.VOLUME_CBM',
+  commodity_desc: 'm.COMMODITY_DESC',
+  cntr_count: 'm.CNTR_COUNT',
+  freight_term_cd: 'm.FREIGHT_TERM_CD',
+  bl_type_cd: 'm.BL_TYPE_CD',
+  original_bl_count: 'm.ORIGINAL_BL_COUNT',
+  status_cd: 'm.STATUS_CD',
+  surrender_yn: 'm.SURRENDER_YN',
+  created_dtm: "DATE_FORMAT(m.CREATED_DTM, '%Y-%m-%d %H:%i')",
+  hbl_count: "(SELECT COUNT(*) FROM BL_HOUSE_BL h WHERE h.MBL_ID = m.MBL_ID AND h.DEL_YN != 'Y')",
+};
 
 // Master B/L 목록 조회
 export async function GET(request: NextRequest) {
@@ -8,8 +52,10 @@ export async function GET(request: NextRequest) {
     const { searchParams } = new URL(request.url);
     const status = searchParams.get('status');
     const carrierId = searchParams.get('carrier_id');
+    const page = parsePage(searchParams);
+    const columns = selectFields(searchParams, MBL_COLUMNS);
 
-    let whereClause = 'WHERE m.DEL_YN != "Y"';
+    let whereClause = "WHERE m.DEL_YN = 'N'";
     const params: (string | number)[] = [];
 
     if (status) {
@@ -20,57 +66,29 @@ export async function GET(request: NextRequest) {
       whereClause += ' AND m.CARRIER_ID = ?';
       params.push(parseInt(carrierId));
     }
+    const keyset = keysetClause(page, 'm.CREATED_DTM', 'm.MBL_ID');
+    if (keyset.condition) {
+      whereClause += ` AND ${keyset.condition}`;
+      params.push(...keyset.params);
+    }
 
     const [rows] = await queryWithLog<RowDataPacket[]>(`
       SELECT
-        m.MBL_ID as mbl_id,
-        m.MBL_NO as mbl_no,
-        m.SHIPMENT_ID as shipment_id,
-        m.BOOKING_ID as booking_id,
-        m.CARRIER_ID as carrier_id,
-        cr.CARRIER_NM as carrier_name,
-        m.VESSEL_NM as vessel_nm,
-        m.VOYAGE_NO as voyage_no,
-        m.POL_PORT_CD as pol_port_cd,
-        m.POD_PORT_CD as pod_port_cd,
-        pol.PORT_NM as pol_port_name,
-        pod.PORT_NM as pod_port_name,
-        m.PLACE_OF_RECEIPT as place_of_receipt,
-        m.PLACE_OF_DELIVERY as place_of_delivery,
-        m.FINAL_DEST as final_dest,
-        DATE_FORMAT(m.ETD_DT, '%Y-%m-%d') as etd_dt,
-        DATE_FORMAT(m.ATD_DT, '%Y-%m-%d') as atd_dt,
-        DATE_FORMAT(m.ETA_DT, '%Y-%m-%d') as eta_dt,
-        DATE_FORMAT(m.ATA_DT, '%Y-%m-%d') as ata_dt,
-        DATE_FORMAT(m.ON_BOARD_DT, '%Y-%m-%d') as on_board_dt,
-        DATE_FORMAT(m.ISSUE_DT, '%Y-%m-%d') as issue_dt,
-        m.ISSUE_PLACE as issue_place,
-        m.SHIPPER_NM as shipper_nm,
-        m.CONSIGNEE_NM as consignee_nm,
-        m.NOTIFY_PARTY as notify_party,
-        m.TOTAL_PKG_QTY as total_pkg_qty,
-        m.PKG_TYPE_CD as pkg_type_cd,
-        m.GROSS_WEIGHT_KG as gross_weight_kg,
-        m.VOLUME_CBM as volume_cbm,
-        m.COMMODITY_DESC as commodity_desc,
-        m.CNTR_COUNT as cntr_count,
-        m.FREIGHT_TERM_CD as freight_term_cd,
-        m.BL_TYPE_CD as bl_type_cd,
-        m.ORIGINAL_BL_COUNT as original_bl_count,
-        m.STATUS_CD as status_cd,
-        m.SURRENDER_YN as surrender_yn,
-        DATE_FORMAT(m.CREATED_DTM, '%Y-%m-%d %H:%i') as created_dtm,
-        (SELECT COUNT(*) FROM BL_HOUSE_BL h WHERE h.MBL_ID = m.MBL_ID AND h.DEL_YN != 'Y') as hbl_count
+        ${columns},
+        ${cursorColumns('m.CREATED_DTM', 'm.MBL_ID')}
       FROM BL_MASTER_BL m
       LEFT JOIN MST_CARRIER cr ON m.CARRIER_ID = cr.CARRIER_ID
       LEFT JOIN MST_PORT pol ON m.POL_PORT_CD = pol.PORT_CD
       LEFT JOIN MST_PORT pod ON m.POD_PORT_CD = pod.PORT_CD
       ${whereClause}
-      ORDER BY m.CREATED_DTM DESC
+      ${keyset.orderLimit}
     `, params);
 
-    return NextResponse.json(rows);
+    return pageResponse(rows, page);
   } catch (error) {
+    if (error instanceof PageParamError) {
+      return NextResponse.json({ error: error.message }, { status: 400 });
+    }
     console.error('Database error:', error);
     return NextResponse.json({ error: 'Failed to fetch Master B/Ls' }, { status: 500 });
   }
@@ -83,12 +101,7 @@ export async function POST(request: NextRequest) {
 
     // 새 MBL 번호 생성
     const year = new Date().getFullYear();
-    const [countResult] = await pool.query<RowDataPacket[]>(
-      `SELECT COUNT(*) as cnt FROM BL_MASTER_BL WHERE MBL_NO LIKE ?`,
-      [`MBL${year}%`]
-    );
-    const count = countResult[0].cnt + 1;
-    const mblNo = `MBL${year}${String(count).padStart(5, '0')}`;
+    const mblNo = await nextDocumentNo({ prefix: `MBL${year}`, width: 5, table: 'BL_MASTER_BL', column: 'MBL_NO' });
 
     const [result] = await pool.query<ResultSetHeader>(`
       INSERT INTO BL_MASTER_BL (
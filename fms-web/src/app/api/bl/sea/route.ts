@@ -1,6 +1,8 @@
 import { NextRequest, NextResponse } from 'next/server';
 import pool from '@/lib/db';
 import { RowDataPacket, ResultSetHeader } from 'mysql2';
+import { parsePage, keysetClause, cursorColumns, pageResponse, CursorError } from '@/lib/pagination';
+import { nextDocumentNo } from '@/lib/sequence';
 
 // 해상 B/L 목록 조회
 export async function GET(request: NextRequest) {
@@ -118,6 +120,8 @@ export async function GET(request: NextRequest) {
     }
 
     // 목록 조회
+    const page = parsePage(searchParams);
+    const keyset = keysetClause(page, 'b.CREATED_DTM', 'b.BL_ID');
     const [rows] = await pool.query<RowDataPacket[]>(`
       SELECT
         b.BL_ID as id,
@@ -140,14 +144,18 @@ export async function GET(request: NextRequest) {
         b.POD_CD as pod,
         CONCAT(b.VESSEL_NM, ' / ', b.VOYAGE_NO) as vesselVoyage,
         b.IO_TYPE as ioType,
-        b.STATUS_CD as status
+        b.STATUS_CD as status,
+        ${cursorColumns('b.CREATED_DTM', 'b.BL_ID')}
       FROM ORD_OCEAN_BL b
-      WHERE b.DEL_YN = 'N'
-      ORDER BY b.CREATED_DTM DESC
-    `);
+      WHERE b.DEL_YN = 'N'${keyset.condition ? ` AND ${keyset.condition}` : ''}
+      ${keyset.orderLimit}
+    `, keyset.params);
 
-    return NextResponse.json(rows);
+    return pageResponse(rows, page);
   } catch (error) {
+    if (error instanceof CursorError) {
+      return NextResponse.json({ error: error.message }, { status: 400 });
+    }
     console.error('Database error:', error);
     return NextResponse.json({ error: 'Failed to fetch B/L data' }, { status: 500 });
   }
@@ -166,12 +174,7 @@ export async function POST(request: NextRequest) {
     const year = new Date().getFullYear();
     const ioType = main.ioType || 'OUT';
     const prefix = ioType === 'OUT' ? 'SEX' : 'SIM';
-    const [countResult] = await pool.query<RowDataPacket[]>(
-      `SELECT COUNT(*) as cnt FROM ORD_OCEAN_BL WHERE JOB_NO LIKE ?`,
-      [`${prefix}-${year}-%`]
-    );
-    const count = countResult[0].cnt + 1;
-    const jobNo = `${prefix}-${year}-${String(count).padStart(4, '0')}`;
+    const jobNo = await nextDocumentNo({ prefix: `${prefix}-${year}-`, width: 4, table: 'ORD_OCEAN_BL', column: 'JOB_NO' });
 
     const [result] = await pool.query<ResultSetHeader>(`
       INSERT INTO ORD_OCEAN_BL (
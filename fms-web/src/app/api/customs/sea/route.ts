@@ -1,6 +1,7 @@
 import { NextRequest, NextResponse } from 'next/server';
 import pool from '@/lib/db';
 import { RowDataPacket, ResultSetHeader } from 'mysql2';
+import { countNewShipment } from '@/lib/statusCount';
 
 // 통관 목록 조회
 export async function GET(request: NextRequest) {
@@ -100,6 +101,7 @@ export async function POST(request: NextRequest) {
         VALUES (?, 'SEA', ?, ?, 'PENDING', 'admin', NOW(), 'N')
       `, [`SHP${Date.now()}`, body.declarationType || 'EXPORT', customerId]);
       shipmentId = shipResult.insertId;
+      await countNewShipment('PENDING', 'SEA');
     }
 
     await pool.query<ResultSetHeader>(`
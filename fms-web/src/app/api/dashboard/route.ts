@@ -1,21 +1,13 @@
 import { NextResponse } from 'next/server';
 import pool from '@/lib/db';
 import { RowDataPacket } from 'mysql2';
+import { readStatusCounts } from '@/lib/statusCount';
 
 export async function GET() {
   try {
-    // 통계 데이터
-    const [totalShipments] = await pool.query<RowDataPacket[]>(
-      `SELECT COUNT(*) as count FROM ORD_SHIPMENT WHERE DEL_YN = 'N'`
-    );
-
-    const [inTransit] = await pool.query<RowDataPacket[]>(
-      `SELECT COUNT(*) as count FROM ORD_SHIPMENT WHERE STATUS_CD IN ('SHIPPED', 'DEPARTED', 'IN_TRANSIT') AND DEL_YN = 'N'`
-    );
-
-    const [pendingBL] = await pool.query<RowDataPacket[]>(
-      `SELECT COUNT(*) as count FROM ORD_SHIPMENT WHERE STATUS_CD IN ('PENDING', 'BOOKED') AND DEL_YN = 'N'`
-    );
+    // 통계 데이터 (SHP_STATUS_COUNT 롤업)
+    const counts = await readStatusCounts();
+    const sumOf = (statuses: string[]) => statuses.reduce((sum, status) => sum + (counts[status] || 0), 0);
 
     // 최근 Shipment 목록
     const [recentShipments] = await pool.query<RowDataPacket[]>(`
@@ -39,9 +31,9 @@ export async function GET() {
 
     return NextResponse.json({
       stats: {
-        totalShipments: totalShipments[0].count,
-        inTransit: inTransit[0].count,
-        pendingBL: pendingBL[0].count,
+        totalShipments: Object.values(counts).reduce((sum, count) => sum + count, 0),
+        inTransit: sumOf(['SHIPPED', 'DEPARTED', 'IN_TRANSIT']),
+        pendingBL: sumOf(['PENDING', 'BOOKED']),
       },
       recentShipments,
     });
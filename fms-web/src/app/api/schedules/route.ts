@@ -1,8 +1,43 @@
 import { NextRequest, NextResponse } from 'next/server';
 import pool from '@/lib/db';
 import { RowDataPacket, ResultSetHeader } from 'mysql2';
+import { parsePage, keysetClause, cursorColumns, selectFields, pageResponse, PageParamError } from '@/lib/pagination';
+
+// 스케줄 목록 컬럼 (fields 파라미터로 선택)
+const SCHEDULE_COLUMNS: Record<string, string> = {
+  schedule_id: 's.SCHEDULE_ID',
+  carrier_id: 's.CARRIER_ID',
+  carrier_name: 'cr.CARRIER_NM',
+  carrier_code: 'cr.CARRIER_CD',
+  vessel_nm: 's.VESSEL_NM',
+  voyage_no: 's.VOYAGE_NO',
+  service_lane: 's.SERVICE_LANE',
+  pol_port_cd: 's.POL_PORT_CD',
+  pod_port_cd: 's.POD_PORT_CD',
+  pol_port_name: 'pol.PORT_NM',
+  pod_port_name: 'pod.PORT_NM',
+  pol_terminal: 's.POL_TERMINAL',
+  pod_terminal: 's.POD_TERMINAL',
+  etd_dt: "DATE_FORMAT(s.ETD_DT, '%Y-%m-%d')",
+  eta_dt: "DATE_FORMAT(s.ETA_DT, '%Y-%m-%d')",
+  atd_dt: "DATE_FORMAT(s.ATD_DT, '%Y-%m-%d')",
+  ata_dt: "DATE_FORMAT(s.ATA_DT, '%Y-%m-%d')",
+  doc_cutoff_dt: "DATE_FORMAT(s.DOC_CUTOFF_DT, '%Y-%m-%d %H:%i')",
+  cargo_cutoff_dt: "DATE_FORMAT(s.CARGO_CUTOFF_DT, '%Y-%m-%d %H:%i')",
+  vgm_cutoff_dt: "DATE_FORMAT(s.VGM_CUTOFF_DT, '%Y-%m-%d %H:%i')",
+  transit_time: 's.TRANSIT_TIME',
+  space_20gp: 's.SPACE_20GP',
+  space_40gp: 's.SPACE_40GP',
+  space_40hc: 's.SPACE_40HC',
+  space_45hc: 's.SPACE_45HC',
+  status_cd: 's.STATUS_CD',
+  remark: 's.REMARK',
+  created_dtm: "DATE_FORMAT(s.CREATED_DTM, '%Y-%m-%d %H:%i')",
+};
 
 // 스케줄 목록 조회
+// - limit / cursor가 없으면 전체 행을 출항일 순(ETD_DT ASC)으로 반환 (기존 화면 호환)
+// - limit 또는 cursor가 있으면 키셋 페이지 순서(CREATED_DTM DESC, SCHEDULE_ID DESC)로 반환
 export async function GET(request: NextRequest) {
   try {
     const { searchParams } = new URL(request.url);
@@ -12,8 +47,10 @@ export async function GET(request: NextRequest) {
     const etdFrom = searchParams.get('etd_from');
     const etdTo = searchParams.get('etd_to');
     const status = searchParams.get('status');
+    const page = parsePage(searchParams);
+    const columns = selectFields(searchParams, SCHEDULE_COLUMNS);
 
-    let whereClause = 'WHERE s.DEL_YN != "Y"';
+    let whereClause = "WHERE s.DEL_YN != 'Y'";
     const params: (string | number)[] = [];
 
     if (carrierId) {
@@ -40,47 +77,29 @@ export async function GET(request: NextRequest) {
       whereClause += ' AND s.STATUS_CD = ?';
       params.push(status);
     }
+    const keyset = keysetClause(page, 's.CREATED_DTM', 's.SCHEDULE_ID', 's.ETD_DT ASC');
+    if (keyset.condition) {
+      whereClause += ` AND ${keyset.condition}`;
+      params.push(...keyset.params);
+    }
 
     const [rows] = await pool.query<RowDataPacket[]>(`
       SELECT
-        s.SCHEDULE_ID as schedule_id,
-        s.CARRIER_ID as carrier_id,
-        cr.CARRIER_NM as carrier_name,
-        cr.CARRIER_CD as carrier_code,
-        s.VESSEL_NM as vessel_nm,
-        s.VOYAGE_NO as voyage_no,
-        s.SERVICE_LANE as service_lane,
-        s.POL_PORT_CD as pol_port_cd,
-        s.POD_PORT_CD as pod_port_cd,
-        pol.PORT_NM as pol_port_name,
-        pod.PORT_NM as pod_port_name,
-        s.POL_TERMINAL as pol_terminal,
-        s.POD_TERMINAL as pod_terminal,
-        DATE_FORMAT(s.ETD_DT, '%Y-%m-%d') as etd_dt,
-        DATE_FORMAT(s.ETA_DT, '%Y-%m-%d') as eta_dt,
-        DATE_FORMAT(s.ATD_DT, '%Y-%m-%d') as atd_dt,
-        DATE_FORMAT(s.ATA_DT, '%Y-%m-%d') as ata_dt,
-        DATE_FORMAT(s.DOC_CUTOFF_DT, '%Y-%m-%d %H:%i') as doc_cutoff_dt,
-        DATE_FORMAT(s.CARGO_CUTOFF_DT, '%Y-%m-%d %H:%i') as cargo_cutoff_dt,
-        DATE_FORMAT(s.VGM_CUTOFF_DT, '%Y-%m-%d %H:%i') as vgm_cutoff_dt,
-        s.TRANSIT_TIME as transit_time,
-        s.SPACE_20GP as space_20gp,
-        s.SPACE_40GP as space_40gp,
-        s.SPACE_40HC as space_40hc,
-        s.SPACE_45HC as space_45hc,
-        s.STATUS_CD as status_cd,
-        s.REMARK as remark,
-        DATE_FORMAT(s.CREATED_DTM, '%Y-%m-%d %H:%i') as created_dtm
+        ${columns},
+        ${cursorColumns('s.CREATED_DTM', 's.SCHEDULE_ID')}
       FROM SCH_VESSEL_SCHEDULE s
       LEFT JOIN MST_CARRIER cr ON s.CARRIER_ID = cr.CARRIER_ID
       LEFT JOIN MST_PORT pol ON s.POL_PORT_CD = pol.PORT_CD
       LEFT JOIN MST_PORT pod ON s.POD_PORT_CD = pod.PORT_CD
       ${whereClause}
-      ORDER BY s.ETD_DT ASC
+      ${keyset.orderLimit}
     `, params);
 
-    return NextResponse.json(rows);
+    return pageResponse(rows, page);
   } catch (error) {
+    if (error instanceof PageParamError) {
+      return NextResponse.json({ error: error.message }, { status: 400 });
+    }
     console.error('Database error:', error);
     return NextResponse.json({ error: 'Failed to fetch schedules' }, { status: 500 });
   }
@@ -1,5 +1,6 @@
 import { NextRequest, NextResponse } from 'next/server';
 import mysql from 'mysql2/promise';
+import { changeShipmentStatus } from '@/lib/statusCount';
 
 const dbConfig = {
   host: '211.236.174.220',
@@ -329,3 +330,43 @@ export async function GET(
     }
   }
 }
+
+// 선적 상태 변경 (상태 이력 + 대시보드 상태별 건수 함께 갱신)
+export async function PATCH(
+  request: NextRequest,
+  { params }: { params: Promise<{ id: string }> }
+) {
+  try {
+    const { id } = await params;
+    const body = await request.json();
+
+    if (!body.status) {
+      return NextResponse.json({ error: 'status is required' }, { status: 400 });
+    }
+
+    const result = await changeShipmentStatus(Number(id), body.status, {
+      statusNm: body.status_nm,
+      eventDtm: body.event_dtm,
+      locationCd: body.location_cd,
+      locationNm: body.location_nm,
+      description: body.description,
+    });
+    if (!result) {
+      return NextResponse.json({ error: 'Shipment not found' }, { status: 404 });
+    }
+
+    return NextResponse.json({
+      success: true,
+      shipment_id: Number(id),
+      previous_status: result.previous,
+      status: body.status,
+      changed: result.changed,
+    });
+  } catch (error) {
+    console.error('Shipment Status API Error:', error);
+    return NextResponse.json(
+      { error: 'Failed to update shipment status' },
+      { status: 500 }
+    );
+  }
+}
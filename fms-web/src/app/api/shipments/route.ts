@@ -1,41 +1,87 @@
 import { NextRequest, NextResponse } from 'next/server';
 import pool from '@/lib/db';
 import { RowDataPacket, ResultSetHeader } from 'mysql2';
+import { parsePage, keysetClause, cursorColumns, selectFields, pageResponse, PageParamError } from '@/lib/pagination';
+import { nextDocumentNo } from '@/lib/sequence';
+import { countNewShipment } from '@/lib/statusCount';
 
-export async function GET() {
+// 선적 목록 컬럼 (fields 파라미터로 선택)
+const SHIPMENT_COLUMNS: Record<string, string> = {
+  shipment_id: 's.SHIPMENT_ID',
+  shipment_no: 's.SHIPMENT_NO',
+  transport_mode: 's.TRANSPORT_MODE_CD',
+  trade_type: 's.TRADE_TYPE_CD',
+  service_type: 's.SERVICE_TYPE_CD',
+  incoterms: 's.INCOTERMS_CD',
+  customer_name: 'c.CUSTOMER_NM',
+  shipper_name: 'sh.PARTNER_NM',
+  consignee_name: 'con.PARTNER_NM',
+  carrier_name: 'cr.CARRIER_NM',
+  origin_port: 's.ORIGIN_PORT_CD',
+  dest_port: 's.DEST_PORT_CD',
+  etd: "DATE_FORMAT(s.ETD_DT, '%Y-%m-%d')",
+  eta: "DATE_FORMAT(s.ETA_DT, '%Y-%m-%d')",
+  total_pkg_qty: 's.TOTAL_PKG_QTY',
+  pkg_type: 's.PKG_TYPE_CD',
+  gross_weight: 's.GROSS_WEIGHT_KG',
+  volume_cbm: 's.VOLUME_CBM',
+  status: 's.STATUS_CD',
+  created_at: "DATE_FORMAT(s.CREATED_DTM, '%Y-%m-%d')",
+};
+
+export async function GET(request: NextRequest) {
   try {
+    const { searchParams } = new URL(request.url);
+    const status = searchParams.get('status');
+    const transportMode = searchParams.get('transport_mode');
+    const tradeType = searchParams.get('trade_type');
+    const customerId = searchParams.get('customer_id');
+    const page = parsePage(searchParams);
+    const columns = selectFields(searchParams, SHIPMENT_COLUMNS);
+
+    let whereClause = "WHERE s.DEL_YN = 'N'";
+    const params: (string | number)[] = [];
+
+    if (status) {
+      whereClause += ' AND s.STATUS_CD = ?';
+      params.push(status);
+    }
+    if (transportMode) {
+      whereClause += ' AND s.TRANSPORT_MODE_CD = ?';
+      params.push(transportMode);
+    }
+    if (tradeType) {
+      whereClause += ' AND s.TRADE_TYPE_CD = ?';
+      params.push(tradeType);
+    }
+    if (customerId) {
+      whereClause += ' AND s.CUSTOMER_ID = ?';
+      params.push(parseInt(customerId));
+    }
+    const keyset = keysetClause(page, 's.CREATED_DTM', 's.SHIPMENT_ID');
+    if (keyset.condition) {
+      whereClause += ` AND ${keyset.condition}`;
+      params.push(...keyset.params);
+    }
+
     const [rows] = await pool.query<RowDataPacket[]>(`
       SELECT
-        s.SHIPMENT_ID as shipment_id,
-        s.SHIPMENT_NO as shipment_no,
-        s.TRANSPORT_MODE_CD as transport_mode,
-        s.TRADE_TYPE_CD as trade_type,
-        s.SERVICE_TYPE_CD as service_type,
-        s.INCOTERMS_CD as incoterms,
-        c.CUSTOMER_NM as customer_name,
-        sh.PARTNER_NM as shipper_name,
-        con.PARTNER_NM as consignee_name,
-        cr.CARRIER_NM as carrier_name,
-        s.ORIGIN_PORT_CD as origin_port,
-        s.DEST_PORT_CD as dest_port,
-        DATE_FORMAT(s.ETD_DT, '%Y-%m-%d') as etd,
-        DATE_FORMAT(s.ETA_DT, '%Y-%m-%d') as eta,
-        s.TOTAL_PKG_QTY as total_pkg_qty,
-        s.PKG_TYPE_CD as pkg_type,
-        s.GROSS_WEIGHT_KG as gross_weight,
-        s.VOLUME_CBM as volume_cbm,
-        s.STATUS_CD as status,
-        DATE_FORMAT(s.CREATED_DTM, '%Y-%m-%d') as created_at
+        ${columns},
+        ${cursorColumns('s.CREATED_DTM', 's.SHIPMENT_ID')}
       FROM ORD_SHIPMENT s
       LEFT JOIN MST_CUSTOMER c ON s.CUSTOMER_ID = c.CUSTOMER_ID
       LEFT JOIN MST_CARRIER cr ON s.CARRIER_ID = cr.CARRIER_ID
       LEFT JOIN MST_PARTNER sh ON s.SHIPPER_ID = sh.PARTNER_ID
       LEFT JOIN MST_PARTNER con ON s.CONSIGNEE_ID = con.PARTNER_ID
-      ORDER BY s.CREATED_DTM DESC
-    `);
+      ${whereClause}
+      ${keyset.orderLimit}
+    `, params);
 
-    return NextResponse.json(rows);
+    return pageResponse(rows, page);
   } catch (error) {
+    if (error instanceof PageParamError) {
+      return NextResponse.json({ error: error.message }, { status: 400 });
+    }
     console.error('Database error:', error);
     return NextResponse.json({ error: 'Failed to fetch shipments' }, { status: 500 });
   }
@@ -47,12 +93,7 @@ export async function POST(request: NextRequest) {
 
     // 새 Shipment 번호 생성
     const year = new Date().getFullYear();
-    const [countResult] = await pool.query<RowDataPacket[]>(
-      `SELECT COUNT(*) as cnt FROM ORD_SHIPMENT WHERE SHIPMENT_NO LIKE ?`,
-      [`SHP${year}%`]
-    );
-    const count = countResult[0].cnt + 1;
-    const shipmentNo = `SHP${year}${String(count).padStart(4, '0')}`;
+    const shipmentNo = await nextDocumentNo({ prefix: `SHP${year}`, width: 4, table: 'ORD_SHIPMENT', column: 'SHIPMENT_NO' });
 
     const [result] = await pool.query<ResultSetHeader>(`
       INSERT INTO ORD_SHIPMENT (
@@ -83,6 +124,7 @@ export async function POST(request: NextRequest) {
       body.declared_value || 0,
       body.currency || 'USD'
     ]);
+    await countNewShipment('DRAFT', body.transport_mode);
 
     return NextResponse.json({
       success: true,
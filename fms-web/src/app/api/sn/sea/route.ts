@@ -1,6 +1,7 @@
 import { NextRequest, NextResponse } from 'next/server';
 import pool from '@/lib/db';
 import { RowDataPacket, ResultSetHeader } from 'mysql2';
+import { countNewShipment } from '@/lib/statusCount';
 
 // S/N 목록 조회
 export async function GET(request: NextRequest) {
@@ -99,6 +100,7 @@ export async function POST(request: NextRequest) {
         VALUES (?, 'SEA', 'EXPORT', ?, 'SHIPPED', 'admin', NOW(), 'N')
       `, [`SHP${Date.now()}`, customerId]);
       shipmentId = shipResult.insertId;
+      await countNewShipment('SHIPPED', 'SEA');
     }
 
     const [result] = await pool.query<ResultSetHeader>(`
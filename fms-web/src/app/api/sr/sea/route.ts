@@ -1,6 +1,7 @@
 import { NextRequest, NextResponse } from 'next/server';
 import pool from '@/lib/db';
 import { RowDataPacket, ResultSetHeader } from 'mysql2';
+import { countNewShipment } from '@/lib/statusCount';
 
 // S/R 목록 조회
 export async function GET(request: NextRequest) {
@@ -102,6 +103,7 @@ export async function POST(request: NextRequest) {
         VALUES (?, ?, ?, ?, 'PENDING', 'admin', NOW(), 'N')
       `, [`SHP${Date.now()}`, body.transportMode || 'SEA', body.tradeType || 'EXPORT', customerId]);
       shipmentId = shipResult.insertId;
+      await countNewShipment('PENDING', body.transportMode || 'SEA');
     }
 
     const [result] = await pool.query<ResultSetHeader>(`
@@ -161,6 +161,14 @@ interface ShipmentRoute {
   progress: number;
   color: string;
   cargo: CargoInfo;
+  routeKey?: string;  // 미리 계산된 경로 키 (geometries)
+}
+
+// 서버에서 미리 계산한 경로 (SHP_ROUTE_GEOMETRY)
+interface RouteGeometry {
+  path: [number, number][];
+  segments: [number, number][][];
+  distanceKm: number;
 }
 
 interface TrackingStats {
@@ -1061,6 +1069,7 @@ function LeafletMap({ viewMode = 'compact', compactHeight }: { viewMode?: 'compa
   const router = useRouter();
   const [routes, setRoutes] = useState<ShipmentRoute[]>([]);
   const [ports, setPorts] = useState<Port[]>([]);
+  const [geometries, setGeometries] = useState<Record<string, RouteGeometry>>({});
   const [stats, setStats] = useState<TrackingStats | null>(null);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
@@ -1087,16 +1096,67 @@ function LeafletMap({ viewMode = 'compact', compactHeight }: { viewMode?: 'compa
     };
   }, []);
 
+  // 경로 좌표: 서버에서 미리 계산한 경로 우선, 없으면 클라이언트에서 생성
+  const routePath = useCallback((route: ShipmentRoute): [number, number][] => {
+    const geometry = route.routeKey ? geometries[route.routeKey] : undefined;
+    if (geometry && geometry.path.length > 1) {
+      return geometry.path;
+    }
+    return createOptimalRoutePath([route.from.lat, route.from.lng], [route.to.lat, route.to.lng], route.type);
+  }, [geometries]);
+
   // 데이터 가져오기
+  // - 처음에는 전체 조회, 이후에는 changeCursor 이후 변경분만 받아 기존 경로에 병합
   useEffect(() => {
+    let changeCursor: string | null = null;
+    let currentRoutes: ShipmentRoute[] = [];
+    let currentPorts: Port[] = [];
+
+    const applyChanges = (data: { routes?: ShipmentRoute[]; removed?: string[]; ports?: Port[] }) => {
+      const changed = data.routes || [];
+      const replaced = new Set([...(data.removed || []), ...changed.map(route => route.id)]);
+      currentRoutes = [...currentRoutes.filter(route => !replaced.has(route.id)), ...changed];
+
+      const activeCodes = new Set(currentRoutes.flatMap(route => [route.from.code, route.to.code]));
+      const portMap = new Map([...currentPorts, ...(data.ports || [])].map(port => [port.code, port]));
+      currentPorts = [...portMap.values()].filter(port => activeCodes.has(port.code));
+
+      setRoutes(currentRoutes);
+      setPorts(currentPorts);
+      setStats({
+        totalShipments: currentRoutes.length,
+        inTransit: currentRoutes.filter(r => ['DEPARTED', 'SHIPPED', 'IN_TRANSIT'].includes(r.status)).length,
+        seaRoutes: currentRoutes.filter(r => r.type === 'sea').length,
+        airRoutes: currentRoutes.filter(r => r.type === 'air').length,
+        activePorts: currentPorts.length,
+      });
+    };
+
     const fetchData = async () => {
       try {
-        const res = await fetch('/api/shipments/tracking');
-        if (!res.ok) throw new Error('Failed to fetch');
-        const data = await res.json();
-        setRoutes(data.routes || []);
-        setPorts(data.ports || []);
-        setStats(data.stats || null);
+        if (!changeCursor) {
+          const res = await fetch('/api/shipments/tracking');
+          if (!res.ok) throw new Error('Failed to fetch');
+          const data = await res.json();
+          currentRoutes = data.routes || [];
+          currentPorts = data.ports || [];
+          setRoutes(currentRoutes);
+          setPorts(currentPorts);
+          setGeometries(data.geometries || {});
+          setStats(data.stats || null);
+          changeCursor = data.changeCursor || null;
+        } else {
+          let hasMore = true;
+          while (hasMore) {
+            const res = await fetch(`/api/shipments/tracking?since=${changeCursor}`);
+            if (!res.ok) throw new Error('Failed to fetch');
+            const data = await res.json();
+            applyChanges(data);
+            setGeometries(prev => ({ ...prev, ...data.geometries }));
+            changeCursor = data.changeCursor;
+            hasMore = data.hasMore;
+          }
+        }
         setLoading(false);
       } catch (err) {
         setError('데이터를 불러오는데 실패했습니다.');
@@ -1350,11 +1410,7 @@ function LeafletMap({ viewMode = 'compact', compactHeight }: { viewMode?: 'compa
 
         {/* 1단계: 해상 경로 배경선 (가장 먼저 렌더링 - 아래층) */}
         {routes.filter(r => r.type === 'sea').map((route) => {
-          const path = createOptimalRoutePath(
-            [route.from.lat, route.from.lng],
-            [route.to.lat, route.to.lng],
-            route.type
-          );
+          const path = routePath(route);
           const segments = splitPathAtDateLine(path);
           return segments.map((segment, idx) => (
             <Polyline
@@ -1372,11 +1428,7 @@ function LeafletMap({ viewMode = 'compact', compactHeight }: { viewMode?: 'compa
 
         {/* 2단계: 해상 경로 진행선 */}
         {routes.filter(r => r.type === 'sea').map((route) => {
-          const path = createOptimalRoutePath(
-            [route.from.lat, route.from.lng],
-            [route.to.lat, route.to.lng],
-            route.type
-          );
+          const path = routePath(route);
           const progressPath = path.slice(0, Math.floor((route.progress / 100) * path.length) + 1);
           const segments = splitPathAtDateLine(progressPath);
           return segments.map((segment, idx) => (
@@ -1394,11 +1446,7 @@ function LeafletMap({ viewMode = 'compact', compactHeight }: { viewMode?: 'compa
 
         {/* 3단계: 트럭 경로 배경선 */}
         {routes.filter(r => r.type === 'truck').map((route) => {
-          const path = createOptimalRoutePath(
-            [route.from.lat, route.from.lng],
-            [route.to.lat, route.to.lng],
-            route.type
-          );
+          const path = routePath(route);
           const segments = splitPathAtDateLine(path);
           return segments.map((segment, idx) => (
             <Polyline
@@ -1416,11 +1464,7 @@ function LeafletMap({ viewMode = 'compact', compactHeight }: { viewMode?: 'compa
 
         {/* 4단계: 트럭 경로 진행선 */}
         {routes.filter(r => r.type === 'truck').map((route) => {
-          const path = createOptimalRoutePath(
-            [route.from.lat, route.from.lng],
-            [route.to.lat, route.to.lng],
-            route.type
-          );
+          const path = routePath(route);
           const progressPath = path.slice(0, Math.floor((route.progress / 100) * path.length) + 1);
           const segments = splitPathAtDateLine(progressPath);
           return segments.map((segment, idx) => (
@@ -1438,11 +1482,7 @@ function LeafletMap({ viewMode = 'compact', compactHeight }: { viewMode?: 'compa
 
         {/* 5단계: 항공 경로 배경선 (마지막 렌더링 - 맨 위층) */}
         {routes.filter(r => r.type === 'air').map((route) => {
-          const path = createOptimalRoutePath(
-            [route.from.lat, route.from.lng],
-            [route.to.lat, route.to.lng],
-            route.type
-          );
+          const path = routePath(route);
           const segments = splitPathAtDateLine(path);
           return segments.map((segment, idx) => (
             <Polyline
@@ -1460,11 +1500,7 @@ function LeafletMap({ viewMode = 'compact', compactHeight }: { viewMode?: 'compa
 
         {/* 6단계: 항공 경로 진행선 */}
         {routes.filter(r => r.type === 'air').map((route) => {
-          const path = createOptimalRoutePath(
-            [route.from.lat, route.from.lng],
-            [route.to.lat, route.to.lng],
-            route.type
-          );
+          const path = routePath(route);
           const progressPath = path.slice(0, Math.floor((route.progress / 100) * path.length) + 1);
           const segments = splitPathAtDateLine(progressPath);
           return segments.map((segment, idx) => (
@@ -1490,11 +1526,7 @@ function LeafletMap({ viewMode = 'compact', compactHeight }: { viewMode?: 'compa
             return null;
           }
 
-          const path = createOptimalRoutePath(
-            [route.from.lat, route.from.lng],
-            [route.to.lat, route.to.lng],
-            route.type
-          );
+          const path = routePath(route);
 
           // 경로가 비어있으면 스킵
           if (!path || path.length === 0) {
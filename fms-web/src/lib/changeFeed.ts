@@ -0,0 +1,121 @@
+import { Pool, PoolConnection, RowDataPacket } from 'mysql2/promise';
+import { CursorError } from '@/lib/pagination';
+
+// 변경분 조회 (증분 폴링)
+// - 행의 변경 시각 = COALESCE(UPDATED_DTM, CREATED_DTM) (등록 후 수정되지 않은 행은 UPDATED_DTM이 NULL)
+// - 피드(테이블)별 위치 (변경 시각, ID) 이후의 행만 (변경 시각, ID) 순으로 limit 건씩 읽는다.
+//   수정된 행은 UPDATED_DTM 인덱스, 수정된 적 없는 행은 (DEL_YN, CREATED_DTM) 인덱스 범위로 읽으므로
+//   읽는 양은 테이블 크기가 아니라 변경 건수에 비례한다.
+// - 삭제(DEL_YN = 'Y')도 UPDATED_DTM을 갱신하므로 같은 피드에 tombstone으로 나온다.
+// - DATETIME은 초 단위이고 늦게 커밋되는 트랜잭션이 있으므로 CHANGE_SETTLE_SECONDS 이전의 변경까지만 읽는다.
+//   그 이후의 변경은 다음 요청에서 읽는다 (같은 행을 두 번 받을 수는 있어도 놓치지 않음).
+
+export const CHANGE_SETTLE_SECONDS = 2;
+
+export interface ChangeFeed {
+  table: string;
+  idColumn: string;
+  parentColumn?: string;  // House → Master 연결 컬럼
+}
+
+export interface FeedPosition {
+  changedDtm: string;
+  id: number;
+}
+
+export type ChangeCursor = Record<string, FeedPosition>;
+
+export interface ChangedRow {
+  id: number;
+  parentId: number | null;
+  deleted: boolean;
+}
+
+type Queryable = Pool | PoolConnection;
+
+// since 파라미터 해석 (잘못된 값은 CursorError)
+export function parseChangeCursor(searchParams: URLSearchParams, param = 'since'): ChangeCursor | null {
+  const value = searchParams.get(param);
+  if (!value) {
+    return null;
+  }
+  try {
+    const parsed = JSON.parse(Buffer.from(value, 'base64url').toString('utf8'));
+    const cursor: ChangeCursor = {};
+    for (const [feed, position] of Object.entries(parsed)) {
+      const [changedDtm, id] = position as [unknown, unknown];
+      if (typeof changedDtm !== 'string' || !Number.isInteger(id)) {
+        throw new Error();
+      }
+      cursor[feed] = { changedDtm, id: id as number };
+    }
+    return cursor;
+  } catch {
+    throw new CursorError('Invalid change cursor');
+  }
+}
+
+export function encodeChangeCursor(cursor: ChangeCursor): string {
+  const positions = Object.fromEntries(
+    Object.entries(cursor).map(([feed, { changedDtm, id }]) => [feed, [changedDtm, id]])
+  );
+  return Buffer.from(JSON.stringify(positions)).toString('base64url');
+}
+
+// 이번 요청에서 읽을 변경의 상한 (DB 시각 기준, 이 시각 미만)
+export async function changeHorizon(db: Queryable): Promise<string> {
+  const [rows] = await db.query<RowDataPacket[]>(
+    `SELECT DATE_FORMAT(NOW() - INTERVAL ? SECOND, '%Y-%m-%d %H:%i:%s') as HORIZON`,
+    [CHANGE_SETTLE_SECONDS]
+  );
+  return rows[0].HORIZON;
+}
+
+// 전체 조회 직후의 시작 위치 (horizon 이후 변경부터)
+export function startCursor(feeds: string[], horizon: string): ChangeCursor {
+  return Object.fromEntries(feeds.map(feed => [feed, { changedDtm: horizon, id: 0 }]));
+}
+
+// 피드 하나의 변경분 (다 읽으면 위치를 horizon으로 옮김)
+export async function readChanges(
+  db: Queryable,
+  feed: ChangeFeed,
+  position: FeedPosition,
+  horizon: string,
+  limit: number
+): Promise<{ rows: ChangedRow[]; position: FeedPosition; hasMore: boolean }> {
+  const { table, idColumn } = feed;
+  const parent = feed.parentColumn || 'NULL';
+  const { changedDtm, id } = position;
+  const [rows] = await db.query<RowDataPacket[]>(
+    `SELECT ID, PARENT_ID, DEL_YN, DATE_FORMAT(CHANGED_DTM, '%Y-%m-%d %H:%i:%s') as CHANGED_DTM
+       FROM (
+         (SELECT ${idColumn} as ID, ${parent} as PARENT_ID, DEL_YN, UPDATED_DTM as CHANGED_DTM
+            FROM ${table}
+           WHERE UPDATED_DTM >= ? AND UPDATED_DTM < ? AND (UPDATED_DTM > ? OR ${idColumn} > ?)
+           ORDER BY UPDATED_DTM, ${idColumn} LIMIT ${limit + 1})
+         UNION ALL
+         (SELECT ${idColumn}, ${parent}, DEL_YN, CREATED_DTM
+            FROM ${table}
+           WHERE DEL_YN = 'N' AND CREATED_DTM >= ? AND CREATED_DTM < ? AND (CREATED_DTM > ? OR ${idColumn} > ?)
+             AND UPDATED_DTM IS NULL
+           ORDER BY CREATED_DTM, ${idColumn} LIMIT ${limit + 1})
+       ) c
+      ORDER BY CHANGED_DTM, ID
+      LIMIT ${limit + 1}`,
+    [changedDtm, horizon, changedDtm, id, changedDtm, horizon, changedDtm, id]
+  );
+
+  const hasMore = rows.length > limit;
+  const pageRows = hasMore ? rows.slice(0, limit) : rows;
+  const last = pageRows[pageRows.length - 1];
+  return {
+    rows: pageRows.map(row => ({
+      id: Number(row.ID),
+      parentId: row.PARENT_ID === null ? null : Number(row.PARENT_ID),
+      deleted: row.DEL_YN === 'Y',
+    })),
+    position: hasMore ? { changedDtm: last.CHANGED_DTM, id: Number(last.ID) } : { changedDtm: horizon, id: 0 },
+    hasMore,
+  };
+}
@@ -0,0 +1,132 @@
+import { NextResponse } from 'next/server';
+import { RowDataPacket } from 'mysql2/promise';
+
+// 목록 API 키셋 페이지네이션 (CREATED_DTM DESC, ID DESC)
+// - 요청: ?limit=100&cursor=<X-Next-Cursor 값>&fields=hbl_id,hbl_no
+// - 응답: 기존과 같은 행 배열 + 다음 페이지가 있으면 X-Next-Cursor 헤더
+// - limit / cursor가 모두 없으면 기존처럼 전체 행을 반환한다 (커서를 따라가지 않는 화면·드롭다운 호환)
+// - fields: 라우트의 컬럼 맵(별칭 -> SQL) 중 필요한 컬럼만 조회 (생략 시 전체)
+// OFFSET 대신 마지막 행의 (CREATED_DTM, ID) 이후부터 읽으므로
+// (DEL_YN, CREATED_DTM) 인덱스가 있으면 페이지 위치와 무관하게 limit 건만 읽는다.
+
+export const DEFAULT_PAGE_SIZE = 100;
+export const MAX_PAGE_SIZE = 500;
+export const NEXT_CURSOR_HEADER = 'X-Next-Cursor';
+
+const CURSOR_DTM = '_cursor_dtm';
+const CURSOR_ID = '_cursor_id';
+
+export interface PageRequest {
+  limit: number | null;  // null: 페이지 없이 전체
+  after: { createdDtm: string; id: number } | null;
+}
+
+// 잘못된 목록 파라미터 (라우트에서 400으로 응답)
+export class PageParamError extends Error {}
+
+export class CursorError extends PageParamError {}
+
+// limit / cursor 파라미터 해석 (잘못된 cursor는 CursorError)
+// 한 응답에 목록이 여러 개면 cursorParam으로 목록별 cursor 파라미터를 구분한다.
+export function parsePage(searchParams: URLSearchParams, cursorParam = 'cursor'): PageRequest {
+  const cursor = searchParams.get(cursorParam);
+  if (!searchParams.has('limit') && !cursor) {
+    return { limit: null, after: null };
+  }
+
+  const requested = parseInt(searchParams.get('limit') || '', 10);
+  const limit = Number.isNaN(requested)
+    ? DEFAULT_PAGE_SIZE
+    : Math.min(Math.max(requested, 1), MAX_PAGE_SIZE);
+
+  if (!cursor) {
+    return { limit, after: null };
+  }
+  try {
+    const [createdDtm, id] = JSON.parse(Buffer.from(cursor, 'base64url').toString('utf8'));
+    if (typeof createdDtm !== 'string' || !Number.isInteger(id)) {
+      throw new Error();
+    }
+    return { limit, after: { createdDtm, id } };
+  } catch {
+    throw new CursorError('Invalid cursor');
+  }
+}
+
+// fields 파라미터로 고른 SELECT 목록 (알 수 없는 필드는 PageParamError)
+// 빠진 컬럼만 쓰던 LEFT JOIN은 MariaDB가 조인 자체를 생략한다 (table elimination).
+export function selectFields(searchParams: URLSearchParams, columns: Record<string, string>): string {
+  const requested = (searchParams.get('fields') || '')
+    .split(',')
+    .map(field => field.trim())
+    .filter(Boolean);
+  const unknown = requested.filter(field => !Object.prototype.hasOwnProperty.call(columns, field));
+  if (unknown.length > 0) {
+    throw new PageParamError(`Unknown fields: ${unknown.join(', ')}`);
+  }
+  const aliases = requested.length > 0 ? requested : Object.keys(columns);
+  return aliases.map(alias => `${columns[alias]} as ${alias}`).join(',\n        ');
+}
+
+// SELECT 목록에 추가할 커서 컬럼 (응답에서는 제거됨)
+export function cursorColumns(createdColumn: string, idColumn: string): string {
+  return `DATE_FORMAT(${createdColumn}, '%Y-%m-%d %H:%i:%s') as ${CURSOR_DTM}, ${idColumn} as ${CURSOR_ID}`;
+}
+
+// WHERE 조건 / ORDER BY / LIMIT 절
+// created <= ? 가 인덱스 범위 조건이 되고, 같은 시각의 행은 ID로 구분한다.
+// unpagedOrder: limit / cursor 없이 전체 조회할 때의 ORDER BY 목록 (생략 시 키셋 순서)
+export function keysetClause(
+  page: PageRequest,
+  createdColumn: string,
+  idColumn: string,
+  unpagedOrder?: string
+): { condition: string; orderLimit: string; params: (string | number)[] } {
+  const keysetOrder = `${createdColumn} DESC, ${idColumn} DESC`;
+  const orderLimit = page.limit === null
+    ? `ORDER BY ${unpagedOrder ?? keysetOrder}`
+    : `ORDER BY ${keysetOrder} LIMIT ${page.limit + 1}`;
+  if (!page.after) {
+    return { condition: '', orderLimit, params: [] };
+  }
+  const { createdDtm, id } = page.after;
+  return {
+    condition: `${createdColumn} <= ? AND (${createdColumn} < ? OR ${idColumn} < ?)`,
+    orderLimit,
+    params: [createdDtm, createdDtm, id],
+  };
+}
+
+// limit + 1 건으로 조회한 결과를 잘라 커서 컬럼을 뺀 행과 다음 페이지 cursor로 반환
+export function takePage(
+  rows: RowDataPacket[],
+  page: PageRequest
+): { rows: Record<string, unknown>[]; nextCursor: string | null } {
+  const hasMore = page.limit !== null && rows.length > page.limit;
+  const pageRows = hasMore ? rows.slice(0, page.limit!) : rows;
+  const last = pageRows[pageRows.length - 1];
+
+  const nextCursor = hasMore && last
+    ? Buffer.from(JSON.stringify([last[CURSOR_DTM], Number(last[CURSOR_ID])])).toString('base64url')
+    : null;
+
+  return {
+    rows: pageRows.map(row => {
+      const rest: Record<string, unknown> = { ...row };
+      delete rest[CURSOR_DTM];
+      delete rest[CURSOR_ID];
+      return rest;
+    }),
+    nextCursor,
+  };
+}
+
+// 행 배열 응답 (다음 페이지가 있으면 X-Next-Cursor)
+export function pageResponse(rows: RowDataPacket[], page: PageRequest): NextResponse {
+  const { rows: body, nextCursor } = takePage(rows, page);
+  const headers: Record<string, string> = {};
+  if (nextCursor) {
+    headers[NEXT_CURSOR_HEADER] = nextCursor;
+  }
+  return NextResponse.json(body, { headers });
+}
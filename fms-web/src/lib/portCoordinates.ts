@@ -0,0 +1,61 @@
+import pool from '@/lib/db';
+import { RowDataPacket } from 'mysql2/promise';
+
+// 항구/공항 좌표 조회 (MST_PORT.LATITUDE / LONGITUDE)
+// - 좌표는 docs/db/port_coordinates.py가 UN/LOCODE·IATA 데이터로 적재한다.
+// - 요청에 필요한 코드만 PK로 조회하고 프로세스 메모리에 캐시한다 (좌표 없는 코드도 캐시).
+// - PORT_COORDINATE_TTL_MS가 지나면 캐시를 비워 좌표 재적재를 반영한다.
+
+export const PORT_COORDINATE_TTL_MS = 10 * 60 * 1000;
+
+export interface PortCoordinate {
+  lat: number;
+  lng: number;
+  name: string;
+  country: string;
+  type: string;
+}
+
+const cache = new Map<string, PortCoordinate | null>();
+let cachedAt = Date.now();
+
+// 코드 -> 좌표 (좌표가 없는 코드는 결과에서 빠짐)
+export async function lookupPorts(codes: Iterable<string>): Promise<Map<string, PortCoordinate>> {
+  if (Date.now() - cachedAt > PORT_COORDINATE_TTL_MS) {
+    cache.clear();
+    cachedAt = Date.now();
+  }
+
+  const requested = [...new Set(codes)].filter(Boolean);
+  const missing = requested.filter(code => !cache.has(code));
+  if (missing.length > 0) {
+    const placeholders = missing.map(() => '?').join(', ');
+    const [rows] = await pool.query<RowDataPacket[]>(
+      `SELECT PORT_CD, COALESCE(PORT_NM_EN, PORT_NM) as PORT_NM, COUNTRY_CD, PORT_TYPE_CD, LATITUDE, LONGITUDE
+         FROM MST_PORT
+        WHERE PORT_CD IN (${placeholders}) AND LATITUDE IS NOT NULL AND LONGITUDE IS NOT NULL`,
+      missing
+    );
+    for (const code of missing) {
+      cache.set(code, null);
+    }
+    for (const row of rows) {
+      cache.set(row.PORT_CD, {
+        lat: Number(row.LATITUDE),
+        lng: Number(row.LONGITUDE),
+        name: row.PORT_NM,
+        country: row.COUNTRY_CD,
+        type: row.PORT_TYPE_CD || (row.PORT_CD.length === 3 ? 'AIR' : 'SEA'),
+      });
+    }
+  }
+
+  const result = new Map<string, PortCoordinate>();
+  for (const code of requested) {
+    const coordinate = cache.get(code);
+    if (coordinate) {
+      result.set(code, coordinate);
+    }
+  }
+  return result;
+}
@@ -0,0 +1,59 @@
+import pool from '@/lib/db';
+import { RowDataPacket } from 'mysql2/promise';
+
+// 추적 지도 경로 캐시 조회 (SHP_ROUTE_GEOMETRY)
+// - docs/db/route_geometry.py가 활성 B/L·AWB의 출발/도착 구간별 경로를 미리 계산해 둔다.
+// - path: 지도 기준 연속 경도 좌표 (WorldMapGlobe 폴리라인에 그대로 사용)
+// - segments: 날짜변경선에서 분할, 경도 -180~180
+// - 캐시가 없는 구간은 결과에서 빠지며, 클라이언트가 기존 방식으로 경로를 생성한다.
+
+// docs/db/route_geometry.py GEOMETRY_VERSION과 같아야 함
+export const ROUTE_GEOMETRY_VERSION = 1;
+
+export interface RouteGeometry {
+  path: [number, number][];
+  segments: [number, number][][];
+  distanceKm: number;
+}
+
+export interface RoutePair {
+  mode: 'SEA' | 'AIR';
+  origin: string;
+  dest: string;
+}
+
+export function routeKey(pair: RoutePair): string {
+  return `${pair.mode}:${pair.origin}-${pair.dest}`;
+}
+
+// 구간 키 -> 캐시된 경로
+export async function lookupRouteGeometries(pairs: RoutePair[]): Promise<Record<string, RouteGeometry>> {
+  const unique = new Map<string, RoutePair>();
+  for (const pair of pairs) {
+    if (pair.origin && pair.dest) {
+      unique.set(routeKey(pair), pair);
+    }
+  }
+  if (unique.size === 0) {
+    return {};
+  }
+
+  const tuples = [...unique.values()];
+  const [rows] = await pool.query<RowDataPacket[]>(
+    `SELECT TRANSPORT_MODE_CD, ORIGIN_CD, DEST_CD, DISTANCE_KM, PATH_JSON, SEGMENTS_JSON
+       FROM SHP_ROUTE_GEOMETRY
+      WHERE GEOMETRY_VER = ?
+        AND (TRANSPORT_MODE_CD, ORIGIN_CD, DEST_CD) IN (${tuples.map(() => '(?, ?, ?)').join(', ')})`,
+    [ROUTE_GEOMETRY_VERSION, ...tuples.flatMap(pair => [pair.mode, pair.origin, pair.dest])]
+  );
+
+  const geometries: Record<string, RouteGeometry> = {};
+  for (const row of rows) {
+    geometries[routeKey({ mode: row.TRANSPORT_MODE_CD, origin: row.ORIGIN_CD, dest: row.DEST_CD })] = {
+      path: JSON.parse(row.PATH_JSON),
+      segments: JSON.parse(row.SEGMENTS_JSON),
+      distanceKm: Number(row.DISTANCE_KM),
+    };
+  }
+  return geometries;
+}
@@ -0,0 +1,86 @@
+import pool from '@/lib/db';
+import { ResultSetHeader } from 'mysql2/promise';
+
+// 문서 번호 발급 (MST_SEQUENCE 블록 할당)
+// - 서버 프로세스가 시퀀스별로 SEQUENCE_BLOCK_SIZE 건을 한 번의 UPDATE로 예약하고
+//   블록이 소진될 때까지 메모리에서 번호를 발급한다.
+// - UPDATE는 행 잠금으로 직렬화되므로 여러 서버가 동시에 예약해도 블록이 겹치지 않는다.
+// - 재시작 시 쓰지 않은 블록 잔여분은 버려진다 (번호에 공백이 생길 수 있음).
+
+export const SEQUENCE_BLOCK_SIZE = 100;
+
+export interface DocumentNoSpec {
+  prefix: string;   // 번호 접두어이자 시퀀스명 (예: HBL2026, SEX-2026-)
+  width: number;    // 일련번호 자릿수
+  table?: string;   // 시퀀스 최초 생성 시 기존 번호를 확인할 테이블 (없으면 1부터)
+  column?: string;
+}
+
+interface Block {
+  next: number;
+  end: number;
+}
+
+const blocks = new Map<string, Block>();
+const reserving = new Map<string, Promise<Block>>();
+
+// NEXT_VAL을 블록 크기만큼 올리고 이전 값을 LAST_INSERT_ID로 돌려받는다
+async function reserve(name: string): Promise<number | null> {
+  const [result] = await pool.query<ResultSetHeader>(
+    `UPDATE MST_SEQUENCE
+        SET NEXT_VAL = LAST_INSERT_ID(NEXT_VAL) + ?, UPDATED_BY = 'system', UPDATED_DTM = NOW()
+      WHERE SEQ_NM = ?`,
+    [SEQUENCE_BLOCK_SIZE, name]
+  );
+  return result.affectedRows > 0 ? result.insertId : null;
+}
+
+async function reserveBlock(spec: DocumentNoSpec): Promise<Block> {
+  let start = await reserve(spec.prefix);
+  if (start === null) {
+    // 시퀀스 최초 사용: 기존 번호(일련번호가 숫자인 것)의 최댓값 다음부터 시작, 이후에는 테이블을 조회하지 않음
+    if (spec.table && spec.column) {
+      const offset = spec.prefix.length + 1;
+      await pool.query<ResultSetHeader>(
+        `INSERT IGNORE INTO MST_SEQUENCE (SEQ_NM, NEXT_VAL, CREATED_BY, CREATED_DTM)
+         SELECT ?, COALESCE(MAX(CAST(SUBSTRING(${spec.column}, ?) AS UNSIGNED)), 0) + 1, 'system', NOW()
+           FROM ${spec.table}
+          WHERE ${spec.column} LIKE ? AND SUBSTRING(${spec.column}, ?) REGEXP '^[0-9]+$'`,
+        [spec.prefix, offset, `${spec.prefix}%`, offset]
+      );
+    } else {
+      await pool.query<ResultSetHeader>(
+        `INSERT IGNORE INTO MST_SEQUENCE (SEQ_NM, NEXT_VAL, CREATED_BY, CREATED_DTM) VALUES (?, 1, 'system', NOW())`,
+        [spec.prefix]
+      );
+    }
+    start = await reserve(spec.prefix);
+    if (start === null) {
+      throw new Error(`Sequence ${spec.prefix} could not be created`);
+    }
+  }
+  return { next: start, end: start + SEQUENCE_BLOCK_SIZE };
+}
+
+// 다음 문서 번호 (prefix + 0으로 채운 일련번호)
+export async function nextDocumentNo(spec: DocumentNoSpec): Promise<string> {
+  let block = blocks.get(spec.prefix);
+  while (!block || block.next >= block.end) {
+    // 같은 시퀀스의 동시 요청은 진행 중인 예약 하나를 기다린다
+    let pending = reserving.get(spec.prefix);
+    if (!pending) {
+      pending = reserveBlock(spec)
+        .then(reserved => {
+          blocks.set(spec.prefix, reserved);
+          return reserved;
+        })
+        .finally(() => reserving.delete(spec.prefix));
+      reserving.set(spec.prefix, pending);
+    }
+    await pending;
+    block = blocks.get(spec.prefix);
+  }
+  const value = block.next;
+  block.next += 1;
+  return `${spec.prefix}${String(value).padStart(spec.width, '0')}`;
+}
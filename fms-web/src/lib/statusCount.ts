@@ -0,0 +1,140 @@
+import pool from '@/lib/db';
+import { Pool, PoolConnection, RowDataPacket, ResultSetHeader } from 'mysql2/promise';
+
+// Shipment 상태별 건수 롤업 (SHP_STATUS_COUNT)
+// - 키: (STATUS_CD, TRANSPORT_MODE_CD), 값: DEL_YN = 'N'인 ORD_SHIPMENT 건수
+// - 선적 등록 / 상태 변경 시 증감으로 갱신하고, 누락·중복 반영분은
+//   docs/db/status_rollup.py가 주기적으로 재집계해 보정한다.
+// - 대시보드는 ORD_SHIPMENT 전체를 세지 않고 상태 수만큼의 행만 읽는다.
+// - 최초 재집계가 끝나 STATUS_ROLLUP_CHECKPOINT에 ROLLUP_READY_JOB 행이 생기기 전에는
+//   롤업에 증감분만 있으므로 ORD_SHIPMENT를 직접 집계한다.
+
+// docs/db/status_rollup.py RECOUNT_JOB과 같아야 함
+export const ROLLUP_READY_JOB = 'STATUS_COUNT';
+
+type Queryable = Pool | PoolConnection;
+
+export interface StatusEvent {
+  statusNm?: string;
+  eventDtm?: string;      // 생략 시 NOW()
+  locationCd?: string;
+  locationNm?: string;
+  description?: string;
+  sourceCd?: string;      // 생략 시 MANUAL
+}
+
+// 상태별 건수 증감 (행이 없으면 생성)
+export async function adjustStatusCount(
+  db: Queryable,
+  status: string,
+  mode: string,
+  delta: number
+): Promise<void> {
+  await db.query<ResultSetHeader>(
+    `INSERT INTO SHP_STATUS_COUNT (STATUS_CD, TRANSPORT_MODE_CD, SHIPMENT_CNT, UPDATED_DTM)
+     VALUES (?, ?, ?, NOW())
+     ON DUPLICATE KEY UPDATE SHIPMENT_CNT = SHIPMENT_CNT + VALUES(SHIPMENT_CNT), UPDATED_DTM = NOW()`,
+    [status, mode, delta]
+  );
+}
+
+// 선적 등록 후 건수 반영
+// 롤업 갱신 실패로 등록 요청을 실패시키지 않는다 (다음 재집계에서 보정됨).
+export async function countNewShipment(status: string, mode: string): Promise<void> {
+  try {
+    await adjustStatusCount(pool, status, mode, 1);
+  } catch (error) {
+    console.error('Status count error:', error);
+  }
+}
+
+// 선적 상태 변경: ORD_SHIPMENT 갱신 + 상태 이력 + 건수 이동을 한 트랜잭션으로 처리
+// 반환값: 변경 전 상태 (선적이 없으면 null)
+export async function changeShipmentStatus(
+  shipmentId: number,
+  status: string,
+  event: StatusEvent = {}
+): Promise<{ previous: string; changed: boolean } | null> {
+  const connection = await pool.getConnection();
+
+  try {
+    await connection.beginTransaction();
+
+    const [rows] = await connection.query<RowDataPacket[]>(
+      `SELECT STATUS_CD, TRANSPORT_MODE_CD, DEL_YN FROM ORD_SHIPMENT WHERE SHIPMENT_ID = ? FOR UPDATE`,
+      [shipmentId]
+    );
+    if (rows.length === 0) {
+      await connection.rollback();
+      return null;
+    }
+
+    const { STATUS_CD: previous, TRANSPORT_MODE_CD: mode, DEL_YN: delYn } = rows[0];
+    if (previous === status) {
+      await connection.rollback();
+      return { previous, changed: false };
+    }
+
+    await connection.query<ResultSetHeader>(
+      `UPDATE ORD_SHIPMENT SET STATUS_CD = ?, UPDATED_BY = 'admin', UPDATED_DTM = NOW() WHERE SHIPMENT_ID = ?`,
+      [status, shipmentId]
+    );
+
+    await connection.query<ResultSetHeader>(
+      `INSERT INTO ORD_SHIPMENT_STATUS_HIST (
+        SHIPMENT_ID, STATUS_CD, STATUS_NM, EVENT_DTM, LOCATION_CD, LOCATION_NM,
+        EVENT_DESC, SOURCE_CD, CREATED_BY, CREATED_DTM
+      ) VALUES (?, ?, ?, COALESCE(?, NOW()), ?, ?, ?, ?, 'admin', NOW())`,
+      [
+        shipmentId,
+        status,
+        event.statusNm || null,
+        event.eventDtm || null,
+        event.locationCd || null,
+        event.locationNm || null,
+        event.description || null,
+        event.sourceCd || 'MANUAL',
+      ]
+    );
+
+    if (delYn === 'N') {
+      // 롤업 행을 항상 같은 순서로 잠가 반대 방향 상태 변경끼리 교착되지 않게 한다
+      const moves: [string, number][] = [[previous, -1], [status, 1]];
+      moves.sort((a, b) => (a[0] < b[0] ? -1 : 1));
+      for (const [code, delta] of moves) {
+        await adjustStatusCount(connection, code, mode, delta);
+      }
+    }
+
+    await connection.commit();
+    return { previous, changed: true };
+  } catch (error) {
+    await connection.rollback();
+    throw error;
+  } finally {
+    connection.release();
+  }
+}
+
+// 상태별 건수 (운송모드 합계)
+// 최초 재집계 전이거나 롤업이 비어 있으면 ORD_SHIPMENT를 한 번 집계한다.
+export async function readStatusCounts(): Promise<Record<string, number>> {
+  let [rows] = await pool.query<RowDataPacket[]>(
+    `SELECT STATUS_CD as status, SUM(SHIPMENT_CNT) as count
+       FROM SHP_STATUS_COUNT
+      WHERE EXISTS (SELECT 1 FROM STATUS_ROLLUP_CHECKPOINT WHERE JOB_NM = ?)
+      GROUP BY STATUS_CD`,
+    [ROLLUP_READY_JOB]
+  );
+  if (rows.length === 0) {
+    [rows] = await pool.query<RowDataPacket[]>(
+      `SELECT STATUS_CD as status, COUNT(*) as count FROM ORD_SHIPMENT WHERE DEL_YN = 'N' GROUP BY STATUS_CD`
+    );
+  }
+
+  const counts: Record<string, number> = {};
+  for (const row of rows) {
+    counts[row.status] = Number(row.count);
+  }
+  return counts;
+}
@@ -0,0 +1,259 @@
+import pool from '@/lib/db';
+import { RowDataPacket } from 'mysql2/promise';
+import { PageParamError } from '@/lib/pagination';
+import { PortCoordinate } from '@/lib/portCoordinates';
+import { lookupRouteGeometries, RouteGeometry, RoutePair, ROUTE_GEOMETRY_VERSION } from '@/lib/routeGeometry';
+
+// 지도 화면 범위 조회 (SHP_ROUTE_GEOCELL)
+// - docs/db/route_geometry.py가 구간별 분할 경로가 지나는 geohash 셀(CELL_PRECISION 자리)을 저장해 둔다.
+// - 요청: ?bbox=서,남,동,북 (Leaflet getBounds().toBBoxString() 순서) &zoom=지도 줌
+//   경도는 지도 기준 연속 경도(-30~290)여도 되며 날짜변경선에서 두 범위로 나눈다.
+// - 범위를 덮는 셀을 MAX_COVER_CELLS개 이하가 되는 자리수로 구하고, 자리수가 짧으면 셀 접두어로 찾는다.
+// - 셀로 찾은 구간은 분할 경로와 범위의 실제 교차 여부로 한 번 더 거른다.
+// - CLUSTER_MAX_ZOOM 미만에서는 경로 대신 항구 geohash 셀별 묶음(cluster)을 반환한다.
+
+// docs/db/route_geometry.py CELL_PRECISION과 같아야 함
+export const CELL_PRECISION = 3;
+export const MAX_COVER_CELLS = 64;
+export const CLUSTER_MAX_ZOOM = 5;
+
+const BASE32 = '0123456789bcdefghjkmnpqrstuvwxyz';
+
+// 경도 -180~180 범위 (서 <= 동)
+export interface Box {
+  south: number;
+  west: number;
+  north: number;
+  east: number;
+}
+
+export interface Viewport {
+  boxes: Box[];
+  frameWest: number;  // 요청 경도 기준 (묶음 좌표를 같은 기준으로 반환)
+  zoom: number;
+}
+
+export interface ShipmentCluster {
+  id: string;
+  lat: number;
+  lng: number;
+  shipments: number;
+  ports: string[];
+}
+
+// bbox / zoom 파라미터 해석 (bbox가 없으면 null, 잘못된 값은 PageParamError)
+export function parseViewport(searchParams: URLSearchParams): Viewport | null {
+  const bbox = searchParams.get('bbox');
+  if (!bbox) {
+    return null;
+  }
+  const values = bbox.split(',').map(Number);
+  const zoom = Number(searchParams.get('zoom') ?? CLUSTER_MAX_ZOOM);
+  if (values.length !== 4 || values.some(value => !Number.isFinite(value))) {
+    throw new PageParamError('Invalid bbox (west,south,east,north)');
+  }
+  if (!Number.isInteger(zoom) || zoom < 0 || zoom > 22) {
+    throw new PageParamError('Invalid zoom');
+  }
+  const [west, south, east, north] = values;
+  if (south > north || west > east || south < -90 || north > 90) {
+    throw new PageParamError('Invalid bbox (west,south,east,north)');
+  }
+
+  // 경도를 -180~180으로 옮기고 날짜변경선을 넘으면 두 범위로 나눈다
+  if (east - west >= 360) {
+    return { boxes: [{ south, west: -180, north, east: 180 }], frameWest: west, zoom };
+  }
+  const start = ((((west + 180) % 360) + 360) % 360) - 180;
+  const end = start + (east - west);
+  const boxes = end <= 180
+    ? [{ south, west: start, north, east: end }]
+    : [{ south, west: start, north, east: 180 }, { south, west: -180, north, east: end - 360 }];
+  return { boxes, frameWest: west, zoom };
+}
+
+// ============================================================
+// Geohash (docs/db/route_geometry.py와 같은 격자)
+// ============================================================
+function gridSize(precision: number): [number, number] {
+  const bits = 5 * precision;
+  return [2 ** Math.ceil(bits / 2), 2 ** Math.floor(bits / 2)];
+}
+
+function cellColumn(lng: number, precision: number): number {
+  const [columns] = gridSize(precision);
+  return Math.min(Math.max(Math.floor(((lng + 180) / 360) * columns), 0), columns - 1);
+}
+
+function cellRow(lat: number, precision: number): number {
+  const [, rows] = gridSize(precision);
+  return Math.min(Math.max(Math.floor(((lat + 90) / 180) * rows), 0), rows - 1);
+}
+
+function cellHash(column: number, row: number, precision: number): string {
+  let columnBits = Math.ceil((5 * precision) / 2);
+  let rowBits = Math.floor((5 * precision) / 2);
+  let hash = '';
+  let value = 0;
+  for (let i = 0; i < 5 * precision; i++) {
+    const bit = i % 2 === 0 ? (column >> --columnBits) & 1 : (row >> --rowBits) & 1;
+    value = (value << 1) | bit;
+    if (i % 5 === 4) {
+      hash += BASE32[value];
+      value = 0;
+    }
+  }
+  return hash;
+}
+
+export function geohash(lat: number, lng: number, precision: number): string {
+  return cellHash(cellColumn(lng, precision), cellRow(lat, precision), precision);
+}
+
+// 범위를 덮는 셀 (MAX_COVER_CELLS개 이하가 되는 가장 긴 자리수)
+export function coverCells(boxes: Box[]): string[] {
+  for (let precision = CELL_PRECISION; precision > 1; precision--) {
+    const count = boxes.reduce((sum, box) =>
+      sum + (cellColumn(box.east, precision) - cellColumn(box.west, precision) + 1)
+        * (cellRow(box.north, precision) - cellRow(box.south, precision) + 1), 0);
+    if (count <= MAX_COVER_CELLS) {
+      return boxCells(boxes, precision);
+    }
+  }
+  return boxCells(boxes, 1);
+}
+
+function boxCells(boxes: Box[], precision: number): string[] {
+  const cells = new Set<string>();
+  for (const box of boxes) {
+    for (let column = cellColumn(box.west, precision); column <= cellColumn(box.east, precision); column++) {
+      for (let row = cellRow(box.south, precision); row <= cellRow(box.north, precision); row++) {
+        cells.add(cellHash(column, row, precision));
+      }
+    }
+  }
+  return [...cells].sort();
+}
+
+// ============================================================
+// 교차 판정
+// ============================================================
+export function inViewport(viewport: Viewport, lat: number, lng: number): boolean {
+  return viewport.boxes.some(box =>
+    lat >= box.south && lat <= box.north && lng >= box.west && lng <= box.east
+  );
+}
+
+// 선분과 범위의 교차 (Liang-Barsky)
+function chordInBox(a: [number, number], b: [number, number], box: Box): boolean {
+  const [y1, x1] = a;
+  const dx = b[1] - x1;
+  const dy = b[0] - y1;
+  let t0 = 0;
+  let t1 = 1;
+  const edges: [number, number][] = [
+    [-dx, x1 - box.west], [dx, box.east - x1],
+    [-dy, y1 - box.south], [dy, box.north - y1],
+  ];
+  for (const [p, q] of edges) {
+    if (p === 0) {
+      if (q < 0) return false;
+      continue;
+    }
+    const t = q / p;
+    if (p < 0) {
+      if (t > t1) return false;
+      t0 = Math.max(t0, t);
+    } else {
+      if (t < t0) return false;
+      t1 = Math.min(t1, t);
+    }
+  }
+  return true;
+}
+
+function routeInViewport(viewport: Viewport, geometry: RouteGeometry): boolean {
+  return geometry.segments.some(segment =>
+    segment.slice(1).some((point, i) => viewport.boxes.some(box => chordInBox(segment[i], point, box)))
+  );
+}
+
+// ============================================================
+// 조회
+// ============================================================
+// 화면 범위를 지나는 구간 (구간 키 -> 캐시된 경로)
+export async function lookupViewportRoutes(
+  viewport: Viewport,
+  modes: string[]
+): Promise<Record<string, RouteGeometry>> {
+  const cells = coverCells(viewport.boxes);
+  const condition = cells[0].length === CELL_PRECISION
+    ? `GEOHASH IN (${cells.map(() => '?').join(', ')})`
+    : `(${cells.map(() => 'GEOHASH LIKE ?').join(' OR ')})`;
+  const [rows] = await pool.query<RowDataPacket[]>(
+    `SELECT DISTINCT TRANSPORT_MODE_CD, ORIGIN_CD, DEST_CD
+       FROM SHP_ROUTE_GEOCELL
+      WHERE GEOMETRY_VER = ? AND ${condition}
+        AND TRANSPORT_MODE_CD IN (${modes.map(() => '?').join(', ')})`,
+    [
+      ROUTE_GEOMETRY_VERSION,
+      ...(cells[0].length === CELL_PRECISION ? cells : cells.map(cell => `${cell}%`)),
+      ...modes,
+    ]
+  );
+
+  const pairs: RoutePair[] = rows.map(row => ({
+    mode: row.TRANSPORT_MODE_CD,
+    origin: row.ORIGIN_CD,
+    dest: row.DEST_CD,
+  }));
+  const geometries = await lookupRouteGeometries(pairs);
+  return Object.fromEntries(
+    Object.entries(geometries).filter(([, geometry]) => routeInViewport(viewport, geometry))
+  );
+}
+
+// 묶음 자리수 (줌 0~1: 1자리, 2~3: 2자리, 4: 3자리)
+export function clusterPrecision(zoom: number): number {
+  return Math.max(1, Math.ceil((zoom + 1) / 2));
+}
+
+// 구간별 선적 건수 -> 항구 셀별 묶음
+// 선적은 화면 안의 출발지에, 출발지가 밖이면 도착지에 센다 (둘 다 밖이면 묶음에 없음).
+export function clusterShipments(
+  viewport: Viewport,
+  counts: { origin: string; dest: string; shipments: number }[],
+  portCoordinates: Map<string, PortCoordinate>
+): ShipmentCluster[] {
+  const precision = clusterPrecision(viewport.zoom);
+  const clusters = new Map<string, { lat: number; lng: number; shipments: number; ports: Set<string> }>();
+  for (const { origin, dest, shipments } of counts) {
+    const code = [origin, dest].find(candidate => {
+      const port = portCoordinates.get(candidate);
+      return port && inViewport(viewport, port.lat, port.lng);
+    });
+    if (!code) continue;
+
+    const port = portCoordinates.get(code)!;
+    const id = geohash(port.lat, port.lng, precision);
+    const cluster = clusters.get(id) || { lat: 0, lng: 0, shipments: 0, ports: new Set<string>() };
+    cluster.lat += port.lat * shipments;
+    cluster.lng += port.lng * shipments;
+    cluster.shipments += shipments;
+    cluster.ports.add(code);
+    clusters.set(id, cluster);
+  }
+
+  // 중심 좌표는 건수 가중 평균, 경도는 요청 bbox 기준으로 옮긴다
+  return [...clusters.entries()].map(([id, cluster]) => {
+    let lng = cluster.lng / cluster.shipments;
+    while (lng < viewport.frameWest) lng += 360;
+    return {
+      id,
+      lat: Math.round((cluster.lat / cluster.shipments) * 1e5) / 1e5,
+      lng: Math.round(lng * 1e5) / 1e5,
+      shipments: cluster.shipments,
+      ports: [...cluster.ports].sort(),
+    };
+  });
+}